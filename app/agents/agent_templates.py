@@ -0,0 +1,127 @@
+"""Agent Templates - Build-once agent prototypes stamped per session
+
+Agent factories used to rebuild full ADK Agent objects on every call:
+validating the model config, attaching large instruction strings and
+constructing fresh toolsets. The audio orchestrator does that for every
+WebSocket session and the Stage Manager for every sub-agent.
+
+Each agent variant now registers a builder here. The builder runs once per
+process to produce a template (prototype) agent; callers get a shallow copy
+of it ("stamp") that shares the template's instruction, model config and
+toolset instances, with only the fields passed as overrides changed. Stamped
+agents are distinct objects, so they can be attached to their own parent
+agent or session.
+
+Templates must be leaf agents (no sub_agents); agents that own sub-agents
+stamp those individually and are built around them.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from google.adk.agents import Agent
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+AgentBuilder = Callable[[], Agent]
+
+
+class AgentTemplateRegistry:
+    """Builds each registered agent variant once and stamps copies of it."""
+
+    def __init__(self) -> None:
+        self._builders: Dict[str, AgentBuilder] = {}
+        self._templates: Dict[str, Agent] = {}
+        self._lock = threading.Lock()
+        self._stats = {"builds": 0, "stamps": 0}
+
+    def register(self, variant: str, builder: AgentBuilder) -> None:
+        """Register (or replace) the builder for an agent variant."""
+        with self._lock:
+            self._builders[variant] = builder
+            self._templates.pop(variant, None)
+
+    def variants(self) -> List[str]:
+        return sorted(self._builders)
+
+    def template(self, variant: str) -> Agent:
+        """Return the template agent for a variant, building it on first use.
+
+        Raises:
+            ValueError: If the variant is unknown or its builder returned an
+                agent with sub-agents
+        """
+        template = self._templates.get(variant)
+        if template is not None:
+            return template
+
+        with self._lock:
+            template = self._templates.get(variant)
+            if template is None:
+                builder = self._builders.get(variant)
+                if builder is None:
+                    raise ValueError(f"Unknown agent template: {variant}")
+                template = builder()
+                if template.sub_agents:
+                    raise ValueError(
+                        f"Agent template {variant} must not have sub_agents"
+                    )
+                self._templates[variant] = template
+                self._stats["builds"] += 1
+                logger.debug("Agent template built", variant=variant)
+        return template
+
+    def stamp(self, variant: str, **overrides: Any) -> Agent:
+        """Create a per-session agent from a variant's template.
+
+        Args:
+            variant: Registered variant name
+            **overrides: Agent fields to change on the copy (e.g. name)
+
+        Returns:
+            A new Agent sharing the template's instruction, model config and
+            toolsets, with its own tools/sub_agents lists and no parent.
+        """
+        template = self.template(variant)
+        update: Dict[str, Any] = {"tools": list(template.tools), "sub_agents": []}
+        update.update(overrides)
+        agent = template.model_copy(update=update)
+        self._stats["stamps"] += 1
+        return agent
+
+    def clear(self, variant: Optional[str] = None) -> None:
+        """Drop built templates (all, or one variant) so they are rebuilt."""
+        with self._lock:
+            if variant is None:
+                self._templates.clear()
+            else:
+                self._templates.pop(variant, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "registered": len(self._builders),
+            "built": len(self._templates),
+        }
+
+
+# Registrations happen at import time of the agent modules, so the registry is
+# created eagerly rather than behind get/reset like other singletons
+_registry = AgentTemplateRegistry()
+
+
+def get_agent_template_registry() -> AgentTemplateRegistry:
+    """Get the process-wide agent template registry."""
+    return _registry
+
+
+def register_agent_template(variant: str, builder: AgentBuilder) -> None:
+    """Register an agent variant with the process-wide registry."""
+    _registry.register(variant, builder)
+
+
+def stamp_agent(variant: str, **overrides: Any) -> Agent:
+    """Stamp a per-session agent from the process-wide registry."""
+    return _registry.stamp(variant, **overrides)
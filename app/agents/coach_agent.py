@@ -1,6 +1,7 @@
 """Coach Agent - Improv Teaching and Feedback using Google ADK"""
 
 from google.adk.agents import Agent
+from app.agents.agent_templates import register_agent_template, stamp_agent
 from app.config import get_settings
 from app.utils.logger import get_logger
 from app.toolsets import ImprovPrinciplesToolset
@@ -117,12 +118,8 @@ Every player should leave a coaching session feeling more confident and clear ab
 how to improve. You're not just teaching improv - you're building improvisers."""
 
 
-def create_coach_agent() -> Agent:
-    """Create Coach Agent with Firestore-backed improv principles toolset.
-
-    Returns:
-        Configured ADK Agent for coaching role with access to improv principles.
-    """
+def _build_coach_agent() -> Agent:
+    """Build the Coach Agent template."""
     logger.info("Creating Coach Agent with ImprovPrinciplesToolset")
 
     # Create toolset with Firestore-backed principles database
@@ -139,3 +136,15 @@ def create_coach_agent() -> Agent:
 
     logger.info("Coach Agent created successfully with ImprovPrinciplesToolset")
     return coach
+
+
+register_agent_template("coach_agent", _build_coach_agent)
+
+
+def create_coach_agent() -> Agent:
+    """Create Coach Agent with Firestore-backed improv principles toolset.
+
+    Returns:
+        Configured ADK Agent for coaching role with access to improv principles.
+    """
+    return stamp_agent("coach_agent")
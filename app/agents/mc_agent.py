@@ -14,6 +14,7 @@ game hosting and improv scene work in a single agent.
 from google.adk.agents import Agent
 from app.toolsets import ImprovGamesToolset
 from app.toolsets.audience_archetypes_toolset import AudienceArchetypesToolset
+from app.agents.agent_templates import register_agent_template, stamp_agent
 from app.config import get_settings
 from app.utils.logger import get_logger
 
@@ -181,15 +182,8 @@ AVAILABLE TOOLS:
 Remember: You wear two hats - enthusiastic host during setup, supportive scene partner during the scene. Make the player feel amazing and help them have a successful, fun improv experience!"""
 
 
-def create_mc_agent() -> Agent:
-    """Create MC Agent for text interactions using ADK framework.
-
-    Uses the standard Flash model which works with the generateContent API
-    for text-based chat sessions (free tier users).
-
-    Returns:
-        Configured ADK Agent for MC role with Firestore-backed game toolset.
-    """
+def _build_mc_agent() -> Agent:
+    """Build the MC Agent (text) template."""
     logger.info("Creating MC Agent for text interactions")
 
     # Create toolset with Firestore-backed game database
@@ -210,19 +204,23 @@ def create_mc_agent() -> Agent:
     return agent
 
 
-def create_mc_agent_for_audio() -> Agent:
-    """Create MC Agent for real-time audio using ADK Live API.
+register_agent_template("mc_agent", _build_mc_agent)
 
-    Uses the Live API model which supports bidirectional audio streaming
-    for premium voice interactions.
 
-    In audio mode, the MC is a unified agent handling BOTH hosting AND scene
-    partner work. No handoff is needed - the MC transitions from host to
-    scene partner seamlessly within the same agent.
+def create_mc_agent() -> Agent:
+    """Create MC Agent for text interactions using ADK framework.
+
+    Uses the standard Flash model which works with the generateContent API
+    for text-based chat sessions (free tier users).
 
     Returns:
-        Configured ADK Agent for unified MC hosting + scene partner role.
+        Configured ADK Agent for MC role with Firestore-backed game toolset.
     """
+    return stamp_agent("mc_agent")
+
+
+def _build_mc_agent_for_audio() -> Agent:
+    """Build the unified MC Agent (audio) template."""
     logger.info("Creating unified MC Agent for audio interactions")
 
     # Create toolsets:
@@ -245,3 +243,22 @@ def create_mc_agent_for_audio() -> Agent:
         model=settings.vertexai_live_model,
     )
     return agent
+
+
+register_agent_template("mc_agent_audio", _build_mc_agent_for_audio)
+
+
+def create_mc_agent_for_audio() -> Agent:
+    """Create MC Agent for real-time audio using ADK Live API.
+
+    Uses the Live API model which supports bidirectional audio streaming
+    for premium voice interactions.
+
+    In audio mode, the MC is a unified agent handling BOTH hosting AND scene
+    partner work. No handoff is needed - the MC transitions from host to
+    scene partner seamlessly within the same agent.
+
+    Returns:
+        Configured ADK Agent for unified MC hosting + scene partner role.
+    """
+    return stamp_agent("mc_agent_audio")
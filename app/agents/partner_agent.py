@@ -1,6 +1,9 @@
 """Partner Agent - Adaptive Improv Scene Partner using Google ADK"""
 
+from functools import partial
+
 from google.adk.agents import Agent
+from app.agents.agent_templates import register_agent_template, stamp_agent
 from app.config import get_settings
 from app.utils.logger import get_logger
 
@@ -213,26 +216,17 @@ You still follow improv rules, but you're human, fallible, and occasionally chal
 Your goal is to make them a better improviser by requiring real collaboration skills."""
 
 
-def create_partner_agent(phase: int = 1) -> Agent:
-    """Create Partner Agent with phase-specific instruction for text mode.
-
-    Args:
-        phase: Partner behavior phase (1 = Supportive, 2 = Fallible)
-
-    Returns:
-        Configured ADK Agent for Partner role with appropriate behavior.
-
-    Raises:
-        ValueError: If phase is not 1 or 2
-        TypeError: If phase is not an integer
-    """
-    # Validate phase parameter
+def _validate_phase(phase: int) -> None:
+    """Raise if phase is not a partner phase (1 or 2)."""
     if not isinstance(phase, int):
         raise TypeError(f"phase must be an integer, got {type(phase).__name__}")
 
     if phase not in [1, 2]:
         raise ValueError(f"phase must be 1 or 2, got {phase}")
 
+
+def _build_partner_agent(phase: int) -> Agent:
+    """Build the Partner Agent (text) template for a phase."""
     if phase == 1:
         instruction = PHASE_1_SYSTEM_PROMPT
         phase_name = "Supportive Training Mode"
@@ -255,30 +249,8 @@ def create_partner_agent(phase: int = 1) -> Agent:
     return partner
 
 
-def create_partner_agent_for_audio(phase: int = 1) -> Agent:
-    """Create Partner Agent for real-time audio using ADK Live API.
-
-    Uses the Live API model which supports bidirectional audio streaming
-    for premium voice interactions. The Partner Agent provides scene work
-    with phase-appropriate behavior.
-
-    Args:
-        phase: Partner behavior phase (1 = Supportive, 2 = Fallible)
-
-    Returns:
-        Configured ADK Agent for Partner role with audio support.
-
-    Raises:
-        ValueError: If phase is not 1 or 2
-        TypeError: If phase is not an integer
-    """
-    # Validate phase parameter
-    if not isinstance(phase, int):
-        raise TypeError(f"phase must be an integer, got {type(phase).__name__}")
-
-    if phase not in [1, 2]:
-        raise ValueError(f"phase must be 1 or 2, got {phase}")
-
+def _build_partner_agent_for_audio(phase: int) -> Agent:
+    """Build the Partner Agent (audio) template for a phase."""
     if phase == 1:
         instruction = PHASE_1_SYSTEM_PROMPT
         phase_name = "Supportive Training Mode"
@@ -303,3 +275,51 @@ def create_partner_agent_for_audio(phase: int = 1) -> Agent:
         model=settings.vertexai_live_model,
     )
     return partner
+
+
+for _phase in (1, 2):
+    register_agent_template(
+        f"partner_agent_phase_{_phase}", partial(_build_partner_agent, _phase)
+    )
+    register_agent_template(
+        f"partner_agent_audio_phase_{_phase}",
+        partial(_build_partner_agent_for_audio, _phase),
+    )
+
+
+def create_partner_agent(phase: int = 1) -> Agent:
+    """Create Partner Agent with phase-specific instruction for text mode.
+
+    Args:
+        phase: Partner behavior phase (1 = Supportive, 2 = Fallible)
+
+    Returns:
+        Configured ADK Agent for Partner role with appropriate behavior.
+
+    Raises:
+        ValueError: If phase is not 1 or 2
+        TypeError: If phase is not an integer
+    """
+    _validate_phase(phase)
+    return stamp_agent(f"partner_agent_phase_{int(phase)}")
+
+
+def create_partner_agent_for_audio(phase: int = 1) -> Agent:
+    """Create Partner Agent for real-time audio using ADK Live API.
+
+    Uses the Live API model which supports bidirectional audio streaming
+    for premium voice interactions. The Partner Agent provides scene work
+    with phase-appropriate behavior.
+
+    Args:
+        phase: Partner behavior phase (1 = Supportive, 2 = Fallible)
+
+    Returns:
+        Configured ADK Agent for Partner role with audio support.
+
+    Raises:
+        ValueError: If phase is not 1 or 2
+        TypeError: If phase is not an integer
+    """
+    _validate_phase(phase)
+    return stamp_agent(f"partner_agent_audio_phase_{int(phase)}")
@@ -2,6 +2,7 @@
 
 from google.adk.agents import Agent
 from app.toolsets import AudienceArchetypesToolset, SentimentAnalysisToolset
+from app.agents.agent_templates import register_agent_template, stamp_agent
 from app.config import get_settings
 from app.utils.logger import get_logger
 
@@ -50,12 +51,8 @@ YOU ARE NOT:
 Remember: You are the pulse of the room, helping everyone create the best possible experience for the audience."""
 
 
-def create_room_agent() -> Agent:
-    """Create Room Agent instance with ADK framework.
-
-    Returns:
-        Configured ADK Agent for Room role with Firestore-backed toolsets.
-    """
+def _build_room_agent() -> Agent:
+    """Build the Room Agent (text) template."""
     logger.info("Creating Room Agent with ADK")
 
     # Create toolsets with Firestore backends
@@ -76,6 +73,18 @@ def create_room_agent() -> Agent:
     return agent
 
 
+register_agent_template("room_agent", _build_room_agent)
+
+
+def create_room_agent() -> Agent:
+    """Create Room Agent instance with ADK framework.
+
+    Returns:
+        Configured ADK Agent for Room role with Firestore-backed toolsets.
+    """
+    return stamp_agent("room_agent")
+
+
 # Audio-specific system prompt for Room Agent
 # This is optimized for ambient commentary with lower volume
 ROOM_AUDIO_SYSTEM_PROMPT = """You are the Room Agent for Improv Olympics - the collective consciousness of the audience, now with a VOICE.
@@ -119,16 +128,8 @@ TIMING:
 Remember: You're the atmosphere, not the action. Your voice adds richness without stealing focus."""
 
 
-def create_room_agent_for_audio() -> Agent:
-    """Create Room Agent for real-time audio using ADK Live API.
-
-    Uses the Live API model which supports bidirectional audio streaming
-    for premium voice interactions. The Room Agent provides ambient
-    commentary about audience sentiment and energy.
-
-    Returns:
-        Configured ADK Agent for Room role with audio support.
-    """
+def _build_room_agent_for_audio() -> Agent:
+    """Build the Room Agent (audio) template."""
     logger.info("Creating Room Agent for audio")
 
     # Create toolsets for sentiment analysis
@@ -150,6 +151,22 @@ def create_room_agent_for_audio() -> Agent:
     return agent
 
 
+register_agent_template("room_agent_audio", _build_room_agent_for_audio)
+
+
+def create_room_agent_for_audio() -> Agent:
+    """Create Room Agent for real-time audio using ADK Live API.
+
+    Uses the Live API model which supports bidirectional audio streaming
+    for premium voice interactions. The Room Agent provides ambient
+    commentary about audience sentiment and energy.
+
+    Returns:
+        Configured ADK Agent for Room role with audio support.
+    """
+    return stamp_agent("room_agent_audio")
+
+
 # Suggestion-specific system prompt for Room Agent
 # This is optimized for providing audience suggestions that feel organic
 ROOM_SUGGESTION_SYSTEM_PROMPT = """You are the Room Agent for Improv Olympics - the VOICE OF THE AUDIENCE providing suggestions.
@@ -192,16 +209,8 @@ COMMUNICATION STYLE:
 Remember: You ARE the audience. When the MC asks for a suggestion, YOU provide it as if called out from the crowd."""
 
 
-def create_room_agent_for_suggestions() -> Agent:
-    """Create Room Agent for providing audience suggestions using ADK Live API.
-
-    This specialized Room Agent is focused on generating demographically-appropriate
-    audience suggestions when the MC asks for them. Uses audience archetypes to
-    ensure suggestions feel authentic to the crowd composition.
-
-    Returns:
-        Configured ADK Agent for Room role with suggestion capabilities.
-    """
+def _build_room_agent_for_suggestions() -> Agent:
+    """Build the Room Agent (suggestions) template."""
     logger.info("Creating Room Agent for suggestions")
 
     # Create toolset for audience archetypes (provides suggestion generation)
@@ -220,3 +229,19 @@ def create_room_agent_for_suggestions() -> Agent:
         model=settings.vertexai_live_model,
     )
     return agent
+
+
+register_agent_template("room_agent_suggestions", _build_room_agent_for_suggestions)
+
+
+def create_room_agent_for_suggestions() -> Agent:
+    """Create Room Agent for providing audience suggestions using ADK Live API.
+
+    This specialized Room Agent is focused on generating demographically-appropriate
+    audience suggestions when the MC asks for them. Uses audience archetypes to
+    ensure suggestions feel authentic to the crowd composition.
+
+    Returns:
+        Configured ADK Agent for Room role with suggestion capabilities.
+    """
+    return stamp_agent("room_agent_suggestions")
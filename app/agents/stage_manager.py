@@ -183,7 +183,7 @@ def create_stage_manager(turn_count: int = 0) -> Agent:
         partner_description=partner_description,
     )
 
-    # Create sub-agents
+    # Stamp sub-agents from their templates (each gets this Stage Manager as parent)
     mc = create_mc_agent()
     room = create_room_agent()
     partner = create_partner_agent(phase=partner_phase)
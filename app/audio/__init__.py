@@ -19,8 +19,25 @@ from app.audio.premium_middleware import (
     track_audio_usage,
     get_fallback_mode,
 )
-from app.audio.audio_orchestrator import AudioStreamOrchestrator
-from app.audio.websocket_handler import AudioWebSocketHandler, audio_handler
+
+# The orchestrator and WebSocket handler pull in ADK and build the audio agents
+# and session service, so they are imported on first use rather than when a
+# light submodule (codec, premium_middleware) is imported
+_LAZY_EXPORTS = {
+    "AudioStreamOrchestrator": "app.audio.audio_orchestrator",
+    "AudioWebSocketHandler": "app.audio.websocket_handler",
+    "audio_handler": "app.audio.websocket_handler",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
+
 
 __all__ = [
     "encode_pcm16_to_base64",
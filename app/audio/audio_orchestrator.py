@@ -19,6 +19,7 @@ from app.audio.turn_manager import AgentTurnManager
 from app.audio.voice_config import get_voice_config
 from app.config import get_settings
 from app.services.adk_session_service import get_adk_session_service
+from app.services.mood_lexicon import MC_TRANSCRIPTION_LEXICON
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -1022,85 +1023,19 @@ class AudioStreamOrchestrator:
         if not text:
             return None
 
-        text_lower = text.lower()
-
-        # Laughter detection phrases - high priority
-        laughter_phrases = [
-            "cracking up",
-            "big laugh",
-            "laughter",
-            "laughing",
-            "that's hilarious",
-            "crowd is dying",
-            "rolling",
-        ]
-
-        # High excitement/celebration phrases
-        excitement_phrases = [
-            "crowd goes wild",
-            "standing ovation",
-            "cheering",
-            "crowd is loving",
-            "energy building",
-            "on the edge of their seats",
-            "rooting for you",
-            "they're cheering",
-            "amazing",
-        ]
-
-        # Positive engagement phrases
-        engagement_phrases = [
-            "audience is",
-            "crowd is",
-            "the room",
-            "everyone's",
-            "nodding heads",
-            "i can feel",
-            "i hear",
-            "i see",
-        ]
-
-        # Tension/anticipation phrases
-        tension_phrases = [
-            "goes quiet",
-            "holding their breath",
-            "anticipation",
-            "tension",
-            "suspense",
-        ]
-
-        # Check for laughter first (highest impact)
-        has_laughter = any(phrase in text_lower for phrase in laughter_phrases)
-
-        # Check for excitement
-        has_excitement = any(phrase in text_lower for phrase in excitement_phrases)
-
-        # Check for general engagement
-        has_engagement = any(phrase in text_lower for phrase in engagement_phrases)
-
-        # Check for tension (still positive, but different mood)
-        has_tension = any(phrase in text_lower for phrase in tension_phrases)
+        reading = MC_TRANSCRIPTION_LEXICON.analyze(text)
+        has_laughter = reading.laughter_detected
+        has_excitement = "excitement" in reading.categories
+        has_engagement = "engagement" in reading.categories
+        has_tension = "tension" in reading.categories
 
         # Only generate room_vibe if we detected audience-related content
-        if not (has_laughter or has_excitement or has_engagement or has_tension):
+        if not reading.categories:
             return None
 
-        # Calculate mood metrics based on detected content
-        sentiment_score = 0.5  # Neutral baseline
-        engagement_score = 0.5  # Neutral baseline
-
-        if has_laughter:
-            sentiment_score = 0.9  # Very positive
-            engagement_score = 0.95  # Highly engaged
-        elif has_excitement:
-            sentiment_score = 0.8  # Positive
-            engagement_score = 0.9  # Very engaged
-        elif has_tension:
-            sentiment_score = 0.6  # Slightly positive (anticipation is good)
-            engagement_score = 0.85  # Engaged and attentive
-        elif has_engagement:
-            sentiment_score = 0.7  # Positive
-            engagement_score = 0.75  # Engaged
+        # Priority: laughter, excitement, tension, then general engagement
+        sentiment_score = reading.sentiment_score
+        engagement_score = reading.engagement_score
 
         mood_metrics = {
             "sentiment_score": sentiment_score,
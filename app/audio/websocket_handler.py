@@ -495,8 +495,24 @@ class AudioWebSocketHandler:
             )
 
 
-# Singleton handler instance
-audio_handler = AudioWebSocketHandler()
+# Singleton handler instance, created on the first connection: building it
+# creates the audio orchestrator (agents and session service)
+_audio_handler: Optional[AudioWebSocketHandler] = None
+
+
+def get_audio_handler() -> AudioWebSocketHandler:
+    """Get or create the singleton audio WebSocket handler."""
+    global _audio_handler
+    if _audio_handler is None:
+        _audio_handler = AudioWebSocketHandler()
+    return _audio_handler
+
+
+def __getattr__(name):
+    # Keeps `from app.audio.websocket_handler import audio_handler` working
+    if name == "audio_handler":
+        return get_audio_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def _stream_responses_to_client(
@@ -678,6 +694,8 @@ async def audio_websocket_endpoint(
         auth_token: OAuth session token
         game_name: Selected game name for scene context
     """
+    audio_handler = get_audio_handler()
+
     # Connect with authentication
     connected = await audio_handler.connect(
         websocket, session_id, auth_token, game_name
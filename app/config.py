@@ -25,6 +25,47 @@ class Settings(BaseSettings):
     firestore_archetypes_collection: str = "audience_archetypes"
     firestore_sentiment_keywords_collection: str = "sentiment_keywords"
 
+    # Tool data snapshot cache - reads older than the TTL trigger a background
+    # refresh; a positive refresh interval also reloads on a fixed schedule
+    tool_data_cache_ttl: int = int(os.getenv("TOOL_DATA_CACHE_TTL", "300"))
+    tool_data_refresh_interval: int = int(
+        os.getenv("TOOL_DATA_REFRESH_INTERVAL", "600")
+    )
+    # Seed the cache from the bundled local snapshot (built by
+    # scripts/build_tool_data_snapshot.py) so cold starts skip Firestore;
+    # an empty path uses app/data/tool_data_snapshot.json
+    tool_data_bundled_snapshot: bool = (
+        os.getenv("TOOL_DATA_BUNDLED_SNAPSHOT", "true").lower() == "true"
+    )
+    tool_data_snapshot_path: str = os.getenv("TOOL_DATA_SNAPSHOT_PATH", "")
+    # Memoize read-only tool calls within one runner invocation; entries of the
+    # most recent invocations are kept in case an invocation is never released
+    tool_call_memoization_enabled: bool = (
+        os.getenv("TOOL_CALL_MEMOIZATION_ENABLED", "true").lower() == "true"
+    )
+    tool_call_cache_max_invocations: int = int(
+        os.getenv("TOOL_CALL_CACHE_MAX_INVOCATIONS", "64")
+    )
+    # Games ranked in-process and listed in the MC game selection prompt
+    mc_game_shortlist_size: int = int(os.getenv("MC_GAME_SHORTLIST_SIZE", "3"))
+
+    # Startup warmup - components are initialized concurrently at startup and
+    # /ready stays not-ready until the critical ones succeed; startup waits at
+    # most the budget, slower components finish in the background
+    startup_warmup_enabled: bool = (
+        os.getenv("STARTUP_WARMUP_ENABLED", "true").lower() == "true"
+    )
+    startup_warmup_budget_seconds: float = float(
+        os.getenv("STARTUP_WARMUP_BUDGET_SECONDS", "20")
+    )
+    # Failed critical components are retried with exponential backoff
+    startup_warmup_retry_seconds: float = float(
+        os.getenv("STARTUP_WARMUP_RETRY_SECONDS", "1")
+    )
+    startup_warmup_retry_max_seconds: float = float(
+        os.getenv("STARTUP_WARMUP_RETRY_MAX_SECONDS", "30")
+    )
+
     # Model configuration
     # See: https://cloud.google.com/vertex-ai/generative-ai/docs/learn/model-versions
     #
@@ -45,6 +86,15 @@ class Settings(BaseSettings):
         os.getenv("RATE_LIMIT_CONCURRENT_SESSIONS", "3")
     )
 
+    # Content filter lexicon - a JSON object of category -> regex list
+    # (severe, profanity, toxic, strong_profanity) replacing the built-in
+    # lists; the file is re-read when it changes, checked at most every
+    # CONTENT_FILTER_RELOAD_SECONDS (0 disables hot reloading)
+    content_filter_lexicon_path: str = os.getenv("CONTENT_FILTER_LEXICON_PATH", "")
+    content_filter_reload_seconds: float = float(
+        os.getenv("CONTENT_FILTER_RELOAD_SECONDS", "30")
+    )
+
     session_timeout_minutes: int = 60
 
     # OAuth Configuration
@@ -66,6 +116,9 @@ class Settings(BaseSettings):
     )
     firestore_users_collection: str = "users"
 
+    # Admin Access - Comma-separated list of emails allowed to use admin endpoints
+    admin_emails: str = os.getenv("ADMIN_EMAILS", "")
+
     @property
     def allowed_users_list(self) -> list[str]:
         """Parse comma-separated allowed users into a list"""
@@ -75,6 +128,20 @@ class Settings(BaseSettings):
             email.strip() for email in self.allowed_users.split(",") if email.strip()
         ]
 
+    @property
+    def admin_emails_list(self) -> list[str]:
+        """Parse comma-separated admin emails into a list"""
+        if not self.admin_emails:
+            return []
+        return [
+            email.strip() for email in self.admin_emails.split(",") if email.strip()
+        ]
+
+    @property
+    def adk_gc_active(self) -> bool:
+        """Whether the local ADK session database is garbage collected"""
+        return self.adk_gc_enabled and self.adk_session_backend == "database"
+
     # Authentication bypass paths (no auth required)
     auth_bypass_paths: list = [
         "/health",
@@ -122,6 +189,65 @@ class Settings(BaseSettings):
         "ADK_DATABASE_URL", "sqlite+aiosqlite:////tmp/adk_sessions.db"
     )
 
+    # ADK session backend: "database" (DatabaseSessionService at ADK_DATABASE_URL)
+    # or "firestore" (shared across instances, see
+    # app/services/adk_firestore_session_service.py)
+    adk_session_backend: str = os.getenv("ADK_SESSION_BACKEND", "database")
+    adk_firestore_sessions_collection: str = os.getenv(
+        "ADK_FIRESTORE_SESSIONS_COLLECTION", "adk_sessions"
+    )
+    adk_firestore_app_states_collection: str = os.getenv(
+        "ADK_FIRESTORE_APP_STATES_COLLECTION", "adk_app_states"
+    )
+    adk_firestore_user_states_collection: str = os.getenv(
+        "ADK_FIRESTORE_USER_STATES_COLLECTION", "adk_user_states"
+    )
+
+    # In-memory LRU cache of ADK sessions (see app/services/adk_session_cache.py);
+    # database backend only
+    adk_session_cache_enabled: bool = (
+        os.getenv("ADK_SESSION_CACHE_ENABLED", "true").lower() == "true"
+    )
+    adk_session_cache_max_entries: int = int(
+        os.getenv("ADK_SESSION_CACHE_MAX_ENTRIES", "256")
+    )
+    adk_session_cache_max_mb: int = int(os.getenv("ADK_SESSION_CACHE_MAX_MB", "64"))
+
+    # Cached ADK session rehydration plans (see app/services/adk_session_rehydration.py)
+    adk_rehydration_cache_size: int = int(
+        os.getenv("ADK_REHYDRATION_CACHE_SIZE", "256")
+    )
+
+    # SQLite tuning for the ADK session database (see app/services/adk_session_db.py)
+    adk_sqlite_wal: bool = os.getenv("ADK_SQLITE_WAL", "true").lower() == "true"
+    adk_sqlite_synchronous: str = os.getenv("ADK_SQLITE_SYNCHRONOUS", "NORMAL")
+    adk_sqlite_busy_timeout_ms: int = int(
+        os.getenv("ADK_SQLITE_BUSY_TIMEOUT_MS", "5000")
+    )
+    adk_sqlite_mmap_size_mb: int = int(os.getenv("ADK_SQLITE_MMAP_SIZE_MB", "64"))
+    adk_sqlite_cache_size_mb: int = int(os.getenv("ADK_SQLITE_CACHE_SIZE_MB", "16"))
+    # 0 sizes the pool to PERF_MAX_CONCURRENT_SESSIONS
+    adk_db_pool_size: int = int(os.getenv("ADK_DB_POOL_SIZE", "0"))
+    adk_db_pool_max_overflow: int = int(os.getenv("ADK_DB_POOL_MAX_OVERFLOW", "5"))
+
+    # Stale ADK session GC and incremental vacuum (see app/services/adk_session_gc.py);
+    # database backend only
+    adk_gc_enabled: bool = os.getenv("ADK_GC_ENABLED", "true").lower() == "true"
+    adk_gc_interval_seconds: int = int(os.getenv("ADK_GC_INTERVAL_SECONDS", "300"))
+    adk_gc_idle_minutes: int = int(os.getenv("ADK_GC_IDLE_MINUTES", "15"))
+    adk_gc_batch_size: int = int(os.getenv("ADK_GC_BATCH_SIZE", "200"))
+    adk_gc_vacuum_pages: int = int(os.getenv("ADK_GC_VACUUM_PAGES", "1000"))
+
+    # ADK session event compaction (see app/services/adk_event_compaction.py)
+    adk_event_compaction_enabled: bool = (
+        os.getenv("ADK_EVENT_COMPACTION_ENABLED", "true").lower() == "true"
+    )
+    adk_compaction_max_turns: int = int(os.getenv("ADK_COMPACTION_MAX_TURNS", "6"))
+    adk_compaction_max_tokens: int = int(os.getenv("ADK_COMPACTION_MAX_TOKENS", "6000"))
+    adk_compaction_trigger_events: int = int(
+        os.getenv("ADK_COMPACTION_TRIGGER_EVENTS", "60")
+    )
+
     # ADK Memory Service Configuration
     memory_service_enabled: bool = (
         os.getenv("MEMORY_SERVICE_ENABLED", "false").lower() == "true"
@@ -131,10 +257,35 @@ class Settings(BaseSettings):
         os.getenv("USE_IN_MEMORY_MEMORY_SERVICE", "true").lower() == "true"
     )
 
+    # Background memory ingestion on session close
+    # (see app/services/memory_ingestion_queue.py)
+    memory_ingestion_collection: str = os.getenv(
+        "MEMORY_INGESTION_COLLECTION", "memory_ingestion_jobs"
+    )
+    memory_ingestion_concurrency: int = int(
+        os.getenv("MEMORY_INGESTION_CONCURRENCY", "2")
+    )
+    memory_ingestion_max_attempts: int = int(
+        os.getenv("MEMORY_INGESTION_MAX_ATTEMPTS", "5")
+    )
+    memory_ingestion_backoff_seconds: float = float(
+        os.getenv("MEMORY_INGESTION_BACKOFF_SECONDS", "5")
+    )
+    # Jobs whose owner has not touched them for this long are recovered
+    memory_ingestion_lease_seconds: int = int(
+        os.getenv("MEMORY_INGESTION_LEASE_SECONDS", "600")
+    )
+    memory_ingestion_recovery_interval: int = int(
+        os.getenv("MEMORY_INGESTION_RECOVERY_INTERVAL", "300")
+    )
+
     # Performance Tuning Configuration
     perf_agent_timeout: int = int(os.getenv("PERF_AGENT_TIMEOUT", "30"))
     perf_cache_ttl: int = int(os.getenv("PERF_CACHE_TTL", "300"))
     perf_max_context_tokens: int = int(os.getenv("PERF_MAX_CONTEXT_TOKENS", "4000"))
+    # Token counter for context budgeting: calibrated, sentencepiece, heuristic
+    perf_token_counter: str = os.getenv("PERF_TOKEN_COUNTER", "calibrated")
+    perf_tokenizer_model_path: str = os.getenv("PERF_TOKENIZER_MODEL_PATH", "")
     perf_batch_write_threshold: int = int(os.getenv("PERF_BATCH_WRITE_THRESHOLD", "5"))
     perf_max_concurrent_sessions: int = int(
         os.getenv("PERF_MAX_CONCURRENT_SESSIONS", "10")
@@ -22,13 +22,22 @@ os.environ.setdefault(
 )
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", os.getenv("GCP_LOCATION", "us-central1"))
 
+from app.config import get_settings
+from app.utils.import_profiler import get_import_profiler, start_import_profiler
+
+settings = get_settings()
+
+# In debug mode, time every import below (routers, SDKs); the breakdown is
+# logged at startup like `python -X importtime`
+if settings.debug:
+    start_import_profiler()
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 import sys
 
-from app.config import get_settings
 from app.utils.logger import get_logger
 from app.middleware.oauth_auth import OAuthSessionMiddleware
 from app.middleware.performance import PerformanceMiddleware
@@ -38,8 +47,6 @@ from app.services.adk_observability import (
 )
 from app.routers import health, sessions, auth, static, audio_poc, user, audio
 
-settings = get_settings()
-
 # CRITICAL: Initialize OpenTelemetry BEFORE any ADK imports
 # This sets up environment variables that enable ADK's auto-instrumentation
 # and configures Cloud Trace exporter to receive ADK's spans
@@ -124,8 +131,15 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.on_event("startup")
 async def startup_event():
     """Application startup event - initialize singleton services"""
-    from app.services.turn_orchestrator import initialize_runner
     from app.services.adk_memory_service import get_adk_memory_service
+    from app.services.firestore_tool_data_service import get_tool_data_cache
+    from app.services.memory_ingestion_queue import get_memory_ingestion_queue
+    from app.services.warmup import get_warmup_manager
+
+    import_profiler = get_import_profiler()
+    if import_profiler is not None:
+        import_profiler.uninstall()
+        logger.info("Startup import time report", **import_profiler.report())
 
     logger.info(
         "Vertex AI configuration",
@@ -134,14 +148,39 @@ async def startup_event():
         location=os.environ.get("GOOGLE_CLOUD_LOCATION"),
     )
 
-    logger.info("Initializing singleton Runner")
-    initialize_runner()
+    # Runner, session DB, tool data, agent templates and clients; /ready stays
+    # not-ready until the critical ones are done
+    warmup = get_warmup_manager()
+    if settings.startup_warmup_enabled:
+        logger.info(
+            "Starting warmup", budget_seconds=settings.startup_warmup_budget_seconds
+        )
+        await warmup.run(settings.startup_warmup_budget_seconds)
+    else:
+        from app.services.turn_orchestrator import initialize_runner
+
+        logger.info("Warmup disabled, initializing singleton Runner")
+        initialize_runner()
+        warmup.skip()
+
+    tool_data_cache = get_tool_data_cache()
+    if tool_data_cache.snapshot is not None and tool_data_cache.snapshot.provisional:
+        # Serve bundled data right away; reconcile with Firestore in the background
+        tool_data_cache.revalidate()
+    if settings.tool_data_refresh_interval > 0:
+        tool_data_cache.start_periodic_refresh(settings.tool_data_refresh_interval)
+
+    if settings.adk_gc_active:
+        from app.services.adk_session_gc import get_adk_session_collector
+
+        get_adk_session_collector().start(settings.adk_gc_interval_seconds)
 
     if settings.memory_service_enabled:
         logger.info("Initializing ADK Memory Service")
         memory_service = get_adk_memory_service()
         if memory_service:
             logger.info("ADK Memory Service initialized")
+            get_memory_ingestion_queue().start()
         else:
             logger.warning("Memory service enabled but initialization returned None")
     else:
@@ -163,7 +202,18 @@ async def shutdown_event():
     # Close ADK DatabaseSessionService connections
     from app.services.adk_session_service import close_adk_session_service
     from app.services.adk_memory_service import close_adk_memory_service
-
+    from app.services.adk_session_gc import get_adk_session_collector
+    from app.services.firestore_tool_data_service import get_tool_data_cache
+    from app.services.memory_ingestion_queue import get_memory_ingestion_queue
+    from app.services.warmup import get_warmup_manager
+
+    await get_warmup_manager().stop()
+    await get_tool_data_cache().stop()
+    if settings.adk_gc_active:
+        await get_adk_session_collector().stop()
+    if settings.memory_service_enabled:
+        # Unfinished ingestion jobs stay in Firestore and are recovered later
+        await get_memory_ingestion_queue().stop()
     await close_adk_session_service()
 
     if settings.memory_service_enabled:
@@ -7,7 +7,7 @@ Supports free, regular, and premium tiers with audio usage tracking.
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 
 
@@ -152,3 +152,17 @@ class UserProfileResponse(BaseModel):
             audio_usage_seconds=profile.audio_usage_seconds,
             audio_usage_limit=profile.audio_usage_limit,
         )
+
+
+class UserListResponse(BaseModel):
+    """API response model for a page of users.
+
+    This is the response format for GET /api/v1/user/admin/users endpoint.
+    """
+
+    users: List[UserProfileResponse] = Field(
+        default_factory=list, description="Users on this page"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
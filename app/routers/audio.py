@@ -10,7 +10,6 @@ from typing import Dict, Any, Optional
 from fastapi import APIRouter, WebSocket, Request, Depends, HTTPException, status, Query
 
 from app.audio.premium_middleware import check_audio_access, get_fallback_mode
-from app.audio.websocket_handler import audio_websocket_endpoint
 from app.config import get_settings
 from app.models.user import UserProfile
 from app.services.user_service import get_user_by_email
@@ -141,6 +140,9 @@ async def websocket_audio(
         game=game,
     )
 
+    # Deferred: the handler imports the audio orchestrator and agents
+    from app.audio.websocket_handler import audio_websocket_endpoint
+
     await audio_websocket_endpoint(websocket, session_id, token, game)
 
 
@@ -7,6 +7,7 @@ from typing import Dict, Any
 from google.cloud import firestore  # type: ignore[attr-defined]
 
 from app.config import get_settings
+from app.services.warmup import get_warmup_manager
 from app.utils.logger import get_logger
 
 router = APIRouter()
@@ -34,13 +35,28 @@ async def health_check() -> Dict[str, Any]:
 async def readiness_check():
     """
     Readiness check with dependency validation.
-    Checks connectivity to Firestore and other critical services.
+    Reports not-ready while startup warmup of critical components is still
+    running (or retrying after a failure), then checks connectivity to Firestore and other
+    critical services.
 
     Returns:
-        200 OK if all dependencies are healthy
-        503 Service Unavailable if any dependency fails
+        200 OK if warm and all dependencies are healthy
+        503 Service Unavailable if warmup is incomplete or any dependency fails
     """
-    checks = {"firestore": False, "vertexai": False}
+    warmup = get_warmup_manager().report()
+    if warmup["status"] not in ("ready", "skipped"):
+        logger.info("Readiness check: warmup incomplete", warmup=warmup["status"])
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "not_ready",
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "checks": {"warmup": False},
+                "warmup": warmup,
+            },
+        )
+
+    checks = {"warmup": True, "firestore": False, "vertexai": False}
 
     try:
         db = firestore.Client(
@@ -74,6 +90,7 @@ async def readiness_check():
         "status": "ready" if all_healthy else "not_ready",
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "checks": checks,
+        "warmup": warmup,
     }
 
     if not all_healthy:
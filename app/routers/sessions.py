@@ -13,14 +13,15 @@ from app.services.mc_welcome_orchestrator import get_mc_welcome_orchestrator
 from app.services.content_filter import get_content_filter
 from app.services.pii_detector import get_pii_detector
 from app.services.prompt_injection_guard import get_prompt_injection_guard
-from app.services.adk_session_service import get_adk_session
-from app.services.adk_memory_service import save_session_to_memory
+from app.services.memory_ingestion_queue import get_memory_ingestion_queue
 from app.services.firestore_tool_data_service import get_all_games
 from app.middleware.iap_auth import get_authenticated_user
+from app.config import get_settings
 from app.utils.logger import get_logger
 
 router = APIRouter(prefix="/api/v1", tags=["sessions"])
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class GameInfo(BaseModel):
@@ -546,34 +547,28 @@ async def close_session(
             detail="Not authorized to close this session",
         )
 
+    if settings.memory_service_enabled:
+        # Ingested by background workers; the close does not wait for it.
+        # Queued before the close marks the ADK session for GC, so its events
+        # are pinned by the time a sweep could delete them
+        try:
+            await get_memory_ingestion_queue().enqueue(
+                session_id=session_id, user_id=user_id
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to queue session memory ingestion, continuing with close",
+                session_id=session_id,
+                user_id=user_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
     await session_manager.close_session(session_id)
     await rate_limiter.decrement_concurrent_sessions(user_id, session_id)
 
     logger.info("Session closed", session_id=session_id, user_id=user_id)
 
-    try:
-        adk_session = await get_adk_session(session_id=session_id, user_id=user_id)
-        if adk_session:
-            memory_saved = await save_session_to_memory(adk_session)
-            if memory_saved:
-                logger.info(
-                    "Session memories saved", session_id=session_id, user_id=user_id
-                )
-        else:
-            logger.warning(
-                "ADK session not found for memory save",
-                session_id=session_id,
-                user_id=user_id,
-            )
-    except Exception as e:
-        logger.error(
-            "Failed to save session to memory, continuing with close",
-            session_id=session_id,
-            user_id=user_id,
-            error=str(e),
-            error_type=type(e).__name__,
-        )
-
     return {"status": "closed", "session_id": session_id}
 
 
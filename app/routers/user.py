@@ -2,15 +2,27 @@
 
 Provides endpoints for user profile management:
 - GET /api/v1/user/me - Get current user's profile
+- GET /api/v1/user/admin/users - Cursor-paginated user listing (admins only)
 """
 
-from fastapi import APIRouter, Request, HTTPException, status
+from typing import Optional
 
-from app.models.user import UserProfileResponse
-from app.services.user_service import get_user_by_email, update_last_login
+from fastapi import APIRouter, Request, HTTPException, Query, status
+
+from app.config import get_settings
+from app.models.user import UserProfileResponse, UserListResponse, UserTier
+from app.services.user_service import (
+    get_user_by_email,
+    update_last_login,
+    list_users_page,
+    InvalidCursorError,
+    DEFAULT_USER_PAGE_SIZE,
+    MAX_USER_PAGE_SIZE,
+)
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 router = APIRouter(prefix="/api/v1/user", tags=["user"])
 
@@ -68,3 +80,50 @@ async def get_current_user(request: Request) -> UserProfileResponse:
     )
 
     return UserProfileResponse.from_user_profile(user_profile)
+
+
+@router.get("/admin/users", response_model=UserListResponse)
+async def list_users_admin(
+    request: Request,
+    page_size: int = Query(DEFAULT_USER_PAGE_SIZE, ge=1, le=MAX_USER_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    tier: Optional[UserTier] = Query(None),
+) -> UserListResponse:
+    """List users one page at a time for admin views.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to fetch the next page.
+
+    Returns:
+        UserListResponse with the page of users and the next cursor
+
+    Raises:
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If user is not an admin
+        HTTPException 400: If the cursor is invalid
+    """
+    user_email = getattr(request.state, "user_email", None)
+    if not user_email:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+        )
+
+    if user_email not in settings.admin_emails_list:
+        logger.warning("Non-admin attempted to list users", user_email=user_email)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+
+    try:
+        page = await list_users_page(tier=tier, page_size=page_size, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+    return UserListResponse(
+        users=[UserProfileResponse.from_user_profile(u) for u in page.users],
+        next_cursor=page.next_cursor,
+    )
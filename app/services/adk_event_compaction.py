@@ -0,0 +1,536 @@
+"""ADK Session Event Compaction - Bound the event history the Runner replays
+
+The singleton Runner appends every event of a turn to the ADK session:
+the user message, ``transfer_to_agent`` function calls and responses, and
+the full output of every sub-agent. Each ``run_async`` loads the whole
+session and sends its events to the model, so without compaction the
+prompt and the session load time grow with every turn.
+
+Compaction rewrites a session's events:
+
+- routing-only events (``transfer_to_agent`` calls/responses) are dropped
+- the most recent turns (invocations) are kept while they fit both
+  ``max_turns`` and ``max_tokens``
+- older turns are collapsed into a single summary event at the start of
+  the session, which also records compaction counters in session state
+
+It only runs once the event count reaches ``trigger_events``, so the
+rewrite cost is amortized over several turns, and is skipped when it would
+not reduce the session's tokens.
+
+The stored events are replaced in one transaction (one batched write for
+Firestore), and only if the session was not updated since it was read, so a
+failure or a concurrent append leaves the session as it was. Turns schedule
+compaction in the background after responding (schedule_compaction); the
+next turn of the session waits for it (wait_for_compaction).
+
+Usage:
+    from app.services.adk_event_compaction import schedule_compaction
+
+    schedule_compaction(session_service, adk_session)
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions import (
+    BaseSessionService,
+    DatabaseSessionService,
+    InMemorySessionService,
+)
+from google.adk.sessions.database_session_service import StorageEvent, StorageSession
+from google.adk.sessions.session import Session as ADKSession
+from google.adk.sessions.state import State
+from google.genai import types
+from sqlalchemy import delete, update
+
+from app.config import get_settings
+from app.services.adk_firestore_session_service import (
+    FirestoreSessionService,
+    split_state,
+)
+from app.services.adk_session_cache import CachedSessionService
+from app.utils.logger import get_logger
+from app.utils.token_counter import TokenCounter, get_token_counter
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+ROUTING_FUNCTION = "transfer_to_agent"
+
+# custom_metadata marker of the summary event
+SUMMARY_MARKER = "compaction_summary"
+
+# Session state key with compaction counters
+COMPACTION_STATE_KEY = "event_compaction"
+
+SUMMARY_PREVIEW_CHARS = 80
+
+
+@dataclass
+class EventCompactionPolicy:
+    """Limits applied when compacting a session's events.
+
+    Attributes:
+        max_turns: Most recent turns kept verbatim
+        max_tokens: Token budget for the kept turns
+        trigger_events: Event count at which a session is compacted
+        summary_max_lines: Turn lines kept in the summary event
+    """
+
+    max_turns: int = 6
+    max_tokens: int = 6000
+    trigger_events: int = 60
+    summary_max_lines: int = 20
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of compacting one session."""
+
+    events_before: int
+    events_after: int
+    turns_summarized: int
+    routing_events_dropped: int
+    tokens_before: int
+    tokens_after: int
+
+
+def get_default_policy() -> EventCompactionPolicy:
+    """Compaction policy from settings."""
+    return EventCompactionPolicy(
+        max_turns=settings.adk_compaction_max_turns,
+        max_tokens=settings.adk_compaction_max_tokens,
+        trigger_events=settings.adk_compaction_trigger_events,
+    )
+
+
+def is_routing_event(event: Event) -> bool:
+    """Whether an event only transfers control between agents."""
+    if not event.content or not event.content.parts:
+        return False
+    names = [call.name for call in event.get_function_calls()]
+    names += [response.name for response in event.get_function_responses()]
+    if not names or any(name != ROUTING_FUNCTION for name in names):
+        return False
+    return not any(part.text for part in event.content.parts)
+
+
+def is_summary_event(event: Event) -> bool:
+    return bool(event.custom_metadata and event.custom_metadata.get(SUMMARY_MARKER))
+
+
+def event_text(event: Event) -> str:
+    """Text an event contributes to the model input."""
+    if not event.content or not event.content.parts:
+        return ""
+    pieces = []
+    for part in event.content.parts:
+        if part.text:
+            pieces.append(part.text)
+        elif part.function_call:
+            pieces.append(f"{part.function_call.name}({part.function_call.args})")
+        elif part.function_response:
+            pieces.append(
+                f"{part.function_response.name}: {part.function_response.response}"
+            )
+    return "\n".join(pieces)
+
+
+def _group_turns(events: List[Event]) -> List[List[Event]]:
+    """Split events into turns (consecutive events of one invocation)."""
+    turns: List[List[Event]] = []
+    for event in events:
+        if turns and turns[-1][0].invocation_id == event.invocation_id:
+            turns[-1].append(event)
+        else:
+            turns.append([event])
+    return turns
+
+
+def _summary_line(turn: List[Event]) -> str:
+    user_text = ""
+    reply_text = ""
+    reply_author = ""
+    for event in turn:
+        text = event_text(event) if not event.get_function_calls() else ""
+        if not text:
+            continue
+        if event.author == "user" and not user_text:
+            user_text = text
+        elif event.author != "user":
+            reply_text, reply_author = text, event.author
+    line = f"user: {user_text[:SUMMARY_PREVIEW_CHARS]}"
+    if reply_text:
+        line += f" | {reply_author}: {reply_text[:SUMMARY_PREVIEW_CHARS]}"
+    return line
+
+
+def _previous_summary_lines(summary: Optional[Event]) -> List[str]:
+    if summary is None:
+        return []
+    return list(summary.custom_metadata.get("lines", []))
+
+
+def build_summary_event(
+    lines: List[str], turns_summarized: int, invocation_id: str, timestamp: float
+) -> Event:
+    """Summary event standing in for collapsed turns (see module docstring)."""
+    text = (
+        f"[Summary of {turns_summarized} earlier turns]\n" + "\n".join(lines)
+        if lines
+        else f"[Summary of {turns_summarized} earlier turns]"
+    )
+    return Event(
+        invocation_id=invocation_id,
+        author="user",
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+        actions=EventActions(
+            state_delta={COMPACTION_STATE_KEY: {"turns_summarized": turns_summarized}}
+        ),
+        custom_metadata={
+            SUMMARY_MARKER: True,
+            "turns_summarized": turns_summarized,
+            "lines": lines,
+        },
+        timestamp=timestamp,
+    )
+
+
+def plan_compaction(
+    events: List[Event],
+    policy: EventCompactionPolicy,
+    counter: Optional[TokenCounter] = None,
+) -> List[Event]:
+    """Compute the compacted event list for a session.
+
+    Args:
+        events: Session events in order
+        policy: Limits to apply
+        counter: Token counter (defaults to the configured one)
+
+    Returns:
+        Events to keep, starting with a summary event when older turns
+        were collapsed
+    """
+    counter = counter or get_token_counter()
+
+    previous_summary = None
+    if events and is_summary_event(events[0]):
+        previous_summary, events = events[0], events[1:]
+    turns_summarized = (
+        previous_summary.custom_metadata.get("turns_summarized", 0)
+        if previous_summary
+        else 0
+    )
+
+    turns = [
+        [event for event in turn if not is_routing_event(event)]
+        for turn in _group_turns(events)
+    ]
+    turns = [turn for turn in turns if turn]
+
+    # Newest turns first while they fit; the latest turn is always kept
+    kept: List[List[Event]] = []
+    used_tokens = 0
+    for turn in reversed(turns):
+        tokens = sum(counter.count(event_text(event)) for event in turn)
+        if kept and (
+            len(kept) >= policy.max_turns or used_tokens + tokens > policy.max_tokens
+        ):
+            break
+        kept.append(turn)
+        used_tokens += tokens
+    kept.reverse()
+
+    folded = turns[: len(turns) - len(kept)]
+    kept_events = [event for turn in kept for event in turn]
+    if not folded:
+        return ([previous_summary] if previous_summary else []) + kept_events
+
+    lines = _previous_summary_lines(previous_summary)
+    lines += [_summary_line(turn) for turn in folded]
+    lines = lines[-policy.summary_max_lines :]
+    first_kept = kept_events[0]
+    summary = build_summary_event(
+        lines,
+        turns_summarized + len(folded),
+        invocation_id=folded[-1][0].invocation_id,
+        timestamp=first_kept.timestamp - 0.001,
+    )
+    return [summary] + kept_events
+
+
+def _replace_in_memory_events(
+    service: InMemorySessionService,
+    session: ADKSession,
+    events: List[Event],
+    session_state: Dict[str, Any],
+) -> bool:
+    stored = (
+        service.sessions.get(session.app_name, {})
+        .get(session.user_id, {})
+        .get(session.id)
+    )
+    if stored is None or stored.last_update_time != session.last_update_time:
+        return False
+    stored.events = list(events)
+    stored.state = session_state
+    return True
+
+
+def _replace_database_rows(
+    sql_session: Any,
+    session: ADKSession,
+    events: List[Event],
+    session_state: Dict[str, Any],
+) -> bool:
+    keys = (session.app_name, session.user_id, session.id)
+    storage_session = sql_session.get(StorageSession, keys)
+    if (
+        storage_session is None
+        or storage_session.update_timestamp_tz > session.last_update_time
+    ):
+        return False
+
+    stored_ids = {event.id for event in session.events}
+    sql_session.execute(
+        delete(StorageEvent).where(
+            StorageEvent.app_name == session.app_name,
+            StorageEvent.user_id == session.user_id,
+            StorageEvent.session_id == session.id,
+            StorageEvent.id.not_in([event.id for event in events]),
+        )
+    )
+    for event in events:
+        if event.id not in stored_ids:
+            sql_session.add(StorageEvent.from_event(session, event))
+    # update_time is kept, so a turn holding the session as loaded before
+    # compaction can still append to it
+    sql_session.execute(
+        update(StorageSession)
+        .where(
+            StorageSession.app_name == session.app_name,
+            StorageSession.user_id == session.user_id,
+            StorageSession.id == session.id,
+        )
+        .values(state=session_state, update_time=StorageSession.update_time)
+    )
+    sql_session.commit()
+    return True
+
+
+async def _replace_database_events(
+    service: DatabaseSessionService,
+    session: ADKSession,
+    events: List[Event],
+    session_state: Dict[str, Any],
+) -> bool:
+    """Replace the rows in one transaction, on a sync or async engine."""
+    if hasattr(service.db_engine, "sync_engine"):
+        async with service.database_session_factory() as sql_session:
+            return await sql_session.run_sync(
+                _replace_database_rows, session, events, session_state
+            )
+    with service.database_session_factory() as sql_session:
+        return _replace_database_rows(sql_session, session, events, session_state)
+
+
+async def replace_session_events(
+    service: BaseSessionService,
+    session: ADKSession,
+    events: List[Event],
+    state: Dict[str, Any],
+) -> bool:
+    """Atomically replace a session's stored events and session state.
+
+    Args:
+        service: Session service holding the session
+        session: Session as loaded; the replacement is abandoned if the
+            stored session was updated since
+        events: New event list (events already stored keep their ids)
+        state: New session state; app:, user: and temp: keys are ignored
+
+    Returns:
+        False if the session is gone or was updated since it was loaded
+
+    Raises:
+        TypeError: If the session service has no atomic replacement
+    """
+    session_state = split_state(state)[2]
+    if isinstance(service, CachedSessionService):
+        try:
+            return await replace_session_events(service.inner, session, events, state)
+        finally:
+            service.invalidate(session.app_name, session.user_id, session.id)
+    if isinstance(service, FirestoreSessionService):
+        return await service.replace_events(session, events, session_state)
+    if isinstance(service, DatabaseSessionService):
+        return await _replace_database_events(service, session, events, session_state)
+    if isinstance(service, InMemorySessionService):
+        return _replace_in_memory_events(service, session, events, session_state)
+    raise TypeError(f"Cannot replace events of {type(service).__name__} sessions")
+
+
+async def compact_session(
+    service: BaseSessionService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    policy: Optional[EventCompactionPolicy] = None,
+) -> Optional[CompactionResult]:
+    """Compact a session's events in place.
+
+    The stored events and state are replaced atomically (see
+    replace_session_events); if that fails, or the session is updated while
+    compacting, the session is left as it was.
+
+    Returns:
+        CompactionResult, or None if the session does not exist, has nothing
+        to compact, would not get smaller or changed while compacting
+    """
+    policy = policy or get_default_policy()
+    counter = get_token_counter()
+
+    session = await service.get_session(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+    if session is None:
+        return None
+
+    events = list(session.events)
+    compacted = plan_compaction(events, policy, counter)
+    if len(compacted) == len(events):
+        return None
+
+    tokens_before = sum(counter.count(event_text(event)) for event in events)
+    tokens_after = sum(counter.count(event_text(event)) for event in compacted)
+    if tokens_after >= tokens_before:
+        logger.debug(
+            "ADK session compaction skipped, no tokens saved",
+            session_id=session_id,
+            tokens_before=tokens_before,
+            tokens_after=tokens_after,
+        )
+        return None
+
+    state: Dict[str, Any] = {
+        key: value
+        for key, value in session.state.items()
+        if not key.startswith(State.TEMP_PREFIX)
+    }
+    for event in compacted:
+        if event.actions and event.actions.state_delta:
+            state.update(event.actions.state_delta)
+    if not await replace_session_events(service, session, compacted, state):
+        logger.info(
+            "ADK session compaction skipped, session changed while compacting",
+            session_id=session_id,
+        )
+        return None
+
+    result = CompactionResult(
+        events_before=len(events),
+        events_after=len(compacted),
+        turns_summarized=(
+            compacted[0].custom_metadata["turns_summarized"]
+            if compacted and is_summary_event(compacted[0])
+            else 0
+        ),
+        routing_events_dropped=sum(1 for event in events if is_routing_event(event)),
+        tokens_before=tokens_before,
+        tokens_after=tokens_after,
+    )
+    logger.info(
+        "ADK session events compacted",
+        session_id=session_id,
+        events_before=result.events_before,
+        events_after=result.events_after,
+        turns_summarized=result.turns_summarized,
+        routing_events_dropped=result.routing_events_dropped,
+        tokens_before=result.tokens_before,
+        tokens_after=result.tokens_after,
+    )
+    return result
+
+
+async def maybe_compact_session(
+    service: BaseSessionService,
+    adk_session: ADKSession,
+    new_events: int = 0,
+    policy: Optional[EventCompactionPolicy] = None,
+) -> Optional[CompactionResult]:
+    """Compact a session once it has reached the policy's event trigger.
+
+    Args:
+        service: Session service holding the session
+        adk_session: Session as loaded for the turn (used for the cheap
+            event-count check only)
+        new_events: Events known to have been appended since it was loaded
+        policy: Limits to apply (defaults to settings)
+    """
+    policy = policy or get_default_policy()
+    if len(adk_session.events) + new_events < policy.trigger_events:
+        return None
+    return await compact_session(
+        service,
+        app_name=adk_session.app_name,
+        user_id=adk_session.user_id,
+        session_id=adk_session.id,
+        policy=policy,
+    )
+
+
+# Background compactions by session ID
+_compactions: Dict[str, "asyncio.Task[Optional[CompactionResult]]"] = {}
+
+
+def _compaction_done(session_id: str, task: "asyncio.Task[Any]") -> None:
+    if _compactions.get(session_id) is task:
+        del _compactions[session_id]
+    if task.cancelled() or task.exception() is None:
+        return
+    error = task.exception()
+    logger.error(
+        "ADK session compaction failed, session left unchanged",
+        session_id=session_id,
+        error=str(error),
+        error_type=type(error).__name__,
+    )
+
+
+def schedule_compaction(
+    service: BaseSessionService,
+    adk_session: ADKSession,
+    new_events: int = 0,
+    policy: Optional[EventCompactionPolicy] = None,
+) -> Optional["asyncio.Task[Optional[CompactionResult]]"]:
+    """Run maybe_compact_session in the background.
+
+    At most one compaction per session runs at a time; failures are logged
+    by the task.
+
+    Returns:
+        The compaction task, or None if the session is below the trigger or
+        already being compacted
+    """
+    policy = policy or get_default_policy()
+    if len(adk_session.events) + new_events < policy.trigger_events:
+        return None
+    if adk_session.id in _compactions:
+        return None
+    task = asyncio.get_running_loop().create_task(
+        maybe_compact_session(service, adk_session, new_events, policy)
+    )
+    _compactions[adk_session.id] = task
+    task.add_done_callback(lambda done: _compaction_done(adk_session.id, done))
+    return task
+
+
+async def wait_for_compaction(session_id: str) -> None:
+    """Wait for a background compaction of the session, if one is running."""
+    task = _compactions.get(session_id)
+    if task is not None:
+        await asyncio.wait([task])
@@ -0,0 +1,362 @@
+"""ADK Firestore Session Service - ADK sessions shared across instances
+
+DatabaseSessionService keeps ADK sessions in an instance-local SQLite file,
+so a turn served by another Cloud Run instance has to rebuild the session
+(see adk_session_rehydration) and scene context is reduced to a summary.
+FirestoreSessionService stores ADK sessions in Firestore instead, so every
+instance sees the same sessions and events.
+
+Layout (collection names from settings):
+
+- ``adk_sessions/{session_id}``: app_name, user_id, session state snapshot,
+  last_update_time and event_count
+- ``adk_sessions/{session_id}/events/{event_id}``: serialized event plus its
+  timestamp for ordering and filtering
+- ``adk_app_states/{app_name}`` and ``adk_user_states/{app_name}:{user_id}``:
+  ``app:`` and ``user:`` prefixed state shared across sessions, as in
+  DatabaseSessionService
+
+Round-trips per operation:
+
+- get_session: one batched get of the session and shared state documents
+  (the state snapshot, so no event replay) concurrently with one events
+  query
+- append_event: one batched write of the event, the changed session state
+  fields and any shared state changes
+- create_session: one batched get of the shared state and one batched write
+- replace_events (event compaction): one get of the session document
+  concurrently with one events query, and one batched write
+
+Select it with ADK_SESSION_BACKEND=firestore.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+from google.adk.sessions.session import Session as ADKSession
+from google.adk.sessions.state import State
+from google.api_core.exceptions import FailedPrecondition, NotFound
+from google.cloud import firestore
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+EVENTS_SUBCOLLECTION = "events"
+
+# Firestore limit on operations in one batched write
+MAX_BATCH_OPERATIONS = 500
+
+
+def split_state(
+    state: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Split state into app, user and session parts; temp: keys are dropped."""
+    app_state: Dict[str, Any] = {}
+    user_state: Dict[str, Any] = {}
+    session_state: Dict[str, Any] = {}
+    for key, value in state.items():
+        if key.startswith(State.APP_PREFIX):
+            app_state[key[len(State.APP_PREFIX) :]] = value
+        elif key.startswith(State.USER_PREFIX):
+            user_state[key[len(State.USER_PREFIX) :]] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session_state[key] = value
+    return app_state, user_state, session_state
+
+
+def merge_state(
+    app_state: Dict[str, Any],
+    user_state: Dict[str, Any],
+    session_state: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Session state with shared state under its app:/user: prefixes."""
+    merged = dict(session_state)
+    merged.update({State.APP_PREFIX + k: v for k, v in app_state.items()})
+    merged.update({State.USER_PREFIX + k: v for k, v in user_state.items()})
+    return merged
+
+
+def encode_event(event: Event) -> Dict[str, Any]:
+    return {
+        "timestamp": event.timestamp,
+        "event": event.model_dump(mode="json", exclude_none=True),
+    }
+
+
+def decode_event(data: Dict[str, Any]) -> Event:
+    return Event.model_validate(data["event"])
+
+
+class FirestoreSessionService(BaseSessionService):
+    """ADK session service persisting sessions and events in Firestore.
+
+    Args:
+        client: Firestore AsyncClient
+        sessions_collection: Collection of session documents
+        app_states_collection: Collection of app-wide state documents
+        user_states_collection: Collection of per-user state documents
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        sessions_collection: Optional[str] = None,
+        app_states_collection: Optional[str] = None,
+        user_states_collection: Optional[str] = None,
+    ):
+        self.client = client
+        self.sessions = client.collection(
+            sessions_collection or settings.adk_firestore_sessions_collection
+        )
+        self.app_states = client.collection(
+            app_states_collection or settings.adk_firestore_app_states_collection
+        )
+        self.user_states = client.collection(
+            user_states_collection or settings.adk_firestore_user_states_collection
+        )
+
+    def _shared_refs(self, app_name: str, user_id: str) -> Tuple[Any, Any]:
+        return (
+            self.app_states.document(app_name),
+            self.user_states.document(f"{app_name}:{user_id}"),
+        )
+
+    async def _get_documents(self, references: List[Any]) -> List[Dict[str, Any]]:
+        """Read documents in one round-trip, in order; missing ones are None."""
+        snapshots = {}
+        async for snapshot in self.client.get_all(references):
+            snapshots[snapshot.reference.path] = snapshot
+        return [
+            snapshots[ref.path].to_dict() if snapshots[ref.path].exists else None
+            for ref in references
+        ]
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> ADKSession:
+        session_ref = (
+            self.sessions.document(session_id.strip())
+            if session_id
+            else self.sessions.document()
+        )
+        app_ref, user_ref = self._shared_refs(app_name, user_id)
+        app_state, user_state, session_state = split_state(state or {})
+
+        stored_app, stored_user = await self._get_documents([app_ref, user_ref])
+
+        now = time.time()
+        batch = self.client.batch()
+        batch.create(
+            session_ref,
+            {
+                "app_name": app_name,
+                "user_id": user_id,
+                "state": session_state,
+                "create_time": now,
+                "last_update_time": now,
+                "event_count": 0,
+            },
+        )
+        if app_state:
+            batch.set(app_ref, app_state, merge=True)
+        if user_state:
+            batch.set(user_ref, user_state, merge=True)
+        await batch.commit()
+
+        return ADKSession(
+            id=session_ref.id,
+            app_name=app_name,
+            user_id=user_id,
+            state=merge_state(
+                {**(stored_app or {}), **app_state},
+                {**(stored_user or {}), **user_state},
+                session_state,
+            ),
+            last_update_time=now,
+        )
+
+    async def _get_events(
+        self, session_ref: Any, config: Optional[GetSessionConfig]
+    ) -> List[Event]:
+        query = session_ref.collection(EVENTS_SUBCOLLECTION)
+        if config and config.after_timestamp:
+            query = query.where("timestamp", ">=", config.after_timestamp)
+        if config and config.num_recent_events:
+            query = query.order_by("timestamp", direction="DESCENDING").limit(
+                config.num_recent_events
+            )
+            docs = list(reversed(await query.get()))
+        else:
+            docs = await query.order_by("timestamp").get()
+        return [decode_event(doc.to_dict()) for doc in docs]
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[ADKSession]:
+        session_ref = self.sessions.document(session_id)
+        app_ref, user_ref = self._shared_refs(app_name, user_id)
+
+        (data, app_state, user_state), events = await asyncio.gather(
+            self._get_documents([session_ref, app_ref, user_ref]),
+            self._get_events(session_ref, config),
+        )
+        if data is None or data["app_name"] != app_name or data["user_id"] != user_id:
+            return None
+
+        return ADKSession(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=merge_state(app_state or {}, user_state or {}, data["state"]),
+            events=events,
+            last_update_time=data["last_update_time"],
+        )
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        query = self.sessions.where("app_name", "==", app_name)
+        if user_id is not None:
+            query = query.where("user_id", "==", user_id)
+        sessions = []
+        for doc in await query.get():
+            data = doc.to_dict()
+            sessions.append(
+                ADKSession(
+                    id=doc.id,
+                    app_name=app_name,
+                    user_id=data["user_id"],
+                    state=data["state"],
+                    last_update_time=data["last_update_time"],
+                )
+            )
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        session_ref = self.sessions.document(session_id)
+        events = await session_ref.collection(EVENTS_SUBCOLLECTION).select([]).get()
+        references = [doc.reference for doc in events] + [session_ref]
+        for start in range(0, len(references), MAX_BATCH_OPERATIONS):
+            batch = self.client.batch()
+            for reference in references[start : start + MAX_BATCH_OPERATIONS]:
+                batch.delete(reference)
+            await batch.commit()
+
+    async def replace_events(
+        self,
+        session: ADKSession,
+        events: List[Event],
+        session_state: Dict[str, Any],
+    ) -> bool:
+        """Replace a session's events and session state in one batched write.
+
+        The write is conditional on the session document not changing since
+        it is read here, and is abandoned if the session was updated since
+        ``session`` was loaded.
+
+        Returns:
+            False if the session is gone, changed, or needs more writes than
+            one batch holds
+        """
+        session_ref = self.sessions.document(session.id)
+        events_ref = session_ref.collection(EVENTS_SUBCOLLECTION)
+        snapshot, stored = await asyncio.gather(
+            session_ref.get(), events_ref.select([]).get()
+        )
+        if (
+            not snapshot.exists
+            or snapshot.get("last_update_time") != session.last_update_time
+        ):
+            return False
+
+        keep = {event.id for event in events}
+        stored_ids = {doc.id for doc in stored}
+        removed = [doc.reference for doc in stored if doc.id not in keep]
+        added = [event for event in events if event.id not in stored_ids]
+        if len(removed) + len(added) + 1 > MAX_BATCH_OPERATIONS:
+            logger.warning(
+                "ADK session too large to replace in one batch",
+                session_id=session.id,
+                writes=len(removed) + len(added) + 1,
+            )
+            return False
+
+        batch = self.client.batch()
+        for reference in removed:
+            batch.delete(reference)
+        for event in added:
+            batch.set(events_ref.document(event.id), encode_event(event))
+        batch.update(
+            session_ref,
+            {"state": session_state, "event_count": len(events)},
+            option=self.client.write_option(last_update_time=snapshot.update_time),
+        )
+        try:
+            await batch.commit()
+        except (FailedPrecondition, NotFound):
+            return False
+        return True
+
+    async def append_event(self, session: ADKSession, event: Event) -> Event:
+        """Persist an event and the state it changes in one batched write.
+
+        Only the keys in the event's state_delta are written, as field paths,
+        so another instance appending to the same session concurrently does
+        not lose its state changes to this instance's in-memory copy.
+
+        Each event is committed on its own: the runner yields an event to the
+        caller as soon as it is appended and has no end-of-invocation hook to
+        flush a buffer, so batching an invocation would lose its events when
+        the invocation is cancelled (e.g. the WebSocket closes mid-turn).
+        """
+        if event.partial:
+            return event
+        event = await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+
+        session_ref = self.sessions.document(session.id)
+        batch = self.client.batch()
+        batch.set(
+            session_ref.collection(EVENTS_SUBCOLLECTION).document(event.id),
+            encode_event(event),
+        )
+        delta = event.actions.state_delta if event.actions else None
+        app_delta, user_delta, session_delta = split_state(delta or {})
+        updates: Dict[str, Any] = {
+            FieldPath("state", key).to_api_repr(): value
+            for key, value in session_delta.items()
+        }
+        updates["last_update_time"] = event.timestamp
+        updates["event_count"] = firestore.Increment(1)
+        batch.update(session_ref, updates)
+        if app_delta or user_delta:
+            app_ref, user_ref = self._shared_refs(session.app_name, session.user_id)
+            if app_delta:
+                batch.set(app_ref, app_delta, merge=True)
+            if user_delta:
+                batch.set(user_ref, user_delta, merge=True)
+        await batch.commit()
+        return event
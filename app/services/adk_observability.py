@@ -18,6 +18,7 @@ Our role is to:
 We do NOT manually create spans for ADK operations - ADK does that automatically.
 """
 
+import importlib
 import os
 from typing import Any, Optional
 
@@ -27,10 +28,6 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
-from opentelemetry.resourcedetector.gcp_resource_detector import (
-    GoogleCloudResourceDetector,
-)
 
 from app.config import get_settings
 from app.utils.logger import get_logger
@@ -38,6 +35,30 @@ from app.utils.logger import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# The GCP exporter and resource detector are only needed when observability is
+# enabled and are slow to import (Cloud Trace client, gRPC stubs), so they are
+# resolved on first use
+_LAZY_EXPORTS = {
+    "CloudTraceSpanExporter": "opentelemetry.exporter.cloud_trace",
+    "GoogleCloudResourceDetector": (
+        "opentelemetry.resourcedetector.gcp_resource_detector"
+    ),
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _exporter(name: str) -> Any:
+    # Prefer a module global (set on first use, or patched in tests)
+    return globals().get(name) or __getattr__(name)
+
 
 class ADKObservability:
     """
@@ -113,7 +134,7 @@ class ADKObservability:
 
         # Try to merge with GCP resource detector
         try:
-            gcp_resource = GoogleCloudResourceDetector().detect()
+            gcp_resource = _exporter("GoogleCloudResourceDetector")().detect()
             resource = resource.merge(gcp_resource)
             logger.debug("GCP resource detection successful")
         except Exception as e:
@@ -127,7 +148,7 @@ class ADKObservability:
             self._tracer_provider = TracerProvider(resource=resource)
 
             # Cloud Trace exporter - sends ADK spans to GCP
-            cloud_trace_exporter = CloudTraceSpanExporter(
+            cloud_trace_exporter = _exporter("CloudTraceSpanExporter")(
                 project_id=settings.gcp_project_id
             )
 
@@ -0,0 +1,247 @@
+"""ADK Session Cache - LRU write-through cache in front of a session service
+
+Every turn loads its ADK session (SessionManager.get_adk_session, then the
+Runner), and DatabaseSessionService deserializes every stored event from
+SQLite each time, even when this instance served the previous turn of the
+session a few seconds earlier.
+
+CachedSessionService wraps a session service and keeps recently used
+sessions in memory:
+
+- get_session is answered from the cache; requests with a GetSessionConfig
+  (event filtering) go to the wrapped service
+- create_session and append_event write through: the wrapped service
+  persists first, then the cached copy is replaced by the updated session,
+  so the cache never holds events that were not stored; an append from a
+  copy that does not extend the cached session evicts it instead
+- delete_session and invalidate (writes made to the wrapped service
+  directly, e.g. by event compaction) evict
+- memory is accounted per session as the serialized size of its events and
+  state; least recently used sessions are evicted beyond ``max_entries`` or
+  ``max_bytes``
+
+Callers get copies, so mutating a returned session (as append_event does)
+never changes the cached one behind the service's back.
+
+Only safe when this process is the only writer of the database, which is
+the case for the instance-local SQLite database.
+"""
+
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+from google.adk.sessions.session import Session as ADKSession
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SessionKey = Tuple[str, str, str]
+
+
+def event_size(event: Event) -> int:
+    """Approximate memory held by an event (its serialized size)."""
+    return len(event.model_dump_json(exclude_none=True))
+
+
+def _state_size(state: Dict[str, Any]) -> int:
+    return len(json.dumps(state, default=str))
+
+
+def _copy_session(session: ADKSession) -> ADKSession:
+    """Copy with its own event list and state; events are shared (immutable)."""
+    return session.model_copy(
+        update={"events": list(session.events), "state": copy.deepcopy(session.state)}
+    )
+
+
+class CachedSessionService(BaseSessionService):
+    """Bounded LRU write-through cache of ADK sessions.
+
+    Args:
+        inner: Session service that persists the sessions
+        max_entries: Maximum number of cached sessions
+        max_bytes: Maximum accounted size of all cached sessions
+    """
+
+    def __init__(
+        self,
+        inner: BaseSessionService,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.inner = inner
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (session, accounted bytes)
+        self._entries: "OrderedDict[SessionKey, Tuple[ADKSession, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "evictions": 0,
+            "evicted_bytes": 0,
+            "write_throughs": 0,
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped service's attributes (e.g. db_engine)
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    @staticmethod
+    def _key(app_name: str, user_id: str, session_id: str) -> SessionKey:
+        return (app_name, user_id, session_id)
+
+    def _store(self, session: ADKSession, size: Optional[int] = None) -> None:
+        """Cache a copy of a session and evict down to the limits."""
+        if not isinstance(session, ADKSession):
+            return
+        if size is None:
+            size = _state_size(session.state) + sum(
+                event_size(event) for event in session.events
+            )
+        key = self._key(session.app_name, session.user_id, session.id)
+        cached = _copy_session(session)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (cached, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+                self._stats["evicted_bytes"] += evicted_size
+                logger.debug(
+                    "ADK session evicted from cache",
+                    session_id=evicted_key[2],
+                    size_bytes=evicted_size,
+                )
+
+    def _evict(self, key: SessionKey) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> ADKSession:
+        session = await self.inner.create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._store(session)
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[ADKSession]:
+        if config is not None:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return await self.inner.get_session(
+                app_name=app_name, user_id=user_id, session_id=session_id, config=config
+            )
+
+        key = self._key(app_name, user_id, session_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return _copy_session(entry[0])
+            self._stats["misses"] += 1
+
+        session = await self.inner.get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+        if session is not None:
+            self._store(session)
+        return session
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        return await self.inner.list_sessions(app_name=app_name, user_id=user_id)
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        self._evict(self._key(app_name, user_id, session_id))
+        await self.inner.delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        )
+
+    async def append_event(self, session: ADKSession, event: Event) -> Event:
+        key = self._key(session.app_name, session.user_id, session.id)
+        try:
+            event = await self.inner.append_event(session, event)
+        except Exception:
+            # The caller's copy may be stale; reload on next access
+            self._evict(key)
+            raise
+        if event.partial:
+            return event
+
+        with self._lock:
+            entry = self._entries.get(key)
+            self._stats["write_throughs"] += 1
+        if entry is not None and len(entry[0].events) + 1 == len(session.events):
+            # Account only the new event instead of re-measuring the session
+            size = entry[1] + event_size(event)
+            size += _state_size(session.state) - _state_size(entry[0].state)
+            self._store(session, size)
+        else:
+            # The caller's copy may predate a write behind the cache (e.g.
+            # event compaction); reload on next access
+            self._evict(key)
+        return event
+
+    def invalidate(self, app_name: str, user_id: str, session_id: str) -> None:
+        """Drop a session written to the wrapped service behind the cache."""
+        self._evict(self._key(app_name, user_id, session_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0
+            return {
+                **self._stats,
+                "total_requests": total,
+                "hit_rate_pct": round(hit_rate, 2),
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
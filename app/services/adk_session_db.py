@@ -0,0 +1,130 @@
+"""SQLite engine configuration for the ADK session database
+
+DatabaseSessionService creates its SQLAlchemy engine from a URL and extra
+engine keyword arguments. With the defaults, a SQLite file uses a rollback
+journal and full fsyncs, and gives up on a locked database after 5 seconds.
+Concurrent turns then serialize on every write, and readers block behind
+writers ("database is locked").
+
+For SQLite URLs this module provides:
+
+- engine_kwargs(): a connection pool sized to the instance concurrency
+- configure_engine(): a connect listener that sets, on every pooled
+  connection:
+    - journal_mode=WAL (readers no longer block on the writer)
+    - synchronous=NORMAL (fsync at checkpoints rather than every commit;
+      safe with WAL)
+    - busy_timeout, so contended writers wait instead of failing
+    - mmap_size and cache_size
+    - auto_vacuum=INCREMENTAL, so space freed by the session GC can be
+      released (applies to new database files; see adk_session_gc)
+
+Other database URLs are left untouched.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class SQLiteTuning:
+    """Pragmas and pool sizing for a SQLite session database.
+
+    Attributes:
+        wal: Use write-ahead logging
+        synchronous: PRAGMA synchronous value (OFF, NORMAL, FULL)
+        busy_timeout_ms: How long a connection waits for a lock
+        mmap_size_mb: Memory-mapped I/O size (0 disables it)
+        cache_size_mb: Page cache size per connection
+        pool_size: Connections kept open
+        max_overflow: Extra connections allowed under burst load
+        incremental_vacuum: Create the database with auto_vacuum=INCREMENTAL
+    """
+
+    wal: bool = True
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size_mb: int = 64
+    cache_size_mb: int = 16
+    pool_size: int = 10
+    max_overflow: int = 5
+    incremental_vacuum: bool = True
+
+    def pragmas(self) -> Dict[str, Any]:
+        pragmas: Dict[str, Any] = {
+            "busy_timeout": self.busy_timeout_ms,
+            "synchronous": self.synchronous,
+            "mmap_size": self.mmap_size_mb * 1024 * 1024,
+            # Negative cache_size is in KiB
+            "cache_size": -self.cache_size_mb * 1024,
+        }
+        if self.wal:
+            pragmas = {"journal_mode": "WAL", **pragmas}
+        if self.incremental_vacuum:
+            # Only applies to a new database, and only before journal_mode=WAL
+            pragmas = {"auto_vacuum": "INCREMENTAL", **pragmas}
+        return pragmas
+
+
+def get_sqlite_tuning() -> SQLiteTuning:
+    """SQLite tuning from settings; the pool follows instance concurrency."""
+    return SQLiteTuning(
+        wal=settings.adk_sqlite_wal,
+        synchronous=settings.adk_sqlite_synchronous,
+        busy_timeout_ms=settings.adk_sqlite_busy_timeout_ms,
+        mmap_size_mb=settings.adk_sqlite_mmap_size_mb,
+        cache_size_mb=settings.adk_sqlite_cache_size_mb,
+        pool_size=settings.adk_db_pool_size or settings.perf_max_concurrent_sessions,
+        max_overflow=settings.adk_db_pool_max_overflow,
+    )
+
+
+def is_sqlite_file_url(db_url: str) -> bool:
+    url = make_url(db_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def engine_kwargs(db_url: str, tuning: SQLiteTuning) -> Dict[str, Any]:
+    """Engine keyword arguments for DatabaseSessionService(db_url, **kwargs)."""
+    if not is_sqlite_file_url(db_url):
+        return {}
+    return {"pool_size": tuning.pool_size, "max_overflow": tuning.max_overflow}
+
+
+def configure_engine(engine: Any, tuning: SQLiteTuning) -> None:
+    """Apply the pragmas to every new connection of a SQLite engine.
+
+    Accepts a sync Engine or an AsyncEngine. Connections already pooled
+    (a sync engine may have connected to create tables) are discarded so
+    every connection in use has the pragmas.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    pragmas = tuning.pragmas()
+
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    event.listen(sync_engine, "connect", set_pragmas)
+    if sync_engine is engine:
+        engine.dispose()
+
+    logger.info("SQLite session database tuned", **pragmas)
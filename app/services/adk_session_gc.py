@@ -0,0 +1,412 @@
+"""ADK Session GC - Remove stale sessions from the local ADK session database
+
+ADK sessions are stored in an instance-local SQLite file
+(/tmp/adk_sessions.db) that nothing cleans up: when a Firestore session is
+closed, times out or is abandoned, its ADK session and events stay in the
+database for the lifetime of the instance. On Cloud Run /tmp is an
+in-memory filesystem, so the file grows the instance's memory use.
+
+AdkSessionCollector runs a periodic sweep:
+
+- sessions closed on this instance (mark_closed) are deleted right away
+- pinned sessions (pin/unpin, e.g. while memory ingestion still needs
+  their events) are kept until unpinned
+- sessions idle longer than ``idle_minutes`` are looked up in Firestore and
+  deleted when the Firestore session is closed, timed out, expired or gone
+- deleted pages are returned to the filesystem with an incremental vacuum
+  (auto_vacuum=INCREMENTAL is enabled once, with a full VACUUM, if the
+  database was created without it) and the WAL is checkpointed
+- database size, free pages and row counts are reported in get_stats()
+  and logged after each sweep
+
+Idle sessions that are still live in Firestore are kept. A deleted session
+that is used again is rebuilt from Firestore (see adk_session_rehydration).
+"""
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from google.adk.sessions import BaseSessionService
+from google.adk.sessions.database_session_service import StorageSession
+from sqlalchemy import select, text
+from sqlalchemy.engine import make_url
+
+from app.config import get_settings
+from app.models.session import SessionStatus
+from app.services.adk_session_service import get_adk_session_service
+from app.services.firestore_tool_data_service import get_firestore_client
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+ADK_TABLES = ("sessions", "events", "app_states", "user_states")
+
+# Firestore statuses whose ADK session is no longer needed
+FINISHED_STATUSES = {SessionStatus.CLOSED.value, SessionStatus.TIMEOUT.value}
+
+
+@dataclass
+class FirestoreSessionState:
+    """Lifecycle fields of a Firestore session document."""
+
+    status: str
+    expires_at: Optional[datetime] = None
+
+    def is_finished(self, now: datetime) -> bool:
+        if self.status in FINISHED_STATUSES:
+            return True
+        return self.expires_at is not None and now > self.expires_at
+
+
+# Maps session IDs to their Firestore state; missing IDs have no document
+SessionStateLookup = Callable[[List[str]], Awaitable[Dict[str, FirestoreSessionState]]]
+
+
+@dataclass
+class LocalSession:
+    """A session row in the local ADK database."""
+
+    session_id: str
+    user_id: str
+    update_time: datetime
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value if isinstance(value, datetime) else None
+
+
+async def firestore_session_states(
+    session_ids: List[str],
+) -> Dict[str, FirestoreSessionState]:
+    """Read status and expiry of Firestore sessions in one batched get."""
+    db = get_firestore_client()
+    collection = db.collection(settings.firestore_sessions_collection)
+    snapshots = db.get_all(
+        [collection.document(session_id) for session_id in session_ids],
+        field_paths=["status", "expires_at"],
+    )
+
+    states = {}
+    async for snapshot in snapshots:
+        if not snapshot.exists:
+            continue
+        data = snapshot.to_dict()
+        states[snapshot.id] = FirestoreSessionState(
+            status=data.get("status", ""),
+            expires_at=_parse_datetime(data.get("expires_at")),
+        )
+    return states
+
+
+async def _run_on_connection(engine: Any, fn: Callable[[Any], Any]) -> Any:
+    """Run fn(sync_connection) on a sync Engine or an AsyncEngine.
+
+    The connection is in autocommit mode, as VACUUM and some pragmas cannot
+    run inside a transaction.
+    """
+    if hasattr(engine, "sync_engine"):
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            return await conn.run_sync(fn)
+
+    def run() -> Any:
+        with engine.connect() as conn:
+            return fn(conn.execution_options(isolation_level="AUTOCOMMIT"))
+
+    return await asyncio.to_thread(run)
+
+
+class AdkSessionCollector:
+    """Deletes stale ADK sessions and keeps the SQLite file compact.
+
+    Args:
+        service: ADK session service (DatabaseSessionService, or a cache
+            wrapping one); deletions go through it so caches stay coherent
+        lookup: Firestore state lookup for idle sessions
+        idle_minutes: Sessions not updated for this long are checked
+        batch_size: Maximum sessions checked per sweep
+        vacuum_pages: Free pages released per sweep (0 releases all)
+    """
+
+    def __init__(
+        self,
+        service: BaseSessionService,
+        lookup: Optional[SessionStateLookup] = None,
+        app_name: Optional[str] = None,
+        idle_minutes: float = 15,
+        batch_size: int = 200,
+        vacuum_pages: int = 1000,
+    ):
+        self.service = service
+        self.lookup = lookup or firestore_session_states
+        self.app_name = app_name or settings.app_name
+        self.idle_minutes = idle_minutes
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+        self._closed: Set[str] = set()
+        self._pinned: Set[str] = set()
+        self._lock = threading.Lock()
+        self._sweep_lock = asyncio.Lock()
+        self._auto_vacuum_ready = False
+        self._task: Optional[asyncio.Task] = None
+        self._metrics: Dict[str, Any] = {}
+        self._stats = {
+            "sweeps": 0,
+            "sessions_checked": 0,
+            "sessions_deleted": 0,
+            "pages_vacuumed": 0,
+            "errors": 0,
+            "last_sweep_ms": 0.0,
+        }
+
+    @property
+    def engine(self) -> Any:
+        return self.service.db_engine
+
+    def mark_closed(self, session_id: str) -> None:
+        """Delete this session's ADK session on the next sweep."""
+        with self._lock:
+            self._closed.add(session_id)
+
+    def pin(self, session_id: str) -> None:
+        """Keep this session's ADK session until unpin is called."""
+        with self._lock:
+            self._pinned.add(session_id)
+
+    def unpin(self, session_id: str) -> None:
+        with self._lock:
+            self._pinned.discard(session_id)
+
+    async def _local_sessions(self, closed: Iterable[str]) -> List[LocalSession]:
+        """Local sessions that are closed here or idle past the cutoff."""
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            minutes=self.idle_minutes
+        )
+        closed = list(closed)
+
+        def query(conn: Any) -> List[LocalSession]:
+            condition = StorageSession.update_time < cutoff
+            order = [StorageSession.update_time]
+            if closed:
+                is_closed = StorageSession.id.in_(closed)
+                condition = condition | is_closed
+                order.insert(0, is_closed.desc())
+            rows = conn.execute(
+                select(
+                    StorageSession.id,
+                    StorageSession.user_id,
+                    StorageSession.update_time,
+                )
+                .where(StorageSession.app_name == self.app_name, condition)
+                .order_by(*order)
+                .limit(self.batch_size)
+            )
+            return [LocalSession(*row) for row in rows]
+
+        return await _run_on_connection(self.engine, query)
+
+    async def _stale_sessions(
+        self, candidates: List[LocalSession], closed: Set[str]
+    ) -> List[LocalSession]:
+        to_check = [s.session_id for s in candidates if s.session_id not in closed]
+        states = await self.lookup(to_check) if to_check else {}
+        now = datetime.now(timezone.utc)
+        stale = []
+        for local in candidates:
+            if local.session_id in closed:
+                stale.append(local)
+                continue
+            state = states.get(local.session_id)
+            if state is None or state.is_finished(now):
+                stale.append(local)
+        return stale
+
+    async def sweep(self) -> Dict[str, Any]:
+        """Delete stale sessions, vacuum and refresh the database metrics."""
+        async with self._sweep_lock:
+            start = time.perf_counter()
+            with self._lock:
+                closed = set(self._closed)
+                pinned = set(self._pinned)
+
+            deleted = 0
+            try:
+                candidates = await self._local_sessions(closed)
+                stale = await self._stale_sessions(candidates, closed)
+                stale = [s for s in stale if s.session_id not in pinned]
+                for local in stale:
+                    await self.service.delete_session(
+                        app_name=self.app_name,
+                        user_id=local.user_id,
+                        session_id=local.session_id,
+                    )
+                    deleted += 1
+                done = {s.session_id for s in stale}
+                if len(candidates) < self.batch_size:
+                    # Not truncated: closed sessions not found are not stored here
+                    done |= closed - pinned
+                with self._lock:
+                    self._closed -= done
+                    self._stats["sessions_checked"] += len(candidates)
+
+                vacuumed = await self.vacuum() if deleted else 0
+                await self.collect_metrics()
+            except Exception as e:
+                with self._lock:
+                    self._stats["errors"] += 1
+                    self._stats["sessions_deleted"] += deleted
+                logger.warning("ADK session GC sweep failed", error=str(e))
+                raise
+
+            duration_ms = round((time.perf_counter() - start) * 1000, 1)
+            with self._lock:
+                self._stats["sweeps"] += 1
+                self._stats["sessions_deleted"] += deleted
+                self._stats["pages_vacuumed"] += vacuumed
+                self._stats["last_sweep_ms"] = duration_ms
+
+            logger.info(
+                "ADK session GC sweep complete",
+                checked=len(candidates),
+                deleted=deleted,
+                pages_vacuumed=vacuumed,
+                duration_ms=duration_ms,
+                **self._metrics,
+            )
+            return self.get_stats()
+
+    async def _ensure_incremental_vacuum(self) -> None:
+        """Switch the database to auto_vacuum=INCREMENTAL (once)."""
+        if self._auto_vacuum_ready:
+            return
+
+        def enable(conn: Any) -> None:
+            mode = conn.execute(text("PRAGMA auto_vacuum")).scalar()
+            if mode != 2:
+                # Only takes effect for an existing database after VACUUM
+                conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+                conn.execute(text("VACUUM"))
+                logger.info("ADK session database switched to incremental vacuum")
+
+        await _run_on_connection(self.engine, enable)
+        self._auto_vacuum_ready = True
+
+    async def vacuum(self) -> int:
+        """Release free pages and checkpoint the WAL; returns pages released."""
+        if self.engine.dialect.name != "sqlite":
+            return 0
+        await self._ensure_incremental_vacuum()
+
+        def run(conn: Any) -> int:
+            before = conn.execute(text("PRAGMA freelist_count")).scalar()
+            target = max(before - self.vacuum_pages, 0) if self.vacuum_pages else 0
+            free = before
+            # The sqlite3 driver steps a statement without result rows once,
+            # which releases a single page; repeat until the target is met
+            while free > target:
+                conn.execute(text(f"PRAGMA incremental_vacuum({free - target})"))
+                remaining = conn.execute(text("PRAGMA freelist_count")).scalar()
+                if remaining >= free:
+                    break
+                free = remaining
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)")).fetchall()
+            return before - free
+
+        return await _run_on_connection(self.engine, run)
+
+    async def collect_metrics(self) -> Dict[str, Any]:
+        """Database file size, free pages and row counts per ADK table."""
+
+        def measure(conn: Any) -> Dict[str, Any]:
+            metrics: Dict[str, Any] = {}
+            for table in ADK_TABLES:
+                metrics[f"{table}_rows"] = conn.execute(
+                    text(f"SELECT COUNT(*) FROM {table}")
+                ).scalar()
+            if conn.dialect.name == "sqlite":
+                page_size = conn.execute(text("PRAGMA page_size")).scalar()
+                page_count = conn.execute(text("PRAGMA page_count")).scalar()
+                free_pages = conn.execute(text("PRAGMA freelist_count")).scalar()
+                metrics["db_size_bytes"] = page_size * page_count
+                metrics["free_bytes"] = page_size * free_pages
+            return metrics
+
+        metrics = await _run_on_connection(self.engine, measure)
+        database = make_url(str(self.engine.url)).database
+        if database and os.path.exists(f"{database}-wal"):
+            metrics["wal_size_bytes"] = os.path.getsize(f"{database}-wal")
+        with self._lock:
+            self._metrics = metrics
+        return metrics
+
+    def start(self, interval_seconds: float) -> None:
+        """Start a background task sweeping every interval."""
+        if self._task and not self._task.done():
+            return
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    await self.sweep()
+                except Exception:
+                    # Already logged in sweep; keep the loop alive
+                    pass
+
+        self._task = asyncio.get_running_loop().create_task(_loop())
+        logger.info("ADK session GC started", interval=interval_seconds)
+
+    async def stop(self) -> None:
+        """Cancel the background sweep task."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                **self._metrics,
+                "pending_closed": len(self._closed),
+                "pinned": len(self._pinned),
+            }
+
+
+_collector: Optional[AdkSessionCollector] = None
+_init_lock = threading.Lock()
+
+
+def get_adk_session_collector() -> AdkSessionCollector:
+    """Get the singleton ADK session collector."""
+    global _collector
+
+    if _collector is None:
+        with _init_lock:
+            if _collector is None:
+                _collector = AdkSessionCollector(
+                    get_adk_session_service(),
+                    idle_minutes=settings.adk_gc_idle_minutes,
+                    batch_size=settings.adk_gc_batch_size,
+                    vacuum_pages=settings.adk_gc_vacuum_pages,
+                )
+    return _collector
+
+
+def reset_adk_session_collector() -> None:
+    """Reset the collector singleton for testing purposes."""
+    global _collector
+    _collector = None
@@ -0,0 +1,240 @@
+"""ADK Session Rehydration - Rebuild local ADK sessions from Firestore
+
+ADK sessions live in the instance-local SQLite database, while Firestore is
+the source of truth for the conversation. When a turn lands on a new or
+restarted Cloud Run instance, the local ADK session is missing; creating an
+empty one would lose all scene context.
+
+Rehydration recreates the session with a compact event history instead of
+replaying the full conversation:
+
+- a summary event for older turns (the same kind of event that event
+  compaction produces, so later compactions fold into it)
+- the most recent turns as user / partner_agent events
+
+The plan (digest plus recent turns) comes from the rolling context summary
+stored in the session metadata, so building it does not depend on history
+length. Plans are kept in an LRU cache keyed by session and turn count, so
+a session rehydrated again (e.g. after local GC) is rebuilt without
+re-deriving it from the history.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService
+from google.adk.sessions.session import Session as ADKSession
+from google.genai import types
+
+from app.config import get_settings
+from app.models.session import Session
+from app.services.adk_event_compaction import build_summary_event
+from app.services.context_manager import get_context_manager
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+PARTNER_AUTHOR = "partner_agent"
+
+# Session state key recording how many turns were rehydrated
+REHYDRATION_STATE_KEY = "rehydrated_turns"
+
+
+@dataclass
+class RehydrationPlan:
+    """Compact history to rebuild an ADK session from.
+
+    Attributes:
+        total_turns: Turns in the Firestore history
+        turns_summarized: Turns represented only by the digest
+        digest: One-line description of the summarized turns
+        recent: (turn_number, user_input, partner_response) of recent turns
+    """
+
+    total_turns: int
+    turns_summarized: int
+    digest: str
+    recent: List[Tuple[int, str, str]] = field(default_factory=list)
+
+
+class RehydrationCache:
+    """LRU cache of rehydration plans keyed by (session_id, total_turns).
+
+    Args:
+        max_entries: Number of plans kept
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[Tuple[str, int], RehydrationPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "rehydrations": 0}
+
+    def get(self, session_id: str, total_turns: int) -> Optional[RehydrationPlan]:
+        with self._lock:
+            plan = self._plans.get((session_id, total_turns))
+            if plan is None:
+                self._stats["misses"] += 1
+                return None
+            self._plans.move_to_end((session_id, total_turns))
+            self._stats["hits"] += 1
+            return plan
+
+    def put(self, session_id: str, plan: RehydrationPlan) -> None:
+        with self._lock:
+            self._plans[(session_id, plan.total_turns)] = plan
+            self._plans.move_to_end((session_id, plan.total_turns))
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def record_rehydration(self) -> None:
+        with self._lock:
+            self._stats["rehydrations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0
+            return {
+                **self._stats,
+                "total_requests": total,
+                "hit_rate_pct": round(hit_rate, 2),
+                "entries": len(self._plans),
+            }
+
+
+def build_plan(session: Session) -> RehydrationPlan:
+    """Plan a compact history from the session's rolling context summary."""
+    summary = get_context_manager().summary_for(session)
+    return RehydrationPlan(
+        total_turns=summary.total_turns,
+        turns_summarized=summary.summarized_turns,
+        digest=summary.digest(),
+        recent=[
+            (turn["turn_number"], turn["user_input"], turn["partner_response"])
+            for turn in summary.recent
+        ],
+    )
+
+
+def plan_events(plan: RehydrationPlan, session_id: str) -> List[Event]:
+    """Events for a plan, timestamped in order just before now."""
+    timestamp = time.time() - 2 * len(plan.recent) - 1
+    events: List[Event] = []
+    if plan.turns_summarized:
+        events.append(
+            build_summary_event(
+                [f"Earlier turns: {plan.digest}"],
+                plan.turns_summarized,
+                invocation_id=f"rehydrate-{session_id}",
+                timestamp=timestamp,
+            )
+        )
+    for turn_number, user_input, partner_response in plan.recent:
+        invocation_id = f"rehydrate-{session_id}-{turn_number}"
+        timestamp += 1
+        events.append(
+            Event(
+                invocation_id=invocation_id,
+                author="user",
+                content=types.Content(
+                    role="user",
+                    parts=[types.Part(text=f"Turn {turn_number}: {user_input}")],
+                ),
+                timestamp=timestamp,
+            )
+        )
+        timestamp += 1
+        events.append(
+            Event(
+                invocation_id=invocation_id,
+                author=PARTNER_AUTHOR,
+                content=types.Content(
+                    role="model", parts=[types.Part(text=partner_response)]
+                ),
+                timestamp=timestamp,
+            )
+        )
+    return events
+
+
+async def rehydrate_adk_session(
+    service: BaseSessionService,
+    session: Session,
+    state: Dict[str, Any],
+    cache: Optional["RehydrationCache"] = None,
+) -> ADKSession:
+    """Create the ADK session for a Firestore session with a compact history.
+
+    Args:
+        service: ADK session service to create the session in
+        session: Firestore session (source of truth)
+        state: Initial ADK session state
+        cache: Plan cache (defaults to the process-wide cache)
+
+    Returns:
+        The created ADK session, with the rehydrated events appended
+    """
+    cache = cache or get_rehydration_cache()
+    total_turns = len(session.conversation_history)
+
+    plan = cache.get(session.session_id, total_turns) if total_turns else None
+    if plan is None and total_turns:
+        plan = build_plan(session)
+        cache.put(session.session_id, plan)
+
+    adk_session = await service.create_session(
+        app_name=settings.app_name,
+        user_id=session.user_id,
+        session_id=session.session_id,
+        state={**state, REHYDRATION_STATE_KEY: total_turns} if plan else state,
+    )
+    if plan is None:
+        return adk_session
+
+    events = plan_events(plan, session.session_id)
+    for event in events:
+        await service.append_event(adk_session, event)
+    cache.record_rehydration()
+
+    logger.info(
+        "ADK session rehydrated from Firestore history",
+        session_id=session.session_id,
+        history_turns=total_turns,
+        turns_summarized=plan.turns_summarized,
+        events=len(events),
+    )
+    return adk_session
+
+
+_rehydration_cache: Optional[RehydrationCache] = None
+_init_lock = threading.Lock()
+
+
+def get_rehydration_cache() -> RehydrationCache:
+    """Get the singleton rehydration plan cache."""
+    global _rehydration_cache
+
+    if _rehydration_cache is None:
+        with _init_lock:
+            if _rehydration_cache is None:
+                _rehydration_cache = RehydrationCache(
+                    max_entries=settings.adk_rehydration_cache_size
+                )
+    return _rehydration_cache
+
+
+def reset_rehydration_cache() -> None:
+    """Reset the rehydration cache singleton for testing purposes."""
+    global _rehydration_cache
+    _rehydration_cache = None
@@ -24,29 +24,45 @@ Usage:
 
 import threading
 from typing import Optional, Dict, Any
-from google.adk.sessions import DatabaseSessionService
+from google.adk.sessions import BaseSessionService, DatabaseSessionService
 from google.adk.sessions.session import Session as ADKSession
 from app.config import get_settings
+from app.services.adk_firestore_session_service import FirestoreSessionService
+from app.services.adk_session_cache import CachedSessionService
+from app.services.adk_session_db import (
+    configure_engine,
+    engine_kwargs,
+    get_sqlite_tuning,
+)
+from app.services.firestore_tool_data_service import get_firestore_client
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-_session_service: Optional[DatabaseSessionService] = None
+_session_service: Optional[BaseSessionService] = None
 _init_lock = threading.Lock()
 
 
-def get_adk_session_service() -> DatabaseSessionService:
+def get_adk_session_service() -> BaseSessionService:
     """Get singleton ADK DatabaseSessionService instance.
 
     Uses SQLite for persistence. The database file is auto-created
-    and tables are auto-managed by ADK's DatabaseSessionService.
+    and tables are auto-managed by ADK's DatabaseSessionService. SQLite
+    files get WAL mode, tuned pragmas and a sized connection pool (see
+    adk_session_db). Unless ADK_SESSION_CACHE_ENABLED is false, the service
+    is wrapped in an in-memory LRU write-through cache (see
+    adk_session_cache); the database service is then its ``inner``.
+
+    With ADK_SESSION_BACKEND=firestore, sessions are stored in Firestore
+    instead (see adk_firestore_session_service) and shared by all
+    instances; that service is not cached, as other instances write too.
 
     The database URL uses the async SQLite driver (aiosqlite) which is
     required for ADK's async session operations.
 
     Returns:
-        DatabaseSessionService: Shared session service instance
+        BaseSessionService: Shared session service instance
 
     Note:
         This function is thread-safe using double-checked locking pattern.
@@ -58,12 +74,30 @@ def get_adk_session_service() -> DatabaseSessionService:
         return _session_service
 
     with _init_lock:
-        if _session_service is None:
+        if _session_service is None and settings.adk_session_backend == "firestore":
+            logger.info(
+                "Initializing ADK FirestoreSessionService",
+                collection=settings.adk_firestore_sessions_collection,
+            )
+            _session_service = FirestoreSessionService(get_firestore_client())
+        elif _session_service is None:
             logger.info(
                 "Initializing ADK DatabaseSessionService",
                 db_url=settings.adk_database_url,
             )
-            _session_service = DatabaseSessionService(db_url=settings.adk_database_url)
+            tuning = get_sqlite_tuning()
+            service = DatabaseSessionService(
+                db_url=settings.adk_database_url,
+                **engine_kwargs(settings.adk_database_url, tuning),
+            )
+            configure_engine(service.db_engine, tuning)
+            if settings.adk_session_cache_enabled:
+                service = CachedSessionService(
+                    service,
+                    max_entries=settings.adk_session_cache_max_entries,
+                    max_bytes=settings.adk_session_cache_max_mb * 1024 * 1024,
+                )
+            _session_service = service
             logger.info("ADK DatabaseSessionService initialized successfully")
 
     return _session_service
@@ -81,9 +115,10 @@ async def close_adk_session_service() -> None:
     """
     global _session_service
     if _session_service is not None:
-        await _session_service.db_engine.dispose()
+        if hasattr(_session_service, "db_engine"):
+            await _session_service.db_engine.dispose()
         _session_service = None
-        logger.info("ADK DatabaseSessionService closed")
+        logger.info("ADK session service closed")
 
 
 def reset_adk_session_service() -> None:
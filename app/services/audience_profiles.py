@@ -0,0 +1,114 @@
+"""Audience Profiles - Precomputed traits for audience archetypes
+
+Audience tools classify members by occupation (for demographic-appropriate
+suggestions), engagement style and improv experience. The classifiers here are
+shared by the audience toolset and by the archetype profile table, which is
+built once per tool data snapshot so suggestion generation can sample
+precomputed profiles instead of copying and re-parsing archetype documents on
+every call.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, NamedTuple
+
+# Fallback demographic category when no occupation matches
+MIXED = "mixed"
+
+# Demographic categories in priority order: when an audience contains several,
+# the first listed wins
+DEMOGRAPHIC_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("tech", ("tech", "engineer", "developer")),
+    ("healthcare", ("doctor", "nurse", "medical")),
+    ("education", ("teacher", "professor", "educator")),
+    ("arts", ("artist", "actor", "creative")),
+    ("finance", ("banker", "finance", "investor")),
+)
+
+_DEMOGRAPHIC_PRIORITY = {
+    category: rank for rank, (category, _) in enumerate(DEMOGRAPHIC_KEYWORDS)
+}
+
+HIGH_ENGAGEMENT = "high"
+LOW_ENGAGEMENT = "low"
+EXPERIENCED = "experienced"
+BEGINNER = "beginner"
+
+
+@lru_cache(maxsize=1024)
+def classify_occupation(occupation: str) -> str:
+    """Map a free-text occupation to a demographic category."""
+    occupation = occupation.lower()
+    for category, keywords in DEMOGRAPHIC_KEYWORDS:
+        if any(keyword in occupation for keyword in keywords):
+            return category
+    return MIXED
+
+
+@lru_cache(maxsize=1024)
+def classify_engagement(engagement_style: str) -> Optional[str]:
+    """Classify an engagement style as high, low, or neither (None)."""
+    engagement_style = engagement_style.lower()
+    if "vocal" in engagement_style or "expressive" in engagement_style:
+        return HIGH_ENGAGEMENT
+    if "quiet" in engagement_style or "reserved" in engagement_style:
+        return LOW_ENGAGEMENT
+    return None
+
+
+@lru_cache(maxsize=1024)
+def classify_experience(improv_knowledge: str) -> Optional[str]:
+    """Classify improv knowledge as experienced, beginner, or neither (None)."""
+    improv_knowledge = improv_knowledge.lower()
+    if "extensive" in improv_knowledge or "professional" in improv_knowledge:
+        return EXPERIENCED
+    if "no prior" in improv_knowledge or "limited" in improv_knowledge:
+        return BEGINNER
+    return None
+
+
+def member_demographic(member: Dict[str, Any]) -> str:
+    """Demographic category of one audience member (MIXED if unknown)."""
+    demographics = member.get("demographics") or {}
+    occupation = (
+        demographics.get("occupation", "") if isinstance(demographics, dict) else ""
+    )
+    return classify_occupation(occupation) if occupation else MIXED
+
+
+def dominant_demographic(categories: Iterable[str]) -> str:
+    """Pick the highest-priority demographic category present, else MIXED."""
+    best = MIXED
+    best_rank = len(DEMOGRAPHIC_KEYWORDS)
+    for category in categories:
+        rank = _DEMOGRAPHIC_PRIORITY.get(category, best_rank)
+        if rank < best_rank:
+            best, best_rank = category, rank
+            if rank == 0:
+                break
+    return best
+
+
+class ArchetypeProfile(NamedTuple):
+    """Precomputed traits of one audience archetype."""
+
+    archetype_id: str
+    name: str
+    demographic: str
+    engagement: Optional[str]
+    experience: Optional[str]
+
+
+def build_archetype_profiles(
+    archetypes: Iterable[Dict[str, Any]],
+) -> Tuple[ArchetypeProfile, ...]:
+    """Build the profile table for a set of archetype documents."""
+    return tuple(
+        ArchetypeProfile(
+            archetype_id=archetype.get("id", ""),
+            name=archetype.get("name", ""),
+            demographic=member_demographic(archetype),
+            engagement=classify_engagement(str(archetype.get("engagement_style", ""))),
+            experience=classify_experience(str(archetype.get("improv_knowledge", ""))),
+        )
+        for archetype in archetypes
+    )
@@ -1,10 +1,27 @@
-"""Content Filtering Service for User Input Validation"""
-
+"""Content Filtering Service for User Input Validation
+
+Every pattern list is compiled into one CompiledPatternSet (see
+content_filter_engine) when the lexicon is loaded, so each input is scanned
+once for all categories. The lexicon can be replaced at runtime: from a JSON
+file that is re-read when its modification time changes, or directly via
+ContentFilter.reload_lexicon. A lexicon that fails to load or compile leaves
+the current one in place.
+"""
+
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.config import get_settings
+from app.services.content_filter_engine import CompiledPatternSet
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class ContentFilterResult:
@@ -19,12 +36,98 @@ class ContentFilterResult:
         self.severity = severity
 
 
+@dataclass(frozen=True)
+class ContentLexicon:
+    """Pattern lists checked by the content filter, compiled once per load.
+
+    Attributes:
+        severe: Patterns that always block the input
+        profanity: Patterns reported as profanity warnings
+        toxic: Patterns reported as toxic behavior warnings
+        strong_profanity: Profanity counted towards "high" severity
+        source: Where the lists came from ("builtin" or a file path)
+        matcher: All categories compiled into a single-pass pattern set
+    """
+
+    severe: Tuple[str, ...]
+    profanity: Tuple[str, ...]
+    toxic: Tuple[str, ...]
+    strong_profanity: Tuple[str, ...]
+    source: str = "builtin"
+    matcher: CompiledPatternSet = field(init=False, repr=False, compare=False)
+
+    CATEGORIES = ("severe", "profanity", "toxic", "strong_profanity")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "matcher",
+            CompiledPatternSet(
+                {category: getattr(self, category) for category in self.CATEGORIES}
+            ),
+        )
+
+    @classmethod
+    def builtin(cls) -> "ContentLexicon":
+        """Lexicon of the pattern lists defined on ContentFilter."""
+        return cls.from_dict({})
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Sequence[str]], source: str = "builtin"
+    ) -> "ContentLexicon":
+        """Build from category lists; missing categories keep the built-in lists.
+
+        Raises:
+            ValueError: If a category is unknown or not a list of strings
+            re.error: If a pattern does not compile
+        """
+        unknown = set(data) - set(cls.CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown lexicon categories: {sorted(unknown)}")
+        defaults = {
+            "severe": ContentFilter.SEVERE_PATTERNS,
+            "profanity": ContentFilter.PROFANITY_PATTERNS,
+            "toxic": ContentFilter.TOXIC_PATTERNS,
+            "strong_profanity": ContentFilter.STRONG_PROFANITY_PATTERNS,
+        }
+        lists = {}
+        for category in cls.CATEGORIES:
+            patterns = data.get(category, defaults[category])
+            if isinstance(patterns, str) or not all(
+                isinstance(pattern, str) for pattern in patterns
+            ):
+                raise ValueError(f"Lexicon category {category} must list strings")
+            lists[category] = tuple(patterns)
+        return cls(**lists, source=source)
+
+    @classmethod
+    def load(cls, path: str) -> "ContentLexicon":
+        """Load a JSON object of category -> pattern list from a file.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON or has invalid categories
+            re.error: If a pattern does not compile
+        """
+        with open(path, encoding="utf-8") as lexicon_file:
+            data = json.load(lexicon_file)
+        if not isinstance(data, dict):
+            raise ValueError("Lexicon file must contain a JSON object")
+        return cls.from_dict(data, source=path)
+
+
 class ContentFilter:
     """
     Filters user input for offensive content and toxicity.
 
     Uses regex patterns to detect profanity, hate speech, and toxic behavior.
     Designed for improv context where some edgy content may be acceptable in character.
+
+    Args:
+        lexicon_path: JSON lexicon file; empty uses the built-in pattern lists
+        reload_interval: Seconds between checks of the lexicon file for
+            changes; 0 disables hot reloading
     """
 
     PROFANITY_PATTERNS = [
@@ -62,13 +165,97 @@ class ContentFilter:
         r"\byou\s+suck",
     ]
 
-    def __init__(self):
+    # More than two of these makes profanity "high" severity
+    STRONG_PROFANITY_PATTERNS = [
+        r"\bf+u+c+k+",
+        r"\bs+h+i+t+",
+        r"\bbullshit",
+        r"\bc+u+n+t+",
+        r"\ba+s+s+h+o+l+e+",
+        r"\bb+i+t+c+h+",
+    ]
+
+    def __init__(self, lexicon_path: str = "", reload_interval: float = 0.0):
         self._stats = {
             "total_checks": 0,
             "blocked": 0,
             "warnings": 0,
             "by_severity": {"severe": 0, "high": 0, "medium": 0, "low": 0},
+            "lexicon_reloads": 0,
+            "lexicon_reload_errors": 0,
         }
+        self._lexicon_path = lexicon_path
+        self._reload_interval = reload_interval
+        self._reload_lock = threading.Lock()
+        self._lexicon_mtime: Optional[float] = None
+        self._next_reload_check = time.monotonic() + reload_interval
+        if lexicon_path:
+            # A missing or broken file at startup is fatal: it is configuration
+            self._lexicon_mtime = os.stat(lexicon_path).st_mtime
+            self._lexicon = ContentLexicon.load(lexicon_path)
+        else:
+            self._lexicon = ContentLexicon.builtin()
+
+    @property
+    def lexicon(self) -> ContentLexicon:
+        return self._lexicon
+
+    def reload_lexicon(
+        self, lexicon: Optional[ContentLexicon] = None
+    ) -> ContentLexicon:
+        """Swap in a new lexicon, by default re-read from the lexicon file.
+
+        The lexicon is compiled before the swap; concurrent checks keep using
+        the previous one until it is in place.
+
+        Raises:
+            OSError, ValueError, re.error: If the file cannot be loaded; the
+                current lexicon stays in place
+        """
+        if lexicon is None:
+            if self._lexicon_path:
+                mtime = os.stat(self._lexicon_path).st_mtime
+                lexicon = ContentLexicon.load(self._lexicon_path)
+                self._lexicon_mtime = mtime
+            else:
+                lexicon = ContentLexicon.builtin()
+        self._lexicon = lexicon
+        self._stats["lexicon_reloads"] += 1
+        logger.info(
+            "Content filter lexicon loaded",
+            source=lexicon.source,
+            patterns=len(lexicon.matcher),
+        )
+        return lexicon
+
+    def _maybe_reload_lexicon(self) -> None:
+        """Reload the lexicon file if it changed since the last check."""
+        if not self._lexicon_path or self._reload_interval <= 0:
+            return
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        # One caller checks; the others keep filtering with the current lexicon
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        mtime = None
+        try:
+            self._next_reload_check = now + self._reload_interval
+            mtime = os.stat(self._lexicon_path).st_mtime
+            if mtime != self._lexicon_mtime:
+                self.reload_lexicon()
+        except (OSError, ValueError, re.error) as e:
+            # A broken file is retried once it changes again
+            if mtime is not None:
+                self._lexicon_mtime = mtime
+            self._stats["lexicon_reload_errors"] += 1
+            logger.error(
+                "Content filter lexicon reload failed, keeping current lexicon",
+                path=self._lexicon_path,
+                error=str(e),
+            )
+        finally:
+            self._reload_lock.release()
 
     def filter_input(self, user_input: str) -> ContentFilterResult:
         """
@@ -81,13 +268,14 @@ class ContentFilter:
             ContentFilterResult with filtering decision and details
         """
         self._stats["total_checks"] += 1
+        self._maybe_reload_lexicon()
 
         violations: List[str] = []
         severity = "none"
 
-        input_lower = user_input.lower()
+        matches = self._lexicon.matcher.scan(user_input)
 
-        severe_matches = self._check_patterns(input_lower, self.SEVERE_PATTERNS)
+        severe_matches = matches.patterns.get("severe", ())
         if severe_matches:
             violations.extend([f"severe:{match}" for match in severe_matches])
             severity = "severe"
@@ -108,19 +296,14 @@ class ContentFilter:
                 severity=severity,
             )
 
-        profanity_matches = self._check_patterns(input_lower, self.PROFANITY_PATTERNS)
+        profanity_matches = matches.patterns.get("profanity", ())
         if profanity_matches:
             violations.extend([f"profanity:{match}" for match in profanity_matches])
-            profanity_count = len(
-                re.findall(
-                    r"\b(?:f+u+c+k+|s+h+i+t+|bullshit|c+u+n+t+|a+s+s+h+o+l+e+|b+i+t+c+h+)",
-                    input_lower,
-                )
-            )
+            profanity_count = matches.counts["strong_profanity"]
             severity = "high" if profanity_count > 2 else "medium"
             self._stats["by_severity"][severity] += 1
 
-        toxic_matches = self._check_patterns(input_lower, self.TOXIC_PATTERNS)
+        toxic_matches = matches.patterns.get("toxic", ())
         if toxic_matches:
             violations.extend([f"toxic:{match}" for match in toxic_matches])
             if severity == "none":
@@ -148,14 +331,6 @@ class ContentFilter:
             severity=severity,
         )
 
-    def _check_patterns(self, text: str, patterns: List[str]) -> List[str]:
-        """Check text against list of regex patterns"""
-        matches = []
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                matches.append(pattern)
-        return matches
-
     def is_toxic(self, user_input: str) -> bool:
         """
         Quick check if input contains toxic content.
@@ -182,6 +357,10 @@ class ContentFilter:
                 else 0.0
             ),
             "by_severity": self._stats["by_severity"].copy(),
+            "lexicon_source": self._lexicon.source,
+            "lexicon_patterns": len(self._lexicon.matcher),
+            "lexicon_reloads": self._stats["lexicon_reloads"],
+            "lexicon_reload_errors": self._stats["lexicon_reload_errors"],
         }
 
 
@@ -192,5 +371,8 @@ def get_content_filter() -> ContentFilter:
     """Get singleton content filter instance"""
     global _filter_instance
     if _filter_instance is None:
-        _filter_instance = ContentFilter()
+        _filter_instance = ContentFilter(
+            lexicon_path=settings.content_filter_lexicon_path,
+            reload_interval=settings.content_filter_reload_seconds,
+        )
     return _filter_instance
@@ -0,0 +1,306 @@
+"""Content Filter Engine - Single-pass matching of a categorized regex lexicon
+
+The content filter checks every turn and welcome submission against several
+pattern lists. Calling ``re.search`` once per pattern walks the text once per
+pattern. CompiledPatternSet merges every pattern of every category into one
+alternation, compiled once per lexicon, and reports all matching patterns and
+categories from a single scan.
+
+How one scan finds every pattern: the alternation is wrapped in a lookahead,
+so it is tried at every text position and reports each position where some
+pattern matches. At those positions only, an anchored alternation of the
+patterns that can start with the character there, each wrapped in a group,
+reports the first that matches; the alternatives after it are checked the
+same way until none is left.
+
+Trying the alternation at every position is slower than a handful of
+``re.search`` calls, which reject most positions on their first instruction.
+The merged pattern therefore starts with a guard derived from the parsed
+patterns: a word boundary when every pattern starts with ``\b``, and a
+character class of every character a match can start with. Positions failing
+the guard, the bulk of any text, cost a couple of C-level checks and no
+Python-level work; see tests/test_performance/test_content_filter_benchmark.py.
+
+The guard is derived with the standard library's regex parser, which is
+private (``re._parser`` as of Python 3.11, the version the Dockerfile pins).
+On an interpreter without it, patterns are searched one at a time instead.
+
+Patterns are combined as written, so backreferences and named groups are not
+supported; a lexicon using them fails to compile.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    # Private modules, present under these names since Python 3.11
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - depends on the interpreter
+    sre_constants = sre_parse = None
+
+# Characters whose candidate patterns are remembered (bounds inputs without
+# a first-character guard)
+MAX_CACHED_CHARS = 4096
+
+_CATEGORY_ESCAPES = (
+    {}
+    if sre_constants is None
+    else {
+        sre_constants.CATEGORY_DIGIT: r"\d",
+        sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+        sre_constants.CATEGORY_SPACE: r"\s",
+        sre_constants.CATEGORY_NOT_SPACE: r"\S",
+        sre_constants.CATEGORY_WORD: r"\w",
+        sre_constants.CATEGORY_NOT_WORD: r"\W",
+    }
+)
+
+
+@dataclass(frozen=True)
+class PatternMatches:
+    """Result of scanning one text.
+
+    Attributes:
+        patterns: Matching pattern sources per category, in lexicon order;
+            categories without a match are omitted
+        counts: Number of text positions where a pattern of the category matches
+    """
+
+    patterns: Dict[str, Tuple[str, ...]]
+    counts: Dict[str, int]
+
+    def __contains__(self, category: str) -> bool:
+        return category in self.patterns
+
+
+def _class_items(items) -> Optional[Set[str]]:
+    """Character class source for an IN item, or None if not representable."""
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.add(re.escape(chr(av)))
+        elif op is sre_constants.RANGE:
+            chars.add(f"{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}")
+        elif op is sre_constants.CATEGORY and av in _CATEGORY_ESCAPES:
+            chars.add(_CATEGORY_ESCAPES[av])
+        else:
+            return None
+    return chars
+
+
+def _first_chars(items) -> Optional[Set[str]]:
+    """Class items covering every first character of a match, if known.
+
+    Zero-width assertions are skipped; anything that may match the empty
+    string or cannot be expressed as a character class gives None.
+    """
+    for op, av in items:
+        if op is sre_constants.AT:
+            continue
+        if op is sre_constants.LITERAL:
+            return {re.escape(chr(av))}
+        if op is sre_constants.IN:
+            return _class_items(av)
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            low, _, body = av
+            return _first_chars(body) if low > 0 else None
+        if op is sre_constants.SUBPATTERN:
+            return _first_chars(av[-1])
+        if op is sre_constants.BRANCH:
+            chars: Set[str] = set()
+            for branch in av[1]:
+                branch_chars = _first_chars(branch)
+                if branch_chars is None:
+                    return None
+                chars |= branch_chars
+            return chars
+        return None
+    return None
+
+
+def _guard(patterns: Sequence[str]) -> str:
+    """Regex source every match position of the patterns satisfies."""
+    parsed = [sre_parse.parse(pattern) for pattern in patterns]
+    guard = ""
+    if all(
+        len(items) and items[0] == (sre_constants.AT, sre_constants.AT_BOUNDARY)
+        for items in parsed
+    ):
+        guard = r"\b"
+    chars: Set[str] = set()
+    for items in parsed:
+        first = _first_chars(items)
+        if first is None:
+            return guard
+        chars |= first
+    return guard + "(?=[" + "".join(sorted(chars)) + "])"
+
+
+def _lookahead(patterns: Sequence[str], grouped: bool) -> "re.Pattern[str]":
+    """Guarded lookahead alternation of the patterns."""
+    wrap = "({})" if grouped else "(?:{})"
+    branches = "|".join(wrap.format(pattern) for pattern in patterns)
+    return re.compile(f"{_guard(patterns)}(?=(?:{branches}))", re.IGNORECASE)
+
+
+def _first_char_class(pattern: str) -> Optional["re.Pattern[str]"]:
+    """Class matching every first character of a match, None if unknown."""
+    chars = _first_chars(sre_parse.parse(pattern))
+    if chars is None:
+        return None
+    return re.compile("[" + "".join(sorted(chars)) + "]", re.IGNORECASE)
+
+
+class _Resolver:
+    """Alternation of some patterns reporting the first one matching.
+
+    Wrapping each pattern in a group roughly doubles the cost of every
+    attempt, so resolvers only run at positions the scanner reported.
+    """
+
+    def __init__(self, patterns: Sequence[str], indexes: Tuple[int, ...]):
+        self.pattern = _lookahead([patterns[i] for i in indexes], grouped=True)
+        # Wrapping group number -> pattern index; patterns may have groups
+        self.indexes: Dict[int, int] = {}
+        group = 1
+        for index in indexes:
+            self.indexes[group] = index
+            group += 1 + re.compile(patterns[index]).groups
+
+    def first_at(self, text: str, position: int) -> Optional[int]:
+        match = self.pattern.match(text, position)
+        return None if match is None else self.indexes[match.lastindex]
+
+
+class CompiledPatternSet:
+    """Categorized regex patterns matched case-insensitively in one pass.
+
+    Args:
+        categories: Pattern lists keyed by category name. A pattern listed
+            under several categories is matched once and reported for each.
+
+    Raises:
+        re.error: If a pattern does not compile or the patterns cannot be
+            combined
+    """
+
+    def __init__(self, categories: Mapping[str, Sequence[str]]):
+        self._categories: Tuple[str, ...] = tuple(categories)
+        pattern_categories: Dict[str, List[str]] = {}
+        for category, patterns in categories.items():
+            for pattern in patterns:
+                re.compile(pattern)
+                if category not in pattern_categories.setdefault(pattern, []):
+                    pattern_categories[pattern].append(category)
+
+        self._patterns: Tuple[str, ...] = tuple(pattern_categories)
+        self._pattern_categories: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(cats) for cats in pattern_categories.values()
+        )
+        self._first_classes: Tuple[Optional["re.Pattern[str]"], ...] = ()
+        self._searchers: Tuple["re.Pattern[str]", ...] = ()
+        self._scanner: Optional["re.Pattern[str]"] = None
+        if sre_parse is None:
+            self._searchers = tuple(
+                re.compile(f"(?=(?:{p}))", re.IGNORECASE) for p in self._patterns
+            )
+        elif self._patterns:
+            self._first_classes = tuple(_first_char_class(p) for p in self._patterns)
+            self._scanner = _lookahead(self._patterns, grouped=False)
+        # Patterns that can start with a character, and resolvers per
+        # candidate tuple; both are filled in as characters are seen
+        self._candidates: Dict[str, Tuple[int, ...]] = {}
+        self._resolvers: Dict[Tuple[int, ...], _Resolver] = {}
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return self._categories
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _candidates_for(self, char: str) -> Tuple[int, ...]:
+        candidates = self._candidates.get(char)
+        if candidates is None:
+            if len(self._candidates) >= MAX_CACHED_CHARS:
+                self._candidates.clear()
+            candidates = self._candidates[char] = tuple(
+                index
+                for index, first in enumerate(self._first_classes)
+                if first is None or first.match(char)
+            )
+        return candidates
+
+    def _resolver(self, candidates: Tuple[int, ...]) -> _Resolver:
+        resolver = self._resolvers.get(candidates)
+        if resolver is None:
+            resolver = self._resolvers[candidates] = _Resolver(
+                self._patterns, candidates
+            )
+        return resolver
+
+    def _indexes_at(self, text: str, position: int) -> Tuple[int, ...]:
+        """Indexes of every pattern matching at the position."""
+        candidates = self._candidates_for(text[position : position + 1])
+        indexes = []
+        while candidates:
+            index = self._resolver(candidates).first_at(text, position)
+            if index is None:
+                break
+            indexes.append(index)
+            candidates = candidates[candidates.index(index) + 1 :]
+        return tuple(indexes)
+
+    def _positions_per_pattern(self, text: str) -> Dict[Tuple[int, ...], int]:
+        """Match positions tallied by pattern set, one search per pattern."""
+        at: Dict[int, List[int]] = {}
+        for index, searcher in enumerate(self._searchers):
+            for match in searcher.finditer(text):
+                at.setdefault(match.start(), []).append(index)
+        positions: Dict[Tuple[int, ...], int] = {}
+        for indexes in at.values():
+            key = tuple(indexes)
+            positions[key] = positions.get(key, 0) + 1
+        return positions
+
+    def scan(self, text: str) -> PatternMatches:
+        """Find every matching pattern and category in one pass over the text."""
+        counts = dict.fromkeys(self._categories, 0)
+        if not text or not self._patterns:
+            return PatternMatches(patterns={}, counts=counts)
+
+        # Positions are tallied by the set of patterns matching there;
+        # categories are resolved once per distinct set
+        if self._scanner is None:
+            positions = self._positions_per_pattern(text)
+        else:
+            positions = {}
+            for match in self._scanner.finditer(text):
+                indexes = self._indexes_at(text, match.start())
+                positions[indexes] = positions.get(indexes, 0) + 1
+
+        found = set()
+        for indexes, hits in positions.items():
+            found.update(indexes)
+            categories = {
+                category
+                for index in indexes
+                for category in self._pattern_categories[index]
+            }
+            for category in categories:
+                counts[category] += hits
+
+        patterns: Dict[str, List[str]] = {}
+        for index in sorted(found):
+            for category in self._pattern_categories[index]:
+                patterns.setdefault(category, []).append(self._patterns[index])
+        return PatternMatches(
+            patterns={
+                category: tuple(patterns[category])
+                for category in self._categories
+                if category in patterns
+            },
+            counts=counts,
+        )
@@ -11,21 +11,175 @@ This service focuses on:
 - Conversation history compaction for display
 """
 
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
+from app.config import get_settings
 from app.models.session import Session
+from app.utils import token_counter
 from app.utils.logger import get_logger
+from app.utils.token_counter import TokenCounter, get_token_counter, turn_text
 
 logger = get_logger(__name__)
 
+# Session metadata key holding the serialized RollingSummary
+SUMMARY_METADATA_KEY = "context_summary"
+
+DEFAULT_RECENT_WINDOW = 3
+PREVIEW_CHARS = 50
+
+
+@dataclass
+class RollingSummary:
+    """Running digest of older turns plus a bounded window of recent turns.
+
+    Stored with the session (metadata[SUMMARY_METADATA_KEY]) and updated in
+    O(1) per appended turn: when the window overflows, its oldest turn is
+    folded into the digest counters. Each recent turn keeps the token count
+    computed when it was appended, so budgeting never re-counts history.
+    """
+
+    window_size: int = DEFAULT_RECENT_WINDOW
+    token_counter: str = ""
+    total_turns: int = 0
+    total_tokens: int = 0
+    summarized_turns: int = 0
+    first_input_preview: Optional[str] = None
+    last_phase: Optional[str] = None
+    phase_count: int = 0
+    recent: List[Dict[str, Any]] = field(default_factory=list)
+
+    def append(self, turn: Dict[str, Any], tokens: int) -> None:
+        """Add the next turn of the conversation."""
+        if self.first_input_preview is None and "user_input" in turn:
+            self.first_input_preview = turn["user_input"][:PREVIEW_CHARS]
+        phase = turn.get("phase")
+        if phase is not None and phase != self.last_phase:
+            self.last_phase = phase
+            self.phase_count += 1
+
+        self.recent.append(
+            {
+                "turn_number": turn.get("turn_number", self.total_turns + 1),
+                "user_input": turn.get("user_input", ""),
+                "partner_response": turn.get("partner_response", ""),
+                "tokens": tokens,
+            }
+        )
+        self.total_turns += 1
+        self.total_tokens += tokens
+
+        while len(self.recent) > self.window_size:
+            self.recent.pop(0)
+            self.summarized_turns += 1
+
+    def digest(self) -> str:
+        """One-line description of the turns folded out of the window."""
+        if not self.summarized_turns:
+            return "No previous activity"
+
+        key_elements = [f"{self.summarized_turns} turns completed"]
+        if self.phase_count > 1:
+            key_elements.append(f"transitioned through {self.phase_count} phases")
+        if self.first_input_preview is not None:
+            key_elements.append(f"started with '{self.first_input_preview}...'")
+        return ", ".join(key_elements)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "window_size": self.window_size,
+            "token_counter": self.token_counter,
+            "total_turns": self.total_turns,
+            "total_tokens": self.total_tokens,
+            "summarized_turns": self.summarized_turns,
+            "first_input_preview": self.first_input_preview,
+            "last_phase": self.last_phase,
+            "phase_count": self.phase_count,
+            "recent": [dict(turn) for turn in self.recent],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingSummary":
+        return cls(
+            window_size=data.get("window_size", DEFAULT_RECENT_WINDOW),
+            token_counter=data.get("token_counter", ""),
+            total_turns=data.get("total_turns", 0),
+            total_tokens=data.get("total_tokens", 0),
+            summarized_turns=data.get("summarized_turns", 0),
+            first_input_preview=data.get("first_input_preview"),
+            last_phase=data.get("last_phase"),
+            phase_count=data.get("phase_count", 0),
+            recent=[dict(turn) for turn in data.get("recent", [])],
+        )
+
 
 class ContextManager:
-    def __init__(self, max_tokens: int = 4000, summarization_threshold: int = 10):
+    def __init__(
+        self,
+        max_tokens: int = 4000,
+        summarization_threshold: int = 10,
+        recent_window: int = DEFAULT_RECENT_WINDOW,
+        counter: Optional[TokenCounter] = None,
+    ):
         self.max_tokens = max_tokens
         self.summarization_threshold = summarization_threshold
+        self.recent_window = recent_window
+        self.counter = counter or get_token_counter()
+        self._contexts_built = 0
+        self._prompt_tokens = 0
+        self._tokens_saved = 0
+        self._last_turn: Optional[Dict[str, int]] = None
 
     def estimate_tokens(self, text: str) -> int:
-        return len(text) // 4
+        return self.counter.count(text)
+
+    def count_turn_tokens(self, turn: Dict[str, Any]) -> int:
+        """Tokens a turn takes in the recent-conversation block.
+
+        Uses the count cached on the turn by record_turn when it was made
+        with the same counter.
+        """
+        return token_counter.count_turn_tokens(self.counter, turn)
+
+    def summary_for(self, session: Session) -> RollingSummary:
+        """Get the session's rolling summary, caught up with its history.
+
+        Loads the summary stored in session metadata and appends only the
+        turns recorded since it was saved; a session without a stored
+        summary is summarized once from its full history.
+        """
+        stored = session.metadata.get(SUMMARY_METADATA_KEY)
+        summary = (
+            RollingSummary.from_dict(stored)
+            if stored
+            and stored.get("token_counter") == self.counter.name
+            and stored.get("total_turns", 0) <= len(session.conversation_history)
+            else RollingSummary(
+                window_size=self.recent_window, token_counter=self.counter.name
+            )
+        )
+        for turn in session.conversation_history[summary.total_turns :]:
+            summary.append(turn, self.count_turn_tokens(turn))
+        return summary
+
+    def record_turn(self, session: Session, turn: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a new turn to the session's summary.
+
+        The turn's token count is also cached on the turn itself, so it is
+        stored with the conversation history.
+
+        Returns:
+            The serialized summary to persist with the turn; it is also set
+            on session.metadata.
+        """
+        summary = self.summary_for(session)
+        tokens = self.count_turn_tokens(turn)
+        turn[token_counter.TURN_TOKENS_KEY] = tokens
+        turn[token_counter.TURN_COUNTER_KEY] = self.counter.name
+        summary.append(turn, tokens)
+        state = summary.to_dict()
+        session.metadata[SUMMARY_METADATA_KEY] = state
+        return state
 
     def build_optimized_context(
         self, session: Session, user_input: str, turn_number: int
@@ -43,33 +197,84 @@ class ContextManager:
         if not session.conversation_history:
             return "\n".join(context_parts)
 
-        history_length = len(session.conversation_history)
-
-        if history_length > self.summarization_threshold:
-            context_parts.append(self._build_summarized_context(session))
-        else:
-            context_parts.append(self._build_recent_context(session))
+        summary = self.summary_for(session)
+        used_tokens = sum(self.estimate_tokens(part) for part in context_parts)
 
-        full_context = "\n".join(context_parts)
-        total_tokens = self.estimate_tokens(full_context)
-
-        if total_tokens > self.max_tokens:
+        if summary.total_turns > self.summarization_threshold:
+            summary_block = (
+                f"Session summary ({summary.total_turns} turns total):\n"
+                f"Earlier turns: {summary.digest()}\n"
+            )
+            context_parts.append(summary_block)
+            used_tokens += self.estimate_tokens(summary_block)
+
+        # Newest turns first until the budget is spent, using the counts
+        # cached when each turn was appended
+        heading = "Recent conversation:"
+        used_tokens += self.estimate_tokens(heading)
+        included: List[Dict[str, Any]] = []
+        for turn in reversed(summary.recent):
+            if used_tokens + turn["tokens"] > self.max_tokens:
+                break
+            included.append(turn)
+            used_tokens += turn["tokens"]
+
+        if len(included) < len(summary.recent):
             logger.warning(
-                "Context exceeds max tokens, applying compaction",
-                estimated_tokens=total_tokens,
+                "Context exceeds max tokens, dropping oldest recent turns",
+                dropped_turns=len(summary.recent) - len(included),
                 max_tokens=self.max_tokens,
                 turn_number=turn_number,
             )
-            full_context = self._compact_context(context_parts)
+
+        context_parts.append(heading)
+        context_parts.extend(turn_text(turn) for turn in reversed(included))
+
+        # Savings against sending the whole history verbatim
+        recent_tokens = sum(turn["tokens"] for turn in included)
+        full_history_tokens = used_tokens - recent_tokens + summary.total_tokens
+        tokens_saved = max(full_history_tokens - used_tokens, 0)
+        self._record_usage(turn_number, used_tokens, tokens_saved)
 
         logger.debug(
             "Context built",
             turn_number=turn_number,
-            history_length=history_length,
-            estimated_tokens=self.estimate_tokens(full_context),
+            history_length=summary.total_turns,
+            prompt_tokens=used_tokens,
+            tokens_saved=tokens_saved,
         )
 
-        return full_context
+        return "\n".join(context_parts)
+
+    def _record_usage(
+        self, turn_number: int, prompt_tokens: int, tokens_saved: int
+    ) -> None:
+        self._contexts_built += 1
+        self._prompt_tokens += prompt_tokens
+        self._tokens_saved += tokens_saved
+        self._last_turn = {
+            "turn_number": turn_number,
+            "prompt_tokens": prompt_tokens,
+            "tokens_saved": tokens_saved,
+        }
+
+    def get_token_report(self) -> Dict[str, Any]:
+        """Prompt tokens used and saved by context building so far."""
+        built = self._contexts_built
+        return {
+            "token_counter": self.counter.name,
+            "max_tokens": self.max_tokens,
+            "contexts_built": built,
+            "prompt_tokens": self._prompt_tokens,
+            "tokens_saved": self._tokens_saved,
+            "avg_prompt_tokens_per_turn": (
+                round(self._prompt_tokens / built, 1) if built else 0.0
+            ),
+            "avg_tokens_saved_per_turn": (
+                round(self._tokens_saved / built, 1) if built else 0.0
+            ),
+            "last_turn": self._last_turn,
+        }
 
     def _build_recent_context(self, session: Session, window_size: int = 3) -> str:
         if not session.conversation_history:
@@ -86,77 +291,6 @@ class ContextManager:
 
         return "\n".join(context_lines)
 
-    def _build_summarized_context(self, session: Session) -> str:
-        if not session.conversation_history:
-            return ""
-
-        total_turns = len(session.conversation_history)
-        older_turns = session.conversation_history[:-3]
-        recent_turns = session.conversation_history[-3:]
-
-        context_lines = [f"Session summary ({total_turns} turns total):"]
-
-        summary = self._summarize_turns(older_turns)
-        context_lines.append(f"Earlier turns: {summary}")
-
-        context_lines.append("\nRecent conversation:")
-        for turn in recent_turns:
-            context_lines.append(
-                f"Turn {turn['turn_number']}: User: {turn['user_input']}"
-            )
-            context_lines.append(f"Partner: {turn['partner_response']}")
-
-        return "\n".join(context_lines)
-
-    def _summarize_turns(self, turns: List[Dict[str, Any]]) -> str:
-        if not turns:
-            return "No previous activity"
-
-        turn_count = len(turns)
-        phase_changes: list[str] = []
-
-        for turn in turns:
-            if "phase" in turn:
-                phase = turn["phase"]
-                if not phase_changes or phase_changes[-1] != phase:
-                    phase_changes.append(phase)
-
-        key_elements = []
-
-        if turn_count > 0:
-            key_elements.append(f"{turn_count} turns completed")
-
-        if len(phase_changes) > 1:
-            key_elements.append(f"transitioned through {len(phase_changes)} phases")
-
-        first_turn = turns[0]
-        if "user_input" in first_turn:
-            first_input_preview = first_turn["user_input"][:50]
-            key_elements.append(f"started with '{first_input_preview}...'")
-
-        return ", ".join(key_elements)
-
-    def _compact_context(self, context_parts: List[str]) -> str:
-        header = context_parts[0] if context_parts else ""
-
-        if len(context_parts) > 1:
-            conversation_text = context_parts[1]
-            lines = conversation_text.split("\n")
-
-            compacted_lines = [lines[0]]
-
-            for line in lines[1:]:
-                if any(
-                    keyword in line.lower() for keyword in ["turn", "user:", "partner:"]
-                ):
-                    compacted_lines.append(line)
-
-            compact_conversation = "\n".join(compacted_lines[-10:])
-
-            return f"{header}\n{compact_conversation}"
-
-        return header
-
     def estimate_context_size(self, session: Session) -> Dict[str, Any]:
         if not session.conversation_history:
             return {
@@ -165,21 +299,14 @@ class ContextManager:
                 "requires_summarization": False,
             }
 
-        total_text = ""
-        for turn in session.conversation_history:
-            total_text += turn.get("user_input", "")
-            total_text += turn.get("partner_response", "")
-
-        estimated_tokens = self.estimate_tokens(total_text)
-        requires_summarization = (
-            len(session.conversation_history) > self.summarization_threshold
-        )
+        summary = self.summary_for(session)
+        requires_summarization = summary.total_turns > self.summarization_threshold
 
         return {
-            "total_turns": len(session.conversation_history),
-            "estimated_tokens": estimated_tokens,
+            "total_turns": summary.total_turns,
+            "estimated_tokens": summary.total_tokens,
             "requires_summarization": requires_summarization,
-            "within_limit": estimated_tokens < self.max_tokens,
+            "within_limit": summary.total_tokens < self.max_tokens,
         }
 
 
@@ -187,13 +314,17 @@ _context_manager_instance: Optional[ContextManager] = None
 
 
 def get_context_manager(
-    max_tokens: int = 4000, summarization_threshold: int = 10
+    max_tokens: Optional[int] = None,
+    summarization_threshold: int = 10,
+    recent_window: int = DEFAULT_RECENT_WINDOW,
 ) -> ContextManager:
     global _context_manager_instance
 
     if _context_manager_instance is None:
         _context_manager_instance = ContextManager(
-            max_tokens=max_tokens, summarization_threshold=summarization_threshold
+            max_tokens=max_tokens or get_settings().perf_max_context_tokens,
+            summarization_threshold=summarization_threshold,
+            recent_window=recent_window,
         )
 
     return _context_manager_instance
@@ -7,12 +7,30 @@ This module provides async Firestore access for tool data collections including:
 - sentiment_keywords: Keyword lists for sentiment analysis
 
 Follows ADK patterns with async operations and singleton service instance.
+
+The get_all_* functions and get_sentiment_keywords read from an instance-wide
+ToolDataCache snapshot instead of streaming the collections on every call.
+Game and principle lookups go through indexes derived from that snapshot
+(GameCatalog, GameRecommender, PrincipleIndex). The cache starts from the bundled local
+snapshot (see tool_data_bundle) and reconciles with Firestore in the
+background.
 """
 
+import asyncio
+import copy
 import threading
-from typing import Optional, List, Dict, Any, Union
-from google.cloud.firestore_v1 import AsyncClient, AsyncQuery, AsyncCollectionReference
+from typing import Optional, List, Dict, Any, Tuple
+from google.cloud.firestore_v1 import AsyncClient, AsyncQuery
 from app.config import get_settings
+from app.services.audience_profiles import ArchetypeProfile, build_archetype_profiles
+from app.services.game_catalog import GameCatalog
+from app.services.game_recommender import GameRecommender
+from app.services.principle_index import BEGINNER_IMPORTANCE_LEVELS, PrincipleIndex
+from app.services.tool_data_bundle import (
+    load_bundled_snapshot,
+    parse_sentiment_keywords,
+)
+from app.services.tool_data_cache import ToolDataCache, ToolDataSnapshot
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -70,29 +88,128 @@ def reset_firestore_client() -> None:
     _firestore_client = None
 
 
+# =============================================================================
+# TOOL DATA SNAPSHOT CACHE
+# =============================================================================
+
+_tool_data_cache: Optional[ToolDataCache] = None
+
+
+async def _fetch_collection(collection_name: str) -> List[Dict[str, Any]]:
+    """Stream every document in a collection, adding its ``id``."""
+    client = get_firestore_client()
+    collection = client.collection(collection_name)
+
+    documents: List[Dict[str, Any]] = []
+    async for doc in collection.stream():
+        data = doc.to_dict()
+        if data is not None:
+            data["id"] = doc.id
+            documents.append(data)
+    return documents
+
+
+async def load_snapshot_from_firestore(version: int) -> ToolDataSnapshot:
+    """Build a ToolDataSnapshot by reading all tool data collections concurrently."""
+    games, principles, archetypes, keywords = await asyncio.gather(
+        _fetch_collection(settings.firestore_games_collection),
+        _fetch_collection(settings.firestore_principles_collection),
+        _fetch_collection(settings.firestore_archetypes_collection),
+        _fetch_sentiment_keywords(),
+    )
+    return ToolDataSnapshot(
+        games=tuple(games),
+        principles=tuple(principles),
+        archetypes=tuple(archetypes),
+        sentiment_keywords=keywords,
+        version=version,
+        source="firestore",
+    )
+
+
+def get_tool_data_cache() -> ToolDataCache:
+    """Get the singleton tool data snapshot cache."""
+    global _tool_data_cache
+
+    if _tool_data_cache is None:
+        with _init_lock:
+            if _tool_data_cache is None:
+                cache = ToolDataCache(
+                    loader=load_snapshot_from_firestore,
+                    ttl_seconds=settings.tool_data_cache_ttl,
+                )
+                if settings.tool_data_bundled_snapshot:
+                    bundled = load_bundled_snapshot(settings.tool_data_snapshot_path)
+                    if bundled is not None:
+                        cache.set_snapshot(bundled)
+                _tool_data_cache = cache
+    return _tool_data_cache
+
+
+def reset_tool_data_cache() -> None:
+    """Reset the snapshot cache singleton for testing purposes."""
+    global _tool_data_cache
+    _tool_data_cache = None
+
+
+async def _snapshot() -> ToolDataSnapshot:
+    return await get_tool_data_cache().get()
+
+
+def _copy_documents(documents) -> List[Dict[str, Any]]:
+    """Deep-copy snapshot documents for callers.
+
+    Snapshot documents (and their nested lists such as rules, skills or
+    coaching tips) are shared by every session on the instance, so getters
+    hand out independent copies.
+    """
+    return [copy.deepcopy(document) for document in documents]
+
+
 # =============================================================================
 # IMPROV GAMES COLLECTION
 # =============================================================================
 
 
-async def get_all_games() -> List[Dict[str, Any]]:
-    """Get all improv games from Firestore.
+async def get_game_catalog() -> GameCatalog:
+    """Get the indexed game catalog for the current tool data snapshot.
 
     Returns:
-        List of game dictionaries with all fields.
+        GameCatalog built once per snapshot version. Its game dictionaries
+        are shared and must not be mutated.
     """
-    client = get_firestore_client()
-    collection = client.collection(settings.firestore_games_collection)
+    return await get_tool_data_cache().get_derived(
+        "game_catalog", lambda snapshot: GameCatalog(snapshot.games)
+    )
+
+
+async def get_game_recommender() -> GameRecommender:
+    """Get the game recommender for the current tool data snapshot.
+
+    Returns:
+        GameRecommender built once per snapshot version, sharing the
+        snapshot's GameCatalog.
+    """
+    catalog = await get_game_catalog()
+    return await get_tool_data_cache().get_derived(
+        "game_recommender",
+        lambda snapshot: GameRecommender(
+            # A refresh may have landed since the catalog was fetched
+            catalog
+            if catalog.games is snapshot.games
+            else GameCatalog(snapshot.games)
+        ),
+    )
 
-    games: List[Dict[str, Any]] = []
-    async for doc in collection.stream():
-        game = doc.to_dict()
-        if game is not None:
-            game["id"] = doc.id
-            games.append(game)
 
-    logger.debug("Fetched all games from Firestore", count=len(games))
-    return games
+async def get_all_games() -> List[Dict[str, Any]]:
+    """Get all improv games from the tool data snapshot.
+
+    Returns:
+        List of game dictionaries with all fields.
+    """
+    snapshot = await _snapshot()
+    return _copy_documents(snapshot.games)
 
 
 async def get_game_by_id(game_id: str) -> Optional[Dict[str, Any]]:
@@ -104,16 +221,12 @@ async def get_game_by_id(game_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Game dictionary if found, None otherwise.
     """
-    client = get_firestore_client()
-    doc_ref = client.collection(settings.firestore_games_collection).document(game_id)
-    doc = await doc_ref.get()
+    catalog = await get_game_catalog()
+    game = catalog.get(game_id)
 
-    if doc.exists:
-        game = doc.to_dict()
-        if game is not None:
-            game["id"] = doc.id
-            logger.debug("Game found", game_id=game_id)
-            return game
+    if game is not None:
+        logger.debug("Game found", game_id=game_id)
+        return copy.deepcopy(game)
 
     logger.warning("Game not found", game_id=game_id)
     return None
@@ -136,41 +249,15 @@ async def search_games(
     Returns:
         List of matching game dictionaries.
     """
-    client = get_firestore_client()
-    collection_ref = client.collection(settings.firestore_games_collection)
-
-    # Build query with available filters
-    query: Union[AsyncCollectionReference, AsyncQuery] = collection_ref
-
-    if energy_level:
-        query = query.where("energy_level", "==", energy_level.lower())
-
-    if difficulty:
-        query = query.where("difficulty", "==", difficulty.lower())
-
-    # Execute query
-    results: List[Dict[str, Any]] = []
-    async for doc in query.stream():
-        game = doc.to_dict()
-        if game is None:
-            continue
-
-        game["id"] = doc.id
-
-        # Apply client-side filters that can't be done in Firestore directly
-        if player_count is not None:
-            pc = game.get("player_count", {})
-            min_players = pc.get("min", 1) if isinstance(pc, dict) else 1
-            max_players = pc.get("max", 99) if isinstance(pc, dict) else 99
-            if not (min_players <= player_count <= max_players):
-                continue
-
-        if max_duration is not None:
-            duration = game.get("duration_minutes", 0)
-            if isinstance(duration, (int, float)) and duration > max_duration:
-                continue
-
-        results.append(game)
+    catalog = await get_game_catalog()
+    results = _copy_documents(
+        catalog.search(
+            energy_level=energy_level,
+            player_count=player_count,
+            difficulty=difficulty,
+            max_duration=max_duration,
+        )
+    )
 
     logger.info(
         "Game search completed",
@@ -189,23 +276,25 @@ async def search_games(
 
 
 async def get_all_principles() -> List[Dict[str, Any]]:
-    """Get all improv principles from Firestore.
+    """Get all improv principles from the tool data snapshot.
 
     Returns:
         List of principle dictionaries with all fields.
     """
-    client = get_firestore_client()
-    collection = client.collection(settings.firestore_principles_collection)
+    snapshot = await _snapshot()
+    return _copy_documents(snapshot.principles)
 
-    principles: List[Dict[str, Any]] = []
-    async for doc in collection.stream():
-        principle = doc.to_dict()
-        if principle is not None:
-            principle["id"] = doc.id
-            principles.append(principle)
 
-    logger.debug("Fetched all principles from Firestore", count=len(principles))
-    return principles
+async def get_principle_index() -> PrincipleIndex:
+    """Get the full-text principle index for the current tool data snapshot.
+
+    Returns:
+        PrincipleIndex built once per snapshot version. Its principle
+        dictionaries are shared and must not be mutated.
+    """
+    return await get_tool_data_cache().get_derived(
+        "principle_index", lambda snapshot: PrincipleIndex(snapshot.principles)
+    )
 
 
 async def get_principle_by_id(principle_id: str) -> Optional[Dict[str, Any]]:
@@ -217,18 +306,12 @@ async def get_principle_by_id(principle_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Principle dictionary if found, None otherwise.
     """
-    client = get_firestore_client()
-    doc_ref = client.collection(settings.firestore_principles_collection).document(
-        principle_id
-    )
-    doc = await doc_ref.get()
+    index = await get_principle_index()
+    principle = index.get(principle_id)
 
-    if doc.exists:
-        principle = doc.to_dict()
-        if principle is not None:
-            principle["id"] = doc.id
-            logger.debug("Principle found", principle_id=principle_id)
-            return principle
+    if principle is not None:
+        logger.debug("Principle found", principle_id=principle_id)
+        return copy.deepcopy(principle)
 
     logger.warning("Principle not found", principle_id=principle_id)
     return None
@@ -243,16 +326,8 @@ async def get_principles_by_importance(importance: str) -> List[Dict[str, Any]]:
     Returns:
         List of matching principles.
     """
-    client = get_firestore_client()
-    collection_ref = client.collection(settings.firestore_principles_collection)
-    query: AsyncQuery = collection_ref.where("importance", "==", importance.lower())
-
-    results: List[Dict[str, Any]] = []
-    async for doc in query.stream():
-        principle = doc.to_dict()
-        if principle is not None:
-            principle["id"] = doc.id
-            results.append(principle)
+    index = await get_principle_index()
+    results = _copy_documents(index.by_importance(importance))
 
     logger.info(
         "Principles filtered by importance", importance=importance, count=len(results)
@@ -266,52 +341,28 @@ async def get_beginner_essentials() -> List[Dict[str, Any]]:
     Returns:
         List of foundational and essential principles.
     """
-    client = get_firestore_client()
-    collection_ref = client.collection(settings.firestore_principles_collection)
-
-    # Query for foundational and essential importance levels
-    results: List[Dict[str, Any]] = []
-    async for doc in collection_ref.stream():
-        principle = doc.to_dict()
-        if principle is not None:
-            importance = principle.get("importance")
-            if importance in ["foundational", "essential"]:
-                principle["id"] = doc.id
-                results.append(principle)
+    index = await get_principle_index()
+    results = _copy_documents(index.by_importance(*BEGINNER_IMPORTANCE_LEVELS))
 
     logger.info("Beginner essentials retrieved", count=len(results))
     return results
 
 
 async def search_principles_by_keyword(keyword: str) -> List[Dict[str, Any]]:
-    """Search principles by keyword in name or description.
+    """Search principles by keyword.
+
+    Matches stemmed terms in the name, description, examples and coaching
+    tips of each principle using the in-memory PrincipleIndex.
 
     Args:
-        keyword: Search term to match
+        keyword: Search term(s) to match
 
     Returns:
-        List of matching principles.
-
-    Note:
-        This performs client-side filtering as Firestore doesn't support
-        full-text search. For production, consider using Firestore with
-        a search extension or external search service.
+        List of matching principles, most relevant first. An empty keyword
+        returns all principles.
     """
-    client = get_firestore_client()
-    collection_ref = client.collection(settings.firestore_principles_collection)
-
-    keyword_lower = keyword.lower()
-    results: List[Dict[str, Any]] = []
-
-    async for doc in collection_ref.stream():
-        principle = doc.to_dict()
-        if principle is not None:
-            name = str(principle.get("name", "")).lower()
-            description = str(principle.get("description", "")).lower()
-
-            if keyword_lower in name or keyword_lower in description:
-                principle["id"] = doc.id
-                results.append(principle)
+    index = await get_principle_index()
+    results = _copy_documents(index.search(keyword))
 
     logger.info("Keyword search completed", keyword=keyword, results=len(results))
     return results
@@ -322,24 +373,27 @@ async def search_principles_by_keyword(keyword: str) -> List[Dict[str, Any]]:
 # =============================================================================
 
 
-async def get_all_archetypes() -> List[Dict[str, Any]]:
-    """Get all audience archetypes from Firestore.
+async def get_archetype_profiles() -> Tuple[ArchetypeProfile, ...]:
+    """Get precomputed archetype profiles for the current tool data snapshot.
 
     Returns:
-        List of archetype dictionaries with all fields.
+        ArchetypeProfile tuple built once per snapshot version, in the same
+        order as get_all_archetypes.
     """
-    client = get_firestore_client()
-    collection = client.collection(settings.firestore_archetypes_collection)
+    return await get_tool_data_cache().get_derived(
+        "archetype_profiles",
+        lambda snapshot: build_archetype_profiles(snapshot.archetypes),
+    )
 
-    archetypes: List[Dict[str, Any]] = []
-    async for doc in collection.stream():
-        archetype = doc.to_dict()
-        if archetype is not None:
-            archetype["id"] = doc.id
-            archetypes.append(archetype)
 
-    logger.debug("Fetched all archetypes from Firestore", count=len(archetypes))
-    return archetypes
+async def get_all_archetypes() -> List[Dict[str, Any]]:
+    """Get all audience archetypes from the tool data snapshot.
+
+    Returns:
+        List of archetype dictionaries with all fields.
+    """
+    snapshot = await _snapshot()
+    return _copy_documents(snapshot.archetypes)
 
 
 async def get_archetype_by_name(name: str) -> Optional[Dict[str, Any]]:
@@ -372,32 +426,27 @@ async def get_archetype_by_name(name: str) -> Optional[Dict[str, Any]]:
 
 
 async def get_sentiment_keywords() -> Dict[str, Any]:
-    """Get sentiment keyword lists from Firestore.
+    """Get sentiment keyword lists from the tool data snapshot.
 
     Returns:
         Dictionary with 'positive', 'negative', and 'engagement' keyword lists.
     """
+    snapshot = await _snapshot()
+    return copy.deepcopy(snapshot.sentiment_keywords)
+
+
+async def _fetch_sentiment_keywords() -> Dict[str, Any]:
+    """Read sentiment keyword lists from Firestore."""
     client = get_firestore_client()
     collection = client.collection(settings.firestore_sentiment_keywords_collection)
 
-    keywords: Dict[str, Any] = {
-        "positive": [],
-        "negative": [],
-        "engagement": {"high": [], "low": []},
-    }
-
+    docs = []
     async for doc in collection.stream():
-        doc_id = doc.id
         data = doc.to_dict()
-        if data is None:
-            continue
-
-        if doc_id == "positive_keywords":
-            keywords["positive"] = data.get("keywords", [])
-        elif doc_id == "negative_keywords":
-            keywords["negative"] = data.get("keywords", [])
-        elif doc_id == "engagement_keywords":
-            keywords["engagement"] = data.get("keywords", {"high": [], "low": []})
+        if data is not None:
+            docs.append((doc.id, data))
+
+    keywords = parse_sentiment_keywords(docs)
 
     logger.debug(
         "Fetched sentiment keywords",
@@ -0,0 +1,180 @@
+"""Game Catalog - Indexed, in-memory view of the improv games collection
+
+Built once per tool data snapshot so game lookups on the hot path need no I/O:
+
+- id, name and alias maps for point lookups
+- inverted indexes for the search_games filters (energy level, difficulty,
+  player-count range, duration)
+- a precompiled name matcher that detects game mentions in free text with a
+  single regex pass instead of a scan over every game name
+
+Game dictionaries held by the catalog are shared with the snapshot and must be
+treated as read-only; the data service hands out copies.
+"""
+
+import bisect
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Defaults used by search_games when player_count is missing or malformed
+DEFAULT_MIN_PLAYERS = 1
+DEFAULT_MAX_PLAYERS = 99
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_game_name(text: str) -> str:
+    """Lowercase and collapse punctuation/underscores to single spaces."""
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+class GameCatalog:
+    """Immutable index over a list of game documents.
+
+    Args:
+        games: Game dictionaries, each with at least ``id`` and ``name``
+    """
+
+    def __init__(self, games: Iterable[Dict[str, Any]]):
+        self._games: Tuple[Dict[str, Any], ...] = tuple(games)
+        self._position: Dict[str, int] = {}
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._alias_to_id: Dict[str, str] = {}
+        self._by_energy: Dict[str, List[int]] = defaultdict(list)
+        self._by_difficulty: Dict[str, List[int]] = defaultdict(list)
+        self._by_player_range: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        durations: List[Tuple[float, int]] = []
+        self._untimed: List[int] = []
+
+        for pos, game in enumerate(self._games):
+            game_id = game["id"]
+            self._position[game_id] = pos
+            self._by_id[game_id] = game
+
+            for alias in self._aliases_for(game):
+                # First game to claim an alias wins, matching catalog order
+                self._alias_to_id.setdefault(alias, game_id)
+
+            energy = game.get("energy_level")
+            if isinstance(energy, str):
+                self._by_energy[energy.lower()].append(pos)
+            difficulty = game.get("difficulty")
+            if isinstance(difficulty, str):
+                self._by_difficulty[difficulty.lower()].append(pos)
+
+            pc = game.get("player_count", {})
+            if isinstance(pc, dict):
+                player_range = (
+                    pc.get("min", DEFAULT_MIN_PLAYERS),
+                    pc.get("max", DEFAULT_MAX_PLAYERS),
+                )
+            else:
+                player_range = (DEFAULT_MIN_PLAYERS, DEFAULT_MAX_PLAYERS)
+            self._by_player_range[player_range].append(pos)
+
+            duration = game.get("duration_minutes", 0)
+            if isinstance(duration, (int, float)):
+                durations.append((duration, pos))
+            else:
+                self._untimed.append(pos)
+
+        durations.sort()
+        self._duration_values = [d for d, _ in durations]
+        self._duration_positions = [p for _, p in durations]
+
+        aliases = sorted(self._alias_to_id, key=len, reverse=True)
+        self._name_pattern: Optional[re.Pattern] = (
+            re.compile(r"\b(?:" + "|".join(re.escape(a) for a in aliases) + r")\b")
+            if aliases
+            else None
+        )
+
+    @staticmethod
+    def _aliases_for(game: Dict[str, Any]) -> List[str]:
+        candidates = [game.get("name", ""), game["id"]]
+        extra = game.get("aliases", [])
+        if isinstance(extra, list):
+            candidates.extend(extra)
+        aliases = []
+        for candidate in candidates:
+            alias = normalize_game_name(str(candidate))
+            if alias and alias not in aliases:
+                aliases.append(alias)
+        return aliases
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    @property
+    def games(self) -> Tuple[Dict[str, Any], ...]:
+        return self._games
+
+    def get(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a game by document ID."""
+        return self._by_id.get(game_id)
+
+    def find_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a game by display name, ID, or alias (case/punctuation-insensitive)."""
+        game_id = self._alias_to_id.get(normalize_game_name(name))
+        return self._by_id[game_id] if game_id else None
+
+    def search(
+        self,
+        energy_level: Optional[str] = None,
+        player_count: Optional[int] = None,
+        difficulty: Optional[str] = None,
+        max_duration: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find games matching every given filter, in catalog order.
+
+        Filter semantics match firestore_tool_data_service.search_games.
+        """
+        candidate_sets = []
+
+        if energy_level:
+            candidate_sets.append(self._by_energy.get(energy_level.lower(), []))
+        if difficulty:
+            candidate_sets.append(self._by_difficulty.get(difficulty.lower(), []))
+        if player_count is not None:
+            candidate_sets.append(
+                [
+                    pos
+                    for (low, high), positions in self._by_player_range.items()
+                    if low <= player_count <= high
+                    for pos in positions
+                ]
+            )
+        if max_duration is not None:
+            cut = bisect.bisect_right(self._duration_values, max_duration)
+            candidate_sets.append(self._duration_positions[:cut] + self._untimed)
+
+        if not candidate_sets:
+            return list(self._games)
+
+        candidate_sets.sort(key=len)
+        matches = set(candidate_sets[0])
+        for positions in candidate_sets[1:]:
+            if not matches:
+                break
+            matches.intersection_update(positions)
+
+        return [self._games[pos] for pos in sorted(matches)]
+
+    def detect_mentioned(self, text: str) -> Optional[Dict[str, Any]]:
+        """Find the game mentioned in free text, if any.
+
+        Uses one precompiled regex pass over the normalized text. When several
+        games are mentioned, the earliest one in catalog order wins.
+        """
+        if not text or self._name_pattern is None:
+            return None
+
+        best: Optional[int] = None
+        for match in self._name_pattern.finditer(normalize_game_name(text)):
+            pos = self._position[self._alias_to_id[match.group(0)]]
+            if best is None or pos < best:
+                best = pos
+                if best == 0:
+                    break
+        return self._games[best] if best is not None else None
@@ -0,0 +1,223 @@
+"""Game Recommender - Ranked game shortlists for the MC welcome phase
+
+During game selection the MC agent used to fetch the game list through its
+tools and reason over every game. The recommender ranks the catalog in-process
+against the user's stated preferences so the MC prompt can carry a short,
+pre-resolved shortlist instead.
+
+Built once per tool data snapshot:
+
+- a TF-IDF vector per game over its name, description and skills, plus
+  feature terms for energy level and difficulty
+- preference cues ("silly", "nervous", "challenge", ...) expand a query with
+  the energy/difficulty features they imply
+- a game mentioned by name always ranks first
+"""
+
+import math
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.services.game_catalog import GameCatalog
+from app.services.principle_index import STOPWORDS, stem, tokenize
+
+# Number of games in the MC prompt shortlist by default
+DEFAULT_SHORTLIST_SIZE = 3
+
+# Preferences assumed when the user hasn't said what they want
+DEFAULT_PREFERENCES = "fun high energy easy beginner game"
+
+# Relative weight of a term occurrence per game field
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "description": 1.0,
+    "skills": 1.0,
+}
+
+# Weight of the energy level / difficulty feature terms
+FEATURE_WEIGHT = 2.0
+
+_ENERGY_LEVELS = ("high", "medium", "low", "variable")
+_DIFFICULTIES = ("beginner", "intermediate", "advanced")
+
+# Preference cue words and the game features they ask for, following the
+# MC's game selection guidance (silly -> high-energy beginner game, nervous ->
+# easy game, challenge -> intermediate/advanced game)
+_CUES: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (
+        ("silly", "fun", "funny", "goofy", "playful", "wild", "crazy", "party"),
+        ("energy:high", "difficulty:beginner"),
+    ),
+    (
+        ("energetic", "energized", "hyper", "excited", "pumped", "loud"),
+        ("energy:high",),
+    ),
+    (
+        ("nervous", "new", "first", "shy", "anxious", "scared", "easy", "simple"),
+        ("difficulty:beginner",),
+    ),
+    (
+        ("challenge", "challenging", "hard", "difficult", "tricky", "experienced"),
+        ("difficulty:intermediate", "difficulty:advanced"),
+    ),
+    (
+        ("calm", "chill", "relaxed", "mellow", "tired", "quiet", "slow"),
+        ("energy:low", "energy:medium"),
+    ),
+)
+
+PREFERENCE_HINTS: Dict[str, Tuple[str, ...]] = {
+    stem(word): features for words, features in _CUES for word in words
+}
+PREFERENCE_HINTS.update({level: (f"difficulty:{level}",) for level in _DIFFICULTIES})
+
+
+class GameRecommendation(NamedTuple):
+    """One shortlisted game and its relevance score (higher is better)."""
+
+    game: Dict[str, Any]
+    score: float
+
+
+def _text_terms(value: Any) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        value = " ".join(str(item).replace("_", " ") for item in value)
+    return [t for t in tokenize(str(value or "")) if t not in STOPWORDS]
+
+
+def game_terms(game: Dict[str, Any]) -> Counter:
+    """Weighted term counts describing one game."""
+    terms: Counter = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        for term in _text_terms(game.get(field)):
+            terms[term] += weight
+
+    energy = game.get("energy_level")
+    if isinstance(energy, str):
+        terms[f"energy:{energy.lower()}"] += FEATURE_WEIGHT
+    difficulty = game.get("difficulty")
+    if isinstance(difficulty, str):
+        terms[f"difficulty:{difficulty.lower()}"] += FEATURE_WEIGHT
+    return terms
+
+
+def preference_terms(preferences: str) -> Counter:
+    """Weighted term counts for free-text preferences, with cue expansion."""
+    tokens = _text_terms(preferences)
+    terms: Counter = Counter(tokens)
+    for i, token in enumerate(tokens):
+        for feature in PREFERENCE_HINTS.get(token, ()):
+            terms[feature] += FEATURE_WEIGHT
+        # "high energy", "low-energy game", ...
+        if token in _ENERGY_LEVELS and i + 1 < len(tokens):
+            if tokens[i + 1] == "energy":
+                terms[f"energy:{token}"] += FEATURE_WEIGHT
+    return terms
+
+
+class GameRecommender:
+    """TF-IDF recommender over a game catalog.
+
+    Args:
+        catalog: Indexed game catalog; its name matcher pins games the user
+            mentions by name to the top of the shortlist
+    """
+
+    def __init__(self, catalog: GameCatalog):
+        self._catalog = catalog
+        games = catalog.games
+        game_term_counts = [game_terms(game) for game in games]
+
+        df: Counter = Counter()
+        for terms in game_term_counts:
+            df.update(terms.keys())
+        total = len(games)
+        # Smoothed IDF: terms shared by every game still count a little
+        self._idf: Dict[str, float] = {
+            term: math.log((1 + total) / (1 + count)) + 1.0
+            for term, count in df.items()
+        }
+
+        self._postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for pos, terms in enumerate(game_term_counts):
+            vector = {term: weight * self._idf[term] for term, weight in terms.items()}
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            for term, weight in vector.items():
+                self._postings[term].append((pos, weight / norm))
+
+    @property
+    def catalog(self) -> GameCatalog:
+        return self._catalog
+
+    def _query_vector(self, preferences: str) -> Dict[str, float]:
+        vector = {
+            term: weight * self._idf[term]
+            for term, weight in preference_terms(preferences).items()
+            if term in self._idf
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        return {term: weight / norm for term, weight in vector.items()}
+
+    def recommend(
+        self,
+        preferences: Optional[str] = None,
+        limit: int = DEFAULT_SHORTLIST_SIZE,
+    ) -> List[GameRecommendation]:
+        """Rank games by cosine similarity to the preferences.
+
+        Args:
+            preferences: The user's free-text preferences; DEFAULT_PREFERENCES
+                is used when they are empty or contain no known terms
+            limit: Maximum number of games to return
+
+        Returns:
+            Up to ``limit`` recommendations, best first (ties in catalog order)
+        """
+        games = self._catalog.games
+        if limit <= 0 or not games:
+            return []
+
+        # Preferences with no known terms ("surprise me") rank like no preferences
+        query = self._query_vector(preferences or "") or self._query_vector(
+            DEFAULT_PREFERENCES
+        )
+        scores = [0.0] * len(games)
+        for term, query_weight in query.items():
+            for pos, weight in self._postings[term]:
+                scores[pos] += query_weight * weight
+
+        mentioned = self._catalog.detect_mentioned(preferences or "")
+        pinned = self._catalog.games.index(mentioned) if mentioned else None
+        if pinned is not None:
+            # Above any cosine similarity
+            scores[pinned] = 1.0 + scores[pinned]
+
+        ranked = sorted(range(len(games)), key=lambda pos: (-scores[pos], pos))
+        return [
+            GameRecommendation(games[pos], round(scores[pos], 4))
+            for pos in ranked[:limit]
+        ]
+
+
+def format_shortlist(recommendations: Iterable[GameRecommendation]) -> str:
+    """Render recommendations as prompt lines for the MC agent."""
+    lines = []
+    for recommendation in recommendations:
+        game = recommendation.game
+        details = [
+            str(game[key])
+            for key in ("difficulty", "energy_level")
+            if game.get(key) is not None
+        ]
+        if details and game.get("energy_level") is not None:
+            details[-1] += " energy"
+        duration = game.get("duration_minutes")
+        if isinstance(duration, (int, float)):
+            details.append(f"{duration} min")
+        summary = f"- {game.get('name', game['id'])}"
+        if details:
+            summary += f" ({', '.join(details)})"
+        if game.get("description"):
+            summary += f": {game['description']}"
+        lines.append(summary)
+    return "\n".join(lines)
@@ -0,0 +1,67 @@
+"""Keyword Matcher - Per-category keyword counting over a prepared lexicon
+
+Sentiment and engagement analysis count how many keywords of each category
+occur in a text. KeywordMatcher prepares the lexicon once per keyword load
+(lowercased, deduplicated across categories) so each analysis lowercases the
+text once and checks every distinct keyword once, whichever categories it
+belongs to.
+
+Matching keeps the substring semantics of the original scans: a keyword counts
+when it appears anywhere in the text (so "love" matches "lovely"), and each
+distinct keyword counts once no matter how often it occurs.
+
+Each check is a C-level substring search. A single compiled pattern over the
+whole lexicon only beats these scans from a few hundred keywords on, while the
+sentiment and mood lexicons have tens; see
+tests/test_performance/test_keyword_matcher_benchmark.py.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+
+class KeywordMatcher:
+    """Counts distinct keyword hits per category.
+
+    Args:
+        categories: Keyword lists keyed by category name. Keywords are
+            matched case-insensitively; empty keywords are ignored.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self._categories: Tuple[str, ...] = tuple(categories)
+        keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword and category not in keyword_categories.setdefault(
+                    keyword, []
+                ):
+                    keyword_categories[keyword].append(category)
+
+        self._keyword_categories: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(cats) for keyword, cats in keyword_categories.items()
+        }
+        self._keywords: Tuple[str, ...] = tuple(keyword_categories)
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return self._categories
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Distinct keywords occurring anywhere in the text."""
+        if not text or not self._keywords:
+            return frozenset()
+
+        text = text.lower()
+        return frozenset(keyword for keyword in self._keywords if keyword in text)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords of each category occurring in the text."""
+        counts = dict.fromkeys(self._categories, 0)
+        for keyword in self.find(text):
+            for category in self._keyword_categories[keyword]:
+                counts[category] += 1
+        return counts
@@ -1,7 +1,8 @@
 """MC Welcome Orchestrator - Handles the MC Welcome Phase using ADK Agents"""
 
+import copy
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 import asyncio
 
 from google.adk.runners import Runner
@@ -12,7 +13,15 @@ from app.models.session import Session, SessionStatus
 from app.services.session_manager import SessionManager
 from app.services.adk_session_service import get_adk_session_service
 from app.services.adk_memory_service import get_adk_memory_service
-from app.services.firestore_tool_data_service import get_all_games, get_game_by_id
+from app.services.firestore_tool_data_service import (
+    get_all_games,
+    get_game_by_id,
+    get_game_catalog,
+    get_game_recommender,
+)
+from app.services.game_catalog import GameCatalog
+from app.services.game_recommender import format_shortlist
+from app.toolsets.tool_call_cache import get_tool_call_cache
 from app.utils.logger import get_logger
 from app.config import get_settings
 
@@ -135,14 +144,24 @@ End with a question about how they're feeling or what kind of experience they wa
         self, session: Session, user_input: Optional[str]
     ) -> Dict[str, Any]:
         """Handle game selection phase."""
-        games = await get_all_games()
+        catalog = await get_game_catalog()
+
+        # Rank the catalog against the user's response up front so the MC picks
+        # from a shortlist instead of fetching and scanning every game
+        recommender = await get_game_recommender()
+        shortlist = format_shortlist(
+            recommender.recommend(user_input, limit=settings.mc_game_shortlist_size)
+        )
 
         # Check if user specified a game or mood
         if user_input:
             prompt = f"""The user responded: "{user_input}"
 
 Based on their response, suggest a perfect improv game for them!
-Use your game database tools to find the best match.
+These games from the game database best match their response, best first:
+{shortlist}
+
+Pick one of them; only use your game database tools if none fit at all.
 
 If they mentioned:
 - Wanting something fun/silly: suggest a high-energy beginner game
@@ -156,10 +175,11 @@ For example: "Audience, give me a location!" or "Who's got a relationship for us
 Remember: You're asking THE AUDIENCE (the crowd), not the player directly.
 Be brief but enthusiastic! 2-3 sentences max."""
         else:
-            prompt = """The user hasn't specified what they want.
+            prompt = f"""The user hasn't specified what they want.
 
 Suggest a fun beginner-friendly game to get them started!
-Pick something like Freeze Tag or 185 that's high energy and easy to learn.
+Pick one of these easy to learn games from the game database:
+{shortlist}
 
 After suggesting, turn to THE AUDIENCE and ask for a suggestion appropriate for that game.
 For example: "Audience, give me a location!" or "Who's got a relationship for us?"
@@ -174,7 +194,7 @@ Be brief but enthusiastic! 2-3 sentences max."""
         )
 
         # Try to detect which game was suggested
-        suggested_game = self._detect_game_from_response(mc_response, games)
+        suggested_game = self._detect_game_from_response(mc_response, catalog)
 
         # Update session with game selection
         if suggested_game:
@@ -378,6 +398,7 @@ This is the transition to scene work, so make it feel like a big moment!"""
                 state={},
             )
 
+        invocation_ids = set()
         try:
             new_message = types.Content(
                 role="user", parts=[types.Part.from_text(text=prompt)]
@@ -389,6 +410,8 @@ This is the transition to scene work, so make it feel like a big moment!"""
                 async for event in runner.run_async(
                     user_id=user_id, session_id=session_id, new_message=new_message
                 ):
+                    invocation_ids.add(getattr(event, "invocation_id", None))
+
                     # Skip events that contain tool/function calls (internal orchestration)
                     # These include transfer_to_agent calls that shouldn't be shown to users
                     if (
@@ -427,23 +450,25 @@ This is the transition to scene work, so make it feel like a big moment!"""
                 prompt_length=len(prompt),
             )
             raise
+        finally:
+            # The invocation is over; its memoized tool results are no longer needed
+            tool_call_cache = get_tool_call_cache()
+            for invocation_id in invocation_ids:
+                tool_call_cache.end_invocation(invocation_id)
 
     def _detect_game_from_response(
-        self, response: str, games: List[Dict]
+        self, response: str, catalog: GameCatalog
     ) -> Optional[Dict]:
         """Attempt to detect which game was mentioned in the MC response."""
-        response_lower = response.lower()
-
-        for game in games:
-            if game["name"].lower() in response_lower:
-                return game
+        game = catalog.detect_mentioned(response)
 
         # Default to Freeze Tag if no match found
-        for game in games:
-            if game["id"] == "freeze_tag":
-                return game
+        if game is None:
+            game = catalog.get("freeze_tag")
+        if game is None and len(catalog):
+            game = catalog.games[0]
 
-        return games[0] if games else None
+        return copy.deepcopy(game) if game else None
 
 
 def get_mc_welcome_orchestrator(
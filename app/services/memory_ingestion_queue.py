@@ -0,0 +1,462 @@
+"""Memory Ingestion Queue - Background memory-bank ingestion of closed sessions
+
+Saving a session to the memory bank (VertexAiMemoryBankService) is a slow
+remote job. Awaiting it in the close request makes the user wait for it.
+Instead, closing a session enqueues an ingestion job and returns; workers
+in the background ingest the session.
+
+- Durable: each job is a Firestore document (one per session, so a session
+  is ingested at most once), written before enqueue returns. Jobs left
+  behind by a stopped or crashed instance are recovered once their lease
+  expires; the document is created, and a recovered job claimed, with a
+  precondition, so two instances never take the same job.
+- Deduplicated: enqueueing a session that is queued, running or done is
+  a no-op.
+- Retried: failed ingestions are retried with exponential backoff up to
+  ``max_attempts``.
+- Bounded: ``concurrency`` workers process jobs, so a burst of closes does
+  not start a burst of remote jobs.
+
+While a job is pending, its session is pinned in the local ADK session GC
+so its events are still there when the worker loads it. A job recovered on
+another instance, or after a restart, does not find the session in the
+default instance-local ADK database; it is then rebuilt from the Firestore
+conversation (see adk_session_rehydration), so the memory bank receives the
+rolling summary and recent turns rather than every event. With
+ADK_SESSION_BACKEND=firestore the original events are always available.
+
+get_stats() reports queue depth, lag (enqueue to start of the first
+attempt), processing time and throughput over the last minute.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+from google.adk.sessions.session import Session as ADKSession
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition, NotFound
+
+from app.config import get_settings
+from app.services.adk_memory_service import get_adk_memory_service
+from app.services.adk_session_gc import get_adk_session_collector
+from app.services.adk_session_service import get_adk_session_service
+from app.services.firestore_tool_data_service import get_firestore_client
+from app.services.session_manager import get_session_manager
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+THROUGHPUT_WINDOW_SECONDS = 60
+
+
+class IngestionStatus(str, Enum):
+    """Memory ingestion job states"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    SKIPPED = "skipped"  # Session no longer available
+    FAILED = "failed"  # Gave up after max_attempts
+
+
+ACTIVE_STATUSES = [IngestionStatus.PENDING.value, IngestionStatus.RUNNING.value]
+
+SessionLoader = Callable[[Dict[str, Any]], Awaitable[Optional[ADKSession]]]
+Ingestor = Callable[[ADKSession], Awaitable[None]]
+
+
+async def load_adk_session(job: Dict[str, Any]) -> Optional[ADKSession]:
+    """Load a job's ADK session, rehydrating it if it is not stored locally.
+
+    Returns None only when the Firestore session is gone as well.
+    """
+    adk_session = await get_adk_session_service().get_session(
+        app_name=job["app_name"], user_id=job["user_id"], session_id=job["session_id"]
+    )
+    if adk_session is not None:
+        return adk_session
+    return await get_session_manager().get_adk_session(job["session_id"])
+
+
+async def add_session_to_memory(adk_session: ADKSession) -> None:
+    """Ingest a session into the memory service; raises on failure."""
+    memory_service = get_adk_memory_service()
+    if memory_service is None:
+        return
+    await memory_service.add_session_to_memory(adk_session)
+
+
+class MemoryIngestionQueue:
+    """Durable background queue of memory ingestion jobs.
+
+    Args:
+        client: Firestore AsyncClient holding the job documents
+        collection: Job collection name
+        load_session: Loads the ADK session of a job (None if unavailable)
+        ingest: Ingests an ADK session into the memory service
+        concurrency: Number of workers
+        max_attempts: Attempts before a job is marked failed
+        backoff_seconds: Delay before the first retry, doubled per attempt
+        lease_seconds: Ownership period of a job; expired jobs are recovered
+        recovery_interval: Seconds between scans for orphaned jobs
+        pin_sessions: Pin queued sessions in the local ADK session GC
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        collection: Optional[str] = None,
+        load_session: SessionLoader = load_adk_session,
+        ingest: Ingestor = add_session_to_memory,
+        concurrency: int = 2,
+        max_attempts: int = 5,
+        backoff_seconds: float = 5.0,
+        lease_seconds: float = 600,
+        recovery_interval: float = 300,
+        pin_sessions: bool = False,
+    ):
+        self.client = client
+        self.collection = client.collection(
+            collection or settings.memory_ingestion_collection
+        )
+        self.load_session = load_session
+        self.ingest = ingest
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.recovery_interval = recovery_interval
+        self.pin_sessions = pin_sessions
+        # Jobs owned by this process (queued, waiting for retry or running)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._enqueuing: Set[str] = set()
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self._retry_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._running = 0
+        self._lag_ms: Deque[float] = deque(maxlen=500)
+        self._processing_ms: Deque[float] = deque(maxlen=500)
+        self._completed_at: Deque[float] = deque()
+        self._stats = {
+            "enqueued": 0,
+            "deduplicated": 0,
+            "recovered": 0,
+            "completed": 0,
+            "skipped": 0,
+            "failed": 0,
+            "retries": 0,
+        }
+
+    async def enqueue(
+        self, session_id: str, user_id: str, app_name: Optional[str] = None
+    ) -> bool:
+        """Record an ingestion job and queue it; False if already known."""
+        if session_id in self._jobs or session_id in self._enqueuing:
+            self._stats["deduplicated"] += 1
+            return False
+
+        self._enqueuing.add(session_id)
+        # Pinned before the first await, so a GC sweep cannot delete the
+        # session's events while the job is being recorded
+        self._pin(session_id)
+        try:
+            return await self._enqueue(session_id, user_id, app_name)
+        finally:
+            self._enqueuing.discard(session_id)
+            if session_id not in self._jobs:
+                self._unpin(session_id)
+
+    async def _enqueue(
+        self, session_id: str, user_id: str, app_name: Optional[str]
+    ) -> bool:
+        doc_ref = self.collection.document(session_id)
+        now = time.time()
+        job = {
+            "session_id": session_id,
+            "user_id": user_id,
+            "app_name": app_name or settings.app_name,
+            "status": IngestionStatus.PENDING.value,
+            "attempts": 0,
+            "enqueued_at": now,
+            "next_attempt_at": now,
+            "lease_until": now + self.lease_seconds,
+            "last_error": None,
+        }
+        try:
+            await doc_ref.create(job)
+        except AlreadyExists:
+            # Only a failed job is queued again, and only if no other
+            # instance re-queued it since it was read
+            snapshot = await doc_ref.get()
+            if (
+                not snapshot.exists
+                or snapshot.get("status") != IngestionStatus.FAILED.value
+            ):
+                self._stats["deduplicated"] += 1
+                return False
+            try:
+                await doc_ref.update(
+                    job,
+                    option=self.client.write_option(
+                        last_update_time=snapshot.update_time
+                    ),
+                )
+            except (FailedPrecondition, NotFound):
+                self._stats["deduplicated"] += 1
+                return False
+        self._stats["enqueued"] += 1
+        self._accept(job)
+        logger.info("Memory ingestion queued", session_id=session_id)
+        return True
+
+    def _accept(self, job: Dict[str, Any]) -> None:
+        """Take ownership of a job and schedule its next attempt."""
+        session_id = job["session_id"]
+        self._jobs[session_id] = job
+        self._schedule(session_id, job["next_attempt_at"] - time.time())
+
+    def _schedule(self, session_id: str, delay: float) -> None:
+        if delay <= 0:
+            self._queue.put_nowait(session_id)
+            return
+        loop = asyncio.get_running_loop()
+        self._retry_handles[session_id] = loop.call_later(
+            delay, self._queue.put_nowait, session_id
+        )
+
+    def _pin(self, session_id: str) -> None:
+        if self.pin_sessions:
+            get_adk_session_collector().pin(session_id)
+
+    def _unpin(self, session_id: str) -> None:
+        if self.pin_sessions:
+            get_adk_session_collector().unpin(session_id)
+
+    def _release(self, session_id: str) -> None:
+        self._jobs.pop(session_id, None)
+        self._retry_handles.pop(session_id, None)
+        self._unpin(session_id)
+
+    async def _process(self, session_id: str) -> None:
+        job = self._jobs.get(session_id)
+        if job is None:
+            return
+        self._retry_handles.pop(session_id, None)
+        doc_ref = self.collection.document(session_id)
+
+        start = time.time()
+        if job["attempts"] == 0:
+            self._lag_ms.append((start - job["enqueued_at"]) * 1000)
+        job["attempts"] += 1
+        job["status"] = IngestionStatus.RUNNING.value
+        job["lease_until"] = start + self.lease_seconds
+        await doc_ref.update(
+            {
+                "status": job["status"],
+                "attempts": job["attempts"],
+                "lease_until": job["lease_until"],
+            }
+        )
+
+        try:
+            adk_session = await self.load_session(job)
+            if adk_session is not None:
+                await self.ingest(adk_session)
+        except Exception as e:
+            await self._handle_failure(job, e)
+            return
+
+        status = IngestionStatus.DONE if adk_session else IngestionStatus.SKIPPED
+        finished = time.time()
+        await doc_ref.update(
+            {"status": status.value, "completed_at": finished, "last_error": None}
+        )
+        self._processing_ms.append((finished - start) * 1000)
+        self._completed_at.append(finished)
+        self._stats["completed" if adk_session else "skipped"] += 1
+        self._release(session_id)
+        logger.info(
+            "Memory ingestion finished",
+            session_id=session_id,
+            status=status.value,
+            attempts=job["attempts"],
+            duration_ms=round((finished - start) * 1000, 1),
+        )
+
+    async def _handle_failure(self, job: Dict[str, Any], error: Exception) -> None:
+        session_id = job["session_id"]
+        doc_ref = self.collection.document(session_id)
+        if job["attempts"] >= self.max_attempts:
+            await doc_ref.update(
+                {"status": IngestionStatus.FAILED.value, "last_error": str(error)}
+            )
+            self._stats["failed"] += 1
+            self._release(session_id)
+            logger.error(
+                "Memory ingestion failed, giving up",
+                session_id=session_id,
+                attempts=job["attempts"],
+                error=str(error),
+                error_type=type(error).__name__,
+            )
+            return
+
+        delay = self.backoff_seconds * 2 ** (job["attempts"] - 1)
+        job["status"] = IngestionStatus.PENDING.value
+        job["next_attempt_at"] = time.time() + delay
+        job["lease_until"] = job["next_attempt_at"] + self.lease_seconds
+        await doc_ref.update(
+            {
+                "status": job["status"],
+                "next_attempt_at": job["next_attempt_at"],
+                "lease_until": job["lease_until"],
+                "last_error": str(error),
+            }
+        )
+        self._stats["retries"] += 1
+        self._schedule(session_id, delay)
+        logger.warning(
+            "Memory ingestion failed, retrying",
+            session_id=session_id,
+            attempts=job["attempts"],
+            retry_in_seconds=delay,
+            error=str(error),
+        )
+
+    async def recover(self) -> int:
+        """Take over active jobs whose lease has expired."""
+        now = time.time()
+        recovered = 0
+        for doc in await self.collection.where("status", "in", ACTIVE_STATUSES).get():
+            job = doc.to_dict()
+            if job["session_id"] in self._jobs or job["lease_until"] > now:
+                continue
+            job["status"] = IngestionStatus.PENDING.value
+            job["next_attempt_at"] = now
+            job["lease_until"] = now + self.lease_seconds
+            try:
+                await doc.reference.update(
+                    {"status": job["status"], "lease_until": job["lease_until"]},
+                    option=self.client.write_option(last_update_time=doc.update_time),
+                )
+            except (FailedPrecondition, NotFound):
+                # Claimed (or finished) by another instance since the query
+                continue
+            self._pin(job["session_id"])
+            self._accept(job)
+            recovered += 1
+        if recovered:
+            self._stats["recovered"] += recovered
+            logger.info("Orphaned memory ingestion jobs recovered", count=recovered)
+        return recovered
+
+    async def _worker(self) -> None:
+        while True:
+            session_id = await self._queue.get()
+            self._running += 1
+            try:
+                await self._process(session_id)
+            except Exception as e:
+                # Job state could not be recorded; recovery picks it up later
+                logger.error(
+                    "Memory ingestion worker error",
+                    session_id=session_id,
+                    error=str(e),
+                )
+                self._release(session_id)
+            finally:
+                self._running -= 1
+                self._queue.task_done()
+
+    async def _recovery_loop(self) -> None:
+        while True:
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.warning("Memory ingestion recovery failed", error=str(e))
+            await asyncio.sleep(self.recovery_interval)
+
+    def start(self) -> None:
+        """Start the workers and the orphaned job recovery loop."""
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+        self._tasks.append(loop.create_task(self._recovery_loop()))
+        logger.info("Memory ingestion queue started", concurrency=self.concurrency)
+
+    async def join(self) -> None:
+        """Wait until no job owned by this process is queued or running."""
+        while self._jobs:
+            await asyncio.sleep(0.01)
+
+    async def stop(self) -> None:
+        """Cancel the workers; unfinished jobs stay durable for recovery."""
+        for handle in self._retry_handles.values():
+            handle.cancel()
+        self._retry_handles.clear()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._tasks = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        while (
+            self._completed_at
+            and now - self._completed_at[0] > THROUGHPUT_WINDOW_SECONDS
+        ):
+            self._completed_at.popleft()
+        lag = list(self._lag_ms)
+        processing = list(self._processing_ms)
+        return {
+            **self._stats,
+            "pending": len(self._jobs) - self._running,
+            "running": self._running,
+            "lag_ms_avg": round(statistics.mean(lag), 1) if lag else 0,
+            "lag_ms_max": round(max(lag), 1) if lag else 0,
+            "processing_ms_avg": (
+                round(statistics.mean(processing), 1) if processing else 0
+            ),
+            "throughput_per_min": len(self._completed_at),
+        }
+
+
+_queue: Optional[MemoryIngestionQueue] = None
+_init_lock = threading.Lock()
+
+
+def get_memory_ingestion_queue() -> MemoryIngestionQueue:
+    """Get the singleton memory ingestion queue."""
+    global _queue
+
+    if _queue is None:
+        with _init_lock:
+            if _queue is None:
+                _queue = MemoryIngestionQueue(
+                    get_firestore_client(),
+                    concurrency=settings.memory_ingestion_concurrency,
+                    max_attempts=settings.memory_ingestion_max_attempts,
+                    backoff_seconds=settings.memory_ingestion_backoff_seconds,
+                    lease_seconds=settings.memory_ingestion_lease_seconds,
+                    recovery_interval=settings.memory_ingestion_recovery_interval,
+                    pin_sessions=settings.adk_gc_active,
+                )
+    return _queue
+
+
+def reset_memory_ingestion_queue() -> None:
+    """Reset the queue singleton for testing purposes."""
+    global _queue
+    _queue = None
@@ -0,0 +1,238 @@
+"""Mood Lexicon - Shared phrase lexicons for audience mood extraction
+
+Text mode (TurnOrchestrator, from the Room agent's ROOM section) and audio
+mode (AudioStreamOrchestrator, from MC transcriptions) both turn free text
+into the same mood metrics for the visual mood indicator. A MoodLexicon holds
+the phrase lists for one source, built once into a KeywordMatcher, plus
+ordered score tiers:
+
+- every phrase category present in the text is found in a single pass
+- sentiment and engagement are the score of the first tier whose category was
+  found (tier order encodes priority, e.g. "disengaged" before "engaged")
+- laughter is reported when the laughter category was found
+
+Call sites keep their own post-processing (laughter boost, "no reaction"
+handling); the lexicons and tiers live here.
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Mapping, Sequence, Tuple
+
+from app.services.keyword_matcher import KeywordMatcher
+
+Tiers = Sequence[Tuple[str, float]]
+
+
+@dataclass(frozen=True)
+class MoodReading:
+    """Mood scores extracted from one text.
+
+    Attributes:
+        sentiment_score: Score of the first matching sentiment tier, else the default
+        engagement_score: Score of the first matching engagement tier, else the default
+        laughter_detected: Whether the laughter category matched
+        categories: Every phrase category found in the text
+    """
+
+    sentiment_score: float
+    engagement_score: float
+    laughter_detected: bool
+    categories: FrozenSet[str]
+
+
+class MoodLexicon:
+    """Phrase lexicon plus scoring tiers, built once.
+
+    Args:
+        phrases: Phrase lists keyed by category
+        sentiment_tiers: (category, score) pairs checked in order
+        engagement_tiers: (category, score) pairs checked in order
+        default_sentiment: Sentiment when no sentiment tier matches
+        default_engagement: Engagement when no engagement tier matches
+        laughter_category: Category whose presence sets laughter_detected
+    """
+
+    def __init__(
+        self,
+        phrases: Mapping[str, Sequence[str]],
+        *,
+        sentiment_tiers: Tiers,
+        engagement_tiers: Tiers,
+        default_sentiment: float,
+        default_engagement: float,
+        laughter_category: str = "laughter",
+    ):
+        unknown = {c for c, _ in (*sentiment_tiers, *engagement_tiers)} - set(phrases)
+        if unknown:
+            raise ValueError(f"Tiers reference unknown categories: {sorted(unknown)}")
+
+        self._phrases = {category: tuple(p) for category, p in phrases.items()}
+        self._matcher = KeywordMatcher(self._phrases)
+        self._sentiment_tiers = tuple(sentiment_tiers)
+        self._engagement_tiers = tuple(engagement_tiers)
+        self._default_sentiment = default_sentiment
+        self._default_engagement = default_engagement
+        self._laughter_category = laughter_category
+
+    def categories_in(self, text: str) -> FrozenSet[str]:
+        """Phrase categories present in the text (case-insensitive)."""
+        counts = self._matcher.count(text)
+        return frozenset(category for category, count in counts.items() if count)
+
+    @staticmethod
+    def _first_tier(
+        tiers: Tuple[Tuple[str, float], ...], found, default: float
+    ) -> float:
+        for category, score in tiers:
+            if category in found:
+                return score
+        return default
+
+    def analyze(self, text: str) -> MoodReading:
+        """Score the text against the lexicon in a single matching pass."""
+        found = self.categories_in(text)
+        return MoodReading(
+            sentiment_score=self._first_tier(
+                self._sentiment_tiers, found, self._default_sentiment
+            ),
+            engagement_score=self._first_tier(
+                self._engagement_tiers, found, self._default_engagement
+            ),
+            laughter_detected=self._laughter_category in found,
+            categories=found,
+        )
+
+
+# Room agent analysis text (text mode). Engagement tiers check negative phrases
+# first: "disengaged" contains "engaged".
+ROOM_ANALYSIS_LEXICON = MoodLexicon(
+    {
+        "laughter": [
+            "laugh",
+            "laughing",
+            "hilarious",
+            "cracking up",
+            "roar",
+            "hysterical",
+            "chuckle",
+            "giggle",
+            "guffaw",
+        ],
+        "disengaged": ["disengaged", "checking their phones", "not paying attention"],
+        "bored": ["bored", "distracted", "low energy", "low engagement"],
+        "moderate": ["moderate", "watching"],
+        "highly_engaged": ["highly engaged", "leaning forward", "on the edge"],
+        "engaged": ["engaged", "attentive", "following", "interested"],
+        "positive_high": [
+            "loving",
+            "enthusiastic",
+            "excited",
+            "thrilled",
+            "ecstatic",
+            "uproarious",
+            "wild",
+            "erupting",
+            "explosive",
+        ],
+        "positive_mid": [
+            "positive",
+            "enjoying",
+            "happy",
+            "pleased",
+            "delighted",
+            "jovial",
+            "lighthearted",
+            "playful",
+            "amused",
+            "fun",
+            "warmth",
+            "warm",
+            "cheerful",
+            "joyful",
+            "gleeful",
+        ],
+        "negative_high": ["hostile", "angry", "furious", "heckling"],
+        "negative_mid": [
+            "negative",
+            "bored",
+            "disengaged",
+            "disappointed",
+            "frustrated",
+            "confused",
+            "lost",
+        ],
+    },
+    sentiment_tiers=[
+        ("positive_high", 0.8),
+        ("positive_mid", 0.5),
+        ("negative_high", -0.8),
+        ("negative_mid", -0.5),
+    ],
+    engagement_tiers=[
+        ("disengaged", 0.1),
+        ("bored", 0.2),
+        ("moderate", 0.5),
+        ("highly_engaged", 0.9),
+        ("engaged", 0.7),
+    ],
+    default_sentiment=0.0,
+    default_engagement=0.5,
+)
+
+# MC transcriptions (audio mode). Priority: laughter, excitement, tension,
+# then general engagement; text with none of these carries no mood signal.
+MC_TRANSCRIPTION_LEXICON = MoodLexicon(
+    {
+        "laughter": [
+            "cracking up",
+            "big laugh",
+            "laughter",
+            "laughing",
+            "that's hilarious",
+            "crowd is dying",
+            "rolling",
+        ],
+        "excitement": [
+            "crowd goes wild",
+            "standing ovation",
+            "cheering",
+            "crowd is loving",
+            "energy building",
+            "on the edge of their seats",
+            "rooting for you",
+            "they're cheering",
+            "amazing",
+        ],
+        "engagement": [
+            "audience is",
+            "crowd is",
+            "the room",
+            "everyone's",
+            "nodding heads",
+            "i can feel",
+            "i hear",
+            "i see",
+        ],
+        "tension": [
+            "goes quiet",
+            "holding their breath",
+            "anticipation",
+            "tension",
+            "suspense",
+        ],
+    },
+    sentiment_tiers=[
+        ("laughter", 0.9),
+        ("excitement", 0.8),
+        ("tension", 0.6),
+        ("engagement", 0.7),
+    ],
+    engagement_tiers=[
+        ("laughter", 0.95),
+        ("excitement", 0.9),
+        ("tension", 0.85),
+        ("engagement", 0.75),
+    ],
+    default_sentiment=0.5,
+    default_engagement=0.5,
+)
@@ -1,7 +1,9 @@
 """Performance Tuning Configuration and Utilities"""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
+
+from app.utils.token_counter import TokenCounter, count_turn_tokens, get_token_counter
 
 
 @dataclass
@@ -92,14 +94,17 @@ class ContextCompactor:
     Utility for compacting conversation context to stay within token limits
 
     Strategies:
-    1. Keep most recent N turns (recency bias)
-    2. Keep first turn (scene setup)
-    3. Summarize middle turns if needed
+    1. Keep first turn (scene setup)
+    2. Keep most recent turns (recency bias), newest first, while they fit
+    3. Always keep the last keep_recent turns
+
+    Turns are measured with the configured token counter, reusing the
+    count cached on each stored turn when there is one.
     """
 
-    def __init__(self, max_tokens: int = 4000):
+    def __init__(self, max_tokens: int = 4000, counter: Optional[TokenCounter] = None):
         self.max_tokens = max_tokens
-        self.avg_tokens_per_turn = 150
+        self.counter = counter or get_token_counter()
 
     def compact_history(self, conversation_history: list, keep_recent: int = 3) -> list:
         """
@@ -115,32 +120,32 @@ class ContextCompactor:
         if not conversation_history:
             return []
 
-        history_length = len(conversation_history)
-        estimated_tokens = history_length * self.avg_tokens_per_turn
-
-        if estimated_tokens <= self.max_tokens:
-            return conversation_history
-
-        max_turns = self.max_tokens // self.avg_tokens_per_turn
-
-        if history_length <= max_turns:
+        turn_tokens = [
+            count_turn_tokens(self.counter, turn) for turn in conversation_history
+        ]
+        if sum(turn_tokens) <= self.max_tokens:
             return conversation_history
 
+        history_length = len(conversation_history)
         if history_length <= keep_recent + 1:
             return conversation_history
 
-        first_turn = conversation_history[0]
-        recent_turns = conversation_history[-keep_recent:]
+        used_tokens = turn_tokens[0]
+        start = history_length
+        while start > 1:
+            kept = history_length - start
+            if kept >= keep_recent and used_tokens + turn_tokens[start - 1] > (
+                self.max_tokens
+            ):
+                break
+            start -= 1
+            used_tokens += turn_tokens[start]
 
-        return [first_turn] + recent_turns
+        return [conversation_history[0]] + conversation_history[start:]
 
     def estimate_tokens(self, text: str) -> int:
-        """
-        Estimate token count for text
-
-        Rough approximation: 1 token ≈ 4 characters
-        """
-        return len(text) // 4
+        """Count tokens for text with the configured token counter."""
+        return self.counter.count(text)
 
 
 class FirestoreBatchWriter:
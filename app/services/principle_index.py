@@ -0,0 +1,179 @@
+"""Principle Index - In-memory full-text index over the improv principles
+
+Built once per tool data snapshot so Coach agent lookups need no I/O:
+
+- id map and importance buckets for point lookups and filters
+- an inverted index over name, description, examples and coaching tips with
+  light stemming ("listening", "listened" and "listens" all index as "listen")
+- ranked keyword search: TF-IDF scores with per-field weights, so a match in
+  a principle's name outranks one buried in a coaching tip
+
+Principle dictionaries held by the index are shared with the snapshot and must
+be treated as read-only; the data service hands out copies.
+"""
+
+import bisect
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Importance levels returned by get_beginner_essentials
+BEGINNER_IMPORTANCE_LEVELS = ("foundational", "essential")
+
+# Relative weight of a term occurrence per indexed field
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "description": 2.0,
+    "examples": 1.0,
+    "coaching_tips": 1.0,
+}
+
+# Query terms this short only match whole terms, never as a prefix
+MIN_PREFIX_LENGTH = 3
+
+# Score multiplier for terms matched by prefix rather than exactly
+PREFIX_MATCH_WEIGHT = 0.5
+
+# Term-frequency saturation constant (BM25-style)
+TF_SATURATION = 1.2
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i if in is it its of on or "
+    "so that the their them they this to was we what when with you your".split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def stem(token: str) -> str:
+    """Strip common English inflections from a lowercase token.
+
+    Deliberately conservative: only plural, -ing, -ed and -ly endings are
+    removed, which is enough to match the phrasing variations in the
+    principles corpus without a full stemmer dependency.
+    """
+    if len(token) <= 3:
+        return token
+    if token.endswith("sses"):
+        return token[:-2]
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    for suffix, min_stem in (("ing", 3), ("ed", 3)):
+        if token.endswith(suffix) and len(token) - len(suffix) >= min_stem:
+            base = token[: -len(suffix)]
+            # running -> run, planned -> plan
+            if len(base) > 3 and base[-1] == base[-2] and base[-1] not in "lsz":
+                base = base[:-1]
+            return base
+    if token.endswith("ly") and len(token) > 5:
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase stemmed terms (apostrophes are dropped)."""
+    return [stem(t) for t in _TOKEN.findall(text.lower().replace("'", ""))]
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(item) for item in value)
+    return str(value) if value is not None else ""
+
+
+class PrincipleIndex:
+    """Immutable full-text index over a list of principle documents.
+
+    Args:
+        principles: Principle dictionaries, each with at least ``id``
+    """
+
+    def __init__(self, principles: Iterable[Dict[str, Any]]):
+        self._principles: Tuple[Dict[str, Any], ...] = tuple(principles)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_importance: Dict[str, List[int]] = defaultdict(list)
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+
+        for pos, principle in enumerate(self._principles):
+            self._by_id[principle["id"]] = principle
+
+            importance = principle.get("importance")
+            if isinstance(importance, str):
+                self._by_importance[importance.lower()].append(pos)
+
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in tokenize(_field_text(principle.get(field))):
+                    doc_postings = postings[term]
+                    doc_postings[pos] = doc_postings.get(pos, 0.0) + weight
+
+        doc_count = len(self._principles)
+        self._postings: Dict[str, Dict[int, float]] = dict(postings)
+        self._idf: Dict[str, float] = {
+            term: math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self._postings.items()
+        }
+        self._vocabulary: List[str] = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._principles)
+
+    @property
+    def principles(self) -> Tuple[Dict[str, Any], ...]:
+        return self._principles
+
+    def get(self, principle_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a principle by document ID."""
+        return self._by_id.get(principle_id)
+
+    def by_importance(self, *levels: str) -> List[Dict[str, Any]]:
+        """Principles with any of the given importance levels, in collection order."""
+        positions = sorted(
+            pos
+            for level in levels
+            for pos in self._by_importance.get(level.lower(), [])
+        )
+        return [self._principles[pos] for pos in positions]
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """Index terms matching a query term, with their match weight."""
+        matches = []
+        if term in self._postings:
+            matches.append((term, 1.0))
+        if len(term) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_right(self._vocabulary, term)
+            for candidate in self._vocabulary[start:]:
+                if not candidate.startswith(term):
+                    break
+                matches.append((candidate, PREFIX_MATCH_WEIGHT))
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank principles by relevance to a free-text query.
+
+        Terms are OR-ed: principles matching more (and rarer) query terms,
+        in higher-weighted fields, rank first; ties keep collection order.
+        An empty query returns every principle in collection order.
+        """
+        if not query.strip():
+            principles = list(self._principles)
+            return principles[:limit] if limit is not None else principles
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        # Ignore stopwords unless the query is nothing but stopwords
+        content_terms = [t for t in terms if t not in STOPWORDS] or terms
+
+        scores: Dict[int, float] = defaultdict(float)
+        for query_term in content_terms:
+            for term, match_weight in self._expand(query_term):
+                idf = self._idf[term]
+                for pos, tf in self._postings[term].items():
+                    saturated = tf * (TF_SATURATION + 1) / (tf + TF_SATURATION)
+                    scores[pos] += match_weight * idf * saturated
+
+        ranked = sorted(scores, key=lambda pos: (-scores[pos], pos))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self._principles[pos] for pos in ranked]
@@ -0,0 +1,127 @@
+"""Sentiment Keyword Store - Process-wide, immutable sentiment keyword lists
+
+Every Room agent build creates a new SentimentAnalysisToolset, so keyword
+lists must not be owned by toolset instances. The store derives one frozen
+SentimentKeywords view per tool data snapshot and hands the same object to
+every caller. Refreshes follow the tool data cache (TTL revalidation and the
+periodic refresh started at app startup); a new view is only built when the
+snapshot actually changes.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from app.services import firestore_tool_data_service as data_service
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.tool_data_cache import ToolDataSnapshot
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SentimentKeywords:
+    """Read-only sentiment keyword lists shared by all toolset instances.
+
+    Attributes:
+        positive: Keywords indicating positive sentiment
+        negative: Keywords indicating negative sentiment
+        engagement_high: Keywords indicating high audience engagement
+        engagement_low: Keywords indicating low audience engagement
+        version: Tool data snapshot version the lists were built from
+        sentiment_matcher: Matcher for the positive/negative lists
+        engagement_matcher: Matcher for the high/low engagement lists
+    """
+
+    positive: Tuple[str, ...] = ()
+    negative: Tuple[str, ...] = ()
+    engagement_high: Tuple[str, ...] = ()
+    engagement_low: Tuple[str, ...] = ()
+    version: int = 0
+    sentiment_matcher: KeywordMatcher = field(init=False, repr=False, compare=False)
+    engagement_matcher: KeywordMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Matchers are built once per keyword load and shared with the view
+        object.__setattr__(
+            self,
+            "sentiment_matcher",
+            KeywordMatcher({"positive": self.positive, "negative": self.negative}),
+        )
+        object.__setattr__(
+            self,
+            "engagement_matcher",
+            KeywordMatcher({"high": self.engagement_high, "low": self.engagement_low}),
+        )
+
+    @classmethod
+    def from_dict(
+        cls, keywords: Dict[str, Any], version: int = 0
+    ) -> "SentimentKeywords":
+        """Build from the get_sentiment_keywords dictionary format."""
+        engagement = keywords.get("engagement") or {}
+        return cls(
+            positive=tuple(keywords.get("positive", [])),
+            negative=tuple(keywords.get("negative", [])),
+            engagement_high=tuple(engagement.get("high", [])),
+            engagement_low=tuple(engagement.get("low", [])),
+            version=version,
+        )
+
+
+class SentimentKeywordStore:
+    """Shares one SentimentKeywords view per tool data snapshot."""
+
+    def __init__(self) -> None:
+        self._stats = {"reads": 0, "loads": 0}
+        self._current: Optional[SentimentKeywords] = None
+
+    def _build(self, snapshot: ToolDataSnapshot) -> SentimentKeywords:
+        keywords = SentimentKeywords.from_dict(
+            snapshot.sentiment_keywords, version=snapshot.version
+        )
+        self._stats["loads"] += 1
+        self._current = keywords
+        logger.info(
+            "Sentiment keywords loaded",
+            version=snapshot.version,
+            source=snapshot.source,
+            positive_count=len(keywords.positive),
+            negative_count=len(keywords.negative),
+        )
+        return keywords
+
+    async def get(self) -> SentimentKeywords:
+        """Return the keyword view for the current tool data snapshot."""
+        self._stats["reads"] += 1
+        return await data_service.get_tool_data_cache().get_derived(
+            "sentiment_keywords", self._build
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "version": self._current.version if self._current else None,
+        }
+
+
+_store: Optional[SentimentKeywordStore] = None
+_store_lock = threading.Lock()
+
+
+def get_sentiment_keyword_store() -> SentimentKeywordStore:
+    """Get the singleton sentiment keyword store."""
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SentimentKeywordStore()
+    return _store
+
+
+def reset_sentiment_keyword_store() -> None:
+    """Reset the store singleton for testing purposes."""
+    global _store
+    _store = None
@@ -9,6 +9,8 @@ from google.adk.sessions.session import Session as ADKSession
 from app.config import get_settings
 from app.utils.logger import get_logger
 from app.models.session import Session, SessionStatus, SessionCreate
+from app.services.adk_session_gc import get_adk_session_collector
+from app.services.adk_session_rehydration import rehydrate_adk_session
 from app.services.adk_session_service import get_adk_session_service
 
 logger = get_logger(__name__)
@@ -262,6 +264,7 @@ class SessionManager:
         turn_data: Dict[str, Any],
         new_phase: Optional[str] = None,
         new_status: Optional[SessionStatus] = None,
+        context_summary: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Atomically update session with turn data, phase, and status using Firestore transaction.
@@ -273,6 +276,8 @@ class SessionManager:
             turn_data: Turn information to append to history
             new_phase: Optional new phase value
             new_status: Optional new status value
+            context_summary: Optional rolling context summary to store in
+                metadata (see ContextManager.record_turn)
         """
         try:
 
@@ -291,6 +296,9 @@ class SessionManager:
                 if new_status is not None:
                     updates["status"] = new_status.value
 
+                if context_summary is not None:
+                    updates["metadata.context_summary"] = context_summary
+
                 # Atomic update
                 transaction.update(doc_ref, updates)
 
@@ -329,6 +337,10 @@ class SessionManager:
                 }
             )
 
+            if self.use_adk_sessions and settings.adk_gc_active:
+                # The local ADK session is deleted on the next GC sweep
+                get_adk_session_collector().mark_closed(session_id)
+
             logger.info("Session closed", session_id=session_id)
 
         except Exception as e:
@@ -502,16 +514,16 @@ class SessionManager:
             )
             return adk_session
 
-        # Create new ADK session if not found
+        # Not in the local database (new or restarted instance): recreate it,
+        # rehydrating a compact history from the Firestore conversation
         status_value = (
             firestore_session.status
             if isinstance(firestore_session.status, str)
             else firestore_session.status.value
         )
-        adk_session = await self.adk_session_service.create_session(
-            app_name=settings.app_name,
-            user_id=firestore_session.user_id,
-            session_id=firestore_session.session_id,
+        adk_session = await rehydrate_adk_session(
+            self.adk_session_service,
+            firestore_session,
             state={
                 "user_email": firestore_session.user_email,
                 "user_name": firestore_session.user_name,
@@ -522,7 +534,9 @@ class SessionManager:
         )
 
         logger.info(
-            "ADK session created in DatabaseSessionService", session_id=session_id
+            "ADK session created in DatabaseSessionService",
+            session_id=session_id,
+            history_turns=len(firestore_session.conversation_history),
         )
 
         return adk_session
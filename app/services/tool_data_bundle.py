@@ -0,0 +1,173 @@
+"""Tool Data Bundle - Versioned local snapshot of the improv tool data
+
+The canonical games, principles, archetypes and sentiment keywords live in
+scripts/seed_firestore_tool_data.py. scripts/build_tool_data_snapshot.py
+serializes them into a compact JSON bundle shipped with the app
+(app/data/tool_data_snapshot.json). At startup the bundle becomes the initial
+ToolDataSnapshot, so the first tool call on a cold instance is served from
+local data while Firestore is reconciled in the background.
+
+Bundle layout::
+
+    {
+        "schema_version": 1,
+        "data_version": "<sha256 prefix of the content>",
+        "generated_at": "<ISO timestamp>",
+        "games": [...],
+        "principles": [...],
+        "archetypes": [...],
+        "sentiment_keywords": {...}
+    }
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from app.services.tool_data_cache import ToolDataSnapshot
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the bundle layout changes; bundles with another version are ignored
+BUNDLE_SCHEMA_VERSION = 1
+
+DEFAULT_BUNDLE_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "tool_data_snapshot.json"
+)
+
+# Version given to the bundled snapshot; the first Firestore load becomes 2
+BUNDLED_SNAPSHOT_VERSION = 1
+
+_CONTENT_KEYS = ("games", "principles", "archetypes", "sentiment_keywords")
+
+
+def parse_sentiment_keywords(
+    docs: Iterable[Tuple[str, Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Shape sentiment keyword documents into the get_sentiment_keywords format.
+
+    Args:
+        docs: (document id, document data) pairs from the sentiment_keywords
+            collection
+
+    Returns:
+        Dictionary with 'positive', 'negative', and 'engagement' keyword lists.
+    """
+    keywords: Dict[str, Any] = {
+        "positive": [],
+        "negative": [],
+        "engagement": {"high": [], "low": []},
+    }
+
+    for doc_id, data in docs:
+        if doc_id == "positive_keywords":
+            keywords["positive"] = data.get("keywords", [])
+        elif doc_id == "negative_keywords":
+            keywords["negative"] = data.get("keywords", [])
+        elif doc_id == "engagement_keywords":
+            keywords["engagement"] = data.get("keywords", {"high": [], "low": []})
+
+    return keywords
+
+
+def _data_version(content: Dict[str, Any]) -> str:
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def build_bundle(
+    games: List[Dict[str, Any]],
+    principles: List[Dict[str, Any]],
+    archetypes: List[Dict[str, Any]],
+    sentiment_docs: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build a bundle from seed data.
+
+    Args:
+        games: Game documents, each including its ``id``
+        principles: Principle documents, each including its ``id``
+        archetypes: Archetype documents, each including its ``id``
+        sentiment_docs: Sentiment keyword documents keyed by document id
+
+    Returns:
+        JSON-serializable bundle dictionary.
+    """
+    content = {
+        "games": games,
+        "principles": principles,
+        "archetypes": archetypes,
+        "sentiment_keywords": parse_sentiment_keywords(sentiment_docs.items()),
+    }
+    return {
+        "schema_version": BUNDLE_SCHEMA_VERSION,
+        "data_version": _data_version(content),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        **content,
+    }
+
+
+def dump_bundle(bundle: Dict[str, Any]) -> str:
+    """Serialize a bundle as compact JSON."""
+    return json.dumps(bundle, separators=(",", ":"), ensure_ascii=False)
+
+
+def load_bundled_snapshot(
+    path: Union[str, Path, None] = None,
+) -> Optional[ToolDataSnapshot]:
+    """Load the bundled tool data as a provisional ToolDataSnapshot.
+
+    Args:
+        path: Bundle file, defaults to DEFAULT_BUNDLE_PATH
+
+    Returns:
+        Snapshot marked provisional (so the cache revalidates it against
+        Firestore), or None if the bundle is missing, unreadable or has an
+        unsupported schema version.
+    """
+    bundle_path = Path(path) if path else DEFAULT_BUNDLE_PATH
+
+    try:
+        bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.info("No bundled tool data snapshot", path=str(bundle_path))
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(
+            "Failed to read bundled tool data snapshot",
+            path=str(bundle_path),
+            error=str(e),
+        )
+        return None
+
+    schema_version = bundle.get("schema_version")
+    if schema_version != BUNDLE_SCHEMA_VERSION or not all(
+        key in bundle for key in _CONTENT_KEYS
+    ):
+        logger.warning(
+            "Ignoring bundled tool data snapshot with unsupported schema",
+            path=str(bundle_path),
+            schema_version=schema_version,
+        )
+        return None
+
+    snapshot = ToolDataSnapshot(
+        games=tuple(bundle["games"]),
+        principles=tuple(bundle["principles"]),
+        archetypes=tuple(bundle["archetypes"]),
+        sentiment_keywords=bundle["sentiment_keywords"],
+        version=BUNDLED_SNAPSHOT_VERSION,
+        source="bundled",
+        provisional=True,
+    )
+    logger.info(
+        "Loaded bundled tool data snapshot",
+        data_version=bundle.get("data_version"),
+        generated_at=bundle.get("generated_at"),
+        games=len(snapshot.games),
+        principles=len(snapshot.principles),
+        archetypes=len(snapshot.archetypes),
+    )
+    return snapshot
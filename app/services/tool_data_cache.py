@@ -0,0 +1,242 @@
+"""Tool Data Snapshot Cache - Instance-wide cache for improv reference data
+
+Games, principles, archetypes and sentiment keywords change rarely but are read
+on almost every agent turn. This module keeps one immutable snapshot of all
+four collections per instance:
+
+- Snapshots are built by a loader and swapped in atomically (single reference
+  assignment), so readers never see a partially refreshed state
+- Reads never wait on Firestore once a snapshot exists; a stale snapshot is
+  served while a background refresh revalidates it (stale-while-revalidate)
+- An optional periodic refresh task keeps the snapshot warm
+- Concurrent cold reads share a single in-flight load
+- A provisional snapshot (e.g. the bundled local data) is served immediately
+  but revalidated on first read, as if it were already stale
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ToolDataSnapshot:
+    """Immutable view of all tool data collections at one point in time.
+
+    Attributes:
+        games: Game documents, each including its ``id``
+        principles: Principle documents, each including its ``id``
+        archetypes: Archetype documents, each including its ``id``
+        sentiment_keywords: Keyword lists as returned by get_sentiment_keywords
+        version: Monotonic version, incremented on every successful refresh
+        loaded_at: time.monotonic() when the snapshot was built
+        source: Where the data came from (e.g. "firestore", "bundled")
+        provisional: Served as-is but revalidated on the next read
+    """
+
+    games: Tuple[Dict[str, Any], ...] = ()
+    principles: Tuple[Dict[str, Any], ...] = ()
+    archetypes: Tuple[Dict[str, Any], ...] = ()
+    sentiment_keywords: Dict[str, Any] = field(default_factory=dict)
+    version: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+    source: str = "firestore"
+    provisional: bool = False
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+
+SnapshotLoader = Callable[[int], Awaitable[ToolDataSnapshot]]
+
+T = TypeVar("T")
+
+
+class ToolDataCache:
+    """Holds the current ToolDataSnapshot and refreshes it in the background.
+
+    Args:
+        loader: Coroutine function building a snapshot for a given version
+        ttl_seconds: Age after which a read triggers a background refresh
+    """
+
+    # Minimum spacing between background refresh attempts after a failure
+    RETRY_BACKOFF_SECONDS = 30.0
+
+    def __init__(self, loader: SnapshotLoader, ttl_seconds: int = 300):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[ToolDataSnapshot] = None
+        self._last_failure_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._periodic_task: Optional[asyncio.Task] = None
+        self._derived: Dict[str, Tuple[ToolDataSnapshot, Any]] = {}
+        self._stats = {
+            "hits": 0,
+            "cold_loads": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "stale_reads": 0,
+        }
+
+    @property
+    def snapshot(self) -> Optional[ToolDataSnapshot]:
+        """Current snapshot without triggering a load (None if never loaded)."""
+        return self._snapshot
+
+    def set_snapshot(self, snapshot: ToolDataSnapshot) -> None:
+        """Atomically replace the current snapshot."""
+        self._snapshot = snapshot
+
+    async def get(self) -> ToolDataSnapshot:
+        """Return the current snapshot, loading it on first use.
+
+        A provisional snapshot, or one older than ``ttl_seconds``, is returned
+        immediately while a refresh runs in the background.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            self._stats["cold_loads"] += 1
+            return await self._refresh_shared()
+
+        self._stats["hits"] += 1
+        if snapshot.provisional or (
+            self.ttl_seconds and snapshot.age_seconds > self.ttl_seconds
+        ):
+            self._stats["stale_reads"] += 1
+            if not self._in_backoff():
+                self._schedule_refresh()
+        return snapshot
+
+    async def get_derived(
+        self, key: str, builder: Callable[[ToolDataSnapshot], T]
+    ) -> T:
+        """Return a structure derived from the current snapshot.
+
+        The builder runs once per snapshot version; later calls reuse its
+        result until a refresh swaps in a new snapshot.
+        """
+        snapshot = await self.get()
+        entry = self._derived.get(key)
+        if entry is not None and entry[0] is snapshot:
+            return entry[1]
+        value = builder(snapshot)
+        self._derived[key] = (snapshot, value)
+        return value
+
+    def revalidate(self) -> None:
+        """Schedule a background refresh without waiting for it."""
+        self._schedule_refresh()
+
+    async def refresh(self) -> ToolDataSnapshot:
+        """Reload the snapshot now, sharing any refresh already in flight."""
+        return await self._refresh_shared()
+
+    def _in_backoff(self) -> bool:
+        return (
+            self._last_failure_at is not None
+            and time.monotonic() - self._last_failure_at < self.RETRY_BACKOFF_SECONDS
+        )
+
+    def _in_flight(self) -> Optional[asyncio.Task]:
+        task = self._refresh_task
+        if task is None or task.done():
+            return None
+        # Tasks are bound to their event loop; ignore ones from a previous loop
+        if task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _schedule_refresh(self) -> asyncio.Task:
+        task = self._in_flight()
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._do_refresh())
+            self._refresh_task = task
+        return task
+
+    async def _refresh_shared(self) -> ToolDataSnapshot:
+        return await asyncio.shield(self._schedule_refresh())
+
+    async def _do_refresh(self) -> ToolDataSnapshot:
+        current = self._snapshot
+        version = (current.version if current else 0) + 1
+        start = time.perf_counter()
+        try:
+            snapshot = await self._loader(version)
+        except Exception as e:
+            self._stats["refresh_failures"] += 1
+            self._last_failure_at = time.monotonic()
+            if current is None:
+                logger.error("Tool data snapshot load failed", error=str(e))
+                raise
+            logger.warning(
+                "Tool data refresh failed, serving previous snapshot",
+                version=current.version,
+                error=str(e),
+            )
+            return current
+
+        self._snapshot = snapshot
+        self._last_failure_at = None
+        self._stats["refreshes"] += 1
+        logger.info(
+            "Tool data snapshot refreshed",
+            version=snapshot.version,
+            source=snapshot.source,
+            games=len(snapshot.games),
+            principles=len(snapshot.principles),
+            archetypes=len(snapshot.archetypes),
+            duration_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        return snapshot
+
+    def start_periodic_refresh(self, interval_seconds: float) -> None:
+        """Start a background task refreshing the snapshot every interval."""
+        if self._periodic_task and not self._periodic_task.done():
+            return
+
+        async def _loop() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    await self.refresh()
+                except Exception:
+                    # Already logged in _do_refresh; keep the loop alive
+                    pass
+
+        self._periodic_task = asyncio.get_running_loop().create_task(_loop())
+        logger.info("Tool data periodic refresh started", interval=interval_seconds)
+
+    async def stop(self) -> None:
+        """Cancel background refresh tasks."""
+        for task in (self._periodic_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._periodic_task = None
+        self._refresh_task = None
+
+    def invalidate(self) -> None:
+        """Drop the current snapshot so the next read reloads it."""
+        self._snapshot = None
+        self._derived.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "version": snapshot.version if snapshot else None,
+            "source": snapshot.source if snapshot else None,
+            "provisional": snapshot.provisional if snapshot else None,
+            "age_seconds": round(snapshot.age_seconds, 1) if snapshot else None,
+            "ttl_seconds": self.ttl_seconds,
+        }
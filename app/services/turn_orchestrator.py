@@ -14,7 +14,13 @@ from app.services.session_manager import SessionManager
 from app.services.agent_cache import get_agent_cache
 from app.services.context_manager import get_context_manager
 from app.services.adk_session_service import get_adk_session_service
+from app.services.adk_event_compaction import (
+    schedule_compaction,
+    wait_for_compaction,
+)
 from app.services.adk_memory_service import get_adk_memory_service, search_user_memories
+from app.services.mood_lexicon import ROOM_ANALYSIS_LEXICON
+from app.toolsets.tool_call_cache import get_tool_call_cache
 from app.utils.logger import get_logger
 from app.config import get_settings
 
@@ -150,6 +156,8 @@ class TurnOrchestrator:
             # This handles the case where the request is routed to a different
             # Cloud Run instance that doesn't have the session in its local SQLite DB.
             # get_adk_session() will create the session if it doesn't exist.
+            # A compaction started after the previous turn finishes first.
+            await wait_for_compaction(session.session_id)
             adk_session = await self.session_manager.get_adk_session(session.session_id)
             if not adk_session:
                 logger.error(
@@ -190,6 +198,9 @@ class TurnOrchestrator:
                 turn_number=turn_number,
             )
 
+            if settings.adk_event_compaction_enabled:
+                self._compact_adk_session(adk_session)
+
             logger.info(
                 "Turn executed successfully",
                 session_id=session.session_id,
@@ -208,6 +219,16 @@ class TurnOrchestrator:
             )
             raise
 
+    def _compact_adk_session(self, adk_session) -> None:
+        """Compact the ADK session's events in the background, off the turn.
+
+        Uses the event count of the session as loaded for this turn, so a
+        session is compacted on the turn after it crosses the trigger.
+        A failed compaction leaves the session unchanged and is logged by
+        the background task.
+        """
+        schedule_compaction(get_adk_session_service(), adk_session)
+
     def _build_context(
         self, session: Session, user_input: str, turn_number: int
     ) -> str:
@@ -325,6 +346,7 @@ ROOM: [Audience vibe analysis]
         Raises:
             asyncio.TimeoutError: If agent execution exceeds timeout
         """
+        invocation_ids = set()
         try:
             new_message = types.Content(
                 role="user", parts=[types.Part.from_text(text=prompt)]
@@ -336,6 +358,8 @@ ROOM: [Audience vibe analysis]
                 async for event in runner.run_async(
                     user_id=user_id, session_id=session_id, new_message=new_message
                 ):
+                    invocation_ids.add(getattr(event, "invocation_id", None))
+
                     # Skip events that contain tool/function calls (internal orchestration)
                     # These include transfer_to_agent calls that shouldn't be shown to users
                     if (
@@ -372,6 +396,11 @@ ROOM: [Audience vibe analysis]
                 "Agent execution timed out", timeout=timeout, prompt_length=len(prompt)
             )
             raise
+        finally:
+            # The invocation is over; its memoized tool results are no longer needed
+            tool_call_cache = get_tool_call_cache()
+            for invocation_id in invocation_ids:
+                tool_call_cache.end_invocation(invocation_id)
 
     def _extract_mood_metrics(self, room_analysis: str) -> Dict[str, Any]:
         """Extract mood metrics from room analysis text for visual mood indication.
@@ -416,93 +445,10 @@ ROOM: [Audience vibe analysis]
             )
             room_analysis = room_analysis[:MAX_ANALYSIS_LENGTH]
 
-        analysis_lower = room_analysis.strip().lower()
-
-        # Laughter detection keywords
-        laughter_keywords = [
-            "laugh",
-            "laughing",
-            "hilarious",
-            "cracking up",
-            "roar",
-            "hysterical",
-            "chuckle",
-            "giggle",
-            "guffaw",
-        ]
-        laughter_detected = any(
-            keyword in analysis_lower for keyword in laughter_keywords
-        )
-
-        # Engagement score calculation - check negative first to avoid substring issues
-        # ("disengaged" contains "engaged", so check disengaged first)
-        engagement_score = 0.5  # Default neutral
-        engagement_map = [
-            (["disengaged", "checking their phones", "not paying attention"], 0.1),
-            (["bored", "distracted", "low energy", "low engagement"], 0.2),
-            (["moderate", "watching"], 0.5),
-            (["highly engaged", "leaning forward", "on the edge"], 0.9),
-            (["engaged", "attentive", "following", "interested"], 0.7),
-        ]
-        for keywords, score in engagement_map:
-            if any(keyword in analysis_lower for keyword in keywords):
-                engagement_score = score
-                break
-
-        # Sentiment score calculation
-        sentiment_score = 0.0  # Default neutral
-
-        # Positive sentiment keywords (higher weight)
-        positive_high = [
-            "loving",
-            "enthusiastic",
-            "excited",
-            "thrilled",
-            "ecstatic",
-            "uproarious",
-            "wild",
-            "erupting",
-            "explosive",
-        ]
-        positive_mid = [
-            "positive",
-            "enjoying",
-            "happy",
-            "pleased",
-            "delighted",
-            "jovial",
-            "lighthearted",
-            "playful",
-            "amused",
-            "fun",
-            "warmth",
-            "warm",
-            "cheerful",
-            "joyful",
-            "gleeful",
-        ]
-
-        # Negative sentiment keywords
-        negative_high = ["hostile", "angry", "furious", "heckling"]
-        negative_mid = [
-            "negative",
-            "bored",
-            "disengaged",
-            "disappointed",
-            "frustrated",
-            "confused",
-            "lost",
-        ]
-
-        # Calculate sentiment based on keyword presence
-        if any(word in analysis_lower for word in positive_high):
-            sentiment_score = 0.8
-        elif any(word in analysis_lower for word in positive_mid):
-            sentiment_score = 0.5
-        elif any(word in analysis_lower for word in negative_high):
-            sentiment_score = -0.8
-        elif any(word in analysis_lower for word in negative_mid):
-            sentiment_score = -0.5
+        reading = ROOM_ANALYSIS_LEXICON.analyze(room_analysis.strip())
+        laughter_detected = reading.laughter_detected
+        engagement_score = reading.engagement_score
+        sentiment_score = reading.sentiment_score
 
         # Boost scores if laughter detected (laughter indicates high positive engagement)
         if laughter_detected:
@@ -644,12 +590,16 @@ ROOM: [Audience vibe analysis]
         elif turn_number >= 15:
             new_status = SessionStatus.SCENE_COMPLETE
 
+        # Fold the turn into the stored rolling summary (O(1) per turn)
+        context_summary = self.context_manager.record_turn(session, turn_data)
+
         # Single atomic update for consistency
         await self.session_manager.update_session_atomic(
             session_id=session.session_id,
             turn_data=turn_data,
             new_phase=new_phase if phase_updated else None,
             new_status=new_status,
+            context_summary=context_summary,
         )
 
         if phase_updated:
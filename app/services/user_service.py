@@ -5,11 +5,19 @@ This service provides async Firestore operations for user management including:
 - User creation with tier assignment
 - Tier updates
 - Audio usage tracking
+- Cursor-paginated user listing
+- Bulk import with batched writes
 - Migration from ALLOWED_USERS environment variable
 """
 
+import asyncio
+import base64
+import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Callable, Set, AsyncIterator, Tuple
+
+from google.cloud.firestore_v1.field_path import FieldPath
 
 from app.config import get_settings
 from app.models.user import UserProfile, UserTier
@@ -22,6 +30,27 @@ settings = get_settings()
 # Collection name for users
 USERS_COLLECTION = "users"
 
+# Firestore caps "in" filters at 30 values per query
+EMAIL_IN_QUERY_LIMIT = 30
+
+# Maximum in-flight Firestore requests during bulk import
+BULK_IMPORT_CONCURRENCY = 8
+
+# Page sizing for cursor-paginated listings
+DEFAULT_USER_PAGE_SIZE = 100
+MAX_USER_PAGE_SIZE = 500
+
+# Fields fetched for user listings (projection keeps pages small)
+USER_LIST_FIELDS = [
+    "user_id",
+    "email",
+    "display_name",
+    "tier",
+    "audio_usage_seconds",
+    "created_at",
+    "last_login_at",
+]
+
 
 class UserNotFoundError(Exception):
     """Raised when a user is not found."""
@@ -35,6 +64,25 @@ class UserAlreadyExistsError(Exception):
     pass
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+@dataclass
+class UserPage:
+    """One page of a cursor-paginated user listing.
+
+    Attributes:
+        users: Users on this page, ordered by (created_at, document id)
+        next_cursor: Opaque cursor for the next page, None on the last page
+    """
+
+    users: List[UserProfile]
+    next_cursor: Optional[str] = None
+
+
 async def get_user_by_email(email: str) -> Optional[UserProfile]:
     """Get user by email address.
 
@@ -115,7 +163,7 @@ async def create_user(
 
     now = datetime.now(timezone.utc)
     profile = UserProfile(
-        user_id=user_id or f"provisioned-{email.replace('@', '-').replace('.', '-')}",
+        user_id=user_id or _provisioned_user_id(email),
         email=email,
         tier=tier,
         display_name=display_name,
@@ -139,6 +187,11 @@ async def create_user(
     return profile
 
 
+def _provisioned_user_id(email: str) -> str:
+    """Build the placeholder user ID for accounts created before first login."""
+    return f"provisioned-{email.replace('@', '-').replace('.', '-')}"
+
+
 async def update_user_tier(email: str, tier: UserTier) -> bool:
     """Update user tier.
 
@@ -221,6 +274,107 @@ async def list_users(tier: Optional[UserTier] = None) -> List[UserProfile]:
     return users
 
 
+def encode_user_cursor(doc_id: str) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+    payload = json.dumps({"id": doc_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_user_cursor(cursor: str) -> List:
+    """Decode a cursor into ``start_after`` values for the listing order.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return [str(payload["id"])]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {e}") from e
+
+
+async def list_users_page(
+    tier: Optional[UserTier] = None,
+    page_size: int = DEFAULT_USER_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> UserPage:
+    """List one page of users using keyset pagination.
+
+    Users are ordered by document ID, which every user has (ordering by
+    ``created_at`` would leave out users written without it), and only the
+    fields in ``USER_LIST_FIELDS`` are fetched.
+
+    Args:
+        tier: Optional tier to filter by
+        page_size: Maximum users per page (capped at MAX_USER_PAGE_SIZE)
+        cursor: Cursor returned by the previous page, None for the first page
+
+    Returns:
+        UserPage with the users and the cursor for the next page
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    page_size = max(1, min(page_size, MAX_USER_PAGE_SIZE))
+    start_after = decode_user_cursor(cursor) if cursor else None
+
+    client = get_firestore_client()
+    query = client.collection(USERS_COLLECTION)
+    if tier:
+        query = query.where("tier", "==", tier.value)
+    query = query.order_by(FieldPath.document_id()).select(USER_LIST_FIELDS)
+    if start_after:
+        query = query.start_after(start_after)
+    query = query.limit(page_size)
+
+    users: List[UserProfile] = []
+    last_doc = None
+    fetched = 0
+    async for doc in query.stream():
+        doc_data = doc.to_dict()
+        last_doc = doc
+        fetched += 1
+        if doc_data:
+            doc_data["user_id"] = doc_data.get("user_id", doc.id)
+            users.append(UserProfile.from_firestore(doc_data))
+
+    # A full page may have more after it, even if some documents were empty
+    next_cursor = None
+    if last_doc is not None and fetched == page_size:
+        next_cursor = encode_user_cursor(last_doc.id)
+
+    logger.debug(
+        "User page listed",
+        count=len(users),
+        tier=tier.value if tier else "all",
+        has_more=next_cursor is not None,
+    )
+    return UserPage(users=users, next_cursor=next_cursor)
+
+
+async def iter_users(
+    tier: Optional[UserTier] = None,
+    page_size: int = DEFAULT_USER_PAGE_SIZE,
+) -> AsyncIterator[UserProfile]:
+    """Stream all users page by page, holding at most one page in memory.
+
+    Args:
+        tier: Optional tier to filter by
+        page_size: Users fetched per Firestore query
+
+    Yields:
+        UserProfile objects ordered by creation time
+    """
+    cursor: Optional[str] = None
+    while True:
+        page = await list_users_page(tier=tier, page_size=page_size, cursor=cursor)
+        for user in page.users:
+            yield user
+        if not page.next_cursor:
+            return
+        cursor = page.next_cursor
+
+
 async def delete_user(email: str) -> bool:
     """Delete a user.
 
@@ -314,6 +468,172 @@ async def reset_audio_usage(email: str) -> None:
         return
 
 
+def _dedupe_emails(emails: Iterable[str]) -> List[str]:
+    """Strip and deduplicate emails, preserving first-seen order."""
+    seen: Set[str] = set()
+    unique: List[str] = []
+    for email in emails:
+        email = email.strip()
+        if email and email not in seen:
+            seen.add(email)
+            unique.append(email)
+    return unique
+
+
+async def _fetch_existing_emails(
+    emails: List[str], semaphore: asyncio.Semaphore
+) -> Tuple[Set[str], Set[str]]:
+    """Find which emails already have a user document.
+
+    Issues one projected ``in`` query per chunk of ``EMAIL_IN_QUERY_LIMIT``
+    emails, running chunks concurrently under the shared semaphore. A failed
+    query only affects the emails of its chunk.
+
+    Returns:
+        Tuple of (existing emails, emails whose lookup failed)
+    """
+    client = get_firestore_client()
+    collection = client.collection(USERS_COLLECTION)
+
+    async def fetch_chunk(chunk: List[str]) -> Tuple[Set[str], Set[str]]:
+        async with semaphore:
+            query = collection.where("email", "in", chunk).select(["email"])
+            found: Set[str] = set()
+            try:
+                async for doc in query.stream():
+                    doc_data = doc.to_dict()
+                    if doc_data and doc_data.get("email"):
+                        found.add(doc_data["email"])
+            except Exception as e:
+                logger.error(
+                    "Bulk import lookup failed",
+                    chunk_size=len(chunk),
+                    first_email=chunk[0],
+                    error=str(e),
+                )
+                return set(), set(chunk)
+            return found, set()
+
+    chunks = [
+        emails[i : i + EMAIL_IN_QUERY_LIMIT]
+        for i in range(0, len(emails), EMAIL_IN_QUERY_LIMIT)
+    ]
+    existing: Set[str] = set()
+    failed: Set[str] = set()
+    for found, chunk_failed in await asyncio.gather(*(fetch_chunk(c) for c in chunks)):
+        existing |= found
+        failed |= chunk_failed
+    return existing, failed
+
+
+async def bulk_import_users(
+    emails: Iterable[str],
+    tier: UserTier = UserTier.REGULAR,
+    created_by: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    max_concurrency: int = BULK_IMPORT_CONCURRENCY,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """Create users for many emails using batched writes.
+
+    Emails are deduplicated in memory, existing users are prefetched with
+    chunked ``in`` queries, and new users are written with Firestore batched
+    writes. Prefetch queries and batch commits run concurrently, bounded by
+    ``max_concurrency``.
+
+    Args:
+        emails: Email addresses to import
+        tier: Tier to assign to created users
+        created_by: Attribution for created users
+        batch_size: Writes per batch (defaults to perf_firestore_batch_size)
+        max_concurrency: Maximum in-flight Firestore requests
+        on_progress: Optional callback invoked as ``on_progress(done, total)``
+            after each batch completes
+
+    Returns:
+        Dictionary with import stats:
+        {total: int, duplicates: int, created: int, skipped: int, errors: int}
+    """
+    email_list = list(emails)
+    unique_emails = _dedupe_emails(email_list)
+    batch_size = batch_size or settings.perf_firestore_batch_size
+
+    stats = {
+        "total": len(email_list),
+        "duplicates": len(email_list) - len(unique_emails),
+        "created": 0,
+        "skipped": 0,
+        "errors": 0,
+    }
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    existing, lookup_failed = await _fetch_existing_emails(unique_emails, semaphore)
+    stats["skipped"] = len(existing)
+    # Emails that could not be checked are not written: they may exist already
+    stats["errors"] = len(lookup_failed)
+
+    new_emails = [
+        email
+        for email in unique_emails
+        if email not in existing and email not in lookup_failed
+    ]
+    total = len(unique_emails)
+    done = len(existing) + len(lookup_failed)
+    if on_progress:
+        on_progress(done, total)
+
+    client = get_firestore_client()
+    collection = client.collection(USERS_COLLECTION)
+    now = datetime.now(timezone.utc)
+
+    async def write_chunk(chunk: List[str]) -> None:
+        nonlocal done
+        async with semaphore:
+            batch = client.batch()
+            for email in chunk:
+                profile = UserProfile(
+                    user_id=_provisioned_user_id(email),
+                    email=email,
+                    tier=tier,
+                    tier_assigned_at=now,
+                    audio_usage_seconds=0,
+                    audio_usage_reset_at=now,
+                    created_at=now,
+                    created_by=created_by,
+                )
+                batch.set(collection.document(), profile.to_dict())
+            try:
+                await batch.commit()
+                stats["created"] += len(chunk)
+            except Exception as e:
+                logger.error(
+                    "Bulk import batch failed",
+                    batch_size=len(chunk),
+                    first_email=chunk[0],
+                    error=str(e),
+                )
+                stats["errors"] += len(chunk)
+
+        done += len(chunk)
+        if on_progress:
+            on_progress(done, total)
+
+    await asyncio.gather(
+        *(
+            write_chunk(new_emails[i : i + batch_size])
+            for i in range(0, len(new_emails), batch_size)
+        )
+    )
+
+    logger.info(
+        "Bulk import complete",
+        tier=tier.value,
+        created_by=created_by,
+        **stats,
+    )
+    return stats
+
+
 async def migrate_from_allowed_users(
     default_tier: UserTier = UserTier.REGULAR,
     created_by: str = "migration-script",
@@ -327,34 +647,20 @@ async def migrate_from_allowed_users(
     Returns:
         Dictionary with migration stats: {migrated: int, skipped: int}
     """
-    allowed_users = settings.allowed_users_list
-
-    stats = {"migrated": 0, "skipped": 0, "errors": 0}
-
-    for email in allowed_users:
-        try:
-            existing = await get_user_by_email(email)
-            if existing:
-                logger.debug("User already exists, skipping", email=email)
-                stats["skipped"] += 1
-                continue
-
-            await create_user(
-                email=email,
-                tier=default_tier,
-                created_by=created_by,
-            )
-            stats["migrated"] += 1
-            logger.info("User migrated", email=email, tier=default_tier.value)
-
-        except Exception as e:
-            logger.error("Migration error", email=email, error=str(e))
-            stats["errors"] += 1
+    stats = await bulk_import_users(
+        settings.allowed_users_list,
+        tier=default_tier,
+        created_by=created_by,
+    )
 
     logger.info(
         "Migration complete",
-        migrated=stats["migrated"],
+        migrated=stats["created"],
         skipped=stats["skipped"],
         errors=stats["errors"],
     )
-    return stats
+    return {
+        "migrated": stats["created"],
+        "skipped": stats["skipped"],
+        "errors": stats["errors"],
+    }
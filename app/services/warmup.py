@@ -0,0 +1,346 @@
+"""Startup Warmup - Concurrent initialization with readiness gating
+
+A fresh Cloud Run instance used to initialize most of its dependencies on the
+first requests that needed them: the tool data snapshot and its derived
+indexes, the Firestore gRPC channel, the ADK session database, the singleton
+Runner, agent templates (including the audio agents) and the genai client.
+
+At startup the WarmupManager runs one coroutine per component concurrently
+and records how long each took. The startup event waits at most the warmup
+budget; components still running after that keep going in the background.
+/ready reports not-ready until every critical component has completed
+successfully, so traffic is only routed to warm instances. A critical
+component that fails is retried in the background with exponential backoff,
+so the instance becomes ready once the dependency recovers.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+WarmupFunc = Callable[[], Awaitable[Any]]
+
+PENDING = "pending"
+RUNNING = "running"
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass
+class WarmupComponent:
+    """One startup initialization step and its outcome.
+
+    Attributes:
+        name: Component name reported by /ready
+        func: Coroutine function that initializes the component
+        critical: Whether the instance is not ready until it succeeds
+        status: pending, running, ok or failed
+        duration_ms: Time the latest attempt took once completed
+        error: Error message of the latest failed attempt
+        attempts: Number of attempts started so far
+    """
+
+    name: str
+    func: WarmupFunc
+    critical: bool = True
+    status: str = PENDING
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "critical": self.critical,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attempts": self.attempts,
+        }
+
+
+class WarmupManager:
+    """Runs registered warmup components concurrently and tracks readiness."""
+
+    def __init__(
+        self, retry_initial_seconds: float = 1.0, retry_max_seconds: float = 30.0
+    ) -> None:
+        self._components: Dict[str, WarmupComponent] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._attempted: Dict[str, asyncio.Event] = {}
+        self._retry_initial_seconds = retry_initial_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._started_at: Optional[float] = None
+        self._skipped = False
+
+    def register(self, name: str, func: WarmupFunc, critical: bool = True) -> None:
+        """Register (or replace) a warmup component before run() is called."""
+        self._components[name] = WarmupComponent(name, func, critical)
+
+    @property
+    def components(self) -> Dict[str, WarmupComponent]:
+        return dict(self._components)
+
+    async def _attempt(self, component: WarmupComponent) -> bool:
+        component.status = RUNNING
+        component.attempts += 1
+        start = time.perf_counter()
+        try:
+            await component.func()
+            component.status = OK
+            component.error = None
+        except Exception as e:
+            component.status = FAILED
+            component.error = str(e)
+            logger.error(
+                "Warmup component failed",
+                component=component.name,
+                critical=component.critical,
+                attempt=component.attempts,
+                error=str(e),
+            )
+        component.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(
+            "Warmup component finished",
+            component=component.name,
+            status=component.status,
+            duration_ms=component.duration_ms,
+        )
+        return component.status == OK
+
+    async def _run_component(self, component: WarmupComponent) -> None:
+        """Run a component; retry critical ones with backoff until they succeed."""
+        succeeded = await self._attempt(component)
+        self._attempted[component.name].set()
+
+        delay = self._retry_initial_seconds
+        while not succeeded and component.critical:
+            logger.info(
+                "Retrying warmup component",
+                component=component.name,
+                delay_seconds=delay,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._retry_max_seconds)
+            succeeded = await self._attempt(component)
+
+    async def run(self, budget_seconds: float) -> bool:
+        """Start all components and wait for them up to the budget.
+
+        Waits for the first attempt of each component. Components still
+        running when the budget is spent, and retries of failed critical
+        components, continue in the background; readiness follows them as
+        they complete.
+
+        Args:
+            budget_seconds: Maximum time to wait for the components
+
+        Returns:
+            True if the instance is ready when this returns
+        """
+        if self._started_at is not None:
+            raise RuntimeError("Warmup already started")
+        self._started_at = time.perf_counter()
+
+        self._attempted = {name: asyncio.Event() for name in self._components}
+        self._tasks = [
+            asyncio.create_task(self._run_component(component))
+            for component in self._components.values()
+        ]
+        if self._tasks:
+            waiters = [
+                asyncio.create_task(event.wait()) for event in self._attempted.values()
+            ]
+            _, pending = await asyncio.wait(waiters, timeout=budget_seconds)
+            for waiter in pending:
+                waiter.cancel()
+            if pending:
+                logger.warning(
+                    "Warmup budget exceeded, continuing in background",
+                    budget_seconds=budget_seconds,
+                    running=self._names_with_status(RUNNING),
+                )
+
+        report = self.report()
+        logger.info(
+            "Warmup phase complete",
+            status=report["status"],
+            elapsed_ms=report["elapsed_ms"],
+            durations_ms={
+                name: c["duration_ms"] for name, c in report["components"].items()
+            },
+        )
+        return self.is_ready
+
+    def skip(self) -> None:
+        """Mark warmup as disabled; the instance is ready immediately."""
+        self._skipped = True
+        for component in self._components.values():
+            component.status = SKIPPED
+
+    async def stop(self) -> None:
+        """Cancel components that are still running (e.g. on shutdown)."""
+        pending = [task for task in self._tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _names_with_status(self, status: str) -> List[str]:
+        return [c.name for c in self._components.values() if c.status == status]
+
+    @property
+    def is_ready(self) -> bool:
+        if self._skipped:
+            return True
+        if self._started_at is None:
+            return False
+        return all(c.status == OK for c in self._components.values() if c.critical)
+
+    def report(self) -> Dict[str, Any]:
+        """Readiness status and per-component warmup results."""
+        if self._skipped:
+            status = "skipped"
+        elif self.is_ready:
+            status = "ready"
+        elif any(c.critical and c.status == FAILED for c in self._components.values()):
+            status = "failed"
+        else:
+            status = "warming"
+
+        elapsed_ms = None
+        if self._started_at is not None:
+            elapsed_ms = round((time.perf_counter() - self._started_at) * 1000, 1)
+
+        return {
+            "status": status,
+            "elapsed_ms": elapsed_ms,
+            "components": {
+                name: component.to_dict()
+                for name, component in self._components.items()
+            },
+        }
+
+
+# =============================================================================
+# DEFAULT COMPONENTS
+# =============================================================================
+
+
+async def warm_tool_data() -> None:
+    """Load the tool data snapshot and build its derived indexes."""
+    from app.services import firestore_tool_data_service as data_service
+
+    await data_service.get_tool_data_cache().get()
+    await data_service.get_game_catalog()
+    await data_service.get_game_recommender()
+    await data_service.get_principle_index()
+    await data_service.get_archetype_profiles()
+
+
+async def warm_firestore() -> None:
+    """Open the Firestore channel with a one-document read."""
+    from app.services.firestore_tool_data_service import get_firestore_client
+
+    client = get_firestore_client()
+    await client.collection(settings.firestore_games_collection).limit(1).get()
+
+
+async def warm_adk_session_db() -> None:
+    """Create the session database engine and tables, then run one query."""
+    from app.services.adk_session_service import get_adk_session_service
+
+    service = await asyncio.to_thread(get_adk_session_service)
+    await service.list_sessions(app_name=settings.app_name, user_id="__warmup__")
+
+
+async def warm_content_filter() -> None:
+    """Compile the content filter lexicon used by every turn."""
+    from app.services.content_filter import get_content_filter
+
+    await asyncio.to_thread(get_content_filter)
+
+
+async def warm_runner() -> None:
+    """Build the singleton Runner (and the Stage Manager it wraps)."""
+    from app.services.turn_orchestrator import initialize_runner
+
+    await asyncio.to_thread(initialize_runner)
+
+
+async def warm_agent_templates() -> None:
+    """Build every registered agent template, including the audio agents."""
+    from app.agents.agent_templates import get_agent_template_registry
+
+    registry = get_agent_template_registry()
+
+    def build_all() -> None:
+        for variant in registry.variants():
+            registry.template(variant)
+
+    await asyncio.to_thread(build_all)
+
+
+async def warm_genai_client() -> None:
+    """Construct a Vertex AI genai client to load modules and credentials."""
+
+    def build_client() -> None:
+        from google import genai
+
+        genai.Client(
+            vertexai=True,
+            project=settings.gcp_project_id,
+            location=settings.gcp_location,
+        )
+
+    await asyncio.to_thread(build_client)
+
+
+def register_default_components(manager: WarmupManager) -> None:
+    """Register the application's startup components.
+
+    Tool data, the session database and the Runner are needed by every turn
+    and gate readiness; the rest only shorten the first request that uses
+    them.
+    """
+    manager.register("tool_data", warm_tool_data, critical=True)
+    manager.register("adk_session_db", warm_adk_session_db, critical=True)
+    manager.register("runner", warm_runner, critical=True)
+    manager.register("firestore", warm_firestore, critical=False)
+    manager.register("content_filter", warm_content_filter, critical=False)
+    manager.register("agent_templates", warm_agent_templates, critical=False)
+    manager.register("genai_client", warm_genai_client, critical=False)
+
+
+_warmup_manager: Optional[WarmupManager] = None
+_init_lock = threading.Lock()
+
+
+def get_warmup_manager() -> WarmupManager:
+    """Get the singleton warmup manager with the default components."""
+    global _warmup_manager
+
+    if _warmup_manager is None:
+        with _init_lock:
+            if _warmup_manager is None:
+                manager = WarmupManager(
+                    retry_initial_seconds=settings.startup_warmup_retry_seconds,
+                    retry_max_seconds=settings.startup_warmup_retry_max_seconds,
+                )
+                register_default_components(manager)
+                _warmup_manager = manager
+    return _warmup_manager
+
+
+def reset_warmup_manager() -> None:
+    """Reset the warmup manager singleton for testing purposes."""
+    global _warmup_manager
+    _warmup_manager = None
@@ -5,21 +5,337 @@ Used by the Room Agent for understanding audience composition and preferences.
 
 Follows ADK patterns:
 - Extends BaseToolset for proper ADK integration
-- Uses FunctionTool to wrap async functions
+- Uses FunctionTool to wrap async functions (read-only tools memoized per
+  invocation; random ones, like sampling and suggestions, are not)
 - Supports tool filtering and prefixing
 """
 
 import random
-from typing import Optional, List, Dict, Any, Union
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping, Tuple, Union
 from google.adk.tools import BaseTool, FunctionTool
 from google.adk.tools.base_toolset import BaseToolset, ToolPredicate
 from google.adk.agents.readonly_context import ReadonlyContext
 
 from app.services import firestore_tool_data_service as data_service
+from app.services.audience_profiles import (
+    BEGINNER,
+    DEMOGRAPHIC_KEYWORDS,
+    EXPERIENCED,
+    HIGH_ENGAGEMENT,
+    LOW_ENGAGEMENT,
+    MIXED,
+    classify_engagement,
+    classify_experience,
+    dominant_demographic,
+    member_demographic,
+)
+from app.toolsets.tool_call_cache import MemoizedFunctionTool
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fallback suggestion type for unknown types and games
+DEFAULT_SUGGESTION_TYPE = "location"
+
+# Audience sample size used when no sample is provided
+DEFAULT_SAMPLE_SIZE = 5
+
+# Suggestion pools by type, then demographic category (see audience_profiles)
+_SUGGESTION_POOLS = {
+    "location": {
+        "tech": [
+            "A hackathon",
+            "A startup office",
+            "A data center",
+            "A tech support hotline",
+        ],
+        "healthcare": [
+            "An operating room",
+            "A hospital waiting room",
+            "A medical conference",
+            "An ambulance",
+        ],
+        "education": [
+            "A classroom",
+            "A teachers' lounge",
+            "A parent-teacher conference",
+            "A school assembly",
+        ],
+        "arts": [
+            "An art gallery opening",
+            "A theater backstage",
+            "A costume fitting",
+            "A rehearsal room",
+        ],
+        "finance": [
+            "A stock exchange floor",
+            "A bank vault",
+            "An investment meeting",
+            "An accounting office",
+        ],
+        "mixed": [
+            "A grocery store",
+            "A coffee shop",
+            "An elevator",
+            "A park bench",
+            "A bus stop",
+        ],
+    },
+    "relationship": {
+        "tech": [
+            "Co-founders",
+            "Developer and product manager",
+            "Tech support and frustrated user",
+            "Startup competitors",
+        ],
+        "healthcare": [
+            "Doctor and patient",
+            "Nurse and family member",
+            "Paramedics on a call",
+            "Hospital roommates",
+        ],
+        "education": [
+            "Teacher and student",
+            "Principal and parent",
+            "Study partners",
+            "Rival debate team members",
+        ],
+        "arts": [
+            "Director and actor",
+            "Costume designer and performer",
+            "Art critic and artist",
+            "Dance partners",
+        ],
+        "finance": [
+            "Banker and loan applicant",
+            "Investment partners",
+            "Accountant and client",
+            "Stock traders",
+        ],
+        "mixed": [
+            "Roommates",
+            "First date",
+            "Longtime friends",
+            "Neighbors",
+            "Siblings",
+        ],
+    },
+    "occupation": {
+        "tech": [
+            "Software engineer",
+            "UX designer",
+            "Blockchain evangelist",
+            "AI ethicist",
+        ],
+        "healthcare": [
+            "Surgeon",
+            "Pediatric nurse",
+            "Hospital administrator",
+            "Medical researcher",
+        ],
+        "education": [
+            "High school teacher",
+            "College professor",
+            "School counselor",
+            "Librarian",
+        ],
+        "arts": [
+            "Stage actor",
+            "Gallery curator",
+            "Film director",
+            "Dance instructor",
+        ],
+        "finance": [
+            "Investment banker",
+            "Financial advisor",
+            "Crypto trader",
+            "Tax auditor",
+        ],
+        "mixed": [
+            "Barista",
+            "Delivery driver",
+            "Customer service rep",
+            "Fitness instructor",
+        ],
+    },
+    "topic": {
+        "tech": [
+            "Artificial intelligence ethics",
+            "The future of remote work",
+            "Cryptocurrency trends",
+            "Tech startup culture",
+        ],
+        "healthcare": [
+            "Healthcare reform",
+            "Medical breakthroughs",
+            "Patient advocacy",
+            "Work-life balance in medicine",
+        ],
+        "education": [
+            "Education reform",
+            "Student mental health",
+            "The value of liberal arts",
+            "Teaching in the digital age",
+        ],
+        "arts": [
+            "The role of art in society",
+            "Creative process",
+            "Art vs commerce",
+            "Performance anxiety",
+        ],
+        "finance": [
+            "Economic inequality",
+            "Investment strategies",
+            "The stock market",
+            "Personal finance",
+        ],
+        "mixed": [
+            "Climate change",
+            "Work-life balance",
+            "Social media",
+            "Family traditions",
+            "Travel",
+        ],
+    },
+    "object": {
+        "tech": [
+            "A laptop",
+            "A prototype device",
+            "A server rack",
+            "A VR headset",
+        ],
+        "healthcare": [
+            "A stethoscope",
+            "A medical chart",
+            "A prescription pad",
+            "An MRI machine",
+        ],
+        "education": [
+            "A textbook",
+            "A whiteboard",
+            "A report card",
+            "A student essay",
+        ],
+        "arts": ["A paintbrush", "A costume piece", "A script", "A prop"],
+        "finance": [
+            "A briefcase",
+            "Stock certificates",
+            "A calculator",
+            "A vault key",
+        ],
+        "mixed": [
+            "A phone",
+            "A set of keys",
+            "A coffee mug",
+            "A backpack",
+            "A letter",
+        ],
+    },
+}
+
+
+def _build_suggestion_index(
+    pools: Dict[str, Dict[str, List[str]]],
+) -> Mapping[Tuple[str, str], Tuple[str, ...]]:
+    """Flatten the pools into a read-only (suggestion_type, demographic) index.
+
+    Categories a type doesn't define fall back to that type's mixed pool, so a
+    lookup never needs more than one probe.
+    """
+    categories = [category for category, _ in DEMOGRAPHIC_KEYWORDS] + [MIXED]
+    index = {}
+    for suggestion_type, by_category in pools.items():
+        for category in categories:
+            pool = by_category.get(category, by_category[MIXED])
+            index[(suggestion_type, category)] = tuple(pool)
+    return MappingProxyType(index)
+
+
+SUGGESTION_INDEX = _build_suggestion_index(_SUGGESTION_POOLS)
+
+# Room recommendation by (energy_profile, experience_profile)
+TRAIT_RECOMMENDATIONS = {
+    ("high_energy", "experienced"): (
+        "Try advanced games with audience participation. "
+        "They'll appreciate creative risks."
+    ),
+    ("high_energy", "beginner_friendly"): (
+        "Focus on accessible, energetic games with clear rules. "
+        "Build confidence early."
+    ),
+    ("high_energy", "mixed"): (
+        "Mix classic crowd-pleasers with a few adventurous choices. "
+        "Read the room as you go."
+    ),
+    ("reserved", "experienced"): (
+        "Emphasize craft and subtlety. "
+        "They'll appreciate technical skill and nuance."
+    ),
+    ("reserved", "beginner_friendly"): (
+        "Start with structured games and clear explanations. Warm them up gradually."
+    ),
+    ("reserved", "mixed"): (
+        "Begin with accessible material, then increase complexity. "
+        "Watch for engagement cues."
+    ),
+    ("mixed", "experienced"): (
+        "Balance showcases with participation. Cater to different engagement styles."
+    ),
+    ("mixed", "beginner_friendly"): (
+        "Use variety in pacing and game types. Something for everyone approach."
+    ),
+    ("mixed", "mixed"): (
+        "Read the room continuously. "
+        "Have backup options for energy and complexity shifts."
+    ),
+}
+
+# Common games mapped to their typical suggestion types
+GAME_SUGGESTION_TYPES = {
+    "long form": "relationship",
+    "long_form": "relationship",
+    "questions only": "location",
+    "questions_only": "location",
+    "alphabet scene": "location",
+    "alphabet_game": "location",
+    "last word, first word": "relationship",
+    "last_word_first_word": "relationship",
+    "expert interview": "topic",
+    "expert_interview": "topic",
+    "emotional rollercoaster": "relationship",
+    "emotional_rollercoaster": "relationship",
+    "genre replay": "location",
+    "genre_replay": "location",
+    "one word story": "topic",
+    "one_word_story": "topic",
+    "character swap": "relationship",
+    "character_swap": "relationship",
+    "status shift": "location",
+    "status_shift": "location",
+    "party quirks": "location",
+    "party_quirks": "location",
+}
+
+SHOUT_TEMPLATES = (
+    "Someone from the crowd shouts: '{suggestion}!'",
+    "An audience member yells: '{suggestion}!'",
+    "From the back row, someone calls out: '{suggestion}!'",
+    "A voice from the audience suggests: '{suggestion}!'",
+    "Someone in the front row shouts: '{suggestion}!'",
+)
+
+
+def lookup_suggestions(suggestion_type: str, demographic: str) -> Tuple[str, ...]:
+    """Suggestion pool for a type and demographic category.
+
+    Unknown suggestion types fall back to location suggestions.
+    """
+    pool = SUGGESTION_INDEX.get((suggestion_type.lower(), demographic))
+    if pool is None:
+        pool = SUGGESTION_INDEX[(DEFAULT_SUGGESTION_TYPE, demographic)]
+    return pool
+
 
 class AudienceArchetypesToolset(BaseToolset):
     """ADK Toolset for accessing audience archetypes from Firestore.
@@ -75,9 +391,9 @@ class AudienceArchetypesToolset(BaseToolset):
         if self._tools is None:
             self._tools = [
                 FunctionTool(self._generate_audience_sample),
-                FunctionTool(self._get_all_archetypes),
-                FunctionTool(self._analyze_audience_traits),
-                FunctionTool(self._get_vibe_check),
+                MemoizedFunctionTool(self._get_all_archetypes),
+                MemoizedFunctionTool(self._analyze_audience_traits),
+                MemoizedFunctionTool(self._get_vibe_check),
                 FunctionTool(self._generate_audience_suggestion),
                 FunctionTool(self._get_suggestion_for_game),
             ]
@@ -154,16 +470,16 @@ class AudienceArchetypesToolset(BaseToolset):
             elif isinstance(preferences, list):
                 all_preferences.extend(preferences)
 
-            engagement_style = member.get("engagement_style", "").lower()
-            if "vocal" in engagement_style or "expressive" in engagement_style:
+            engagement = classify_engagement(member.get("engagement_style", ""))
+            if engagement == HIGH_ENGAGEMENT:
                 high_engagement += 1
-            elif "quiet" in engagement_style or "reserved" in engagement_style:
+            elif engagement == LOW_ENGAGEMENT:
                 low_engagement += 1
 
-            improv_knowledge = member.get("improv_knowledge", "").lower()
-            if "extensive" in improv_knowledge or "professional" in improv_knowledge:
+            experience = classify_experience(member.get("improv_knowledge", ""))
+            if experience == EXPERIENCED:
                 experienced += 1
-            elif "no prior" in improv_knowledge or "limited" in improv_knowledge:
+            elif experience == BEGINNER:
                 beginners += 1
 
         energy_profile = "mixed"
@@ -178,44 +494,6 @@ class AudienceArchetypesToolset(BaseToolset):
         elif beginners > experienced * 1.5:
             experience_profile = "beginner_friendly"
 
-        recommendations = {
-            ("high_energy", "experienced"): (
-                "Try advanced games with audience participation. "
-                "They'll appreciate creative risks."
-            ),
-            ("high_energy", "beginner_friendly"): (
-                "Focus on accessible, energetic games with clear rules. "
-                "Build confidence early."
-            ),
-            ("high_energy", "mixed"): (
-                "Mix classic crowd-pleasers with a few adventurous choices. "
-                "Read the room as you go."
-            ),
-            ("reserved", "experienced"): (
-                "Emphasize craft and subtlety. "
-                "They'll appreciate technical skill and nuance."
-            ),
-            ("reserved", "beginner_friendly"): (
-                "Start with structured games and clear explanations. "
-                "Warm them up gradually."
-            ),
-            ("reserved", "mixed"): (
-                "Begin with accessible material, then increase complexity. "
-                "Watch for engagement cues."
-            ),
-            ("mixed", "experienced"): (
-                "Balance showcases with participation. "
-                "Cater to different engagement styles."
-            ),
-            ("mixed", "beginner_friendly"): (
-                "Use variety in pacing and game types. Something for everyone approach."
-            ),
-            ("mixed", "mixed"): (
-                "Read the room continuously. "
-                "Have backup options for energy and complexity shifts."
-            ),
-        }
-
         traits = {
             "energy_profile": energy_profile,
             "experience_profile": experience_profile,
@@ -224,7 +502,7 @@ class AudienceArchetypesToolset(BaseToolset):
             "low_engagement_count": low_engagement,
             "experienced_count": experienced,
             "beginner_count": beginners,
-            "recommendation": recommendations.get(
+            "recommendation": TRAIT_RECOMMENDATIONS.get(
                 (energy_profile, experience_profile),
                 "Stay flexible and adapt to audience response.",
             ),
@@ -290,244 +568,17 @@ class AudienceArchetypesToolset(BaseToolset):
             has_sample=audience_sample is not None,
         )
 
-        # Get or generate audience sample
-        if not audience_sample:
-            audience_sample = await self._generate_audience_sample(size=5)
-
-        # Extract dominant demographics from audience
-        dominant_demographics = []
-        for member in audience_sample:
-            demographics = member.get("demographics", {})
-            occupation = demographics.get("occupation", "")
-            if occupation:
-                dominant_demographics.append(occupation.lower())
-
-        # Map suggestion types to demographic-based suggestions
-        suggestion_pools = {
-            "location": {
-                "tech": [
-                    "A hackathon",
-                    "A startup office",
-                    "A data center",
-                    "A tech support hotline",
-                ],
-                "healthcare": [
-                    "An operating room",
-                    "A hospital waiting room",
-                    "A medical conference",
-                    "An ambulance",
-                ],
-                "education": [
-                    "A classroom",
-                    "A teachers' lounge",
-                    "A parent-teacher conference",
-                    "A school assembly",
-                ],
-                "arts": [
-                    "An art gallery opening",
-                    "A theater backstage",
-                    "A costume fitting",
-                    "A rehearsal room",
-                ],
-                "finance": [
-                    "A stock exchange floor",
-                    "A bank vault",
-                    "An investment meeting",
-                    "An accounting office",
-                ],
-                "mixed": [
-                    "A grocery store",
-                    "A coffee shop",
-                    "An elevator",
-                    "A park bench",
-                    "A bus stop",
-                ],
-            },
-            "relationship": {
-                "tech": [
-                    "Co-founders",
-                    "Developer and product manager",
-                    "Tech support and frustrated user",
-                    "Startup competitors",
-                ],
-                "healthcare": [
-                    "Doctor and patient",
-                    "Nurse and family member",
-                    "Paramedics on a call",
-                    "Hospital roommates",
-                ],
-                "education": [
-                    "Teacher and student",
-                    "Principal and parent",
-                    "Study partners",
-                    "Rival debate team members",
-                ],
-                "arts": [
-                    "Director and actor",
-                    "Costume designer and performer",
-                    "Art critic and artist",
-                    "Dance partners",
-                ],
-                "finance": [
-                    "Banker and loan applicant",
-                    "Investment partners",
-                    "Accountant and client",
-                    "Stock traders",
-                ],
-                "mixed": [
-                    "Roommates",
-                    "First date",
-                    "Longtime friends",
-                    "Neighbors",
-                    "Siblings",
-                ],
-            },
-            "occupation": {
-                "tech": [
-                    "Software engineer",
-                    "UX designer",
-                    "Blockchain evangelist",
-                    "AI ethicist",
-                ],
-                "healthcare": [
-                    "Surgeon",
-                    "Pediatric nurse",
-                    "Hospital administrator",
-                    "Medical researcher",
-                ],
-                "education": [
-                    "High school teacher",
-                    "College professor",
-                    "School counselor",
-                    "Librarian",
-                ],
-                "arts": [
-                    "Stage actor",
-                    "Gallery curator",
-                    "Film director",
-                    "Dance instructor",
-                ],
-                "finance": [
-                    "Investment banker",
-                    "Financial advisor",
-                    "Crypto trader",
-                    "Tax auditor",
-                ],
-                "mixed": [
-                    "Barista",
-                    "Delivery driver",
-                    "Customer service rep",
-                    "Fitness instructor",
-                ],
-            },
-            "topic": {
-                "tech": [
-                    "Artificial intelligence ethics",
-                    "The future of remote work",
-                    "Cryptocurrency trends",
-                    "Tech startup culture",
-                ],
-                "healthcare": [
-                    "Healthcare reform",
-                    "Medical breakthroughs",
-                    "Patient advocacy",
-                    "Work-life balance in medicine",
-                ],
-                "education": [
-                    "Education reform",
-                    "Student mental health",
-                    "The value of liberal arts",
-                    "Teaching in the digital age",
-                ],
-                "arts": [
-                    "The role of art in society",
-                    "Creative process",
-                    "Art vs commerce",
-                    "Performance anxiety",
-                ],
-                "finance": [
-                    "Economic inequality",
-                    "Investment strategies",
-                    "The stock market",
-                    "Personal finance",
-                ],
-                "mixed": [
-                    "Climate change",
-                    "Work-life balance",
-                    "Social media",
-                    "Family traditions",
-                    "Travel",
-                ],
-            },
-            "object": {
-                "tech": [
-                    "A laptop",
-                    "A prototype device",
-                    "A server rack",
-                    "A VR headset",
-                ],
-                "healthcare": [
-                    "A stethoscope",
-                    "A medical chart",
-                    "A prescription pad",
-                    "An MRI machine",
-                ],
-                "education": [
-                    "A textbook",
-                    "A whiteboard",
-                    "A report card",
-                    "A student essay",
-                ],
-                "arts": ["A paintbrush", "A costume piece", "A script", "A prop"],
-                "finance": [
-                    "A briefcase",
-                    "Stock certificates",
-                    "A calculator",
-                    "A vault key",
-                ],
-                "mixed": [
-                    "A phone",
-                    "A set of keys",
-                    "A coffee mug",
-                    "A backpack",
-                    "A letter",
-                ],
-            },
-        }
+        # Determine the audience's demographic category. Without a sample,
+        # draw one from the precomputed archetype profiles (no document copies)
+        if audience_sample:
+            categories = [member_demographic(member) for member in audience_sample]
+        else:
+            profiles = await data_service.get_archetype_profiles()
+            sample = random.sample(profiles, min(DEFAULT_SAMPLE_SIZE, len(profiles)))
+            categories = [profile.demographic for profile in sample]
+        demographic_category = dominant_demographic(categories)
 
-        # Determine demographic category
-        demographic_category = "mixed"
-        if any(
-            "tech" in demo or "engineer" in demo or "developer" in demo
-            for demo in dominant_demographics
-        ):
-            demographic_category = "tech"
-        elif any(
-            "doctor" in demo or "nurse" in demo or "medical" in demo
-            for demo in dominant_demographics
-        ):
-            demographic_category = "healthcare"
-        elif any(
-            "teacher" in demo or "professor" in demo or "educator" in demo
-            for demo in dominant_demographics
-        ):
-            demographic_category = "education"
-        elif any(
-            "artist" in demo or "actor" in demo or "creative" in demo
-            for demo in dominant_demographics
-        ):
-            demographic_category = "arts"
-        elif any(
-            "banker" in demo or "finance" in demo or "investor" in demo
-            for demo in dominant_demographics
-        ):
-            demographic_category = "finance"
-
-        # Get suggestion pool for this type and demographic
-        type_pool = suggestion_pools.get(
-            suggestion_type.lower(), suggestion_pools["location"]
-        )
-        suggestions = type_pool.get(demographic_category, type_pool["mixed"])
+        suggestions = lookup_suggestions(suggestion_type, demographic_category)
 
         # Select random suggestion
         suggestion = random.choice(suggestions)
@@ -561,35 +612,9 @@ class AudienceArchetypesToolset(BaseToolset):
         """
         logger.info("Generating game-specific suggestion", game_name=game_name)
 
-        # Map common games to their typical suggestion types
-        game_suggestion_types = {
-            "long form": "relationship",
-            "long_form": "relationship",
-            "questions only": "location",
-            "questions_only": "location",
-            "alphabet scene": "location",
-            "alphabet_game": "location",
-            "last word, first word": "relationship",
-            "last_word_first_word": "relationship",
-            "expert interview": "topic",
-            "expert_interview": "topic",
-            "emotional rollercoaster": "relationship",
-            "emotional_rollercoaster": "relationship",
-            "genre replay": "location",
-            "genre_replay": "location",
-            "one word story": "topic",
-            "one_word_story": "topic",
-            "character swap": "relationship",
-            "character_swap": "relationship",
-            "status shift": "location",
-            "status_shift": "location",
-            "party quirks": "location",
-            "party_quirks": "location",
-        }
-
         # Determine suggestion type for this game (default to location)
         game_key = game_name.lower().strip()
-        suggestion_type = game_suggestion_types.get(game_key, "location")
+        suggestion_type = GAME_SUGGESTION_TYPES.get(game_key, DEFAULT_SUGGESTION_TYPE)
 
         logger.debug(
             "Determined suggestion type for game",
@@ -603,15 +628,7 @@ class AudienceArchetypesToolset(BaseToolset):
         )
 
         # Create audience shout-out with variety
-        shout_phrases = [
-            f"Someone from the crowd shouts: '{suggestion}!'",
-            f"An audience member yells: '{suggestion}!'",
-            f"From the back row, someone calls out: '{suggestion}!'",
-            f"A voice from the audience suggests: '{suggestion}!'",
-            f"Someone in the front row shouts: '{suggestion}!'",
-        ]
-
-        result = random.choice(shout_phrases)
+        result = random.choice(SHOUT_TEMPLATES).format(suggestion=suggestion)
 
         logger.info(
             "Game suggestion generated",
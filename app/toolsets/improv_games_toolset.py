@@ -5,16 +5,17 @@ Used by the MC Agent for game selection and information retrieval.
 
 Follows ADK patterns:
 - Extends BaseToolset for proper ADK integration
-- Uses FunctionTool to wrap async functions
+- Uses FunctionTool to wrap async functions (memoized per invocation)
 - Supports tool filtering and prefixing
 """
 
 from typing import Optional, List, Dict, Any, Union
-from google.adk.tools import BaseTool, FunctionTool
+from google.adk.tools import BaseTool
 from google.adk.tools.base_toolset import BaseToolset, ToolPredicate
 from google.adk.agents.readonly_context import ReadonlyContext
 
 from app.services import firestore_tool_data_service as data_service
+from app.toolsets.tool_call_cache import MemoizedFunctionTool
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -72,9 +73,9 @@ class ImprovGamesToolset(BaseToolset):
         """
         if self._tools is None:
             self._tools = [
-                FunctionTool(self._get_all_games),
-                FunctionTool(self._get_game_by_id),
-                FunctionTool(self._search_games),
+                MemoizedFunctionTool(self._get_all_games),
+                MemoizedFunctionTool(self._get_game_by_id),
+                MemoizedFunctionTool(self._search_games),
             ]
             logger.debug("Game tools created", tool_count=len(self._tools))
 
@@ -5,16 +5,17 @@ Used by the Coach Agent for providing principle-based feedback.
 
 Follows ADK patterns:
 - Extends BaseToolset for proper ADK integration
-- Uses FunctionTool to wrap async functions
+- Uses FunctionTool to wrap async functions (memoized per invocation)
 - Supports tool filtering and prefixing
 """
 
 from typing import Optional, List, Dict, Any, Union
-from google.adk.tools import BaseTool, FunctionTool
+from google.adk.tools import BaseTool
 from google.adk.tools.base_toolset import BaseToolset, ToolPredicate
 from google.adk.agents.readonly_context import ReadonlyContext
 
 from app.services import firestore_tool_data_service as data_service
+from app.toolsets.tool_call_cache import MemoizedFunctionTool
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -74,11 +75,11 @@ class ImprovPrinciplesToolset(BaseToolset):
         """
         if self._tools is None:
             self._tools = [
-                FunctionTool(self._get_all_principles),
-                FunctionTool(self._get_principle_by_id),
-                FunctionTool(self._get_beginner_essentials),
-                FunctionTool(self._get_principles_by_importance),
-                FunctionTool(self._search_principles_by_keyword),
+                MemoizedFunctionTool(self._get_all_principles),
+                MemoizedFunctionTool(self._get_principle_by_id),
+                MemoizedFunctionTool(self._get_beginner_essentials),
+                MemoizedFunctionTool(self._get_principles_by_importance),
+                MemoizedFunctionTool(self._search_principles_by_keyword),
             ]
             logger.debug("Principles tools created", tool_count=len(self._tools))
 
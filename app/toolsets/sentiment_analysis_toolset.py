@@ -9,7 +9,8 @@ and loaded dynamically, allowing for updates without code changes.
 Follows ADK patterns:
 - Extends BaseToolset for proper ADK integration
 - Uses FunctionTool to wrap async functions
-- Caches keyword lists for performance
+- Reads keyword lists from the process-wide SentimentKeywordStore, so new
+  toolset instances don't reload them
 """
 
 from typing import Optional, List, Dict, Any, Union
@@ -17,7 +18,10 @@ from google.adk.tools import BaseTool, FunctionTool
 from google.adk.tools.base_toolset import BaseToolset, ToolPredicate
 from google.adk.agents.readonly_context import ReadonlyContext
 
-from app.services import firestore_tool_data_service as data_service
+from app.services.sentiment_keyword_store import (
+    SentimentKeywords,
+    get_sentiment_keyword_store,
+)
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,7 +35,7 @@ class SentimentAnalysisToolset(BaseToolset):
     - analyze_engagement: Analyze audience engagement from observations
     - analyze_collective_mood: Combine sentiment and engagement analysis
 
-    Keywords are loaded from Firestore on first use and cached.
+    Keywords are shared by all instances through the SentimentKeywordStore.
 
     Example usage with ADK Agent:
         ```python
@@ -61,23 +65,15 @@ class SentimentAnalysisToolset(BaseToolset):
         """
         super().__init__(tool_filter=tool_filter, tool_name_prefix=tool_name_prefix)
         self._tools: Optional[List[BaseTool]] = None
-        self._keywords_cache: Optional[Dict[str, Any]] = None
         logger.info("SentimentAnalysisToolset initialized")
 
-    async def _ensure_keywords_loaded(self) -> Dict[str, Any]:
-        """Load sentiment keywords from Firestore if not cached.
+    async def _ensure_keywords_loaded(self) -> SentimentKeywords:
+        """Get the shared sentiment keyword lists.
 
         Returns:
-            Dictionary with positive, negative, and engagement keyword lists.
+            Immutable SentimentKeywords view for the current tool data snapshot.
         """
-        if self._keywords_cache is None:
-            self._keywords_cache = await data_service.get_sentiment_keywords()
-            logger.debug(
-                "Sentiment keywords loaded",
-                positive_count=len(self._keywords_cache.get("positive", [])),
-                negative_count=len(self._keywords_cache.get("negative", [])),
-            )
-        return self._keywords_cache
+        return await get_sentiment_keyword_store().get()
 
     async def get_tools(
         self,
@@ -130,17 +126,9 @@ class SentimentAnalysisToolset(BaseToolset):
             }
 
         keywords = await self._ensure_keywords_loaded()
-        positive_keywords = keywords.get("positive", [])
-        negative_keywords = keywords.get("negative", [])
-
-        text_lower = text.lower()
-
-        positive_count = sum(
-            1 for keyword in positive_keywords if keyword in text_lower
-        )
-        negative_count = sum(
-            1 for keyword in negative_keywords if keyword in text_lower
-        )
+        counts = keywords.sentiment_matcher.count(text)
+        positive_count = counts["positive"]
+        negative_count = counts["negative"]
 
         total_sentiment_words = positive_count + negative_count
 
@@ -215,19 +203,9 @@ class SentimentAnalysisToolset(BaseToolset):
             }
 
         keywords = await self._ensure_keywords_loaded()
-        engagement_keywords = keywords.get("engagement", {"high": [], "low": []})
-        high_engagement_keywords = engagement_keywords.get("high", [])
-        low_engagement_keywords = engagement_keywords.get("low", [])
-
-        combined_text = " ".join(observations).lower()
-
-        high_engagement_count = sum(
-            1 for keyword in high_engagement_keywords if keyword in combined_text
-        )
-
-        low_engagement_count = sum(
-            1 for keyword in low_engagement_keywords if keyword in combined_text
-        )
+        counts = keywords.engagement_matcher.count(" ".join(observations))
+        high_engagement_count = counts["high"]
+        low_engagement_count = counts["low"]
 
         total_engagement_indicators = high_engagement_count + low_engagement_count
 
@@ -373,5 +351,4 @@ class SentimentAnalysisToolset(BaseToolset):
     async def close(self) -> None:
         """Cleanup resources when toolset is no longer needed."""
         self._tools = None
-        self._keywords_cache = None
         logger.debug("SentimentAnalysisToolset closed")
@@ -0,0 +1,187 @@
+"""Tool Call Cache - Per-invocation memoization for read-only toolset tools
+
+Within one runner invocation the Stage Manager and its sub-agents often call
+the same read-only tools (get_all_archetypes, get_game_by_id,
+get_all_principles, ...) several times with identical arguments. Toolsets wrap
+such tools in MemoizedFunctionTool, which answers repeated calls from a cache
+keyed by (invocation id, tool name, arguments):
+
+- Entries are scoped to one invocation; a new invocation always starts cold,
+  so results never leak across turns or users
+- Concurrent identical calls (parallel function calls) share one execution
+- Failed calls are not cached
+- Only the most recent ``max_invocations`` invocations are kept; orchestrators
+  drop an invocation's entries as soon as its run finishes (end_invocation)
+
+Tools that are random or have side effects must keep using FunctionTool.
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from google.adk.tools import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+def _args_key(tool_name: str, args: Dict[str, Any]) -> str:
+    """Canonical cache key for one tool call."""
+    return tool_name + ":" + json.dumps(args, sort_keys=True, default=str)
+
+
+class ToolCallCache:
+    """Memoizes tool results per runner invocation.
+
+    Args:
+        max_invocations: Number of most recent invocations whose entries are kept
+    """
+
+    def __init__(self, max_invocations: int = 64):
+        self.max_invocations = max_invocations
+        self._invocations: "OrderedDict[str, Dict[str, asyncio.Future]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _entries_for(self, invocation_id: str) -> Dict[str, asyncio.Future]:
+        entries = self._invocations.get(invocation_id)
+        if entries is None:
+            entries = self._invocations[invocation_id] = {}
+            while len(self._invocations) > self.max_invocations:
+                self._invocations.popitem(last=False)
+                self._stats["evictions"] += 1
+        else:
+            self._invocations.move_to_end(invocation_id)
+        return entries
+
+    async def get_or_call(
+        self,
+        invocation_id: str,
+        tool_name: str,
+        args: Dict[str, Any],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the memoized result for this call, executing it on a miss."""
+        key = _args_key(tool_name, args)
+
+        with self._lock:
+            entries = self._entries_for(invocation_id)
+            future = entries.get(key)
+            if future is not None:
+                self._stats["hits"] += 1
+                hit = True
+            else:
+                future = asyncio.get_running_loop().create_future()
+                entries[key] = future
+                self._stats["misses"] += 1
+                hit = False
+
+        if hit:
+            # shield: a cancelled waiter must not cancel the shared result
+            return await asyncio.shield(future)
+
+        try:
+            result = await call()
+        except BaseException as e:
+            with self._lock:
+                entries = self._invocations.get(invocation_id)
+                if entries is not None and entries.get(key) is future:
+                    del entries[key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Waiters re-raise it; avoid "exception never retrieved" noise
+                future.exception()
+            else:
+                future.cancel()
+            raise
+
+        future.set_result(result)
+        return result
+
+    def end_invocation(self, invocation_id: Optional[str]) -> None:
+        """Drop the entries of a finished invocation."""
+        if not invocation_id:
+            return
+        with self._lock:
+            entries = self._invocations.pop(invocation_id, None)
+        if entries:
+            logger.debug(
+                "Tool call cache released invocation",
+                invocation_id=invocation_id,
+                entries=len(entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invocations.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0
+            return {
+                **self._stats,
+                "total_requests": total,
+                "hit_rate_pct": round(hit_rate, 2),
+                "active_invocations": len(self._invocations),
+            }
+
+
+class MemoizedFunctionTool(FunctionTool):
+    """FunctionTool whose results are memoized per runner invocation.
+
+    Only use for read-only, deterministic tools. Calls without an invocation
+    id (e.g. direct calls outside a runner) and calls made while memoization
+    is disabled go straight to the wrapped function.
+    """
+
+    def __init__(self, func: Callable[..., Any], cache: Optional[ToolCallCache] = None):
+        super().__init__(func)
+        self._cache = cache
+
+    async def run_async(
+        self, *, args: Dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        invocation_id = getattr(tool_context, "invocation_id", None)
+        if not invocation_id or not settings.tool_call_memoization_enabled:
+            return await super().run_async(args=args, tool_context=tool_context)
+
+        cache = self._cache or get_tool_call_cache()
+        return await cache.get_or_call(
+            invocation_id,
+            self.name,
+            args,
+            lambda: super(MemoizedFunctionTool, self).run_async(
+                args=args, tool_context=tool_context
+            ),
+        )
+
+
+_cache: Optional[ToolCallCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_call_cache() -> ToolCallCache:
+    """Get the singleton tool call cache."""
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ToolCallCache(
+                    max_invocations=settings.tool_call_cache_max_invocations
+                )
+    return _cache
+
+
+def reset_tool_call_cache() -> None:
+    """Reset the cache singleton for testing purposes."""
+    global _cache
+    _cache = None
@@ -0,0 +1,178 @@
+"""Import-time profiler - ``python -X importtime`` style breakdown in-process
+
+``-X importtime`` has to be set on the interpreter command line and prints
+raw lines to stderr. This profiler can be switched on from application code
+(main.py installs it in debug mode before importing routers and SDKs) and
+produces a structured report that goes to the application logs:
+
+- per module: self time and cumulative time (including nested imports)
+- per top-level package: summed self time (e.g. how much ``google.adk`` costs)
+
+It works by wrapping the loader of every module found while installed, so it
+only sees modules imported for the first time after install().
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+from importlib.abc import MetaPathFinder
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ImportRecord:
+    """Import time of one module, in microseconds."""
+
+    module: str
+    self_us: float = 0.0
+    cumulative_us: float = 0.0
+    depth: int = 0
+
+
+class _TimingLoader:
+    """Delegating loader that times exec_module for the profiler."""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # Hide the wrapper from the module once the import system has set it
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(MetaPathFinder):
+    def __init__(self, profiler: "ImportProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimingLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class ImportProfiler:
+    """Records how long each newly imported module takes to import."""
+
+    def __init__(self) -> None:
+        self._finder = _TimingFinder(self)
+        self._records: Dict[str, ImportRecord] = {}
+        # (module, start, time spent in nested imports)
+        self._stack: List[List[Any]] = []
+
+    @property
+    def installed(self) -> bool:
+        return self._finder in sys.meta_path
+
+    def install(self) -> "ImportProfiler":
+        if not self.installed:
+            sys.meta_path.insert(0, self._finder)
+        return self
+
+    def uninstall(self) -> None:
+        if self.installed:
+            sys.meta_path.remove(self._finder)
+
+    def __enter__(self) -> "ImportProfiler":
+        return self.install()
+
+    def __exit__(self, *exc_info) -> None:
+        self.uninstall()
+
+    def _enter(self, module: str) -> None:
+        self._stack.append([module, time.perf_counter(), 0.0])
+
+    def _exit(self, module: str) -> None:
+        name, start, nested = self._stack.pop()
+        cumulative = (time.perf_counter() - start) * 1e6
+        self._records[name] = ImportRecord(
+            module=name,
+            self_us=cumulative - nested,
+            cumulative_us=cumulative,
+            depth=len(self._stack),
+        )
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    @property
+    def records(self) -> List[ImportRecord]:
+        return list(self._records.values())
+
+    @property
+    def total_us(self) -> float:
+        return sum(record.self_us for record in self._records.values())
+
+    def by_package(self) -> Dict[str, float]:
+        """Summed self time per top-level package (``google.adk`` counts as
+        ``google.adk`` rather than ``google``), slowest first."""
+        totals: Dict[str, float] = {}
+        for record in self._records.values():
+            parts = record.module.split(".")
+            package = ".".join(parts[:2]) if parts[0] == "google" else parts[0]
+            totals[package] = totals.get(package, 0.0) + record.self_us
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def report(self, top: int = 25) -> Dict[str, Any]:
+        """Slowest modules and packages, in milliseconds, for logging."""
+        slowest = sorted(
+            self._records.values(), key=lambda r: r.cumulative_us, reverse=True
+        )
+        return {
+            "total_ms": round(self.total_us / 1000, 1),
+            "modules": len(self._records),
+            "slowest_modules_ms": {
+                r.module: round(r.cumulative_us / 1000, 1) for r in slowest[:top]
+            },
+            "packages_ms": {
+                package: round(us / 1000, 1)
+                for package, us in list(self.by_package().items())[:top]
+            },
+        }
+
+    def format_importtime(self, min_cumulative_us: float = 0.0) -> str:
+        """Render the records like ``python -X importtime`` (import order)."""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for record in self._records.values():
+            if record.cumulative_us < min_cumulative_us:
+                continue
+            lines.append(
+                f"import time: {record.self_us:>9.0f} | {record.cumulative_us:>10.0f}"
+                f" | {'  ' * record.depth}{record.module}"
+            )
+        return "\n".join(lines)
+
+
+_startup_profiler: Optional[ImportProfiler] = None
+
+
+def start_import_profiler() -> ImportProfiler:
+    """Install the process-wide startup import profiler."""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = ImportProfiler()
+    return _startup_profiler.install()
+
+
+def get_import_profiler() -> Optional[ImportProfiler]:
+    """Get the startup import profiler, if it was started."""
+    return _startup_profiler
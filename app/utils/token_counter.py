@@ -0,0 +1,144 @@
+"""Token counting for prompt budgeting
+
+Context assembly used to estimate tokens as ``len(text) // 4`` over whole
+concatenated prompts. Counters here are pluggable:
+
+- ``calibrated`` (default): splits text like a SentencePiece tokenizer does
+  (words, digits, punctuation) and charges long words per sub-word chunk.
+  No model file needed.
+- ``sentencepiece``: exact counts from a local SentencePiece model file
+  (requires the optional ``sentencepiece`` package).
+- ``heuristic``: the old 4-characters-per-token estimate.
+
+Counts of conversation turns are computed once and stored on the turn
+(``token_count``/``token_counter``), so budgeting sums cached counts instead
+of re-tokenizing the history.
+"""
+
+import math
+import re
+import threading
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+
+TURN_TOKENS_KEY = "token_count"
+TURN_COUNTER_KEY = "token_counter"
+
+_PIECE_RE = re.compile(r"[A-Za-z]+|\d|[^\sA-Za-z\d]")
+
+
+class TokenCounter:
+    """Counts the tokens a text takes in a prompt."""
+
+    name = "base"
+
+    def count(self, text: str) -> int:
+        raise NotImplementedError
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Fixed characters-per-token estimate."""
+
+    name = "heuristic"
+
+    def __init__(self, chars_per_token: int = 4) -> None:
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return len(text) // self.chars_per_token
+
+
+class CalibratedTokenCounter(TokenCounter):
+    """SentencePiece-style estimator.
+
+    Words of up to ``whole_word_chars`` letters are one token, longer words
+    cost one token per ``subword_chars`` letters; every digit and every
+    other non-space character (punctuation, non-Latin script) is one token.
+    """
+
+    name = "calibrated"
+
+    def __init__(self, whole_word_chars: int = 7, subword_chars: int = 4) -> None:
+        self.whole_word_chars = whole_word_chars
+        self.subword_chars = subword_chars
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for piece in _PIECE_RE.findall(text):
+            if len(piece) <= self.whole_word_chars:
+                tokens += 1
+            else:
+                tokens += math.ceil(len(piece) / self.subword_chars)
+        return tokens
+
+
+class SentencePieceTokenCounter(TokenCounter):
+    """Exact counts from a local SentencePiece model."""
+
+    name = "sentencepiece"
+
+    def __init__(self, model_path: str) -> None:
+        try:
+            import sentencepiece
+        except ImportError as e:
+            raise ImportError(
+                "The sentencepiece token counter requires the sentencepiece "
+                "package: pip install sentencepiece"
+            ) from e
+        self._processor = sentencepiece.SentencePieceProcessor(model_file=model_path)
+
+    def count(self, text: str) -> int:
+        return len(self._processor.encode(text))
+
+
+def turn_text(turn: Dict[str, Any]) -> str:
+    """Text of a conversation turn as it appears in prompts."""
+    return (
+        f"Turn {turn.get('turn_number', 0)}: User: {turn.get('user_input', '')}\n"
+        f"Partner: {turn.get('partner_response', '')}"
+    )
+
+
+def count_turn_tokens(counter: TokenCounter, turn: Dict[str, Any]) -> int:
+    """Tokens of a turn, from the count cached on it when available."""
+    if turn.get(TURN_COUNTER_KEY) == counter.name and TURN_TOKENS_KEY in turn:
+        return turn[TURN_TOKENS_KEY]
+    return counter.count(turn_text(turn))
+
+
+def create_token_counter(name: str, model_path: str = "") -> TokenCounter:
+    """Build a token counter by name (calibrated, heuristic, sentencepiece)."""
+    if name == CalibratedTokenCounter.name:
+        return CalibratedTokenCounter()
+    if name == HeuristicTokenCounter.name:
+        return HeuristicTokenCounter()
+    if name == SentencePieceTokenCounter.name:
+        if not model_path:
+            raise ValueError("PERF_TOKENIZER_MODEL_PATH is required for sentencepiece")
+        return SentencePieceTokenCounter(model_path)
+    raise ValueError(f"Unknown token counter: {name}")
+
+
+_token_counter: Optional[TokenCounter] = None
+_init_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the singleton token counter selected by PERF_TOKEN_COUNTER."""
+    global _token_counter
+
+    if _token_counter is None:
+        with _init_lock:
+            if _token_counter is None:
+                settings = get_settings()
+                _token_counter = create_token_counter(
+                    settings.perf_token_counter, settings.perf_tokenizer_model_path
+                )
+    return _token_counter
+
+
+def reset_token_counter() -> None:
+    """Reset the token counter singleton for testing purposes."""
+    global _token_counter
+    _token_counter = None
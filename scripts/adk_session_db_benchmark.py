@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""ADK session database benchmark: concurrent appends and reads on one instance
+
+Simulates concurrent turns against one DatabaseSessionService on a fresh
+SQLite file. Each writer owns a session and appends events the way a turn
+does (load the session, append an event); readers keep loading random
+sessions until the writers finish. The run is repeated with the default
+engine and with the tuned engine from app/services/adk_session_db.py.
+
+For each configuration it reports:
+
+- appends_per_s / reads_per_s: completed operations per second
+- append_p95_ms: 95th percentile latency of one load+append
+- lock_errors: operations that failed with "database is locked"
+
+Usage:
+    # From project root:
+    python scripts/adk_session_db_benchmark.py
+
+    # More concurrency:
+    python scripts/adk_session_db_benchmark.py --writers 16 --readers 8 --turns 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from google.adk.events import Event  # noqa: E402
+from google.adk.sessions import DatabaseSessionService  # noqa: E402
+from google.adk.sessions import database_session_service  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from app.services.adk_session_db import (  # noqa: E402
+    SQLiteTuning,
+    configure_engine,
+    engine_kwargs,
+)
+
+APP_NAME = "session-db-benchmark"
+
+
+def sqlite_url(path: Path) -> str:
+    """SQLite URL with the driver the installed ADK version expects."""
+    if hasattr(database_session_service, "create_async_engine"):
+        return f"sqlite+aiosqlite:///{path}"
+    return f"sqlite:///{path}"
+
+
+def create_service(db_url: str, tuning: SQLiteTuning = None) -> DatabaseSessionService:
+    """Session service with the default engine, or tuned when given tuning."""
+    if tuning is None:
+        return DatabaseSessionService(db_url=db_url)
+    service = DatabaseSessionService(db_url=db_url, **engine_kwargs(db_url, tuning))
+    configure_engine(service.db_engine, tuning)
+    return service
+
+
+def _turn_event(writer: int, turn: int) -> Event:
+    return Event(
+        invocation_id=f"inv-{writer}-{turn}",
+        author="partner_agent",
+        content=types.Content(
+            role="model",
+            parts=[types.Part(text=f"Turn {turn}: yes, and... " * 20)],
+        ),
+    )
+
+
+def _is_lock_error(error: Exception) -> bool:
+    return "database is locked" in str(error)
+
+
+async def run_benchmark(
+    db_url: str,
+    tuning: SQLiteTuning = None,
+    writers: int = 8,
+    readers: int = 4,
+    turns: int = 20,
+) -> Dict[str, Any]:
+    """Run concurrent writers and readers against a fresh session database."""
+    service = create_service(db_url, tuning)
+    session_ids = [f"session-{n}" for n in range(writers)]
+    for session_id in session_ids:
+        await service.create_session(
+            app_name=APP_NAME, user_id="user", session_id=session_id, state={}
+        )
+
+    append_ms: List[float] = []
+    counts = {"reads": 0, "lock_errors": 0, "errors": 0}
+    done = asyncio.Event()
+
+    async def writer(index: int) -> None:
+        for turn in range(turns):
+            start = time.perf_counter()
+            try:
+                session = await service.get_session(
+                    app_name=APP_NAME, user_id="user", session_id=session_ids[index]
+                )
+                await service.append_event(session, _turn_event(index, turn))
+                append_ms.append((time.perf_counter() - start) * 1000)
+            except Exception as e:
+                counts["lock_errors" if _is_lock_error(e) else "errors"] += 1
+
+    async def reader() -> None:
+        while not done.is_set():
+            try:
+                await service.get_session(
+                    app_name=APP_NAME,
+                    user_id="user",
+                    session_id=random.choice(session_ids),
+                )
+                counts["reads"] += 1
+            except Exception as e:
+                counts["lock_errors" if _is_lock_error(e) else "errors"] += 1
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    reader_tasks = [asyncio.create_task(reader()) for _ in range(readers)]
+    await asyncio.gather(*(writer(n) for n in range(writers)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await asyncio.gather(*reader_tasks)
+
+    dispose = service.db_engine.dispose()
+    if asyncio.iscoroutine(dispose):
+        await dispose
+
+    return {
+        "appends": len(append_ms),
+        "appends_per_s": round(len(append_ms) / elapsed, 1),
+        "reads_per_s": round(counts["reads"] / elapsed, 1),
+        "append_p95_ms": (
+            round(statistics.quantiles(append_ms, n=20)[-1], 2)
+            if len(append_ms) >= 2
+            else None
+        ),
+        "lock_errors": counts["lock_errors"],
+        "errors": counts["errors"],
+    }
+
+
+async def compare(writers: int, readers: int, turns: int) -> Dict[str, Dict]:
+    """Run the benchmark with the default and the tuned engine."""
+    results = {}
+    for name, tuning in (("default", None), ("tuned", SQLiteTuning())):
+        with tempfile.TemporaryDirectory() as tmp:
+            results[name] = await run_benchmark(
+                sqlite_url(Path(tmp) / "sessions.db"),
+                tuning,
+                writers=writers,
+                readers=readers,
+                turns=turns,
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ADK session DB")
+    parser.add_argument("--writers", type=int, default=8, help="Concurrent turns")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent readers")
+    parser.add_argument("--turns", type=int, default=20, help="Appends per writer")
+    args = parser.parse_args()
+
+    results = asyncio.run(compare(args.writers, args.readers, args.turns))
+    for name, result in results.items():
+        print(
+            f"  {name}: appends/s={result['appends_per_s']} "
+            f"reads/s={result['reads_per_s']} "
+            f"append_p95_ms={result['append_p95_ms']} "
+            f"lock_errors={result['lock_errors']} errors={result['errors']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
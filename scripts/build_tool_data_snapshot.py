@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Build the bundled tool data snapshot
+
+Serializes the canonical tool data from seed_firestore_tool_data.py into
+app/data/tool_data_snapshot.json. The app loads this file as its initial tool
+data cache so cold starts don't wait on Firestore; rerun this script whenever
+the seed data changes.
+
+Usage:
+    # From project root:
+    python scripts/build_tool_data_snapshot.py
+
+    # Write somewhere else:
+    python scripts/build_tool_data_snapshot.py --output /tmp/snapshot.json
+
+    # Exit non-zero if the committed bundle is out of date with the seed data:
+    python scripts/build_tool_data_snapshot.py --check
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.tool_data_bundle import (  # noqa: E402
+    DEFAULT_BUNDLE_PATH,
+    build_bundle,
+    dump_bundle,
+)
+from scripts.seed_firestore_tool_data import (  # noqa: E402
+    ARCHETYPES_DATA,
+    GAMES_DATA,
+    PRINCIPLES_DATA,
+    SENTIMENT_KEYWORDS_DATA,
+)
+
+
+def build_from_seed_data() -> dict:
+    """Build a bundle from the seed script's data."""
+    return build_bundle(
+        games=GAMES_DATA,
+        principles=PRINCIPLES_DATA,
+        archetypes=ARCHETYPES_DATA,
+        sentiment_docs=SENTIMENT_KEYWORDS_DATA,
+    )
+
+
+def is_up_to_date(path: Path) -> bool:
+    """Check whether the bundle at path matches the current seed data."""
+    try:
+        existing = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    current = build_from_seed_data()
+    return (
+        existing.get("schema_version") == current["schema_version"]
+        and existing.get("data_version") == current["data_version"]
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the bundled tool data snapshot")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_BUNDLE_PATH,
+        help=f"Output file (default: {DEFAULT_BUNDLE_PATH})",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only verify the output file is up to date with the seed data",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        if is_up_to_date(args.output):
+            print(f"{args.output} is up to date")
+            return 0
+        print(f"{args.output} is out of date; run scripts/build_tool_data_snapshot.py")
+        return 1
+
+    bundle = build_from_seed_data()
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(dump_bundle(bundle) + "\n", encoding="utf-8")
+
+    print(f"Wrote {args.output}")
+    print(f"  data_version: {bundle['data_version']}")
+    print(f"  games: {len(bundle['games'])}")
+    print(f"  principles: {len(bundle['principles'])}")
+    print(f"  archetypes: {len(bundle['archetypes'])}")
+    print(f"  size: {args.output.stat().st_size} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
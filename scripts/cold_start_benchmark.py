@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark: time to first response of a fresh process
+
+Each run starts a new Python interpreter that imports app.main and serves
+one GET /health through the ASGI app (startup events, i.e. the warmup phase,
+are not run; their per-component timings are reported by /ready). A run
+records:
+
+- import_ms: time to import app.main (routers, SDKs, middleware)
+- first_response_ms: import plus the first /health response
+- process_ms: wall time of the whole child process, including interpreter
+  start and shutdown
+- modules: number of modules loaded after the first response
+- deferred: heavy modules that should not be loaded yet, and whether they were
+
+Results can be appended to a JSON-lines history file so releases can be
+compared; the previous entry is printed next to the new one.
+
+Usage:
+    # From project root:
+    python scripts/cold_start_benchmark.py
+
+    # Median of 5 runs, appended to a history file:
+    python scripts/cold_start_benchmark.py --runs 5 --history cold_start.jsonl
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+project_root = Path(__file__).parent.parent
+
+# Modules app.main must not import; they are loaded on first use
+DEFERRED_MODULES = (
+    "app.audio.audio_orchestrator",
+    "app.audio.websocket_handler",
+    "opentelemetry.exporter.cloud_trace",
+)
+
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+response = TestClient(app.main.app).get("/health")
+responded = time.perf_counter()
+print(json.dumps({
+    "status_code": response.status_code,
+    "import_ms": (imported - start) * 1000,
+    "first_response_ms": (responded - start) * 1000,
+    "modules": len(sys.modules),
+    "deferred": {name: name in sys.modules for name in %r},
+}))
+"""
+
+
+def measure_once(env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Start a fresh interpreter and time its first response."""
+    child_env = {**os.environ, **(env or {})}
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT % (DEFERRED_MODULES,)],
+        cwd=project_root,
+        env=child_env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    process_ms = (time.perf_counter() - start) * 1000
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    run["process_ms"] = process_ms
+    return run
+
+
+def measure_cold_start(
+    runs: int = 3, env: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Median timings over several cold starts."""
+    samples: List[Dict[str, Any]] = [measure_once(env) for _ in range(runs)]
+    summary: Dict[str, Any] = {
+        key: round(statistics.median(sample[key] for sample in samples), 1)
+        for key in ("import_ms", "first_response_ms", "process_ms")
+    }
+    summary["runs"] = runs
+    summary["modules"] = samples[-1]["modules"]
+    summary["status_code"] = samples[-1]["status_code"]
+    summary["deferred"] = samples[-1]["deferred"]
+    return summary
+
+
+def release_id() -> str:
+    """Current git revision, or 'unknown' outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "describe", "--tags", "--always", "--dirty"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def read_last_entry(history: Path) -> Optional[Dict[str, Any]]:
+    try:
+        lines = history.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    return json.loads(lines[-1]) if lines else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure cold-start latency")
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts to run")
+    parser.add_argument(
+        "--history",
+        type=Path,
+        help="JSON-lines file to append the result to and compare against",
+    )
+    args = parser.parse_args()
+
+    summary = measure_cold_start(args.runs)
+    summary["release"] = release_id()
+    summary["measured_at"] = datetime.now(timezone.utc).isoformat()
+
+    previous = read_last_entry(args.history) if args.history else None
+    for key in ("import_ms", "first_response_ms", "process_ms"):
+        line = f"  {key}: {summary[key]:.1f}"
+        if previous and key in previous:
+            line += f" (was {previous[key]:.1f} at {previous.get('release')})"
+        print(line)
+    print(f"  modules: {summary['modules']}")
+    for module, loaded in summary["deferred"].items():
+        print(f"  {module}: {'LOADED' if loaded else 'deferred'}")
+
+    if args.history:
+        with args.history.open("a", encoding="utf-8") as history:
+            history.write(json.dumps(summary) + "\n")
+        print(f"Appended to {args.history}")
+
+    return 1 if any(summary["deferred"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
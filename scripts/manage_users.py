@@ -9,6 +9,7 @@ Commands:
     list                   - List all users
     list --tier <tier>     - List users by tier
     remove <email>         - Remove a user
+    import <file> <tier>   - Bulk import emails from a file (one per line)
     migrate-env            - Migrate from ALLOWED_USERS env var
 
 Usage:
@@ -17,6 +18,7 @@ Usage:
     python scripts/manage_users.py list
     python scripts/manage_users.py list --tier premium
     python scripts/manage_users.py remove user@example.com
+    python scripts/manage_users.py import emails.txt regular
     python scripts/manage_users.py migrate-env
 """
 
@@ -89,9 +91,9 @@ async def update_user(email: str, tier: str) -> None:
         sys.exit(1)
 
 
-async def list_users(tier: Optional[str] = None) -> None:
-    """List users, optionally filtered by tier."""
-    from app.services.user_service import list_users as svc_list_users
+async def list_users(tier: Optional[str] = None, page_size: int = 100) -> None:
+    """List users page by page, optionally filtered by tier."""
+    from app.services.user_service import iter_users
     from app.models.user import UserTier
 
     tier_filter = None
@@ -103,25 +105,25 @@ async def list_users(tier: Optional[str] = None) -> None:
             sys.exit(1)
 
     try:
-        users = await svc_list_users(tier=tier_filter)
+        count = 0
+        async for user in iter_users(tier=tier_filter, page_size=page_size):
+            if count == 0:
+                print(f"{'Email':<40} {'Tier':<10} {'Created':<20} {'Last Login':<20}")
+                print("-" * 90)
+            created = user.created_at.strftime("%Y-%m-%d %H:%M") if user.created_at else "N/A"
+            last_login = user.last_login_at.strftime("%Y-%m-%d %H:%M") if user.last_login_at else "Never"
+            print(f"{user.email:<40} {user.tier.value:<10} {created:<20} {last_login:<20}")
+            count += 1
 
-        if not users:
+        if count == 0:
             if tier_filter:
                 print(f"No users found with tier: {tier_filter.value}")
             else:
                 print("No users found")
             return
 
-        print(f"{'Email':<40} {'Tier':<10} {'Created':<20} {'Last Login':<20}")
-        print("-" * 90)
-
-        for user in users:
-            created = user.created_at.strftime("%Y-%m-%d %H:%M") if user.created_at else "N/A"
-            last_login = user.last_login_at.strftime("%Y-%m-%d %H:%M") if user.last_login_at else "Never"
-            print(f"{user.email:<40} {user.tier.value:<10} {created:<20} {last_login:<20}")
-
         print("-" * 90)
-        print(f"Total: {len(users)} users")
+        print(f"Total: {count} users")
 
     except Exception as e:
         print(f"Error listing users: {e}")
@@ -147,6 +149,52 @@ async def remove_user(email: str) -> None:
         sys.exit(1)
 
 
+def _print_progress(done: int, total: int) -> None:
+    """Render an in-place progress line for bulk operations."""
+    percent = (done / total * 100) if total else 100.0
+    print(f"\r  Progress: {done}/{total} ({percent:.0f}%)", end="", flush=True)
+
+
+async def import_users(path: str, tier: str, created_by: str = "cli-admin") -> None:
+    """Bulk import users from a file with one email per line."""
+    from app.services.user_service import bulk_import_users
+    from app.models.user import UserTier
+
+    try:
+        tier_enum = UserTier(tier.lower())
+    except ValueError:
+        print(f"Error: Invalid tier '{tier}'. Must be one of: free, regular, premium")
+        sys.exit(1)
+
+    try:
+        with open(path) as f:
+            emails = [line.split(",")[0].strip() for line in f if line.strip()]
+    except OSError as e:
+        print(f"Error reading {path}: {e}")
+        sys.exit(1)
+
+    print(f"Importing {len(emails)} emails from {path} as {tier_enum.value}...")
+
+    try:
+        result = await bulk_import_users(
+            emails,
+            tier=tier_enum,
+            created_by=created_by,
+            on_progress=_print_progress,
+        )
+        print()
+        print("Import complete:")
+        print(f"  ✅ Created: {result['created']}")
+        print(f"  ⏭️  Skipped (already exists): {result['skipped']}")
+        print(f"  🔁 Duplicates in input: {result['duplicates']}")
+        if result.get("errors", 0) > 0:
+            print(f"  ❌ Errors: {result['errors']}")
+
+    except Exception as e:
+        print(f"\nError during import: {e}")
+        sys.exit(1)
+
+
 async def migrate_from_env(default_tier: str = "regular") -> None:
     """Migrate users from ALLOWED_USERS environment variable."""
     from app.services.user_service import migrate_from_allowed_users
@@ -203,6 +251,7 @@ Examples:
   %(prog)s list
   %(prog)s list --tier premium
   %(prog)s remove user@example.com
+  %(prog)s import emails.txt regular
   %(prog)s migrate-env
         """,
     )
@@ -222,11 +271,17 @@ Examples:
     # List command
     list_parser = subparsers.add_parser("list", help="List users")
     list_parser.add_argument("--tier", choices=["free", "regular", "premium"], help="Filter by tier")
+    list_parser.add_argument("--page-size", type=int, default=100, help="Users fetched per page (default: 100)")
 
     # Remove command
     remove_parser = subparsers.add_parser("remove", help="Remove a user")
     remove_parser.add_argument("email", help="User email address")
 
+    # Import command
+    import_parser = subparsers.add_parser("import", help="Bulk import users from a file")
+    import_parser.add_argument("file", help="File with one email per line")
+    import_parser.add_argument("tier", choices=["free", "regular", "premium"], help="User tier")
+
     # Migrate command
     migrate_parser = subparsers.add_parser("migrate-env", help="Migrate from ALLOWED_USERS env var")
     migrate_parser.add_argument(
@@ -248,9 +303,11 @@ Examples:
     elif args.command == "update":
         asyncio.run(update_user(args.email, args.tier))
     elif args.command == "list":
-        asyncio.run(list_users(args.tier))
+        asyncio.run(list_users(args.tier, args.page_size))
     elif args.command == "remove":
         asyncio.run(remove_user(args.email))
+    elif args.command == "import":
+        asyncio.run(import_users(args.file, args.tier))
     elif args.command == "migrate-env":
         asyncio.run(migrate_from_env(args.tier))
 
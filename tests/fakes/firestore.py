@@ -0,0 +1,443 @@
+"""In-process Firestore stand-in
+
+Implements the subset of ``google.cloud.firestore_v1.AsyncClient`` used by the
+app services (collections, documents, subcollections, queries with filters,
+ordering, cursors and projections, batched writes, field-path updates with
+``Increment``, update-time preconditions and ``get_all``) on top of plain
+dictionaries, so services can be exercised and benchmarked at realistic data
+volumes without network access.
+
+Every call that would be a network round-trip in production is counted in
+``client.stats`` and can optionally be delayed by ``latency`` seconds.
+"""
+
+import asyncio
+import copy
+import functools
+import itertools
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from google.api_core.exceptions import AlreadyExists, FailedPrecondition
+from google.cloud.firestore_v1.field_path import parse_field_path
+from google.cloud.firestore_v1.transforms import Increment
+
+ASCENDING = "ASCENDING"
+DESCENDING = "DESCENDING"
+DOCUMENT_ID = "__name__"
+
+MAX_IN_VALUES = 30
+MAX_BATCH_OPERATIONS = 500
+
+_auto_ids = itertools.count(1)
+
+
+def _get_field(data: Dict[str, Any], field_path: str) -> Any:
+    value: Any = data
+    for part in field_path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def _has_field(data: Optional[Dict[str, Any]], field_path: str) -> bool:
+    value: Any = data
+    for part in field_path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return False
+        value = value[part]
+    return True
+
+
+def _sort_value(value: Any) -> Tuple[int, Any]:
+    # Firestore orders nulls before every other value
+    return (0, 0) if value is None else (1, value)
+
+
+class FakeDocumentSnapshot:
+    def __init__(
+        self,
+        reference: "FakeDocumentReference",
+        data: Optional[Dict[str, Any]],
+        projection: Optional[List[str]] = None,
+    ):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self.update_time = (
+            reference._client._update_times.get(reference.path) if self.exists else None
+        )
+        if data is not None and projection is not None:
+            data = {f: data[f] for f in projection if f in data}
+        self._data = data
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field_path: str) -> Any:
+        if field_path == DOCUMENT_ID:
+            return self.id
+        return _get_field(self._data or {}, field_path)
+
+
+class FakeDocumentReference:
+    def __init__(self, client: "FakeFirestoreClient", parent_path: str, doc_id: str):
+        self._client = client
+        self._parent_path = parent_path
+        self.id = doc_id
+
+    @property
+    def path(self) -> str:
+        return f"{self._parent_path}/{self.id}"
+
+    def collection(self, name: str) -> "FakeCollectionReference":
+        return FakeCollectionReference(self._client, f"{self.path}/{name}")
+
+    def _docs(self) -> Dict[str, Dict[str, Any]]:
+        return self._client._store.setdefault(self._parent_path, {})
+
+    async def get(self, field_paths: Optional[List[str]] = None) -> FakeDocumentSnapshot:
+        await self._client._round_trip(reads=1)
+        return self._snapshot(field_paths)
+
+    def _snapshot(self, field_paths: Optional[List[str]] = None) -> FakeDocumentSnapshot:
+        data = self._docs().get(self.id)
+        return FakeDocumentSnapshot(self, copy.deepcopy(data), field_paths)
+
+    def _apply_set(self, data: Dict[str, Any], merge: bool = False) -> None:
+        docs = self._docs()
+        if merge and self.id in docs:
+            docs[self.id].update(copy.deepcopy(data))
+        else:
+            docs[self.id] = copy.deepcopy(data)
+        self._client._touch(self.path)
+
+    def _apply_update(self, updates: Dict[str, Any]) -> None:
+        docs = self._docs()
+        if self.id not in docs:
+            raise KeyError(f"No document to update: {self.path}")
+        for key, value in updates.items():
+            target = docs[self.id]
+            parts = parse_field_path(key)
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            if isinstance(value, Increment):
+                target[parts[-1]] = (target.get(parts[-1]) or 0) + value.value
+            else:
+                target[parts[-1]] = copy.deepcopy(value)
+        self._client._touch(self.path)
+
+    def _apply_delete(self) -> None:
+        self._docs().pop(self.id, None)
+        self._client._update_times.pop(self.path, None)
+
+    def _check(self, option: Optional["FakeWriteOption"]) -> None:
+        if option is not None and option.last_update_time != (
+            self._client._update_times.get(self.path)
+        ):
+            raise FailedPrecondition(f"Document was updated: {self.path}")
+
+    async def set(self, data: Dict[str, Any], merge: bool = False) -> None:
+        await self._client._round_trip(writes=1)
+        self._apply_set(data, merge=merge)
+
+    async def create(self, data: Dict[str, Any]) -> None:
+        await self._client._round_trip(writes=1)
+        if self.id in self._docs():
+            raise AlreadyExists(f"Document already exists: {self.path}")
+        self._apply_set(data)
+
+    async def update(
+        self, updates: Dict[str, Any], option: Optional["FakeWriteOption"] = None
+    ) -> None:
+        await self._client._round_trip(writes=1)
+        self._check(option)
+        self._apply_update(updates)
+
+    async def delete(self) -> None:
+        await self._client._round_trip(writes=1)
+        self._apply_delete()
+
+
+class FakeQuery:
+    def __init__(
+        self,
+        client: "FakeFirestoreClient",
+        path: str,
+        filters: Tuple[Tuple[str, str, Any], ...] = (),
+        orders: Tuple[Tuple[str, str], ...] = (),
+        limit_count: Optional[int] = None,
+        cursor: Optional[Any] = None,
+        projection: Optional[List[str]] = None,
+    ):
+        self._client = client
+        self._path = path
+        self._filters = filters
+        self._orders = orders
+        self._limit = limit_count
+        self._cursor = cursor
+        self._projection = projection
+
+    def _copy(self, **changes: Any) -> "FakeQuery":
+        params = {
+            "filters": self._filters,
+            "orders": self._orders,
+            "limit_count": self._limit,
+            "cursor": self._cursor,
+            "projection": self._projection,
+        }
+        params.update(changes)
+        return FakeQuery(self._client, self._path, **params)
+
+    def where(self, field_path: str, op_string: str, value: Any) -> "FakeQuery":
+        if op_string in ("in", "not-in", "array_contains_any"):
+            if len(value) > MAX_IN_VALUES:
+                raise ValueError(
+                    f"'{op_string}' filters support at most {MAX_IN_VALUES} values"
+                )
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path: str, direction: str = ASCENDING) -> "FakeQuery":
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._copy(limit_count=count)
+
+    def start_after(self, document_fields_or_snapshot: Any) -> "FakeQuery":
+        return self._copy(cursor=document_fields_or_snapshot)
+
+    def select(self, field_paths: Iterable[str]) -> "FakeQuery":
+        return self._copy(projection=list(field_paths))
+
+    @staticmethod
+    def _matches(snapshot: FakeDocumentSnapshot, field: str, op: str, value: Any) -> bool:
+        actual = snapshot.get(field)
+        if op == "==":
+            return actual == value
+        if op == "!=":
+            return actual is not None and actual != value
+        if op == "in":
+            return actual in value
+        if op == "not-in":
+            return actual is not None and actual not in value
+        if op == "array_contains":
+            return isinstance(actual, list) and value in actual
+        if op == "array_contains_any":
+            return isinstance(actual, list) and any(v in actual for v in value)
+        if actual is None:
+            return False
+        if op == "<":
+            return actual < value
+        if op == "<=":
+            return actual <= value
+        if op == ">":
+            return actual > value
+        if op == ">=":
+            return actual >= value
+        raise ValueError(f"Unsupported operator: {op}")
+
+    def _order_key(self, snapshot: FakeDocumentSnapshot) -> List[Tuple[int, Any]]:
+        return [_sort_value(snapshot.get(field)) for field, _ in self._effective_orders()]
+
+    def _effective_orders(self) -> Tuple[Tuple[str, str], ...]:
+        if any(field == DOCUMENT_ID for field, _ in self._orders):
+            return self._orders
+        return self._orders + ((DOCUMENT_ID, ASCENDING),)
+
+    def _compare(self, left: List[Any], right: List[Any]) -> int:
+        for (l_val, r_val), (_, direction) in zip(
+            zip(left, right), self._effective_orders()
+        ):
+            if l_val == r_val:
+                continue
+            result = -1 if l_val < r_val else 1
+            return -result if direction == DESCENDING else result
+        return 0
+
+    def _cursor_key(self) -> List[Tuple[int, Any]]:
+        cursor = self._cursor
+        if isinstance(cursor, FakeDocumentSnapshot):
+            return self._order_key(cursor)
+        if isinstance(cursor, dict):
+            return [
+                _sort_value(cursor.get(field)) for field, _ in self._effective_orders()
+            ]
+        return [_sort_value(v) for v in cursor]
+
+    def _run(self) -> List[FakeDocumentSnapshot]:
+        docs = self._client._store.get(self._path, {})
+        snapshots = [
+            FakeDocumentSnapshot(
+                FakeDocumentReference(self._client, self._path, doc_id), data
+            )
+            for doc_id, data in docs.items()
+        ]
+        for field, op, value in self._filters:
+            snapshots = [s for s in snapshots if self._matches(s, field, op, value)]
+        # Like Firestore, ordering by a field leaves out documents without it
+        for field, _ in self._orders:
+            if field != DOCUMENT_ID:
+                snapshots = [s for s in snapshots if _has_field(s._data, field)]
+
+        keyed = [(self._order_key(s), s) for s in snapshots]
+        keyed.sort(key=functools.cmp_to_key(lambda a, b: self._compare(a[0], b[0])))
+
+        if self._cursor is not None:
+            cursor_key = self._cursor_key()
+            keyed = [
+                (key, s) for key, s in keyed if self._compare(key, cursor_key) > 0
+            ]
+
+        results = [s for _, s in keyed]
+        if self._limit is not None:
+            results = results[: self._limit]
+        return [
+            FakeDocumentSnapshot(s.reference, copy.deepcopy(s._data), self._projection)
+            for s in results
+        ]
+
+    async def stream(self):
+        await self._client._round_trip(reads=1)
+        for snapshot in self._run():
+            yield snapshot
+
+    async def get(self) -> List[FakeDocumentSnapshot]:
+        await self._client._round_trip(reads=1)
+        return self._run()
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, client: "FakeFirestoreClient", path: str):
+        super().__init__(client, path)
+        self.id = path.rsplit("/", 1)[-1]
+
+    def document(self, document_id: Optional[str] = None) -> FakeDocumentReference:
+        return FakeDocumentReference(
+            self._client, self._path, document_id or f"auto{next(_auto_ids):012d}"
+        )
+
+    async def add(
+        self, document_data: Dict[str, Any], document_id: Optional[str] = None
+    ) -> Tuple[datetime, FakeDocumentReference]:
+        doc_ref = self.document(document_id)
+        await doc_ref.set(document_data)
+        return datetime.now(timezone.utc), doc_ref
+
+
+class FakeWriteOption:
+    """Precondition from ``client.write_option(last_update_time=...)``."""
+
+    def __init__(self, last_update_time: datetime):
+        self.last_update_time = last_update_time
+
+
+class FakeWriteBatch:
+    def __init__(self, client: "FakeFirestoreClient"):
+        self._client = client
+        self._operations: List[Tuple[str, FakeDocumentReference, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def _add(self, operation: str, reference: FakeDocumentReference, data: Any) -> None:
+        if len(self._operations) >= MAX_BATCH_OPERATIONS:
+            raise ValueError(
+                f"A batch supports at most {MAX_BATCH_OPERATIONS} operations"
+            )
+        self._operations.append((operation, reference, data))
+
+    def set(self, reference: FakeDocumentReference, document_data: Dict[str, Any], merge: bool = False) -> None:
+        self._add("set_merge" if merge else "set", reference, document_data)
+
+    def create(self, reference: FakeDocumentReference, document_data: Dict[str, Any]) -> None:
+        self._add("set", reference, document_data)
+
+    def update(
+        self,
+        reference: FakeDocumentReference,
+        field_updates: Dict[str, Any],
+        option: Optional[FakeWriteOption] = None,
+    ) -> None:
+        self._add("update", reference, (field_updates, option))
+
+    def delete(self, reference: FakeDocumentReference) -> None:
+        self._add("delete", reference, None)
+
+    async def commit(self) -> List[Any]:
+        await self._client._round_trip(writes=len(self._operations))
+        # Preconditions are checked first, so a failed batch writes nothing
+        for operation, reference, data in self._operations:
+            if operation == "update":
+                reference._check(data[1])
+        for operation, reference, data in self._operations:
+            if operation == "set":
+                reference._apply_set(data)
+            elif operation == "set_merge":
+                reference._apply_set(data, merge=True)
+            elif operation == "update":
+                reference._apply_update(data[0])
+            elif operation == "delete":
+                reference._apply_delete()
+        results = [None] * len(self._operations)
+        self._operations = []
+        return results
+
+
+class FakeFirestoreClient:
+    """Drop-in replacement for the async Firestore client in tests.
+
+    Args:
+        latency: Optional simulated network delay per round-trip, in seconds
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._store: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._update_times: Dict[str, datetime] = {}
+        self._last_update_time = datetime.now(timezone.utc)
+        self.stats = {"round_trips": 0, "reads": 0, "writes": 0}
+
+    async def _round_trip(self, reads: int = 0, writes: int = 0) -> None:
+        self.stats["round_trips"] += 1
+        self.stats["reads"] += reads
+        self.stats["writes"] += writes
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def _touch(self, path: str) -> None:
+        # Every write gets a distinct, increasing update time
+        self._last_update_time = max(
+            datetime.now(timezone.utc),
+            self._last_update_time + timedelta(microseconds=1),
+        )
+        self._update_times[path] = self._last_update_time
+
+    def collection(self, name: str) -> FakeCollectionReference:
+        return FakeCollectionReference(self, name)
+
+    @staticmethod
+    def write_option(last_update_time: datetime) -> FakeWriteOption:
+        return FakeWriteOption(last_update_time)
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    async def get_all(self, references: Iterable[FakeDocumentReference], field_paths: Optional[List[str]] = None):
+        references = list(references)
+        await self._round_trip(reads=len(references))
+        for reference in references:
+            yield reference._snapshot(field_paths)
+
+    async def close(self) -> None:
+        pass
+
+    def seed(self, collection: str, documents: Dict[str, Dict[str, Any]]) -> None:
+        """Insert documents directly without counting round-trips."""
+        self._store.setdefault(collection, {}).update(copy.deepcopy(documents))
+        for doc_id in documents:
+            self._touch(f"{collection}/{doc_id}")
+
+    def documents(self, collection: str) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of every document stored in a collection."""
+        return copy.deepcopy(self._store.get(collection, {}))
@@ -0,0 +1,105 @@
+"""Tests for the agent template registry
+
+Templates are built once per variant; stamped agents are independent copies
+that share the template's instruction, model config and toolsets.
+"""
+
+import pytest
+from google.adk.agents import Agent
+
+from app.agents.agent_templates import AgentTemplateRegistry
+from app.agents.mc_agent import create_mc_agent_for_audio
+from app.agents.partner_agent import create_partner_agent
+from app.agents.stage_manager import create_stage_manager
+
+
+def make_agent(name="leaf_agent", **kwargs):
+    return Agent(name=name, model="gemini-2.0-flash", instruction="Be brief.", **kwargs)
+
+
+class TestAgentTemplateRegistry:
+    def test_builds_template_once(self):
+        builds = []
+        registry = AgentTemplateRegistry()
+        registry.register("leaf", lambda: builds.append(1) or make_agent())
+
+        first = registry.stamp("leaf")
+        second = registry.stamp("leaf")
+
+        assert len(builds) == 1
+        assert first is not second
+        assert first.instruction is second.instruction
+        assert registry.get_stats()["builds"] == 1
+        assert registry.get_stats()["stamps"] == 2
+
+    def test_stamp_applies_overrides_only_to_the_copy(self):
+        registry = AgentTemplateRegistry()
+        registry.register("leaf", make_agent)
+
+        stamped = registry.stamp("leaf", name="session_agent")
+
+        assert stamped.name == "session_agent"
+        assert registry.template("leaf").name == "leaf_agent"
+
+    def test_stamped_tool_lists_are_independent(self):
+        registry = AgentTemplateRegistry()
+        registry.register("leaf", make_agent)
+
+        stamped = registry.stamp("leaf")
+        stamped.tools.append(lambda: None)
+
+        assert registry.template("leaf").tools == []
+
+    def test_unknown_variant(self):
+        with pytest.raises(ValueError, match="Unknown agent template"):
+            AgentTemplateRegistry().stamp("missing")
+
+    def test_templates_must_be_leaf_agents(self):
+        registry = AgentTemplateRegistry()
+        registry.register(
+            "parent", lambda: make_agent("parent", sub_agents=[make_agent()])
+        )
+
+        with pytest.raises(ValueError, match="must not have sub_agents"):
+            registry.stamp("parent")
+
+    def test_clear_and_reregister_rebuild(self):
+        builds = []
+        registry = AgentTemplateRegistry()
+        registry.register("leaf", lambda: builds.append(1) or make_agent())
+
+        registry.stamp("leaf")
+        registry.clear()
+        registry.stamp("leaf")
+        registry.register("leaf", make_agent)
+        registry.stamp("leaf")
+
+        assert len(builds) == 2
+        assert registry.get_stats()["built"] == 1
+
+
+class TestStampedAgentFactories:
+    def test_audio_mc_agents_are_per_session_with_shared_toolsets(self):
+        first = create_mc_agent_for_audio()
+        second = create_mc_agent_for_audio()
+
+        assert first is not second
+        assert first.name == "mc_agent_audio_unified"
+        assert [type(t) for t in first.tools] == [type(t) for t in second.tools]
+        assert all(a is b for a, b in zip(first.tools, second.tools))
+
+    def test_partner_phase_validation_still_applies(self):
+        with pytest.raises(ValueError):
+            create_partner_agent(phase=3)
+        with pytest.raises(TypeError):
+            create_partner_agent(phase="1")
+
+    def test_stage_managers_get_their_own_sub_agents(self):
+        first = create_stage_manager(turn_count=0)
+        second = create_stage_manager(turn_count=1)
+
+        for a, b in zip(first.sub_agents, second.sub_agents):
+            assert a is not b
+            assert a.name == b.name
+        assert all(sub.parent_agent is first for sub in first.sub_agents)
+        assert all(sub.parent_agent is second for sub in second.sub_agents)
@@ -0,0 +1,98 @@
+"""Per-turn overhead of the ADK session backends
+
+A turn loads its ADK session and appends the user message, a tool call and
+the partner response. This runs the same turns against DatabaseSessionService
+on a tuned SQLite file and against FirestoreSessionService on the in-process
+Firestore stand-in, with and without simulated network latency, and reports
+milliseconds and Firestore round-trips per turn.
+"""
+
+import time
+
+import pytest
+from google.adk.events import Event
+from google.genai import types
+
+from app.services.adk_firestore_session_service import FirestoreSessionService
+from app.services.adk_session_db import SQLiteTuning
+from scripts.adk_session_db_benchmark import create_service, sqlite_url
+from tests.fakes.firestore import FakeFirestoreClient
+
+APP = "backend-benchmark"
+USER = "user-1"
+EVENTS_PER_TURN = 3
+
+
+def turn_events(turn):
+    return [
+        Event(
+            invocation_id=f"inv-{turn}",
+            author=author,
+            content=types.Content(
+                role=role, parts=[types.Part(text=f"Turn {turn}: yes, and... " * 10)]
+            ),
+        )
+        for author, role in (
+            ("user", "user"),
+            ("partner_agent", "model"),
+            ("partner_agent", "model"),
+        )
+    ]
+
+
+async def per_turn_ms(service, turns=30, sessions=3):
+    """Average milliseconds for one load + appends turn."""
+    for n in range(sessions):
+        await service.create_session(
+            app_name=APP, user_id=USER, session_id=f"s{n}", state={}
+        )
+
+    start = time.perf_counter()
+    for turn in range(turns):
+        session = await service.get_session(
+            app_name=APP, user_id=USER, session_id=f"s{turn % sessions}"
+        )
+        for event in turn_events(turn):
+            await service.append_event(session, event)
+    return (time.perf_counter() - start) / turns * 1000
+
+
+class TestSessionBackendBenchmark:
+    @pytest.mark.asyncio
+    async def test_per_turn_overhead(self, tmp_path):
+        database = create_service(sqlite_url(tmp_path / "sessions.db"), SQLiteTuning())
+        database_ms = await per_turn_ms(database)
+        dispose = database.db_engine.dispose()
+        if hasattr(dispose, "__await__"):
+            await dispose
+
+        local = FakeFirestoreClient()
+        firestore_ms = await per_turn_ms(FirestoreSessionService(local))
+        round_trips = local.stats["round_trips"]
+
+        networked = FakeFirestoreClient(latency=0.005)
+        networked_ms = await per_turn_ms(FirestoreSessionService(networked))
+
+        print(
+            f"\nper turn: database={database_ms:.2f}ms "
+            f"firestore(stand-in)={firestore_ms:.2f}ms "
+            f"firestore(5ms rtt)={networked_ms:.2f}ms "
+            f"round_trips={round_trips}"
+        )
+        # create: 2 per session; turn: 2 for the load + 1 per appended event
+        assert round_trips == 3 * 2 + 30 * (2 + EVENTS_PER_TURN)
+
+    @pytest.mark.asyncio
+    async def test_session_load_costs_one_latency(self):
+        client = FakeFirestoreClient(latency=0.02)
+        service = FirestoreSessionService(client)
+        await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+
+        round_trips = client.stats["round_trips"]
+        start = time.perf_counter()
+        await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+        elapsed = time.perf_counter() - start
+
+        # Documents and events are read in one round-trip each, concurrently
+        print(f"\nsession load (20ms rtt): {elapsed * 1000:.1f}ms")
+        assert client.stats["round_trips"] - round_trips == 2
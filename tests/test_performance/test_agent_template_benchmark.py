@@ -0,0 +1,93 @@
+"""Benchmarks for stamping agents from templates
+
+Compares building agents from scratch (the template builders, i.e. what the
+factories did before templates) against stamping them from a built template:
+construction time and bytes allocated per session. Timings and allocations are
+printed for reference only; the tests check from the registry stats that each
+template is built once and every later agent is stamped from it.
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from app.agents import mc_agent, partner_agent, room_agent
+from app.agents.agent_templates import (
+    AgentTemplateRegistry,
+    get_agent_template_registry,
+)
+from app.agents.stage_manager import create_stage_manager
+
+
+def per_call_us(fn, iterations=300):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def allocated_bytes(fn, sessions=50):
+    """Bytes still held after creating agents for ``sessions`` sessions."""
+    fn()
+    tracemalloc.start()
+    agents = [fn() for _ in range(sessions)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(agents) == sessions
+    return current / sessions
+
+
+VARIANTS = [
+    ("mc_agent_audio", mc_agent._build_mc_agent_for_audio),
+    ("room_agent", room_agent._build_room_agent),
+    ("partner_agent_phase_2", lambda: partner_agent._build_partner_agent(2)),
+]
+
+
+class TestAgentTemplateBenchmark:
+    @pytest.fixture
+    def registry(self):
+        registry = AgentTemplateRegistry()
+        for variant, builder in VARIANTS:
+            registry.register(variant, builder)
+        return registry
+
+    @pytest.mark.parametrize("variant,builder", VARIANTS, ids=[v for v, _ in VARIANTS])
+    def test_stamp_vs_build(self, registry, variant, builder):
+        build_us = per_call_us(builder)
+        stamp_us = per_call_us(lambda: registry.stamp(variant))
+        build_bytes = allocated_bytes(builder)
+        stamp_bytes = allocated_bytes(lambda: registry.stamp(variant))
+
+        print(
+            f"\n{variant}: build={build_us:.1f}us/{build_bytes:.0f}B "
+            f"stamp={stamp_us:.1f}us/{stamp_bytes:.0f}B"
+        )
+        # One warm-up call each, then 300 timed calls and 50 held sessions
+        stats = registry.get_stats()
+        assert stats["builds"] == 1
+        assert stats["stamps"] == (1 + 300) + (1 + 50)
+
+    def test_stage_manager_per_turn(self):
+        registry = get_agent_template_registry()
+        registry.clear()
+
+        cold_us = per_call_us(
+            lambda: (registry.clear(), create_stage_manager(turn_count=5)), 100
+        )
+        before = registry.get_stats()
+        sub_agents = len(create_stage_manager(turn_count=5).sub_agents)
+        warm_us = per_call_us(lambda: create_stage_manager(turn_count=5), 100)
+        warm_bytes = allocated_bytes(lambda: create_stage_manager(turn_count=5))
+        after = registry.get_stats()
+
+        print(
+            f"\nstage_manager: rebuild={cold_us:.1f}us "
+            f"stamped={warm_us:.1f}us/{warm_bytes:.0f}B"
+        )
+        # Warm turns stamp every sub-agent from the built templates
+        turns = 1 + (1 + 100) + (1 + 50)
+        assert after["builds"] == before["builds"]
+        assert after["stamps"] - before["stamps"] == turns * sub_agents
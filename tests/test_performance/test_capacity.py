@@ -145,8 +145,8 @@ class TestContextCompactor:
         history = [
             {
                 "turn_number": i,
-                "user_input": f"Test {i}",
-                "partner_response": f"Response {i}",
+                "user_input": f"Test {i} " + "word " * 100,
+                "partner_response": f"Response {i} " + "word " * 100,
             }
             for i in range(1, 21)
         ]
@@ -0,0 +1,69 @@
+"""Cold-start benchmark and import-time profiler
+
+The benchmark starts a fresh interpreter (scripts/cold_start_benchmark.py),
+imports app.main and times the first /health response. Heavy optional
+subsystems (audio orchestrator, Cloud Trace exporter) must stay deferred.
+"""
+
+import sys
+
+from app.utils.import_profiler import ImportProfiler
+from scripts.cold_start_benchmark import DEFERRED_MODULES, measure_cold_start
+
+
+class TestColdStart:
+    def test_time_to_first_response(self):
+        summary = measure_cold_start(runs=1, env={"OTEL_ENABLED": "false"})
+
+        print(
+            f"\ncold start: import={summary['import_ms']:.0f}ms "
+            f"first_response={summary['first_response_ms']:.0f}ms "
+            f"process={summary['process_ms']:.0f}ms modules={summary['modules']}"
+        )
+        assert summary["status_code"] == 200
+        assert summary["first_response_ms"] >= summary["import_ms"]
+        assert summary["deferred"] == {name: False for name in DEFERRED_MODULES}
+
+
+class TestImportProfiler:
+    def test_records_self_and_cumulative_time(self, tmp_path, monkeypatch):
+        (tmp_path / "cold_pkg").mkdir()
+        (tmp_path / "cold_pkg" / "__init__.py").write_text(
+            "import time\ntime.sleep(0.01)\nfrom cold_pkg import child\n"
+        )
+        (tmp_path / "cold_pkg" / "child.py").write_text(
+            "import time\ntime.sleep(0.02)\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        try:
+            with ImportProfiler() as profiler:
+                import cold_pkg  # noqa: F401
+        finally:
+            sys.modules.pop("cold_pkg", None)
+            sys.modules.pop("cold_pkg.child", None)
+
+        records = {r.module: r for r in profiler.records}
+        parent, child = records["cold_pkg"], records["cold_pkg.child"]
+        assert child.depth == parent.depth + 1
+        assert child.self_us >= 20_000
+        assert 10_000 <= parent.self_us < parent.cumulative_us
+        assert parent.cumulative_us >= parent.self_us + child.cumulative_us
+        assert profiler.by_package()["cold_pkg"] >= 30_000
+        assert "cold_pkg" in profiler.report()["slowest_modules_ms"]
+        assert profiler.format_importtime().splitlines()[-1].endswith("cold_pkg")
+        assert not profiler.installed
+
+    def test_loader_is_restored_on_module(self, tmp_path, monkeypatch):
+        (tmp_path / "cold_leaf.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        try:
+            with ImportProfiler():
+                import cold_leaf
+        finally:
+            sys.modules.pop("cold_leaf", None)
+
+        assert cold_leaf.VALUE == 1
+        assert type(cold_leaf.__loader__).__name__ == "SourceFileLoader"
+        assert cold_leaf.__spec__.loader is cold_leaf.__loader__
@@ -0,0 +1,95 @@
+"""Benchmarks for content filtering
+
+Compares the compiled single-pass lexicon in ContentFilter against the
+previous implementation (one re.search per pattern, plus a separate findall to
+count strong profanity) on typical turn input, long input and adversarial
+input: near misses that make every pattern backtrack, and dense profanity
+where every word is a hit. Turn input is capped at 1000 characters; the
+longer texts show how both approaches scale. Timings are printed for reference
+only; the tests check that both give the same result.
+"""
+
+import re
+import time
+
+import pytest
+
+from app.services.content_filter import ContentFilter, ContentLexicon
+
+TURN = "Let's open a bakery on the moon and hire the astronauts as bakers!"
+SCENE = (
+    "We're colleagues at a lighthouse, and honestly the storm is the least of "
+    "our problems because the keeper keeps hiding the good biscuits. "
+)
+
+INPUTS = {
+    "turn": TURN,
+    "turn-1000": (SCENE * 8)[:1000],
+    "long": SCENE * 70,
+    # Runs of repeated letters: every ``f+u+c+k+`` style pattern backtracks
+    "adversarial-repeats": ("f" * 500 + "u" * 500 + " ") * 10,
+    # Every word starts several patterns that fail late
+    "adversarial-near-miss": "kill you are you go i hate sex with " * 28,
+    # Every word is a hit
+    "adversarial-dense": "damn crap hell piss you suck go die " * 28,
+}
+
+
+def legacy_filter(user_input):
+    """The per-pattern implementation the compiled lexicon replaced."""
+    input_lower = user_input.lower()
+
+    def check(patterns):
+        return [p for p in patterns if re.search(p, input_lower, re.IGNORECASE)]
+
+    severe = check(ContentFilter.SEVERE_PATTERNS)
+    if severe:
+        return [f"severe:{m}" for m in severe], "severe"
+    violations, severity = [], "none"
+    profanity = check(ContentFilter.PROFANITY_PATTERNS)
+    if profanity:
+        violations += [f"profanity:{m}" for m in profanity]
+        count = len(
+            re.findall(
+                r"\b(?:f+u+c+k+|s+h+i+t+|bullshit|c+u+n+t+|a+s+s+h+o+l+e+|b+i+t+c+h+)",
+                input_lower,
+            )
+        )
+        severity = "high" if count > 2 else "medium"
+    toxic = check(ContentFilter.TOXIC_PATTERNS)
+    if toxic:
+        violations += [f"toxic:{m}" for m in toxic]
+        if severity == "none":
+            severity = "medium"
+    return violations, severity
+
+
+def per_call_us(fn, text, budget=0.2):
+    iterations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < budget:
+        fn(text)
+        iterations += 1
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+@pytest.mark.parametrize("name", list(INPUTS))
+def test_compiled_vs_per_pattern(name):
+    text = INPUTS[name]
+    content_filter = ContentFilter()
+
+    result = content_filter.filter_input(text)
+    assert (result.violations, result.severity) == legacy_filter(text)
+
+    legacy = per_call_us(legacy_filter, text)
+    compiled = per_call_us(content_filter.filter_input, text)
+    print(
+        f"\n{name} ({len(text)} chars): per-pattern={legacy:.1f}us "
+        f"compiled={compiled:.1f}us ({legacy / compiled:.1f}x)"
+    )
+
+
+def test_lexicon_build_cost():
+    # A hot reload compiles the new lexicon like this before swapping it in
+    build = per_call_us(lambda _: ContentLexicon.builtin(), None)
+    print(f"\nlexicon build={build / 1000:.2f}ms")
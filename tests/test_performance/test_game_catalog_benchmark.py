@@ -0,0 +1,105 @@
+"""Microbenchmarks for the indexed game catalog
+
+Compares catalog lookups against the linear scans they replaced, on a catalog
+an order of magnitude larger than the seeded game list. Results are checked
+against the scans; timings are only reported (run with -s to see them).
+"""
+
+import random
+import time
+
+import pytest
+
+from app.services.game_catalog import GameCatalog
+
+ENERGY = ["high", "medium", "low", "variable"]
+DIFFICULTY = ["beginner", "intermediate", "advanced"]
+
+
+def make_games(count: int):
+    rng = random.Random(7)
+    return [
+        {
+            "id": f"game_{i}",
+            "name": f"Game Number {i} {rng.choice(['Tag', 'Story', 'Scene', 'Swap'])}",
+            "energy_level": rng.choice(ENERGY),
+            "difficulty": rng.choice(DIFFICULTY),
+            "player_count": {"min": rng.randint(1, 3), "max": rng.randint(3, 8)},
+            "duration_minutes": rng.randint(3, 20),
+        }
+        for i in range(count)
+    ]
+
+
+def linear_search(games, energy_level, difficulty, player_count, max_duration):
+    results = []
+    for game in games:
+        if game.get("energy_level") != energy_level:
+            continue
+        if game.get("difficulty") != difficulty:
+            continue
+        pc = game["player_count"]
+        if not (pc["min"] <= player_count <= pc["max"]):
+            continue
+        if game["duration_minutes"] > max_duration:
+            continue
+        results.append(game)
+    return results
+
+
+def linear_detect(response, games):
+    response_lower = response.lower()
+    for game in games:
+        if game["name"].lower() in response_lower:
+            return game
+    return None
+
+
+def per_call_us(fn, iterations=2000):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+class TestGameCatalogBenchmark:
+    @pytest.fixture(scope="class")
+    def games(self):
+        return make_games(500)
+
+    @pytest.fixture(scope="class")
+    def catalog(self, games):
+        return GameCatalog(games)
+
+    def test_get_by_id(self, games, catalog):
+        assert catalog.get("game_450") == games[450]
+
+        linear = per_call_us(lambda: next(g for g in games if g["id"] == "game_450"))
+        indexed = per_call_us(lambda: catalog.get("game_450"))
+        print(f"\nget_by_id: linear={linear:.2f}us catalog={indexed:.2f}us")
+
+    def test_search(self, games, catalog):
+        args = ("high", "beginner", 2, 10)
+        filters = dict(energy_level="high", difficulty="beginner", player_count=2, max_duration=10)
+        assert [g["id"] for g in catalog.search(**filters)] == [g["id"] for g in linear_search(games, *args)]
+
+        linear = per_call_us(lambda: linear_search(games, *args), iterations=500)
+        indexed = per_call_us(lambda: catalog.search(**filters), iterations=500)
+        print(f"\nsearch: linear={linear:.2f}us catalog={indexed:.2f}us")
+
+    def test_detect_mentioned(self, games, catalog):
+        response = (
+            "You're feeling adventurous? Perfect! Let's warm up the crowd and "
+            f"then jump into {games[480]['name']} - it's high energy and great "
+            "for beginners. Audience, give me a location!"
+        )
+        expected = linear_detect(response, games)
+        assert catalog.detect_mentioned(response)["id"] == expected["id"]
+
+        linear = per_call_us(lambda: linear_detect(response, games), iterations=500)
+        indexed = per_call_us(lambda: catalog.detect_mentioned(response), iterations=500)
+        print(f"\ndetect: linear={linear:.2f}us catalog={indexed:.2f}us")
+
+    def test_build_cost(self, games):
+        build = per_call_us(lambda: GameCatalog(games), iterations=20)
+        print(f"\nbuild (500 games): {build / 1000:.2f}ms")
@@ -0,0 +1,88 @@
+"""Benchmarks for sentiment keyword matching
+
+Compares KeywordMatcher against the original per-category substring scans at
+the seeded lexicon size and at larger lexicon sizes, for typical Room agent
+inputs (a short comment and a paragraph of observations). Timings are printed
+for reference only; the tests check that both give the same counts.
+"""
+
+import random
+import time
+
+import pytest
+
+from app.services.keyword_matcher import KeywordMatcher
+from scripts.seed_firestore_tool_data import SENTIMENT_KEYWORDS_DATA
+
+SEED_LEXICON = {
+    "positive": SENTIMENT_KEYWORDS_DATA["positive_keywords"]["keywords"],
+    "negative": SENTIMENT_KEYWORDS_DATA["negative_keywords"]["keywords"],
+}
+
+SHORT_TEXT = "This is amazing, I love it! So much fun."
+LONG_TEXT = (
+    "The audience was laughing and clapping through the opening, a few people "
+    "were on their phones and one guy yawned, but overall there was great "
+    "energy and lots of cheering from the back rows. The middle section felt "
+    "a little slow and confusing for some, then the callback was brilliant "
+    "and the room loved the ending."
+)
+
+# Sentiment-ish vocabulary used to grow the lexicon to realistic sizes
+_STEMS = [
+    "laugh", "cheer", "smil", "grin", "gasp", "groan", "sigh", "clap", "whoop",
+    "boo", "hiss", "yawn", "snor", "giggl", "chuckl", "roar", "applaud", "delight",
+    "thrill", "bor", "annoy", "frustrat", "confus", "excit", "amaz", "surpris",
+    "shock", "disappoint", "impress", "entertain", "engag", "distract", "energ",
+    "tir", "restless", "focus", "curious", "nervous", "awkward", "warm",
+]
+_SUFFIXES = ["", "s", "ed", "ing", "er", "ful", "y", "ly", "ment", "able", "ous", "ness"]
+
+
+def make_lexicon(size: int):
+    rng = random.Random(size)
+    words = list(dict.fromkeys(SEED_LEXICON["positive"] + SEED_LEXICON["negative"]))
+    candidates = [stem + suffix for stem in _STEMS for suffix in _SUFFIXES]
+    rng.shuffle(candidates)
+    while len(words) < size:
+        word = candidates.pop() if candidates else "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9))
+        )
+        if word not in words:
+            words.append(word)
+    half = size // 2
+    return {"positive": words[:half], "negative": words[half:size]}
+
+
+def scan_counts(lexicon, text):
+    text_lower = text.lower()
+    return {
+        category: sum(1 for keyword in keywords if keyword in text_lower)
+        for category, keywords in lexicon.items()
+    }
+
+
+def per_call_us(fn, iterations=1000):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+@pytest.mark.parametrize("size", [36, 100, 200, 500, 2000])
+@pytest.mark.parametrize("text", [SHORT_TEXT, LONG_TEXT], ids=["short", "long"])
+def test_matcher_vs_scan(size, text):
+    lexicon = make_lexicon(size)
+    matcher = KeywordMatcher(lexicon)
+
+    assert matcher.count(text) == scan_counts(lexicon, text)
+
+    scan = per_call_us(lambda: scan_counts(lexicon, text))
+    matched = per_call_us(lambda: matcher.count(text))
+    print(f"\nlexicon={size} text={len(text)}: scan={scan:.1f}us matcher={matched:.1f}us")
+
+
+def test_build_cost():
+    lexicon = make_lexicon(2000)
+    build = per_call_us(lambda: KeywordMatcher(lexicon), iterations=5)
+    print(f"\nbuild (2000 keywords): {build / 1000:.1f}ms")
@@ -0,0 +1,130 @@
+"""Microbenchmark for mood extraction
+
+Per-call cost of the shared MoodLexicon against the phrase scans it replaced,
+on representative Room agent analyses and MC transcription chunks.
+"""
+
+import time
+
+import pytest
+
+from app.services.mood_lexicon import MC_TRANSCRIPTION_LEXICON, ROOM_ANALYSIS_LEXICON
+
+ROOM_ANALYSES = [
+    "The audience is laughing and leaning forward, clearly enjoying the absurd premise.",
+    "Energy dipped a little - a few people are checking their phones, but most are still watching.",
+    "The crowd is thrilled! Uproarious laughter erupting after that callback.",
+    "Audience seems confused by the time jump, attentive but quiet.",
+    "Neutral room, polite applause.",
+]
+
+MC_TRANSCRIPTS = [
+    "Okay okay, I can feel the room warming up! Now, let's set the scene: you're in "
+    "a coffee shop and your partner just walked in with a mysterious package.",
+    "Oh the crowd is dying over here! That's hilarious!",
+    "Welcome back everybody, tonight's game is Questions Only.",
+    "And the room goes quiet... everyone holding their breath for this one.",
+    "Give it up for our player, the crowd goes wild!",
+]
+
+
+def legacy_room_scan(analysis_lower):
+    """Scans from TurnOrchestrator._extract_mood_metrics before MoodLexicon."""
+    laughter = any(
+        k in analysis_lower
+        for k in ["laugh", "laughing", "hilarious", "cracking up", "roar",
+                  "hysterical", "chuckle", "giggle", "guffaw"]
+    )
+    engagement = 0.5
+    for keywords, score in [
+        (["disengaged", "checking their phones", "not paying attention"], 0.1),
+        (["bored", "distracted", "low energy", "low engagement"], 0.2),
+        (["moderate", "watching"], 0.5),
+        (["highly engaged", "leaning forward", "on the edge"], 0.9),
+        (["engaged", "attentive", "following", "interested"], 0.7),
+    ]:
+        if any(k in analysis_lower for k in keywords):
+            engagement = score
+            break
+    sentiment = 0.0
+    positive_high = ["loving", "enthusiastic", "excited", "thrilled", "ecstatic",
+                     "uproarious", "wild", "erupting", "explosive"]
+    positive_mid = ["positive", "enjoying", "happy", "pleased", "delighted", "jovial",
+                    "lighthearted", "playful", "amused", "fun", "warmth", "warm",
+                    "cheerful", "joyful", "gleeful"]
+    negative_high = ["hostile", "angry", "furious", "heckling"]
+    negative_mid = ["negative", "bored", "disengaged", "disappointed", "frustrated",
+                    "confused", "lost"]
+    if any(w in analysis_lower for w in positive_high):
+        sentiment = 0.8
+    elif any(w in analysis_lower for w in positive_mid):
+        sentiment = 0.5
+    elif any(w in analysis_lower for w in negative_high):
+        sentiment = -0.8
+    elif any(w in analysis_lower for w in negative_mid):
+        sentiment = -0.5
+    return sentiment, engagement, laughter
+
+
+def legacy_mc_scan(text_lower):
+    """Scans from AudioStreamOrchestrator._extract_mood_from_mc_transcription."""
+    laughter = any(p in text_lower for p in [
+        "cracking up", "big laugh", "laughter", "laughing", "that's hilarious",
+        "crowd is dying", "rolling"])
+    excitement = any(p in text_lower for p in [
+        "crowd goes wild", "standing ovation", "cheering", "crowd is loving",
+        "energy building", "on the edge of their seats", "rooting for you",
+        "they're cheering", "amazing"])
+    engagement = any(p in text_lower for p in [
+        "audience is", "crowd is", "the room", "everyone's", "nodding heads",
+        "i can feel", "i hear", "i see"])
+    tension = any(p in text_lower for p in [
+        "goes quiet", "holding their breath", "anticipation", "tension", "suspense"])
+    return laughter, excitement, engagement, tension
+
+
+def per_call_us(fn, iterations=2000):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+@pytest.mark.parametrize("analysis", ROOM_ANALYSES)
+def test_room_analysis_matches_legacy(analysis):
+    reading = ROOM_ANALYSIS_LEXICON.analyze(analysis)
+    assert (
+        reading.sentiment_score,
+        reading.engagement_score,
+        reading.laughter_detected,
+    ) == legacy_room_scan(analysis.lower())
+
+
+@pytest.mark.parametrize("transcript", MC_TRANSCRIPTS)
+def test_mc_transcript_matches_legacy(transcript):
+    found = MC_TRANSCRIPTION_LEXICON.categories_in(transcript)
+    assert tuple(
+        c in found for c in ("laughter", "excitement", "engagement", "tension")
+    ) == legacy_mc_scan(transcript.lower())
+
+
+@pytest.mark.parametrize(
+    "lexicon,texts,legacy",
+    [
+        (ROOM_ANALYSIS_LEXICON, ROOM_ANALYSES, legacy_room_scan),
+        (MC_TRANSCRIPTION_LEXICON, MC_TRANSCRIPTS, legacy_mc_scan),
+    ],
+    ids=["room_analysis", "mc_transcription"],
+)
+def test_per_call_cost(lexicon, texts, legacy):
+    def run_legacy():
+        for text in texts:
+            legacy(text.lower())
+
+    def run_lexicon():
+        for text in texts:
+            lexicon.analyze(text)
+
+    legacy_us = per_call_us(run_legacy) / len(texts)
+    lexicon_us = per_call_us(run_lexicon) / len(texts)
+    print(f"\nper call: legacy={legacy_us:.2f}us lexicon={lexicon_us:.2f}us")
@@ -0,0 +1,89 @@
+"""Microbenchmarks for the principle full-text index
+
+Compares ranked index search against the per-call substring scan it replaced,
+using the seeded principles corpus replicated to a larger size. Results are
+checked against the scan; timings are only reported (run with -s to see them).
+"""
+
+import copy
+import time
+
+import pytest
+
+from app.services.principle_index import PrincipleIndex
+from scripts.seed_firestore_tool_data import PRINCIPLES_DATA
+
+QUERIES = ["listen", "yes and", "character", "status", "heighten the game", "partner"]
+
+
+def make_principles(copies: int):
+    principles = []
+    for i in range(copies):
+        for principle in PRINCIPLES_DATA:
+            clone = copy.deepcopy(principle)
+            clone["id"] = f"{principle['id']}_{i}"
+            principles.append(clone)
+    return principles
+
+
+def substring_scan(principles, keyword):
+    keyword_lower = keyword.lower()
+    results = []
+    for principle in principles:
+        text = " ".join(
+            [
+                str(principle.get("name", "")),
+                str(principle.get("description", "")),
+                " ".join(principle.get("examples", [])),
+                " ".join(principle.get("coaching_tips", [])),
+            ]
+        ).lower()
+        if keyword_lower in text:
+            results.append(principle)
+    return results
+
+
+def per_call_us(fn, iterations=500):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+class TestPrincipleIndexBenchmark:
+    @pytest.fixture(scope="class")
+    def principles(self):
+        return make_principles(20)
+
+    @pytest.fixture(scope="class")
+    def index(self, principles):
+        return PrincipleIndex(principles)
+
+    def test_search_finds_every_scan_match(self, principles, index):
+        for query in QUERIES:
+            scanned = {p["id"] for p in substring_scan(principles, query)}
+            assert scanned <= {p["id"] for p in index.search(query)}, query
+
+    def test_search_vs_scan(self, principles, index):
+        def scan_all():
+            for query in QUERIES:
+                substring_scan(principles, query)
+
+        def search_all():
+            for query in QUERIES:
+                index.search(query)
+
+        scan = per_call_us(scan_all, iterations=50) / len(QUERIES)
+        indexed = per_call_us(search_all, iterations=50) / len(QUERIES)
+        print(f"\nsearch ({len(principles)} principles): scan={scan:.1f}us index={indexed:.1f}us")
+
+    def test_seeded_corpus_search(self):
+        index = PrincipleIndex(PRINCIPLES_DATA)
+        for query in QUERIES:
+            assert index.search(query) == index.search(query.upper())
+            search = per_call_us(lambda: index.search(query))
+            print(f"\nseeded search {query!r}: {search:.1f}us")
+
+    def test_build_cost(self, principles):
+        build = per_call_us(lambda: PrincipleIndex(principles), iterations=5)
+        print(f"\nbuild ({len(principles)} principles): {build / 1000:.2f}ms")
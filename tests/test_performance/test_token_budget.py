@@ -0,0 +1,158 @@
+"""Token counters, cached per-turn counts and the tokens-saved report"""
+
+import pytest
+
+from datetime import datetime, timezone
+
+from app.models.session import Session, SessionStatus
+from app.services.context_manager import ContextManager
+from app.services.performance_tuning import ContextCompactor
+from app.utils import token_counter
+from app.utils.token_counter import (
+    CalibratedTokenCounter,
+    HeuristicTokenCounter,
+    TokenCounter,
+    create_token_counter,
+)
+
+
+class CountingCounter(TokenCounter):
+    """Calibrated counter that records how much text it tokenized."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.inner = CalibratedTokenCounter()
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return self.inner.count(text)
+
+
+def make_turn(number, words=20):
+    return {
+        "turn_number": number,
+        "user_input": f"line {number} " + "scene " * words,
+        "partner_response": f"reply {number} " + "yes and " * words,
+    }
+
+
+def make_session(turns):
+    return Session(
+        session_id="budget-session",
+        user_id="user",
+        user_email="user@example.com",
+        location="Stage",
+        status=SessionStatus.ACTIVE,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc),
+        conversation_history=[make_turn(n) for n in range(1, turns + 1)],
+    )
+
+
+class TestTokenCounters:
+    def test_calibrated_counts_words_digits_and_punctuation(self):
+        counter = CalibratedTokenCounter()
+
+        assert counter.count("Yes, and the 42 llamas!") == 8
+        assert counter.count("extraordinarily") == 4
+        assert counter.count("   \n") == 0
+
+    def test_heuristic_matches_old_estimate(self):
+        assert HeuristicTokenCounter().count("A" * 1000) == 250
+
+    def test_create_token_counter(self):
+        assert create_token_counter("calibrated").name == "calibrated"
+        assert create_token_counter("heuristic").name == "heuristic"
+        with pytest.raises(ValueError):
+            create_token_counter("sentencepiece")
+        with pytest.raises(ValueError):
+            create_token_counter("unknown")
+
+    def test_cached_turn_count_is_reused(self):
+        counter = CountingCounter()
+        turn = make_turn(1)
+        turn[token_counter.TURN_TOKENS_KEY] = 7
+        turn[token_counter.TURN_COUNTER_KEY] = "counting"
+
+        assert token_counter.count_turn_tokens(counter, turn) == 7
+        assert counter.calls == 0
+
+        turn[token_counter.TURN_COUNTER_KEY] = "heuristic"
+        assert token_counter.count_turn_tokens(counter, turn) != 7
+
+
+class TestContextBudget:
+    def test_record_turn_caches_count_on_turn(self):
+        manager = ContextManager(counter=CountingCounter())
+        turn = make_turn(1)
+
+        manager.record_turn(make_session(0), turn)
+
+        assert turn[token_counter.TURN_COUNTER_KEY] == "counting"
+        assert turn[token_counter.TURN_TOKENS_KEY] == manager.counter.inner.count(
+            token_counter.turn_text(turn)
+        )
+
+    def test_context_is_trimmed_exactly_to_budget(self):
+        counter = CalibratedTokenCounter()
+        for max_tokens in (60, 120, 200, 400):
+            manager = ContextManager(max_tokens=max_tokens, counter=counter)
+            context = manager.build_optimized_context(
+                make_session(12), "next", turn_number=13
+            )
+
+            assert counter.count(context) <= max_tokens
+            assert manager.get_token_report()["last_turn"]["prompt_tokens"] == (
+                counter.count(context)
+            )
+
+    def test_history_is_not_retokenized_per_turn(self):
+        counter = CountingCounter()
+        manager = ContextManager(counter=counter)
+        session = make_session(0)
+        for number in range(1, 31):
+            manager.build_optimized_context(session, "x", turn_number=number)
+            turn = make_turn(number)
+            manager.record_turn(session, turn)
+            session.conversation_history.append(turn)
+
+        # One count per turn plus a constant number of header parts per build
+        assert counter.calls < 30 * 6
+
+    def test_tokens_saved_report(self):
+        manager = ContextManager(counter=CalibratedTokenCounter())
+        session = make_session(20)
+
+        manager.build_optimized_context(session, "next", turn_number=21)
+        manager.build_optimized_context(session, "next", turn_number=21)
+        report = manager.get_token_report()
+
+        assert report["token_counter"] == "calibrated"
+        assert report["contexts_built"] == 2
+        assert report["last_turn"]["tokens_saved"] > 0
+        assert report["tokens_saved"] == 2 * report["last_turn"]["tokens_saved"]
+        assert report["avg_tokens_saved_per_turn"] == (
+            report["last_turn"]["tokens_saved"]
+        )
+
+        print(f"\ntoken report: {report}")
+
+
+class TestCompactorBudget:
+    def test_compacts_to_budget_with_first_turn(self):
+        counter = CalibratedTokenCounter()
+        history = [make_turn(n) for n in range(1, 21)]
+        compactor = ContextCompactor(max_tokens=500, counter=counter)
+
+        result = compactor.compact_history(history)
+
+        total = sum(token_counter.count_turn_tokens(counter, t) for t in result)
+        assert result[0]["turn_number"] == 1
+        assert result[-1]["turn_number"] == 20
+        assert total <= 500
+        # The next older turn would not have fitted
+        dropped = history[len(history) - len(result)]
+        assert total + token_counter.count_turn_tokens(counter, dropped) > 500
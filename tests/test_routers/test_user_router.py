@@ -8,6 +8,8 @@ Test Cases:
 - TC-ROUTER-03: GET /api/v1/user/me returns 403 for user not in Firestore
 - TC-ROUTER-04: User profile response includes tier information
 - TC-ROUTER-05: User profile response includes audio usage
+- TC-ROUTER-06: GET /api/v1/user/admin/users returns a page for admins
+- TC-ROUTER-07: GET /api/v1/user/admin/users returns 403 for non-admins
 """
 
 import pytest
@@ -166,6 +168,72 @@ class TestGetCurrentUser:
         assert isinstance(result.audio_usage_limit, int)
 
 
+class TestAdminListUsers:
+    """Tests for GET /api/v1/user/admin/users endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_tc_router_06_admin_gets_page(self, sample_user_profile):
+        """TC-ROUTER-06: Admins receive a page of users and the next cursor."""
+        from app.routers.user import list_users_admin
+        from app.services.user_service import UserPage
+        from fastapi import Request
+
+        mock_request = MagicMock(spec=Request)
+        mock_request.state.user_email = "admin@example.com"
+
+        page = UserPage(users=[sample_user_profile], next_cursor="abc")
+        with patch("app.routers.user.settings") as mock_settings, patch(
+            "app.routers.user.list_users_page", AsyncMock(return_value=page)
+        ) as mock_list:
+            mock_settings.admin_emails_list = ["admin@example.com"]
+
+            result = await list_users_admin(
+                mock_request, page_size=50, cursor=None, tier=None
+            )
+
+        mock_list.assert_awaited_once_with(tier=None, page_size=50, cursor=None)
+        assert result.next_cursor == "abc"
+        assert result.users[0].email == "test@example.com"
+
+    @pytest.mark.asyncio
+    async def test_tc_router_07_non_admin_forbidden(self):
+        """TC-ROUTER-07: Non-admins get 403."""
+        from app.routers.user import list_users_admin
+        from fastapi import Request, HTTPException
+
+        mock_request = MagicMock(spec=Request)
+        mock_request.state.user_email = "test@example.com"
+
+        with patch("app.routers.user.settings") as mock_settings:
+            mock_settings.admin_emails_list = ["admin@example.com"]
+
+            with pytest.raises(HTTPException) as exc_info:
+                await list_users_admin(
+                    mock_request, page_size=50, cursor=None, tier=None
+                )
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_admin_invalid_cursor_returns_400(self):
+        """Malformed cursors are rejected with 400."""
+        from app.routers.user import list_users_admin
+        from fastapi import Request, HTTPException
+
+        mock_request = MagicMock(spec=Request)
+        mock_request.state.user_email = "admin@example.com"
+
+        with patch("app.routers.user.settings") as mock_settings:
+            mock_settings.admin_emails_list = ["admin@example.com"]
+
+            with pytest.raises(HTTPException) as exc_info:
+                await list_users_admin(
+                    mock_request, page_size=50, cursor="bogus", tier=None
+                )
+
+        assert exc_info.value.status_code == 400
+
+
 class TestUserRouterIntegration:
     """Integration tests for user router."""
 
@@ -1,7 +1,15 @@
 """Tests for Content Filtering Service"""
 
+import json
+import os
+import re
+
 import pytest
-from app.services.content_filter import ContentFilter, get_content_filter
+from app.services.content_filter import (
+    ContentFilter,
+    ContentLexicon,
+    get_content_filter,
+)
 
 
 class TestContentFilter:
@@ -208,3 +216,72 @@ class TestContentFilterEdgeCases:
 
         assert not result.is_allowed
         assert result.severity in ["high", "severe"]
+
+
+class TestCompiledLexicon:
+    """Single-pass lexicon matching and hot reloading"""
+
+    def test_reports_every_matching_pattern_in_lexicon_order(self):
+        """Overlapping matches are all reported, each pattern once"""
+        filter_instance = ContentFilter()
+
+        result = filter_instance.filter_input("you suck, go die, I hate you suck")
+        assert result.violations == [
+            r"toxic:\bgo\s+die",
+            r"toxic:\bi\s+hate\s+you",
+            r"toxic:\byou\s+suck",
+        ]
+
+    def test_strong_profanity_counts_occurrences(self):
+        """More than two strong profanities make the input high severity"""
+        filter_instance = ContentFilter()
+
+        assert filter_instance.filter_input("shit, shit").severity == "medium"
+        assert filter_instance.filter_input("damn damn damn damn").severity == (
+            "medium"
+        )
+        assert filter_instance.filter_input("shit bitch shit").severity == "high"
+
+    def test_reload_lexicon_swaps_patterns(self):
+        """A reloaded lexicon is used for the next check"""
+        filter_instance = ContentFilter()
+        assert filter_instance.filter_input("you absolute muppet").violations == []
+
+        filter_instance.reload_lexicon(
+            ContentLexicon.from_dict({"toxic": [r"\bmuppet"]})
+        )
+
+        result = filter_instance.filter_input("you absolute muppet")
+        assert result.violations == [r"toxic:\bmuppet"]
+        # Categories absent from the update keep the built-in lists
+        assert filter_instance.is_toxic("Go kill yourself") is True
+        assert filter_instance.get_filter_stats()["lexicon_reloads"] == 1
+
+    def test_lexicon_file_is_hot_reloaded(self, tmp_path):
+        """A changed lexicon file is picked up; a broken one is ignored"""
+        path = tmp_path / "lexicon.json"
+        path.write_text(json.dumps({"toxic": [r"\bmuppet"]}))
+        filter_instance = ContentFilter(lexicon_path=str(path), reload_interval=0.01)
+        assert filter_instance.filter_input("muppet").violations
+
+        path.write_text(json.dumps({"toxic": [r"\bnincompoop"]}))
+        os.utime(path, (0, 1))
+        filter_instance._next_reload_check = 0
+        assert filter_instance.filter_input("muppet").violations == []
+        assert filter_instance.filter_input("nincompoop").violations
+
+        path.write_text(json.dumps({"toxic": ["(unbalanced"]}))
+        os.utime(path, (0, 2))
+        filter_instance._next_reload_check = 0
+        assert filter_instance.filter_input("nincompoop").violations
+
+        stats = filter_instance.get_filter_stats()
+        assert stats["lexicon_source"] == str(path)
+        assert stats["lexicon_reload_errors"] == 1
+
+    def test_invalid_lexicon_is_rejected(self):
+        """Unknown categories and uncompilable patterns fail the load"""
+        with pytest.raises(ValueError):
+            ContentLexicon.from_dict({"rude": [r"\bmuppet"]})
+        with pytest.raises(re.error):
+            ContentLexicon.from_dict({"toxic": ["(unbalanced"]})
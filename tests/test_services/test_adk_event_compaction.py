@@ -0,0 +1,370 @@
+"""Tests for ADK session event compaction"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions import InMemorySessionService
+from google.adk.sessions.database_session_service import StorageEvent
+from google.genai import types
+
+from app.services.adk_event_compaction import (
+    COMPACTION_STATE_KEY,
+    EventCompactionPolicy,
+    compact_session,
+    is_routing_event,
+    is_summary_event,
+    maybe_compact_session,
+    plan_compaction,
+    replace_session_events,
+    schedule_compaction,
+    wait_for_compaction,
+)
+from app.services.adk_firestore_session_service import FirestoreSessionService
+from app.services.adk_session_cache import CachedSessionService
+from app.utils.token_counter import CalibratedTokenCounter
+from scripts.adk_session_db_benchmark import create_service, sqlite_url
+from tests.fakes.firestore import FakeFirestoreClient, FakeWriteBatch
+
+APP = "Improv Olympics"
+USER = "user-1"
+
+
+def text_event(invocation_id, author, text, timestamp):
+    role = "user" if author == "user" else "model"
+    return Event(
+        invocation_id=invocation_id,
+        author=author,
+        content=types.Content(role=role, parts=[types.Part(text=text)]),
+        timestamp=timestamp,
+    )
+
+
+def transfer_event(invocation_id, timestamp, response=False):
+    if response:
+        part = types.Part(
+            function_response=types.FunctionResponse(
+                name="transfer_to_agent", response={"result": None}
+            )
+        )
+        author, role = "stage_manager", "user"
+    else:
+        part = types.Part(
+            function_call=types.FunctionCall(
+                name="transfer_to_agent", args={"agent_name": "partner_agent"}
+            )
+        )
+        author, role = "stage_manager", "model"
+    return Event(
+        invocation_id=invocation_id,
+        author=author,
+        content=types.Content(role=role, parts=[part]),
+        actions=EventActions(transfer_to_agent="partner_agent" if response else None),
+        timestamp=timestamp,
+    )
+
+
+def turn_events(number, start, words=10):
+    invocation = f"inv-{number}"
+    return [
+        text_event(invocation, "user", f"user turn {number}", start),
+        transfer_event(invocation, start + 0.1),
+        transfer_event(invocation, start + 0.2, response=True),
+        text_event(
+            invocation,
+            "partner_agent",
+            f"partner turn {number} " + "yes and " * words,
+            start + 0.3,
+        ),
+    ]
+
+
+def make_events(turns, words=10):
+    start = time.time() - 1000
+    return [
+        event
+        for number in range(1, turns + 1)
+        for event in turn_events(number, start + number, words)
+    ]
+
+
+async def seed_session(service, session_id, turns, words=10):
+    session = await service.create_session(
+        app_name=APP, user_id=USER, session_id=session_id, state={"turn_count": turns}
+    )
+    for event in make_events(turns, words):
+        await service.append_event(session, event)
+    return session
+
+
+class TestPlanCompaction:
+    def test_routing_events_are_detected(self):
+        events = turn_events(1, time.time())
+
+        assert [is_routing_event(e) for e in events] == [False, True, True, False]
+
+    def test_keeps_recent_turns_and_summarizes_older(self):
+        events = make_events(10)
+        policy = EventCompactionPolicy(max_turns=3, max_tokens=10_000)
+
+        compacted = plan_compaction(events, policy, CalibratedTokenCounter())
+
+        summary, rest = compacted[0], compacted[1:]
+        assert is_summary_event(summary)
+        assert summary.custom_metadata["turns_summarized"] == 7
+        assert "user: user turn 7 | partner_agent: partner turn 7" in (
+            summary.content.parts[0].text
+        )
+        assert {e.invocation_id for e in rest} == {"inv-8", "inv-9", "inv-10"}
+        assert not any(is_routing_event(e) for e in rest)
+        assert summary.timestamp < rest[0].timestamp
+
+    def test_token_cap_limits_kept_turns(self):
+        counter = CalibratedTokenCounter()
+        events = make_events(10, words=100)
+        policy = EventCompactionPolicy(max_turns=10, max_tokens=500)
+
+        compacted = plan_compaction(events, policy, counter)
+
+        kept = [e for e in compacted if not is_summary_event(e)]
+        kept_tokens = sum(counter.count(e.content.parts[0].text) for e in kept)
+        assert kept_tokens <= 500
+        assert kept[-1].invocation_id == "inv-10"
+
+    def test_latest_turn_is_kept_even_over_budget(self):
+        events = make_events(3, words=500)
+        policy = EventCompactionPolicy(max_turns=3, max_tokens=10)
+
+        compacted = plan_compaction(events, policy, CalibratedTokenCounter())
+
+        assert {e.invocation_id for e in compacted[1:]} == {"inv-3"}
+
+    def test_summary_is_folded_into_on_next_compaction(self):
+        policy = EventCompactionPolicy(max_turns=2, max_tokens=10_000)
+        counter = CalibratedTokenCounter()
+        first = plan_compaction(make_events(5), policy, counter)
+        later = make_events(8)[5 * 4 :]
+
+        second = plan_compaction(first + later, policy, counter)
+
+        assert second[0].custom_metadata["turns_summarized"] == 6
+        assert len(second[0].custom_metadata["lines"]) == 6
+        assert {e.invocation_id for e in second[1:]} == {"inv-7", "inv-8"}
+
+
+class TestCompactSession:
+    @pytest.mark.asyncio
+    async def test_rewrites_session_events_and_keeps_state(self):
+        service = InMemorySessionService()
+        await seed_session(service, "s1", turns=12)
+        policy = EventCompactionPolicy(max_turns=4, max_tokens=10_000)
+
+        result = await compact_session(service, APP, USER, "s1", policy)
+
+        session = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+        assert result.events_before == 48
+        assert result.events_after == len(session.events) == 1 + 4 * 2
+        assert result.routing_events_dropped == 24
+        assert result.tokens_after < result.tokens_before
+        assert session.state["turn_count"] == 12
+        assert session.state[COMPACTION_STATE_KEY] == {"turns_summarized": 8}
+
+    @pytest.mark.asyncio
+    async def test_session_stays_bounded_across_turns(self):
+        service = InMemorySessionService()
+        session = await seed_session(service, "s2", turns=1)
+        policy = EventCompactionPolicy(max_turns=4, trigger_events=20)
+        start = time.time()
+
+        sizes = []
+        for number in range(2, 40):
+            loaded = await service.get_session(
+                app_name=APP, user_id=USER, session_id="s2"
+            )
+            for event in turn_events(number, start + number):
+                await service.append_event(loaded, event)
+            await maybe_compact_session(service, loaded, policy=policy)
+            session = await service.get_session(
+                app_name=APP, user_id=USER, session_id="s2"
+            )
+            sizes.append(len(session.events))
+
+        assert max(sizes) < 20 + 4
+        assert session.events[-1].invocation_id == "inv-39"
+
+    @pytest.mark.asyncio
+    async def test_below_trigger_is_not_compacted(self):
+        service = InMemorySessionService()
+        session = await seed_session(service, "s3", turns=3)
+
+        result = await maybe_compact_session(
+            service, session, policy=EventCompactionPolicy(trigger_events=60)
+        )
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_missing_session(self):
+        result = await compact_session(InMemorySessionService(), APP, USER, "missing")
+
+        assert result is None
+
+
+@pytest.fixture(params=["memory", "database", "cached", "firestore"])
+async def backend(request, tmp_path):
+    if request.param == "memory":
+        yield InMemorySessionService()
+        return
+    if request.param == "firestore":
+        yield FirestoreSessionService(FakeFirestoreClient())
+        return
+    database = create_service(sqlite_url(tmp_path / "sessions.db"))
+    yield CachedSessionService(database) if request.param == "cached" else database
+    result = database.db_engine.dispose()
+    if hasattr(result, "__await__"):
+        await result
+
+
+async def load(service, session_id):
+    return await service.get_session(app_name=APP, user_id=USER, session_id=session_id)
+
+
+class TestAtomicCompaction:
+    @pytest.mark.asyncio
+    async def test_compacts_on_every_backend(self, backend):
+        turn_loaded = await seed_session(backend, "s1", turns=12)
+        policy = EventCompactionPolicy(max_turns=4, max_tokens=10_000)
+
+        result = await compact_session(backend, APP, USER, "s1", policy)
+
+        session = await load(backend, "s1")
+        assert result.events_after == len(session.events) == 1 + 4 * 2
+        assert is_summary_event(session.events[0])
+        assert session.state["turn_count"] == 12
+        assert session.state[COMPACTION_STATE_KEY] == {"turns_summarized": 8}
+
+        # A turn that loaded the session before compaction can still append
+        await backend.append_event(
+            turn_loaded, text_event("inv-13", "user", "user turn 13", time.time())
+        )
+        session = await load(backend, "s1")
+        assert len(session.events) == 1 + 4 * 2 + 1
+
+    @pytest.mark.asyncio
+    async def test_failure_midway_keeps_original_events(self, tmp_path):
+        service = create_service(sqlite_url(tmp_path / "sessions.db"))
+        await seed_session(service, "s1", turns=12)
+        before = [event.id for event in (await load(service, "s1")).events]
+
+        # Fails after the old events were deleted in the transaction
+        with patch.object(
+            StorageEvent, "from_event", side_effect=RuntimeError("disk full")
+        ):
+            with pytest.raises(RuntimeError):
+                await compact_session(
+                    service, APP, USER, "s1", EventCompactionPolicy(max_turns=4)
+                )
+
+        session = await load(service, "s1")
+        assert [event.id for event in session.events] == before
+        assert COMPACTION_STATE_KEY not in session.state
+
+    @pytest.mark.asyncio
+    async def test_failed_firestore_write_keeps_original_events(self):
+        client = FakeFirestoreClient()
+        service = FirestoreSessionService(client)
+        await seed_session(service, "s1", turns=12)
+
+        with patch.object(
+            FakeWriteBatch, "commit", side_effect=RuntimeError("unavailable")
+        ):
+            with pytest.raises(RuntimeError):
+                await compact_session(
+                    service, APP, USER, "s1", EventCompactionPolicy(max_turns=4)
+                )
+
+        assert len((await load(service, "s1")).events) == 48
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kind", ["memory", "firestore"])
+    async def test_concurrent_append_abandons_replacement(self, kind):
+        if kind == "memory":
+            service = InMemorySessionService()
+        else:
+            service = FirestoreSessionService(FakeFirestoreClient())
+        await seed_session(service, "s1", turns=12)
+        compacting = await load(service, "s1")
+        turn = await load(service, "s1")
+        await service.append_event(
+            turn, text_event("inv-13", "user", "user turn 13", time.time())
+        )
+
+        replaced = await replace_session_events(
+            service, compacting, compacting.events[-4:], compacting.state
+        )
+
+        assert replaced is False
+        assert len((await load(service, "s1")).events) == 49
+
+    @pytest.mark.asyncio
+    async def test_skipped_when_no_tokens_are_saved(self):
+        service = InMemorySessionService()
+        session = await service.create_session(
+            app_name=APP, user_id=USER, session_id="s1"
+        )
+        start = time.time() - 100
+        for number in range(10):
+            invocation = f"inv-{number}"
+            await service.append_event(
+                session, text_event(invocation, "user", "a", start + number)
+            )
+            await service.append_event(
+                session,
+                text_event(invocation, "partner_agent", "b", start + number + 0.5),
+            )
+
+        result = await compact_session(
+            service, APP, USER, "s1", EventCompactionPolicy(max_turns=1)
+        )
+
+        assert result is None
+        assert len((await load(service, "s1")).events) == 20
+
+
+class TestScheduleCompaction:
+    @pytest.mark.asyncio
+    async def test_runs_in_background_once_per_session(self):
+        service = InMemorySessionService()
+        await seed_session(service, "s1", turns=12)
+        loaded = await load(service, "s1")
+        policy = EventCompactionPolicy(max_turns=4, trigger_events=20)
+
+        task = schedule_compaction(service, loaded, policy=policy)
+        assert task is not None
+        assert schedule_compaction(service, loaded, policy=policy) is None
+        assert len((await load(service, "s1")).events) == 48
+
+        await wait_for_compaction("s1")
+
+        assert task.result().events_after == 9
+        assert len((await load(service, "s1")).events) == 9
+
+    @pytest.mark.asyncio
+    async def test_failure_is_logged_and_session_kept(self):
+        service = InMemorySessionService()
+        await seed_session(service, "s1", turns=12)
+        loaded = await load(service, "s1")
+        policy = EventCompactionPolicy(max_turns=4, trigger_events=20)
+
+        with patch(
+            "app.services.adk_event_compaction.replace_session_events",
+            side_effect=RuntimeError("unavailable"),
+        ), patch("app.services.adk_event_compaction.logger") as logger:
+            schedule_compaction(service, loaded, policy=policy)
+            await wait_for_compaction("s1")
+            await asyncio.sleep(0)
+
+        logger.error.assert_called_once()
+        assert len((await load(service, "s1")).events) == 48
@@ -0,0 +1,166 @@
+"""Tests for the Firestore-backed ADK session service"""
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+from app.services.adk_firestore_session_service import FirestoreSessionService
+from tests.fakes.firestore import FakeFirestoreClient
+
+APP = "Improv Olympics"
+USER = "user-1"
+
+
+def make_event(text, timestamp, state_delta=None):
+    return Event(
+        invocation_id="inv",
+        author="partner_agent",
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state_delta or {}),
+        timestamp=timestamp,
+    )
+
+
+@pytest.fixture
+def client():
+    return FakeFirestoreClient()
+
+
+@pytest.fixture
+def service(client):
+    return FirestoreSessionService(client)
+
+
+async def get(service, session_id="s1", config=None):
+    return await service.get_session(
+        app_name=APP, user_id=USER, session_id=session_id, config=config
+    )
+
+
+class TestFirestoreSessionService:
+    @pytest.mark.asyncio
+    async def test_events_and_state_round_trip(self, service):
+        session = await service.create_session(
+            app_name=APP, user_id=USER, session_id="s1", state={"phase": "PHASE_1"}
+        )
+        await service.append_event(session, make_event("hello", 100.0))
+        await service.append_event(
+            session, make_event("yes, and", 101.0, {"phase": "PHASE_2"})
+        )
+
+        loaded = await get(service)
+
+        assert [e.content.parts[0].text for e in loaded.events] == [
+            "hello",
+            "yes, and",
+        ]
+        assert [e.id for e in loaded.events] == [e.id for e in session.events]
+        assert loaded.state == {"phase": "PHASE_2"}
+        assert loaded.last_update_time == 101.0
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_shared_between_service_instances(self, client):
+        writer = FirestoreSessionService(client)
+        session = await writer.create_session(app_name=APP, user_id=USER)
+        await writer.append_event(session, make_event("scene", 100.0))
+
+        loaded = await FirestoreSessionService(client).get_session(
+            app_name=APP, user_id=USER, session_id=session.id
+        )
+
+        assert loaded.id == session.id
+        assert len(loaded.events) == 1
+
+    @pytest.mark.asyncio
+    async def test_appends_from_stale_copies_keep_each_others_state(self, client):
+        await FirestoreSessionService(client).create_session(
+            app_name=APP, user_id=USER, session_id="s1", state={"phase": "PHASE_1"}
+        )
+        first = await get(FirestoreSessionService(client))
+        second = await get(FirestoreSessionService(client))
+
+        await FirestoreSessionService(client).append_event(
+            first, make_event("one", 100.0, {"phase": "PHASE_2"})
+        )
+        await FirestoreSessionService(client).append_event(
+            second, make_event("two", 101.0, {"scene:mood": "tense"})
+        )
+
+        stored = client.documents("adk_sessions")["s1"]
+        assert stored["state"] == {"phase": "PHASE_2", "scene:mood": "tense"}
+        assert stored["event_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_app_and_user_state_are_shared_across_sessions(self, service):
+        first = await service.create_session(
+            app_name=APP, user_id=USER, session_id="s1", state={"app:theme": "noir"}
+        )
+        await service.append_event(
+            first, make_event("x", 100.0, {"user:level": 3, "temp:scratch": 1})
+        )
+
+        second = await service.create_session(
+            app_name=APP, user_id=USER, session_id="s2"
+        )
+
+        assert second.state == {"app:theme": "noir", "user:level": 3}
+        assert "temp:scratch" not in (await get(service)).state
+
+    @pytest.mark.asyncio
+    async def test_event_filters(self, service):
+        session = await service.create_session(
+            app_name=APP, user_id=USER, session_id="s1"
+        )
+        for n in range(5):
+            await service.append_event(session, make_event(f"e{n}", 100.0 + n))
+
+        recent = await get(service, config=GetSessionConfig(num_recent_events=2))
+        after = await get(service, config=GetSessionConfig(after_timestamp=103.0))
+
+        assert [e.content.parts[0].text for e in recent.events] == ["e3", "e4"]
+        assert [e.content.parts[0].text for e in after.events] == ["e3", "e4"]
+
+    @pytest.mark.asyncio
+    async def test_round_trips_per_operation(self, service, client):
+        session = await service.create_session(
+            app_name=APP, user_id=USER, session_id="s1"
+        )
+        for n in range(10):
+            await service.append_event(session, make_event(f"e{n}", 100.0 + n))
+
+        client.stats["round_trips"] = 0
+        await service.append_event(session, make_event("one more", 200.0))
+        assert client.stats["round_trips"] == 1
+
+        client.stats["round_trips"] = 0
+        await get(service)
+        assert client.stats["round_trips"] == 2
+
+    @pytest.mark.asyncio
+    async def test_list_and_delete(self, service, client):
+        for session_id in ("s1", "s2"):
+            session = await service.create_session(
+                app_name=APP, user_id=USER, session_id=session_id
+            )
+            await service.append_event(session, make_event("x", 100.0))
+
+        listed = await service.list_sessions(app_name=APP, user_id=USER)
+        assert sorted(s.id for s in listed.sessions) == ["s1", "s2"]
+
+        await service.delete_session(app_name=APP, user_id=USER, session_id="s1")
+
+        assert await get(service) is None
+        assert client.documents("adk_sessions/s1/events") == {}
+        assert await get(service, "s2") is not None
+
+    @pytest.mark.asyncio
+    async def test_other_users_cannot_read_a_session(self, service):
+        await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+
+        assert (
+            await service.get_session(
+                app_name=APP, user_id="someone-else", session_id="s1"
+            )
+            is None
+        )
@@ -0,0 +1,168 @@
+"""Tests for the in-memory LRU write-through ADK session cache"""
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions import InMemorySessionService
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+from app.services.adk_session_cache import CachedSessionService, event_size
+
+APP = "Improv Olympics"
+USER = "user-1"
+
+
+class CountingSessionService(InMemorySessionService):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    async def get_session(self, **kwargs):
+        self.loads += 1
+        return await super().get_session(**kwargs)
+
+
+def make_event(text, state_delta=None):
+    return Event(
+        invocation_id="inv",
+        author="partner_agent",
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        actions=EventActions(state_delta=state_delta or {}),
+    )
+
+
+@pytest.fixture
+def inner():
+    return CountingSessionService()
+
+
+@pytest.fixture
+def cache(inner):
+    return CachedSessionService(inner, max_entries=3)
+
+
+async def create(cache, session_id, events=0):
+    session = await cache.create_session(
+        app_name=APP, user_id=USER, session_id=session_id, state={"turn": 0}
+    )
+    for n in range(events):
+        await cache.append_event(session, make_event(f"line {n}"))
+    return session
+
+
+async def get(cache, session_id):
+    return await cache.get_session(app_name=APP, user_id=USER, session_id=session_id)
+
+
+class TestCachedSessionService:
+    @pytest.mark.asyncio
+    async def test_repeat_loads_skip_the_inner_service(self, cache, inner):
+        await create(cache, "s1", events=3)
+
+        first = await get(cache, "s1")
+        second = await get(cache, "s1")
+
+        assert inner.loads == 0
+        assert [e.content.parts[0].text for e in second.events] == [
+            "line 0",
+            "line 1",
+            "line 2",
+        ]
+        assert first is not second
+        assert cache.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_append_event_writes_through(self, cache, inner):
+        await create(cache, "s1")
+        session = await get(cache, "s1")
+
+        await cache.append_event(session, make_event("hello", {"turn": 1}))
+
+        cached = await get(cache, "s1")
+        stored = await inner.get_session(app_name=APP, user_id=USER, session_id="s1")
+        assert [e.id for e in cached.events] == [e.id for e in stored.events]
+        assert cached.state["turn"] == stored.state["turn"] == 1
+        assert cached.last_update_time == stored.last_update_time
+
+    @pytest.mark.asyncio
+    async def test_returned_copies_do_not_change_the_cache(self, cache):
+        await create(cache, "s1", events=1)
+
+        session = await get(cache, "s1")
+        session.events.clear()
+        session.state["turn"] = 99
+
+        cached = await get(cache, "s1")
+        assert len(cached.events) == 1
+        assert cached.state["turn"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entries(self, cache, inner):
+        for session_id in ("s1", "s2", "s3"):
+            await create(cache, session_id)
+        await get(cache, "s1")
+        await create(cache, "s4")
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["evictions"] == 1
+
+        await get(cache, "s2")
+        assert inner.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_accounting_and_byte_limit(self, inner):
+        cache = CachedSessionService(inner, max_entries=100, max_bytes=5000)
+        session = await create(cache, "s1")
+        event = make_event("x" * 1000)
+        await cache.append_event(session, event)
+
+        assert cache.get_stats()["bytes"] >= event_size(event)
+
+        for session_id in ("s2", "s3", "s4", "s5", "s6"):
+            await create(cache, session_id, events=1)
+            await cache.append_event(
+                await get(cache, session_id), make_event("y" * 1000)
+            )
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 5000
+        assert stats["evictions"] >= 1
+        assert stats["evicted_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts(self, cache, inner):
+        await create(cache, "s1")
+
+        await cache.delete_session(app_name=APP, user_id=USER, session_id="s1")
+
+        assert await get(cache, "s1") is None
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_filtered_loads_bypass_the_cache(self, cache, inner):
+        await create(cache, "s1", events=5)
+
+        session = await cache.get_session(
+            app_name=APP,
+            user_id=USER,
+            session_id="s1",
+            config=GetSessionConfig(num_recent_events=2),
+        )
+
+        assert len(session.events) == 2
+        assert inner.loads == 1
+        assert cache.get_stats()["bypassed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_append_evicts(self, cache, inner):
+        session = await create(cache, "s1")
+
+        async def fail(*args, **kwargs):
+            raise ValueError("stale session")
+
+        inner.append_event = fail
+        with pytest.raises(ValueError):
+            await cache.append_event(session, make_event("x"))
+
+        assert cache.get_stats()["entries"] == 0
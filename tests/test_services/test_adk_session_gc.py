@@ -0,0 +1,213 @@
+"""Tests for the stale ADK session garbage collector"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from google.adk.events import Event
+from google.genai import types
+from sqlalchemy import text
+
+from app.services import adk_session_gc
+from app.services.adk_session_cache import CachedSessionService
+from app.services.adk_session_db import SQLiteTuning
+from app.services.adk_session_gc import (
+    AdkSessionCollector,
+    FirestoreSessionState,
+    firestore_session_states,
+)
+from scripts.adk_session_db_benchmark import create_service, sqlite_url
+from tests.fakes.firestore import FakeFirestoreClient
+
+APP = "gc-test"
+USER = "user-1"
+
+
+def make_event(text_value):
+    return Event(
+        invocation_id="inv",
+        author="partner_agent",
+        content=types.Content(role="model", parts=[types.Part(text=text_value)]),
+    )
+
+
+class FakeLookup:
+    def __init__(self, states):
+        self.states = states
+        self.calls = []
+
+    async def __call__(self, session_ids):
+        self.calls.append(sorted(session_ids))
+        return {sid: self.states[sid] for sid in session_ids if sid in self.states}
+
+
+async def dispose(service):
+    result = service.db_engine.dispose()
+    if hasattr(result, "__await__"):
+        await result
+
+
+@pytest.fixture
+async def service(tmp_path):
+    service = create_service(sqlite_url(tmp_path / "sessions.db"), SQLiteTuning())
+    yield service
+    await dispose(service)
+
+
+async def add_session(service, session_id, events=1, size=100):
+    session = await service.create_session(
+        app_name=APP, user_id=USER, session_id=session_id, state={}
+    )
+    for _ in range(events):
+        await service.append_event(session, make_event("x" * size))
+    return session
+
+
+async def session_ids(service):
+    response = await service.list_sessions(app_name=APP, user_id=USER)
+    return sorted(s.id for s in response.sessions)
+
+
+def collector_for(service, states=None, **kwargs):
+    kwargs.setdefault("idle_minutes", 0)
+    return AdkSessionCollector(
+        service, lookup=FakeLookup(states or {}), app_name=APP, **kwargs
+    )
+
+
+class TestAdkSessionCollector:
+    @pytest.mark.asyncio
+    async def test_closed_sessions_are_deleted_without_lookup(self, service):
+        await add_session(service, "closed")
+        await add_session(service, "open")
+        collector = collector_for(service, idle_minutes=60)
+
+        collector.mark_closed("closed")
+        stats = await collector.sweep()
+
+        assert await session_ids(service) == ["open"]
+        assert collector.lookup.calls == []
+        assert stats["sessions_deleted"] == 1
+        assert stats["pending_closed"] == 0
+        assert stats["events_rows"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pinned_sessions_are_kept_until_unpinned(self, service):
+        await add_session(service, "closed")
+        collector = collector_for(service)
+        collector.mark_closed("closed")
+
+        collector.pin("closed")
+        await collector.sweep()
+        assert await session_ids(service) == ["closed"]
+        assert collector.get_stats()["pending_closed"] == 1
+
+        collector.unpin("closed")
+        await collector.sweep()
+        assert await session_ids(service) == []
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_deleted_when_finished_in_firestore(self, service):
+        for session_id in ("live", "closed", "timeout", "expired", "gone"):
+            await add_session(service, session_id)
+        past = datetime.now(timezone.utc) - timedelta(minutes=1)
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        collector = collector_for(
+            service,
+            {
+                "live": FirestoreSessionState("active", future),
+                "closed": FirestoreSessionState("closed", future),
+                "timeout": FirestoreSessionState("timeout", future),
+                "expired": FirestoreSessionState("active", past),
+            },
+        )
+
+        stats = await collector.sweep()
+
+        assert await session_ids(service) == ["live"]
+        assert stats["sessions_checked"] == 5
+        assert stats["sessions_deleted"] == 4
+        assert stats["sessions_rows"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recently_updated_sessions_are_not_checked(self, service):
+        await add_session(service, "recent")
+        collector = collector_for(service, idle_minutes=60)
+
+        stats = await collector.sweep()
+
+        assert collector.lookup.calls == []
+        assert stats["sessions_checked"] == 0
+        assert await session_ids(service) == ["recent"]
+
+    @pytest.mark.asyncio
+    async def test_deletes_go_through_the_session_cache(self, service):
+        cache = CachedSessionService(service)
+        await add_session(cache, "closed")
+        collector = collector_for(cache)
+
+        await collector.sweep()
+
+        assert cache.get_stats()["entries"] == 0
+        assert (
+            await cache.get_session(app_name=APP, user_id=USER, session_id="closed")
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_vacuum_keeps_the_database_file_flat(self, service):
+        collector = collector_for(service)
+
+        sizes = []
+        for round_number in range(3):
+            for n in range(10):
+                await add_session(service, f"r{round_number}-{n}", events=10, size=2000)
+            await collector.sweep()
+            sizes.append(collector.get_stats()["db_size_bytes"])
+
+        stats = collector.get_stats()
+        assert stats["sessions_rows"] == 0
+        assert stats["pages_vacuumed"] > 0
+        assert stats["free_bytes"] == 0
+        assert sizes[-1] <= sizes[0]
+
+    @pytest.mark.asyncio
+    async def test_existing_database_switched_to_incremental_vacuum(self, tmp_path):
+        service = create_service(
+            sqlite_url(tmp_path / "legacy.db"), SQLiteTuning(incremental_vacuum=False)
+        )
+        await add_session(service, "old", events=5, size=2000)
+        collector = collector_for(service)
+
+        await collector.sweep()
+
+        with_mode = collector.engine
+        if hasattr(with_mode, "sync_engine"):
+            with_mode = with_mode.sync_engine
+        with with_mode.connect() as conn:
+            assert conn.execute(text("PRAGMA auto_vacuum")).scalar() == 2
+        await dispose(service)
+
+
+@pytest.mark.asyncio
+async def test_firestore_lookup_uses_the_shared_async_client():
+    client = FakeFirestoreClient()
+    client.seed(
+        "sessions",
+        {
+            "open": {"status": "active", "expires_at": "2026-01-01T00:00:00Z"},
+            "done": {"status": "closed"},
+        },
+    )
+
+    with patch.object(adk_session_gc, "get_firestore_client", return_value=client):
+        states = await firestore_session_states(["open", "done", "gone"])
+
+    assert states == {
+        "open": FirestoreSessionState(
+            status="active",
+            expires_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        ),
+        "done": FirestoreSessionState(status="closed"),
+    }
+    assert client.stats["round_trips"] == 1
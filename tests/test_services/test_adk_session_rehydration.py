@@ -0,0 +1,110 @@
+"""Tests for ADK session rehydration from Firestore history"""
+
+from datetime import datetime, timezone
+
+import pytest
+from google.adk.sessions import InMemorySessionService
+
+from app.models.session import Session, SessionStatus
+from app.services.adk_event_compaction import is_summary_event
+from app.services.adk_session_rehydration import (
+    RehydrationCache,
+    build_plan,
+    plan_events,
+    rehydrate_adk_session,
+)
+from app.services.context_manager import SUMMARY_METADATA_KEY, get_context_manager
+
+
+def make_session(turns, session_id="sess_1"):
+    return Session(
+        session_id=session_id,
+        user_id="user",
+        user_email="user@example.com",
+        location="Stage",
+        status=SessionStatus.ACTIVE,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc),
+        conversation_history=[
+            {
+                "turn_number": n,
+                "user_input": f"user line {n}",
+                "partner_response": f"partner line {n}",
+                "phase": "Phase 1",
+            }
+            for n in range(1, turns + 1)
+        ],
+    )
+
+
+class TestRehydrationPlan:
+    def test_plan_uses_stored_rolling_summary(self):
+        session = make_session(200)
+        state = get_context_manager().summary_for(session).to_dict()
+        session.metadata[SUMMARY_METADATA_KEY] = state
+
+        plan = build_plan(session)
+
+        assert plan.total_turns == 200
+        assert plan.turns_summarized == 197
+        assert [turn[0] for turn in plan.recent] == [198, 199, 200]
+
+    def test_events_are_ordered_and_start_with_summary(self):
+        plan = build_plan(make_session(8))
+
+        events = plan_events(plan, "sess_1")
+
+        assert is_summary_event(events[0])
+        assert events[0].custom_metadata["turns_summarized"] == 5
+        assert [e.author for e in events[1:]] == ["user", "partner_agent"] * 3
+        timestamps = [e.timestamp for e in events]
+        assert timestamps == sorted(timestamps)
+
+    def test_short_history_has_no_summary(self):
+        events = plan_events(build_plan(make_session(2)), "sess_1")
+
+        assert not any(is_summary_event(e) for e in events)
+        assert len(events) == 4
+
+
+class TestRehydrationCache:
+    def test_lru_eviction_and_stats(self):
+        cache = RehydrationCache(max_entries=2)
+        for n in range(3):
+            cache.put(f"sess_{n}", build_plan(make_session(n + 1, f"sess_{n}")))
+
+        assert cache.get("sess_0", 1) is None
+        assert cache.get("sess_2", 3) is not None
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1
+        assert stats["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rehydrating_again_reuses_cached_plan(self):
+        cache = RehydrationCache()
+        session = make_session(30)
+
+        for service in (InMemorySessionService(), InMemorySessionService()):
+            adk_session = await rehydrate_adk_session(
+                service, session, state={}, cache=cache
+            )
+            assert len(adk_session.events) == 1 + 3 * 2
+
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["rehydrations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_history_creates_empty_session(self):
+        cache = RehydrationCache()
+
+        adk_session = await rehydrate_adk_session(
+            InMemorySessionService(), make_session(0), state={"a": 1}, cache=cache
+        )
+
+        assert adk_session.events == []
+        assert adk_session.state == {"a": 1}
+        assert cache.get_stats()["rehydrations"] == 0
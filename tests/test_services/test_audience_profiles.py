@@ -0,0 +1,65 @@
+"""Tests for audience archetype profiles and classifiers"""
+
+import pytest
+
+from app.services.audience_profiles import (
+    BEGINNER,
+    EXPERIENCED,
+    HIGH_ENGAGEMENT,
+    LOW_ENGAGEMENT,
+    MIXED,
+    build_archetype_profiles,
+    classify_engagement,
+    classify_experience,
+    classify_occupation,
+    dominant_demographic,
+    member_demographic,
+)
+from scripts.seed_firestore_tool_data import ARCHETYPES_DATA
+
+
+class TestClassifiers:
+    @pytest.mark.parametrize(
+        "occupation,expected",
+        [
+            ("Software Engineer", "tech"),
+            ("ER Nurse", "healthcare"),
+            ("College Professor", "education"),
+            ("Stage Actor", "arts"),
+            ("Investment Banker", "finance"),
+            ("Barista", MIXED),
+        ],
+    )
+    def test_classify_occupation(self, occupation, expected):
+        assert classify_occupation(occupation) == expected
+
+    def test_classify_engagement_and_experience(self):
+        assert classify_engagement("Vocal and expressive") == HIGH_ENGAGEMENT
+        assert classify_engagement("Quiet appreciation") == LOW_ENGAGEMENT
+        assert classify_engagement("Observant") is None
+        assert classify_experience("Extensive, has seen many shows") == EXPERIENCED
+        assert classify_experience("No prior experience") == BEGINNER
+        assert classify_experience("Varies") is None
+
+    def test_dominant_demographic_uses_priority_order(self):
+        assert dominant_demographic(["finance", "education", MIXED]) == "education"
+        assert dominant_demographic(["arts", "tech"]) == "tech"
+        assert dominant_demographic([]) == MIXED
+
+    def test_member_demographic_tolerates_missing_fields(self):
+        assert member_demographic({}) == MIXED
+        assert member_demographic({"demographics": None}) == MIXED
+        assert member_demographic({"demographics": {"occupation": "Nurse"}}) == "healthcare"
+
+
+class TestArchetypeProfiles:
+    def test_profiles_for_seed_archetypes(self):
+        profiles = build_archetype_profiles(ARCHETYPES_DATA)
+
+        assert [p.archetype_id for p in profiles] == [a["id"] for a in ARCHETYPES_DATA]
+        by_id = {p.archetype_id: p for p in profiles}
+        assert by_id["enthusiast"].engagement == HIGH_ENGAGEMENT
+        assert by_id["skeptic"].engagement == LOW_ENGAGEMENT
+        assert by_id["first_timer"].experience == BEGINNER
+        assert by_id["professional"].experience == EXPERIENCED
+        assert all(p.demographic == MIXED for p in profiles)
@@ -0,0 +1,89 @@
+"""Tests for the single-pass content filter pattern set"""
+
+import re
+
+import pytest
+
+from app.services import content_filter_engine
+from app.services.content_filter_engine import CompiledPatternSet
+
+
+def per_pattern_matches(categories, text):
+    """Reference: one re.search per pattern."""
+    return {
+        category: tuple(p for p in patterns if re.search(p, text, re.IGNORECASE))
+        for category, patterns in categories.items()
+        if any(re.search(p, text, re.IGNORECASE) for p in patterns)
+    }
+
+
+class TestCompiledPatternSet:
+    def test_patterns_at_the_same_position_are_all_found(self):
+        categories = {
+            "severe": [r"\bk+i+l+l+\s+yourself"],
+            "toxic": [r"\bkill\s+yourself", r"\bkill"],
+        }
+        matches = CompiledPatternSet(categories).scan("Kill yourself")
+
+        assert matches.patterns == {
+            "severe": (r"\bk+i+l+l+\s+yourself",),
+            "toxic": (r"\bkill\s+yourself", r"\bkill"),
+        }
+
+    def test_matches_inside_other_matches_are_found(self):
+        categories = {"toxic": [r"\bi\s+hate\s+you", r"\byou\s+suck"]}
+        matches = CompiledPatternSet(categories).scan("i hate you suck")
+
+        assert matches.patterns["toxic"] == tuple(categories["toxic"])
+
+    def test_counts_positions_per_category(self):
+        categories = {
+            "profanity": [r"\bd+a+m+n+", r"\bs+h+i+t+"],
+            "strong": [r"\bs+h+i+t+"],
+        }
+        matches = CompiledPatternSet(categories).scan("damn shit SHIIT damn")
+
+        assert matches.counts == {"profanity": 4, "strong": 2}
+        assert "strong" in matches
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            [r"\bfoo", r"bar\b", r"\d+x"],
+            [r"(?:ab|cd)+e", r"[^a]z", r"x?y"],
+            [r"\bfoo|baz", r"(q)(r)s", r"^start", r"end$"],
+        ],
+        ids=["mixed-anchors", "unguarded", "groups-and-anchors"],
+    )
+    def test_agrees_with_per_pattern_search(self, patterns):
+        categories = {"a": patterns[:2], "b": patterns[1:]}
+        pattern_set = CompiledPatternSet(categories)
+        texts = [
+            "start foo bar 12x abcde cdz y end",
+            "FOObar bazz qrs ababe",
+            "nothing here",
+            "",
+        ]
+
+        for text in texts:
+            assert pattern_set.scan(text).patterns == per_pattern_matches(
+                categories, text
+            ), text
+
+    def test_falls_back_to_per_pattern_search_without_parser(self, monkeypatch):
+        categories = {
+            "profanity": [r"\bd+a+m+n+", r"\bs+h+i+t+"],
+            "strong": [r"\bs+h+i+t+", r"(?:ab|cd)+e"],
+        }
+        text = "damn shit SHIIT damn abcde"
+        expected = CompiledPatternSet(categories).scan(text)
+
+        monkeypatch.setattr(content_filter_engine, "sre_parse", None)
+        matches = CompiledPatternSet(categories).scan(text)
+
+        assert matches == expected
+        assert matches.counts == {"profanity": 4, "strong": 4}
+
+    def test_invalid_pattern_raises(self):
+        with pytest.raises(re.error):
+            CompiledPatternSet({"a": ["(unbalanced"]})
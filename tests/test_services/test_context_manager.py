@@ -0,0 +1,133 @@
+"""Tests for the incremental rolling context summary"""
+
+import time
+from datetime import datetime, timezone
+
+from app.models.session import Session, SessionStatus
+from app.services.context_manager import (
+    SUMMARY_METADATA_KEY,
+    ContextManager,
+    RollingSummary,
+)
+
+
+def make_turn(number, phase="Phase 1"):
+    return {
+        "turn_number": number,
+        "user_input": f"user line {number}",
+        "partner_response": f"partner line {number}",
+        "phase": phase,
+    }
+
+
+def make_session(turns=0):
+    return Session(
+        session_id="ctx-session",
+        user_id="user",
+        user_email="user@example.com",
+        location="Stage",
+        status=SessionStatus.ACTIVE,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        expires_at=datetime.now(timezone.utc),
+        conversation_history=[make_turn(n) for n in range(1, turns + 1)],
+    )
+
+
+def per_call_us(func, calls=200):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+class TestRollingSummary:
+    def test_window_is_bounded_and_older_turns_are_folded(self):
+        summary = RollingSummary(window_size=3)
+        for number in range(1, 8):
+            phase = "Phase 1" if number < 5 else "Phase 2"
+            summary.append(make_turn(number, phase), tokens=10)
+
+        assert [turn["turn_number"] for turn in summary.recent] == [5, 6, 7]
+        assert summary.summarized_turns == 4
+        assert summary.total_turns == 7
+        assert summary.total_tokens == 70
+        assert summary.digest() == (
+            "4 turns completed, transitioned through 2 phases, "
+            "started with 'user line 1...'"
+        )
+
+    def test_round_trips_through_dict(self):
+        summary = RollingSummary(window_size=2)
+        for number in range(1, 5):
+            summary.append(make_turn(number), tokens=number)
+
+        restored = RollingSummary.from_dict(summary.to_dict())
+
+        assert restored == summary
+
+
+class TestContextManager:
+    def test_record_turn_stores_summary_in_metadata(self):
+        manager = ContextManager()
+        session = make_session(turns=4)
+
+        state = manager.record_turn(session, make_turn(5))
+
+        assert session.metadata[SUMMARY_METADATA_KEY] is state
+        assert state["total_turns"] == 5
+        assert [turn["turn_number"] for turn in state["recent"]] == [3, 4, 5]
+
+    def test_stored_summary_is_only_caught_up_with_new_turns(self):
+        manager = ContextManager()
+        session = make_session(turns=12)
+        manager.record_turn(session, make_turn(13))
+        session.conversation_history.append(make_turn(13))
+        session.conversation_history.append(make_turn(14))
+
+        counted = []
+        original = manager.count_turn_tokens
+        manager.count_turn_tokens = lambda turn: counted.append(turn) or original(turn)
+        summary = manager.summary_for(session)
+
+        assert [turn["turn_number"] for turn in counted] == [14]
+        assert summary.total_turns == 14
+
+    def test_context_includes_digest_and_recent_window(self):
+        manager = ContextManager(summarization_threshold=10)
+        session = make_session(turns=12)
+
+        context = manager.build_optimized_context(session, "next", turn_number=13)
+
+        assert "Session summary (12 turns total):" in context
+        assert "Earlier turns: 9 turns completed" in context
+        assert "Turn 10: User: user line 10" in context
+        assert "Turn 12: User: user line 12" in context
+        assert "user line 9\n" not in context
+
+    def test_oldest_recent_turns_are_dropped_to_fit_budget(self):
+        manager = ContextManager(max_tokens=20)
+        session = make_session(turns=3)
+
+        context = manager.build_optimized_context(session, "next", turn_number=4)
+
+        assert manager.estimate_tokens(context) <= 20
+        assert "Turn 3: User: user line 3" in context
+        assert "user line 1" not in context
+
+    def test_context_cost_does_not_grow_with_history(self):
+        manager = ContextManager()
+        short, long = make_session(turns=20), make_session(turns=2000)
+        for session in (short, long):
+            state = manager.summary_for(session).to_dict()
+            session.metadata[SUMMARY_METADATA_KEY] = state
+
+        short_us = per_call_us(
+            lambda: manager.build_optimized_context(short, "x", turn_number=21)
+        )
+        long_us = per_call_us(
+            lambda: manager.build_optimized_context(long, "x", turn_number=2001)
+        )
+
+        print(f"\ncontext build: 20 turns={short_us:.1f}us 2000 turns={long_us:.1f}us")
+        assert long_us < short_us * 5
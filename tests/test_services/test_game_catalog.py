@@ -0,0 +1,136 @@
+"""Tests for the indexed game catalog
+
+The catalog must return the same results as the original Firestore query plus
+client-side filtering in search_games, and detect game mentions in MC text.
+"""
+
+import pytest
+
+from app.services.game_catalog import GameCatalog, normalize_game_name
+
+GAMES = [
+    {
+        "id": "long_form",
+        "name": "Long Form",
+        "player_count": {"min": 2, "max": 2},
+        "energy_level": "variable",
+        "duration_minutes": 15,
+        "difficulty": "beginner",
+    },
+    {
+        "id": "questions_only",
+        "name": "Questions Only",
+        "player_count": {"min": 2, "max": 2},
+        "energy_level": "medium",
+        "duration_minutes": 8,
+        "difficulty": "intermediate",
+    },
+    {
+        "id": "last_word_first_word",
+        "name": "Last Word, First Word",
+        "player_count": {"min": 2, "max": 4},
+        "energy_level": "medium",
+        "duration_minutes": 8,
+        "difficulty": "intermediate",
+    },
+    {
+        "id": "freeze_tag",
+        "name": "Freeze Tag",
+        "aliases": ["Freeze"],
+        "player_count": {"min": 3, "max": 10},
+        "energy_level": "High",
+        "duration_minutes": "varies",
+        "difficulty": "beginner",
+    },
+    {
+        "id": "one_word_story",
+        "name": "One Word Story",
+        "energy_level": "low",
+        "duration_minutes": 5,
+        "difficulty": "beginner",
+    },
+]
+
+
+def reference_search(games, energy_level=None, player_count=None, difficulty=None, max_duration=None):
+    """Original search_games semantics (Firestore equality + Python filters)."""
+    results = []
+    for game in games:
+        if energy_level and game.get("energy_level") != energy_level.lower():
+            continue
+        if difficulty and game.get("difficulty") != difficulty.lower():
+            continue
+        if player_count is not None:
+            pc = game.get("player_count", {})
+            min_players = pc.get("min", 1) if isinstance(pc, dict) else 1
+            max_players = pc.get("max", 99) if isinstance(pc, dict) else 99
+            if not (min_players <= player_count <= max_players):
+                continue
+        if max_duration is not None:
+            duration = game.get("duration_minutes", 0)
+            if isinstance(duration, (int, float)) and duration > max_duration:
+                continue
+        results.append(game)
+    return results
+
+
+@pytest.fixture
+def catalog():
+    return GameCatalog(GAMES)
+
+
+class TestLookups:
+    def test_get_by_id(self, catalog):
+        assert catalog.get("questions_only")["name"] == "Questions Only"
+        assert catalog.get("missing") is None
+
+    def test_find_by_name_and_alias(self, catalog):
+        assert catalog.find_by_name("last word first word")["id"] == "last_word_first_word"
+        assert catalog.find_by_name("LONG FORM")["id"] == "long_form"
+        assert catalog.find_by_name("freeze")["id"] == "freeze_tag"
+        assert catalog.find_by_name("questions_only")["id"] == "questions_only"
+        assert catalog.find_by_name("nothing") is None
+
+    def test_normalize_game_name(self):
+        assert normalize_game_name("First Line / Last Line") == "first line last line"
+
+
+class TestSearch:
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"energy_level": "medium"},
+            {"energy_level": "MEDIUM", "difficulty": "Intermediate"},
+            {"player_count": 3},
+            {"player_count": 50},
+            {"max_duration": 8},
+            {"max_duration": 1},
+            {"difficulty": "beginner", "max_duration": 10},
+            {"energy_level": "unknown"},
+        ],
+    )
+    def test_matches_reference_semantics(self, catalog, filters):
+        expected = [g["id"] for g in reference_search(GAMES, **filters)]
+        assert [g["id"] for g in catalog.search(**filters)] == expected
+
+
+class TestDetectMentioned:
+    def test_detects_name_in_text(self, catalog):
+        game = catalog.detect_mentioned("Let's play Questions Only tonight!")
+        assert game["id"] == "questions_only"
+
+    def test_detects_punctuated_name_and_alias(self, catalog):
+        assert catalog.detect_mentioned("Try last word first word!")["id"] == "last_word_first_word"
+        assert catalog.detect_mentioned("Everybody FREEZE!")["id"] == "freeze_tag"
+
+    def test_catalog_order_wins_for_multiple_mentions(self, catalog):
+        game = catalog.detect_mentioned("Questions Only or maybe Long Form?")
+        assert game["id"] == "long_form"
+
+    def test_requires_word_boundaries(self, catalog):
+        assert catalog.detect_mentioned("The longformat show") is None
+
+    def test_no_match(self, catalog):
+        assert catalog.detect_mentioned("Let's do something fun") is None
+        assert GameCatalog([]).detect_mentioned("Long Form") is None
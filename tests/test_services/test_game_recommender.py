@@ -0,0 +1,118 @@
+"""Tests for the MC game recommender
+
+Rankings run against the seeded game database, so they reflect what the MC
+prompt will actually carry.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.services import firestore_tool_data_service as data_service
+from app.services.game_catalog import GameCatalog
+from app.services.game_recommender import (
+    GameRecommender,
+    format_shortlist,
+    preference_terms,
+)
+from scripts.seed_firestore_tool_data import GAMES_DATA
+from tests.fakes.firestore import FakeFirestoreClient
+
+
+@pytest.fixture(scope="module")
+def recommender():
+    return GameRecommender(GameCatalog(GAMES_DATA))
+
+
+def ids(recommendations):
+    return [recommendation.game["id"] for recommendation in recommendations]
+
+
+class TestPreferenceTerms:
+    def test_cues_expand_to_game_features(self):
+        terms = preference_terms("I'm feeling nervous")
+
+        assert terms["difficulty:beginner"] > 0
+
+    def test_energy_phrases(self):
+        assert preference_terms("something high-energy")["energy:high"] > 0
+        assert "energy:high" not in preference_terms("high stakes")
+
+
+class TestRecommend:
+    def test_nervous_user_gets_beginner_games(self, recommender):
+        shortlist = recommender.recommend("I'm nervous, it's my first time")
+
+        assert len(shortlist) == 3
+        assert all(r.game["difficulty"] == "beginner" for r in shortlist)
+
+    def test_challenge_prefers_harder_games(self, recommender):
+        shortlist = recommender.recommend("Give me a real challenge")
+
+        assert all(
+            r.game["difficulty"] in ("intermediate", "advanced") for r in shortlist
+        )
+
+    def test_calm_mood_prefers_low_energy(self, recommender):
+        assert ids(recommender.recommend("I'm tired, something chill", limit=1)) == [
+            "one_word_story"
+        ]
+
+    def test_description_terms_match(self, recommender):
+        assert ids(recommender.recommend("I love playing characters", limit=1)) == [
+            "character_swap"
+        ]
+
+    def test_named_game_ranks_first(self, recommender):
+        shortlist = recommender.recommend("Can we do forward reverse?")
+
+        assert shortlist[0].game["id"] == "forward_reverse"
+        assert shortlist[0].score > 1.0
+
+    def test_no_known_terms_ranks_like_no_preferences(self, recommender):
+        assert ids(recommender.recommend("Surprise me!")) == ids(
+            recommender.recommend(None)
+        )
+        assert all(r.game["difficulty"] == "beginner" for r in recommender.recommend())
+
+    def test_scores_are_descending(self, recommender):
+        shortlist = recommender.recommend("fun scene with characters", limit=6)
+
+        scores = [r.score for r in shortlist]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_limit(self, recommender):
+        assert len(recommender.recommend("fun", limit=5)) == 5
+        assert recommender.recommend("fun", limit=0) == []
+        assert len(recommender.recommend("fun", limit=100)) == len(GAMES_DATA)
+
+    def test_empty_catalog(self):
+        assert GameRecommender(GameCatalog([])).recommend("fun") == []
+
+
+class TestFormatShortlist:
+    def test_lists_details_and_description(self, recommender):
+        text = format_shortlist(recommender.recommend("one word story", limit=1))
+
+        assert text.startswith("- One Word Story (beginner, low energy, 5 min): ")
+
+    def test_minimal_game(self):
+        catalog = GameCatalog([{"id": "mystery", "name": "Mystery"}])
+
+        assert format_shortlist(GameRecommender(catalog).recommend()) == "- Mystery"
+
+
+@pytest.mark.asyncio
+async def test_data_service_shares_catalog_per_snapshot():
+    client = FakeFirestoreClient()
+    client.seed("improv_games", {game["id"]: game for game in GAMES_DATA})
+
+    data_service.reset_tool_data_cache()
+    with patch.object(
+        data_service, "get_firestore_client", return_value=client
+    ), patch.object(data_service.settings, "tool_data_bundled_snapshot", False):
+        recommender = await data_service.get_game_recommender()
+
+        assert recommender is await data_service.get_game_recommender()
+        assert recommender.catalog is await data_service.get_game_catalog()
+        assert len(recommender.recommend(limit=20)) == len(GAMES_DATA)
+    data_service.reset_tool_data_cache()
@@ -0,0 +1,64 @@
+"""Tests for the per-category keyword matcher
+
+The matcher must give exactly the counts of the original ``keyword in text``
+scans over the deduplicated, lowercased lexicon.
+"""
+
+import random
+import string
+
+from app.services.keyword_matcher import KeywordMatcher
+
+
+def naive_counts(categories, text):
+    text = text.lower()
+    return {
+        category: sum(1 for keyword in set(k.lower() for k in keywords if k) if keyword in text)
+        for category, keywords in categories.items()
+    }
+
+
+class TestKeywordMatcher:
+    def test_substring_semantics(self):
+        matcher = KeywordMatcher(
+            {"positive": ["love", "fun", "funny", "yes"], "negative": ["bad", "slow"]}
+        )
+
+        counts = matcher.count("LOVELY and funny, yes yes, but slowly")
+        assert counts == {"positive": 4, "negative": 1}
+
+    def test_overlapping_and_nested_keywords(self):
+        matcher = KeywordMatcher(
+            {"a": ["laugh", "laughing", "ugh", "hin"], "b": ["in"]}
+        )
+        assert matcher.find("laughing") == {"laugh", "laughing", "ugh", "hin", "in"}
+        assert matcher.find("Nothing") == {"hin", "in"}
+
+    def test_keyword_in_multiple_categories(self):
+        matcher = KeywordMatcher({"high": ["cheer"], "low": ["cheer", "quiet"]})
+        assert matcher.count("they cheer") == {"high": 1, "low": 1}
+
+    def test_empty_inputs(self):
+        matcher = KeywordMatcher({"a": ["", "x"], "b": []})
+        assert len(matcher) == 1
+        assert matcher.count("") == {"a": 0, "b": 0}
+        assert KeywordMatcher({}).count("anything") == {}
+
+    def test_special_characters_are_literal(self):
+        matcher = KeywordMatcher({"a": ["a.b", "c+", "(d)"]})
+        assert matcher.find("axb c+ (d)") == {"c+", "(d)"}
+
+    def test_matches_naive_scan_on_random_lexicons(self):
+        rng = random.Random(42)
+        alphabet = "abcde "
+        for _ in range(200):
+            categories = {
+                name: [
+                    "".join(rng.choice("abcde") for _ in range(rng.randint(1, 5)))
+                    for _ in range(rng.randint(0, 12))
+                ]
+                for name in ("p", "n")
+            }
+            text = "".join(rng.choice(alphabet + string.ascii_uppercase[:5]) for _ in range(60))
+            expected = naive_counts(categories, text)
+            assert KeywordMatcher(categories).count(text) == expected
@@ -15,6 +15,8 @@ from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timezone
 
 from app.services.mc_welcome_orchestrator import MCWelcomeOrchestrator
+from app.services.game_catalog import GameCatalog
+from app.services.game_recommender import GameRecommender
 from app.models.session import Session, SessionStatus
 
 
@@ -179,6 +181,36 @@ class TestMCWelcomeGameSelection:
             turn_count=0,
         )
 
+    @pytest.fixture(autouse=True)
+    def recommender(self):
+        """Recommender over a small catalog, so no tool data is loaded"""
+        recommender = GameRecommender(
+            GameCatalog(
+                [
+                    {
+                        "id": "long_form",
+                        "name": "Long Form",
+                        "difficulty": "beginner",
+                        "energy_level": "variable",
+                        "description": "A free-form scene.",
+                    },
+                    {
+                        "id": "forward_reverse",
+                        "name": "Forward Reverse",
+                        "difficulty": "advanced",
+                        "energy_level": "high",
+                        "description": "Rewind and replay the scene.",
+                    },
+                ]
+            )
+        )
+        with patch(
+            "app.services.mc_welcome_orchestrator.get_game_recommender",
+            new_callable=AsyncMock,
+            return_value=recommender,
+        ):
+            yield recommender
+
     @pytest.mark.asyncio
     async def test_tc_mc_02a_game_selection_with_user_mood(
         self, orchestrator, session_manager, mc_welcome_session
@@ -194,12 +226,12 @@ class TestMCWelcomeGameSelection:
             mock_run.return_value = "You're feeling silly? Perfect! Let's play Long Form - it's flexible and fun!"
 
             with patch(
-                "app.services.mc_welcome_orchestrator.get_all_games",
+                "app.services.mc_welcome_orchestrator.get_game_catalog",
                 new_callable=AsyncMock,
-            ) as mock_games:
-                mock_games.return_value = [
-                    {"id": "long_form", "name": "Long Form", "difficulty": "beginner"}
-                ]
+            ) as mock_catalog:
+                mock_catalog.return_value = GameCatalog(
+                    [{"id": "long_form", "name": "Long Form", "difficulty": "beginner"}]
+                )
 
                 result = await orchestrator.execute_welcome(
                     session=mc_welcome_session, user_input="I'm feeling silly tonight!"
@@ -224,12 +256,12 @@ class TestMCWelcomeGameSelection:
             mock_run.return_value = "Let's play Long Form tonight!"
 
             with patch(
-                "app.services.mc_welcome_orchestrator.get_all_games",
+                "app.services.mc_welcome_orchestrator.get_game_catalog",
                 new_callable=AsyncMock,
-            ) as mock_games:
-                mock_games.return_value = [
-                    {"id": "long_form", "name": "Long Form", "difficulty": "beginner"}
-                ]
+            ) as mock_catalog:
+                mock_catalog.return_value = GameCatalog(
+                    [{"id": "long_form", "name": "Long Form", "difficulty": "beginner"}]
+                )
 
                 result = await orchestrator.execute_welcome(
                     session=mc_welcome_session, user_input="Surprise me!"
@@ -257,12 +289,12 @@ class TestMCWelcomeGameSelection:
             mock_run.return_value = "Let's play Long Form!"
 
             with patch(
-                "app.services.mc_welcome_orchestrator.get_all_games",
+                "app.services.mc_welcome_orchestrator.get_game_catalog",
                 new_callable=AsyncMock,
-            ) as mock_games:
-                mock_games.return_value = [
-                    {"id": "long_form", "name": "Long Form", "difficulty": "beginner"}
-                ]
+            ) as mock_catalog:
+                mock_catalog.return_value = GameCatalog(
+                    [{"id": "long_form", "name": "Long Form", "difficulty": "beginner"}]
+                )
 
                 await orchestrator.execute_welcome(
                     session=mc_welcome_session, user_input="sounds good"
@@ -272,6 +304,36 @@ class TestMCWelcomeGameSelection:
             session_id="test-session-123", status=SessionStatus.GAME_SELECT
         )
 
+    @pytest.mark.asyncio
+    async def test_tc_mc_02d_game_selection_prompt_includes_ranked_shortlist(
+        self, orchestrator, mc_welcome_session
+    ):
+        """
+        TC-MC-02d: Game Selection Prompt Carries a Pre-Ranked Shortlist
+
+        The MC should not need to fetch and scan the game list itself.
+        """
+        with patch.object(
+            orchestrator, "_run_mc_agent", new_callable=AsyncMock
+        ) as mock_run:
+            mock_run.return_value = "Let's play Forward Reverse!"
+
+            with patch(
+                "app.services.mc_welcome_orchestrator.get_game_catalog",
+                new_callable=AsyncMock,
+            ) as mock_catalog:
+                mock_catalog.return_value = GameCatalog(
+                    [{"id": "long_form", "name": "Long Form", "difficulty": "beginner"}]
+                )
+
+                await orchestrator.execute_welcome(
+                    session=mc_welcome_session, user_input="I want a challenge"
+                )
+
+        prompt = mock_run.call_args.kwargs["prompt"]
+        assert "- Forward Reverse (advanced, high energy)" in prompt
+        assert prompt.index("Forward Reverse") < prompt.index("Long Form")
+
 
 class TestMCWelcomeAudienceSuggestion:
     """TC-MC-03: Audience Suggestion Collection"""
@@ -0,0 +1,305 @@
+"""Tests for the background memory ingestion queue"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.memory_ingestion_queue import (
+    IngestionStatus,
+    MemoryIngestionQueue,
+    load_adk_session,
+)
+from tests.fakes.firestore import FakeFirestoreClient
+
+COLLECTION = "memory_ingestion_jobs"
+
+
+class FakeMemory:
+    """Records ingested sessions; optionally slow or failing."""
+
+    def __init__(self, delay=0.0, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.ingested = []
+        self.active = 0
+        self.max_active = 0
+
+    async def load(self, job):
+        if job["session_id"].startswith("missing"):
+            return None
+        return MagicMock(id=job["session_id"])
+
+    async def ingest(self, adk_session):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("memory bank unavailable")
+            self.ingested.append(adk_session.id)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def client():
+    return FakeFirestoreClient()
+
+
+@pytest.fixture
+async def make_queue(client):
+    queues = []
+
+    def make(memory, **kwargs):
+        kwargs.setdefault("backoff_seconds", 0.01)
+        queue = MemoryIngestionQueue(
+            client,
+            collection=COLLECTION,
+            load_session=memory.load,
+            ingest=memory.ingest,
+            **kwargs,
+        )
+        queue.start()
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        await queue.stop()
+
+
+def job_status(client, session_id):
+    return client.documents(COLLECTION)[session_id]["status"]
+
+
+class TestMemoryIngestionQueue:
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_before_ingestion(self, client, make_queue):
+        memory = FakeMemory(delay=0.2)
+        queue = make_queue(memory)
+
+        start = time.perf_counter()
+        assert await queue.enqueue("s1", "user-1") is True
+        assert time.perf_counter() - start < 0.1
+        assert job_status(client, "s1") == IngestionStatus.PENDING.value
+
+        await queue.join()
+        assert memory.ingested == ["s1"]
+        assert job_status(client, "s1") == IngestionStatus.DONE.value
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_per_session(self, client, make_queue):
+        memory = FakeMemory(delay=0.05)
+        queue = make_queue(memory)
+
+        results = await asyncio.gather(
+            queue.enqueue("s1", "user-1"), queue.enqueue("s1", "user-1")
+        )
+        await queue.join()
+        assert await queue.enqueue("s1", "user-1") is False
+        await queue.join()
+
+        assert sorted(results) == [False, True]
+        assert memory.ingested == ["s1"]
+        assert queue.get_stats()["deduplicated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self, client, make_queue):
+        memory = FakeMemory(failures=2)
+        queue = make_queue(memory, max_attempts=3)
+
+        await queue.enqueue("s1", "user-1")
+        await queue.join()
+
+        job = client.documents(COLLECTION)["s1"]
+        assert memory.ingested == ["s1"]
+        assert job["status"] == IngestionStatus.DONE.value
+        assert job["attempts"] == 3
+        assert queue.get_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, client, make_queue):
+        memory = FakeMemory(failures=5)
+        queue = make_queue(memory, max_attempts=2)
+
+        await queue.enqueue("s1", "user-1")
+        await queue.join()
+
+        job = client.documents(COLLECTION)["s1"]
+        assert job["status"] == IngestionStatus.FAILED.value
+        assert job["last_error"] == "memory bank unavailable"
+        assert queue.get_stats()["failed"] == 1
+        # A failed job can be queued again
+        assert await queue.enqueue("s1", "user-1") is True
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, make_queue):
+        memory = FakeMemory(delay=0.02)
+        queue = make_queue(memory, concurrency=2)
+
+        for n in range(8):
+            await queue.enqueue(f"s{n}", "user-1")
+        await queue.join()
+
+        assert len(memory.ingested) == 8
+        assert memory.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_session_is_skipped(self, client, make_queue):
+        memory = FakeMemory()
+        queue = make_queue(memory)
+
+        await queue.enqueue("missing-1", "user-1")
+        await queue.join()
+
+        assert job_status(client, "missing-1") == IngestionStatus.SKIPPED.value
+        assert queue.get_stats()["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recovers_jobs_with_expired_leases(self, client, make_queue):
+        now = time.time()
+        job = {
+            "user_id": "user-1",
+            "app_name": "Improv Olympics",
+            "status": IngestionStatus.RUNNING.value,
+            "attempts": 1,
+            "enqueued_at": now - 900,
+            "next_attempt_at": now - 900,
+        }
+        client.seed(
+            COLLECTION,
+            {
+                "orphaned": {**job, "session_id": "orphaned", "lease_until": now - 1},
+                "owned": {**job, "session_id": "owned", "lease_until": now + 600},
+            },
+        )
+        memory = FakeMemory()
+        queue = make_queue(memory)
+
+        # The recovery loop also runs at start; a job is only taken over once
+        await queue.recover()
+        await queue.join()
+
+        assert memory.ingested == ["orphaned"]
+        assert job_status(client, "owned") == IngestionStatus.RUNNING.value
+        assert queue.get_stats()["recovered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_job_is_claimed_by_one_instance(self, client, make_queue):
+        now = time.time()
+        client.seed(
+            COLLECTION,
+            {
+                "orphaned": {
+                    "session_id": "orphaned",
+                    "user_id": "user-1",
+                    "app_name": "Improv Olympics",
+                    "status": IngestionStatus.RUNNING.value,
+                    "attempts": 1,
+                    "enqueued_at": now - 900,
+                    "next_attempt_at": now - 900,
+                    "lease_until": now - 1,
+                }
+            },
+        )
+        # Round-trip latency lets both instances read the job before either
+        # claims it
+        client.latency = 0.005
+        memory = FakeMemory()
+        queues = [make_queue(memory), make_queue(memory)]
+
+        await asyncio.gather(*(queue.recover() for queue in queues))
+        for queue in queues:
+            await queue.join()
+
+        assert memory.ingested == ["orphaned"]
+        assert sum(queue.get_stats()["recovered"] for queue in queues) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_enqueues_on_two_instances(self, client, make_queue):
+        client.latency = 0.005
+        memory = FakeMemory()
+        queues = [make_queue(memory), make_queue(memory)]
+
+        results = await asyncio.gather(
+            *(queue.enqueue("s1", "user-1") for queue in queues)
+        )
+        for queue in queues:
+            await queue.join()
+
+        assert sorted(results) == [False, True]
+        assert memory.ingested == ["s1"]
+
+    @pytest.mark.asyncio
+    async def test_lag_and_throughput_metrics(self, make_queue):
+        memory = FakeMemory(delay=0.01)
+        queue = make_queue(memory, concurrency=1)
+
+        for n in range(3):
+            await queue.enqueue(f"s{n}", "user-1")
+        await queue.join()
+
+        stats = queue.get_stats()
+        assert stats["completed"] == 3
+        assert stats["throughput_per_min"] == 3
+        assert stats["pending"] == 0
+        # The last job waited for the first two
+        assert stats["lag_ms_max"] >= 15
+        assert stats["processing_ms_avg"] >= 10
+
+    @pytest.mark.asyncio
+    async def test_queued_sessions_are_pinned_in_session_gc(self, make_queue):
+        collector = MagicMock()
+        with patch(
+            "app.services.memory_ingestion_queue.get_adk_session_collector",
+            return_value=collector,
+        ):
+            queue = make_queue(FakeMemory(), pin_sessions=True)
+            await queue.enqueue("s1", "user-1")
+            await queue.join()
+
+        collector.pin.assert_called_once_with("s1")
+        collector.unpin.assert_called_once_with("s1")
+
+    @pytest.mark.asyncio
+    async def test_session_is_pinned_before_the_job_is_written(
+        self, client, make_queue
+    ):
+        collector = MagicMock()
+        client.latency = 0.005
+        with patch(
+            "app.services.memory_ingestion_queue.get_adk_session_collector",
+            return_value=collector,
+        ):
+            queue = make_queue(FakeMemory(), pin_sessions=True)
+            enqueue = asyncio.create_task(queue.enqueue("s1", "user-1"))
+            await asyncio.sleep(0)
+
+            collector.pin.assert_called_once_with("s1")
+            assert COLLECTION not in client._store
+            await enqueue
+            await queue.join()
+
+        collector.unpin.assert_called_once_with("s1")
+
+
+@pytest.mark.asyncio
+async def test_session_missing_locally_is_rehydrated():
+    job = {"session_id": "s1", "user_id": "user-1", "app_name": "Improv Olympics"}
+    service = MagicMock(get_session=AsyncMock(return_value=None))
+    rehydrated = MagicMock(id="s1")
+    manager = MagicMock(get_adk_session=AsyncMock(return_value=rehydrated))
+
+    with patch(
+        "app.services.memory_ingestion_queue.get_adk_session_service",
+        return_value=service,
+    ), patch(
+        "app.services.memory_ingestion_queue.get_session_manager",
+        return_value=manager,
+    ):
+        assert await load_adk_session(job) is rehydrated
+
+    manager.get_adk_session.assert_awaited_once_with("s1")
@@ -0,0 +1,72 @@
+"""Tests for the shared mood lexicon engine"""
+
+import pytest
+
+from app.services.mood_lexicon import (
+    MC_TRANSCRIPTION_LEXICON,
+    ROOM_ANALYSIS_LEXICON,
+    MoodLexicon,
+)
+
+
+def make_lexicon():
+    return MoodLexicon(
+        {"laughter": ["laugh"], "cold": ["cold"], "hot": ["hot", "fire"]},
+        sentiment_tiers=[("hot", 0.9), ("cold", -0.4)],
+        engagement_tiers=[("cold", 0.2), ("hot", 0.8)],
+        default_sentiment=0.0,
+        default_engagement=0.5,
+    )
+
+
+class TestMoodLexicon:
+    def test_first_matching_tier_wins(self):
+        lexicon = make_lexicon()
+
+        reading = lexicon.analyze("Cold start, then the room caught FIRE and laughed")
+
+        assert reading.categories == {"laughter", "cold", "hot"}
+        assert reading.sentiment_score == 0.9
+        assert reading.engagement_score == 0.2
+        assert reading.laughter_detected is True
+
+    def test_defaults_when_nothing_matches(self):
+        reading = make_lexicon().analyze("Nothing to see here")
+
+        assert reading.categories == frozenset()
+        assert (reading.sentiment_score, reading.engagement_score) == (0.0, 0.5)
+        assert reading.laughter_detected is False
+
+    def test_tiers_must_reference_known_categories(self):
+        with pytest.raises(ValueError, match="unknown categories"):
+            MoodLexicon(
+                {"a": ["x"]},
+                sentiment_tiers=[("b", 1.0)],
+                engagement_tiers=[],
+                default_sentiment=0.0,
+                default_engagement=0.5,
+            )
+
+
+class TestBuiltInLexicons:
+    def test_room_analysis_disengaged_checked_before_engaged(self):
+        reading = ROOM_ANALYSIS_LEXICON.analyze("The audience looks disengaged")
+
+        assert reading.engagement_score == 0.1
+        assert reading.sentiment_score == -0.5
+
+    def test_room_analysis_laughter_substring(self):
+        assert ROOM_ANALYSIS_LEXICON.analyze("Big laughs all round").laughter_detected
+
+    def test_mc_transcription_priority(self):
+        reading = MC_TRANSCRIPTION_LEXICON.analyze(
+            "The crowd is cracking up and cheering!"
+        )
+
+        assert reading.categories == {"laughter", "excitement", "engagement"}
+        assert (reading.sentiment_score, reading.engagement_score) == (0.9, 0.95)
+
+    def test_mc_transcription_without_audience_phrases(self):
+        assert not MC_TRANSCRIPTION_LEXICON.analyze(
+            "Tonight's game is Freeze Tag"
+        ).categories
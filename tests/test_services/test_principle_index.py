@@ -0,0 +1,164 @@
+"""Tests for the in-memory principle full-text index
+
+Covers tokenization and light stemming, importance filters, ranked keyword
+search, and the index-backed firestore_tool_data_service principle readers.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.services.principle_index import PrincipleIndex, stem, tokenize
+from tests.fakes.firestore import FakeFirestoreClient
+
+PRINCIPLES = [
+    {
+        "id": "yes_and",
+        "name": "Yes, And...",
+        "description": "Accept what your scene partner offers and build upon it.",
+        "importance": "foundational",
+        "examples": ["Partner: 'We're on a spaceship!' You: 'Yes, and the oxygen is low!'"],
+        "coaching_tips": ["Your job is to make your partner look good"],
+    },
+    {
+        "id": "listening",
+        "name": "Active Listening",
+        "description": "Truly hear what your scene partner is saying.",
+        "importance": "foundational",
+        "examples": ["Notice when your partner establishes a location"],
+        "coaching_tips": ["React authentically to what you hear"],
+    },
+    {
+        "id": "specificity",
+        "name": "Be Specific",
+        "description": "Specific details make scenes vivid.",
+        "importance": "essential",
+        "examples": ["Not 'a car' but 'my grandmother's 1987 Buick'"],
+        "coaching_tips": ["Name things", "Keep listening for details to reuse"],
+    },
+    {
+        "id": "game_of_scene",
+        "name": "Find the Game",
+        "description": "Identify the unusual pattern and heighten it.",
+        "importance": "advanced",
+    },
+]
+
+
+@pytest.fixture
+def index():
+    return PrincipleIndex(PRINCIPLES)
+
+
+class TestTokenizer:
+    @pytest.mark.parametrize(
+        "word,expected",
+        [
+            ("listening", "listen"),
+            ("listened", "listen"),
+            ("listens", "listen"),
+            ("running", "run"),
+            ("details", "detail"),
+            ("stories", "story"),
+            ("yes", "yes"),
+            ("focus", "focus"),
+        ],
+    )
+    def test_stem(self, word, expected):
+        assert stem(word) == expected
+
+    def test_tokenize_drops_punctuation_and_apostrophes(self):
+        assert tokenize("Yes, And... we're LISTENING!") == ["yes", "and", "were", "listen"]
+
+
+class TestLookups:
+    def test_get_by_id(self, index):
+        assert index.get("listening")["name"] == "Active Listening"
+        assert index.get("missing") is None
+
+    def test_by_importance_keeps_collection_order(self, index):
+        assert [p["id"] for p in index.by_importance("FOUNDATIONAL")] == ["yes_and", "listening"]
+        assert [p["id"] for p in index.by_importance("foundational", "essential")] == [
+            "yes_and",
+            "listening",
+            "specificity",
+        ]
+        assert index.by_importance("invalid_level") == []
+
+
+class TestSearch:
+    def test_empty_query_returns_all_in_order(self, index):
+        assert [p["id"] for p in index.search("")] == [p["id"] for p in PRINCIPLES]
+
+    def test_stemmed_match_ranks_name_hits_first(self, index):
+        results = [p["id"] for p in index.search("listen")]
+        # Name match outranks a coaching tip mention
+        assert results == ["listening", "specificity"]
+
+    def test_case_insensitive(self, index):
+        assert index.search("yes") == index.search("YES") == index.search("YeS")
+        assert index.search("yes")[0]["id"] == "yes_and"
+
+    def test_multi_term_query_prefers_more_matches(self, index):
+        results = [p["id"] for p in index.search("partner details")]
+        assert set(results) == {"yes_and", "listening", "specificity"}
+        assert results[0] in {"yes_and", "specificity"}
+
+    def test_prefix_match(self, index):
+        assert [p["id"] for p in index.search("heighte")] == ["game_of_scene"]
+
+    def test_stopwords_ignored_unless_query_is_only_stopwords(self, index):
+        assert [p["id"] for p in index.search("the game")] == ["game_of_scene"]
+        assert index.search("and")[0]["id"] == "yes_and"
+
+    def test_no_match_and_limit(self, index):
+        assert index.search("xylophone") == []
+        assert len(index.search("partner", limit=1)) == 1
+
+
+class TestIndexedDataService:
+    @pytest.fixture
+    def fake_client(self):
+        from app.services import firestore_tool_data_service as data_service
+
+        client = FakeFirestoreClient()
+        client.seed(
+            "improv_principles",
+            {p["id"]: {k: v for k, v in p.items() if k != "id"} for p in PRINCIPLES},
+        )
+
+        data_service.reset_tool_data_cache()
+        with patch.object(
+            data_service, "get_firestore_client", return_value=client
+        ), patch.object(data_service.settings, "tool_data_bundled_snapshot", False):
+            yield client
+        data_service.reset_tool_data_cache()
+
+    @pytest.mark.asyncio
+    async def test_principle_readers_use_snapshot(self, fake_client):
+        from app.services import firestore_tool_data_service as data_service
+
+        assert (await data_service.get_principle_by_id("yes_and"))["name"] == "Yes, And..."
+        assert await data_service.get_principle_by_id("nonexistent") is None
+        essentials = await data_service.get_beginner_essentials()
+        # Firestore streams in document ID order
+        assert [p["id"] for p in essentials] == ["listening", "specificity", "yes_and"]
+        advanced = await data_service.get_principles_by_importance("advanced")
+        assert [p["id"] for p in advanced] == ["game_of_scene"]
+        results = await data_service.search_principles_by_keyword("listening")
+        assert results[0]["id"] == "listening"
+        round_trips = fake_client.stats["round_trips"]
+
+        for _ in range(10):
+            await data_service.search_principles_by_keyword("partner")
+
+        # Only the initial snapshot load touches Firestore
+        assert fake_client.stats["round_trips"] == round_trips
+
+    @pytest.mark.asyncio
+    async def test_returned_principles_are_copies(self, fake_client):
+        from app.services import firestore_tool_data_service as data_service
+
+        principle = await data_service.get_principle_by_id("yes_and")
+        principle["name"] = "changed"
+
+        assert (await data_service.get_principle_by_id("yes_and"))["name"] == "Yes, And..."
@@ -0,0 +1,94 @@
+"""Tests for the process-wide sentiment keyword store
+
+Covers sharing one immutable keyword view across toolset instances, load
+counting, and picking up refreshed tool data snapshots.
+"""
+
+import dataclasses
+import pytest
+from unittest.mock import patch
+
+from app.services.sentiment_keyword_store import (
+    SentimentKeywords,
+    get_sentiment_keyword_store,
+    reset_sentiment_keyword_store,
+)
+from app.toolsets.sentiment_analysis_toolset import SentimentAnalysisToolset
+from tests.fakes.firestore import FakeFirestoreClient
+
+
+@pytest.fixture
+def fake_client():
+    from app.services import firestore_tool_data_service as data_service
+
+    client = FakeFirestoreClient()
+    client.seed(
+        "sentiment_keywords",
+        {
+            "positive_keywords": {"keywords": ["love", "great"]},
+            "negative_keywords": {"keywords": ["boring"]},
+            "engagement_keywords": {"keywords": {"high": ["cheering"], "low": ["silent"]}},
+        },
+    )
+
+    data_service.reset_tool_data_cache()
+    reset_sentiment_keyword_store()
+    with patch.object(
+        data_service, "get_firestore_client", return_value=client
+    ), patch.object(data_service.settings, "tool_data_bundled_snapshot", False):
+        yield client
+    data_service.reset_tool_data_cache()
+    reset_sentiment_keyword_store()
+
+
+class TestSentimentKeywords:
+    def test_from_dict(self):
+        keywords = SentimentKeywords.from_dict(
+            {"positive": ["yay"], "engagement": {"high": ["wow"]}}, version=3
+        )
+        assert keywords.positive == ("yay",)
+        assert keywords.negative == ()
+        assert keywords.engagement_high == ("wow",)
+        assert keywords.engagement_low == ()
+        assert keywords.version == 3
+
+    def test_view_is_immutable(self):
+        keywords = SentimentKeywords.from_dict({"positive": ["yay"]})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            keywords.positive = ("nope",)
+
+
+class TestSentimentKeywordStore:
+    @pytest.mark.asyncio
+    async def test_toolset_instances_share_one_load(self, fake_client):
+        toolsets = [SentimentAnalysisToolset() for _ in range(5)]
+
+        results = [await t._analyze_text("I love this, great scene") for t in toolsets]
+        engagement = await toolsets[0]._analyze_engagement(["crowd cheering"])
+
+        assert all(r["sentiment"] == "very_positive" for r in results)
+        assert engagement["high_engagement_indicators"] == 1
+        stats = get_sentiment_keyword_store().get_stats()
+        assert stats["loads"] == 1
+        assert stats["reads"] == 6
+        # One stream per tool data collection, nothing per toolset
+        assert fake_client.stats["round_trips"] == 4
+
+    @pytest.mark.asyncio
+    async def test_same_view_until_snapshot_refresh(self, fake_client):
+        from app.services import firestore_tool_data_service as data_service
+
+        store = get_sentiment_keyword_store()
+        first = await store.get()
+        assert await store.get() is first
+
+        fake_client.seed(
+            "sentiment_keywords", {"positive_keywords": {"keywords": ["stellar"]}}
+        )
+        await data_service.get_tool_data_cache().refresh()
+        refreshed = await store.get()
+
+        assert refreshed is not first
+        assert refreshed.positive == ("stellar",)
+        assert refreshed.version == first.version + 1
+        assert store.get_stats()["loads"] == 2
@@ -223,3 +223,72 @@ def test_session_manager_factory_without_adk():
             mock_service.return_value = None
             manager = get_session_manager(use_adk_sessions=False)
             assert manager.use_adk_sessions is False
+
+
+@pytest.mark.asyncio
+async def test_get_adk_session_rehydrates_missing_session(mock_firestore_client):
+    """A session missing locally is recreated with a compact Firestore history"""
+    from google.adk.sessions import InMemorySessionService
+
+    from app.services.adk_session_rehydration import (
+        REHYDRATION_STATE_KEY,
+        reset_rehydration_cache,
+    )
+
+    session_id = "sess_rehydrate"
+    history = [
+        {
+            "turn_number": n,
+            "user_input": f"user line {n}",
+            "partner_response": f"partner line {n}",
+            "phase": "Phase 1",
+        }
+        for n in range(1, 13)
+    ]
+    mock_snapshot = MagicMock()
+    mock_snapshot.exists = True
+    mock_snapshot.to_dict.return_value = {
+        "session_id": session_id,
+        "user_id": "user_123",
+        "user_email": "test@example.com",
+        "user_name": "Test User",
+        "location": "Mars",
+        "status": "active",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "expires_at": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+        "conversation_history": history,
+        "metadata": {},
+        "current_phase": "PHASE_2",
+        "turn_count": 12,
+    }
+    mock_doc_ref = MagicMock()
+    mock_doc_ref.get.return_value = mock_snapshot
+    mock_firestore_client.collection.return_value.document.return_value = mock_doc_ref
+
+    reset_rehydration_cache()
+    service = InMemorySessionService()
+    with patch(
+        "app.services.session_manager.get_adk_session_service", return_value=service
+    ):
+        manager = SessionManager(use_adk_sessions=True)
+
+    adk_session = await manager.get_adk_session(session_id)
+
+    texts = [event.content.parts[0].text for event in adk_session.events]
+    assert adk_session.state[REHYDRATION_STATE_KEY] == 12
+    assert adk_session.state["turn_count"] == 12
+    assert texts[0].startswith("[Summary of 9 earlier turns]")
+    assert texts[1:] == [
+        "Turn 10: user line 10",
+        "partner line 10",
+        "Turn 11: user line 11",
+        "partner line 11",
+        "Turn 12: user line 12",
+        "partner line 12",
+    ]
+
+    # The next lookup finds the local session instead of rehydrating again
+    again = await manager.get_adk_session(session_id)
+    assert len(again.events) == len(adk_session.events)
+    reset_rehydration_cache()
@@ -0,0 +1,128 @@
+"""Tests for the bundled local tool data snapshot
+
+Covers building and loading the bundle, keeping the committed bundle in sync
+with the seed data, and serving bundled data on a cold cache while Firestore
+is reconciled in the background.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from app.services.tool_data_bundle import (
+    DEFAULT_BUNDLE_PATH,
+    build_bundle,
+    dump_bundle,
+    load_bundled_snapshot,
+)
+from scripts.build_tool_data_snapshot import build_from_seed_data, is_up_to_date
+from tests.fakes.firestore import FakeFirestoreClient
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    bundle = build_bundle(
+        games=[{"id": "freeze_tag", "name": "Freeze Tag"}],
+        principles=[{"id": "yes_and", "name": "Yes, And", "importance": "foundational"}],
+        archetypes=[{"id": "tech", "name": "Tech Enthusiast"}],
+        sentiment_docs={
+            "positive_keywords": {"keywords": ["love"]},
+            "engagement_keywords": {"keywords": {"high": ["wow"], "low": ["meh"]}},
+        },
+    )
+    path = tmp_path / "snapshot.json"
+    path.write_text(dump_bundle(bundle))
+    return path
+
+
+class TestBundle:
+    def test_committed_bundle_matches_seed_data(self):
+        assert is_up_to_date(DEFAULT_BUNDLE_PATH), (
+            "app/data/tool_data_snapshot.json is stale; "
+            "run python scripts/build_tool_data_snapshot.py"
+        )
+
+    def test_data_version_tracks_content_only(self):
+        first = build_from_seed_data()
+        second = build_from_seed_data()
+        assert first["data_version"] == second["data_version"]
+
+        changed = build_bundle(first["games"][:1], [], [], {})
+        assert changed["data_version"] != first["data_version"]
+
+    def test_load_bundled_snapshot(self, bundle_path):
+        snapshot = load_bundled_snapshot(bundle_path)
+
+        assert snapshot.source == "bundled"
+        assert snapshot.provisional is True
+        assert snapshot.games[0]["id"] == "freeze_tag"
+        assert snapshot.sentiment_keywords == {
+            "positive": ["love"],
+            "negative": [],
+            "engagement": {"high": ["wow"], "low": ["meh"]},
+        }
+
+    def test_missing_or_unsupported_bundle_is_ignored(self, tmp_path):
+        assert load_bundled_snapshot(tmp_path / "missing.json") is None
+
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"schema_version": 0, "games": []}))
+        assert load_bundled_snapshot(path) is None
+
+        path.write_text("{not json")
+        assert load_bundled_snapshot(path) is None
+
+
+class TestBundledColdStart:
+    @pytest.fixture
+    def data_service(self, bundle_path):
+        from app.services import firestore_tool_data_service as data_service
+
+        client = FakeFirestoreClient(latency=0.01)
+        client.seed("improv_games", {"freeze_tag": {"name": "Freeze Tag (live)"}})
+
+        data_service.reset_tool_data_cache()
+        with patch.object(
+            data_service, "get_firestore_client", return_value=client
+        ), patch.object(
+            data_service.settings, "tool_data_bundled_snapshot", True
+        ), patch.object(
+            data_service.settings, "tool_data_snapshot_path", str(bundle_path)
+        ):
+            yield data_service, client
+        data_service.reset_tool_data_cache()
+
+    @pytest.mark.asyncio
+    async def test_first_read_served_from_bundle_then_reconciled(self, data_service):
+        service, client = data_service
+
+        games = await service.get_all_games()
+        assert games == [{"id": "freeze_tag", "name": "Freeze Tag"}]
+        # The read did not wait on Firestore
+        assert client.stats["round_trips"] == 0
+
+        cache = service.get_tool_data_cache()
+        await cache._refresh_task
+        assert cache.snapshot.source == "firestore"
+        assert cache.snapshot.provisional is False
+        assert (await service.get_game_by_id("freeze_tag"))["name"] == "Freeze Tag (live)"
+
+    @pytest.mark.asyncio
+    async def test_firestore_failure_keeps_bundled_data(self, data_service):
+        service, _ = data_service
+
+        async def failing_loader(version):
+            await asyncio.sleep(0)
+            raise RuntimeError("firestore unavailable")
+
+        cache = service.get_tool_data_cache()
+        cache._loader = failing_loader
+        await service.get_all_games()
+        await cache._refresh_task
+
+        assert cache.snapshot.source == "bundled"
+        assert (await service.get_principle_by_id("yes_and"))["name"] == "Yes, And"
+        # Backoff prevents a retry storm on every read
+        await service.get_all_games()
+        assert cache._refresh_task.done()
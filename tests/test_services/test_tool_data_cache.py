@@ -0,0 +1,197 @@
+"""Tests for the tool data snapshot cache
+
+Covers cold loads, single-flight loading, stale-while-revalidate refresh,
+failure handling, and the cache-backed firestore_tool_data_service readers.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.services.tool_data_cache import ToolDataCache, ToolDataSnapshot
+from tests.fakes.firestore import FakeFirestoreClient
+
+
+def make_loader(calls, fail_on=None, delay=0.0):
+    async def loader(version: int) -> ToolDataSnapshot:
+        calls.append(version)
+        if delay:
+            await asyncio.sleep(delay)
+        if fail_on and version in fail_on:
+            raise RuntimeError("firestore unavailable")
+        return ToolDataSnapshot(
+            games=({"id": f"game_v{version}", "name": "Freeze Tag"},),
+            version=version,
+        )
+
+    return loader
+
+
+class TestToolDataCache:
+    @pytest.mark.asyncio
+    async def test_cold_load_then_hits(self):
+        calls = []
+        cache = ToolDataCache(make_loader(calls), ttl_seconds=300)
+
+        first = await cache.get()
+        second = await cache.get()
+
+        assert first is second
+        assert first.version == 1
+        assert calls == [1]
+        stats = cache.get_stats()
+        assert stats["cold_loads"] == 1
+        assert stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_reads_share_one_load(self):
+        calls = []
+        cache = ToolDataCache(make_loader(calls, delay=0.01))
+
+        snapshots = await asyncio.gather(*(cache.get() for _ in range(20)))
+
+        assert calls == [1]
+        assert all(s is snapshots[0] for s in snapshots)
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_while_revalidating(self):
+        calls = []
+        cache = ToolDataCache(make_loader(calls, delay=0.01), ttl_seconds=1)
+        await cache.get()
+        cache.set_snapshot(
+            ToolDataSnapshot(games=cache.snapshot.games, version=1, loaded_at=0.0)
+        )
+
+        stale = await cache.get()
+        assert stale.version == 1
+
+        await cache._refresh_task
+        fresh = await cache.get()
+        assert fresh.version == 2
+        assert cache.get_stats()["stale_reads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_snapshot(self):
+        calls = []
+        cache = ToolDataCache(make_loader(calls, fail_on={2}))
+        first = await cache.get()
+
+        refreshed = await cache.refresh()
+
+        assert refreshed is first
+        assert cache.get_stats()["refresh_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_cold_load_raises(self):
+        cache = ToolDataCache(make_loader([], fail_on={1}))
+
+        with pytest.raises(RuntimeError):
+            await cache.get()
+
+    @pytest.mark.asyncio
+    async def test_periodic_refresh_and_stop(self):
+        calls = []
+        cache = ToolDataCache(make_loader(calls))
+        await cache.get()
+
+        cache.start_periodic_refresh(0.01)
+        await asyncio.sleep(0.05)
+        await cache.stop()
+
+        assert cache.snapshot.version >= 2
+
+
+class TestCachedDataService:
+    @pytest.fixture
+    def fake_client(self):
+        from app.services import firestore_tool_data_service as data_service
+
+        client = FakeFirestoreClient()
+        client.seed(
+            "improv_games",
+            {"freeze_tag": {"name": "Freeze Tag", "difficulty": "beginner"}},
+        )
+        client.seed(
+            "improv_principles",
+            {"yes_and": {"name": "Yes, And", "importance": "foundational"}},
+        )
+        client.seed("audience_archetypes", {"tech": {"name": "Tech Enthusiast"}})
+        client.seed(
+            "sentiment_keywords",
+            {"positive_keywords": {"keywords": ["love", "great"]}},
+        )
+
+        data_service.reset_tool_data_cache()
+        with patch.object(
+            data_service, "get_firestore_client", return_value=client
+        ), patch.object(data_service.settings, "tool_data_bundled_snapshot", False):
+            yield client
+        data_service.reset_tool_data_cache()
+
+    @pytest.mark.asyncio
+    async def test_readers_share_one_snapshot_load(self, fake_client):
+        from app.services import firestore_tool_data_service as data_service
+
+        games = await data_service.get_all_games()
+        principles = await data_service.get_all_principles()
+        archetypes = await data_service.get_all_archetypes()
+        keywords = await data_service.get_sentiment_keywords()
+        round_trips = fake_client.stats["round_trips"]
+
+        for _ in range(10):
+            await data_service.get_all_games()
+
+        assert games == [
+            {"id": "freeze_tag", "name": "Freeze Tag", "difficulty": "beginner"}
+        ]
+        assert principles[0]["id"] == "yes_and"
+        assert archetypes[0]["name"] == "Tech Enthusiast"
+        assert keywords["positive"] == ["love", "great"]
+        # One stream per collection for the initial snapshot, nothing after
+        assert round_trips == 4
+        assert fake_client.stats["round_trips"] == 4
+
+    @pytest.mark.asyncio
+    async def test_returned_data_does_not_mutate_snapshot(self, fake_client):
+        from app.services import firestore_tool_data_service as data_service
+
+        games = await data_service.get_all_games()
+        games[0]["name"] = "changed"
+        games.clear()
+
+        assert (await data_service.get_all_games())[0]["name"] == "Freeze Tag"
+
+    @pytest.mark.asyncio
+    async def test_nested_values_are_not_shared_with_snapshot(self, fake_client):
+        from app.services import firestore_tool_data_service as data_service
+
+        fake_client.seed(
+            "improv_games",
+            {"freeze_tag": {"name": "Freeze Tag", "rules": ["Freeze", "Tag in"]}},
+        )
+        fake_client.seed(
+            "improv_principles",
+            {"yes_and": {"name": "Yes, And", "coaching_tips": ["Accept offers"]}},
+        )
+        fake_client.seed(
+            "audience_archetypes", {"tech": {"name": "Tech", "traits": ["curious"]}}
+        )
+
+        (await data_service.get_all_games())[0]["rules"].append("changed")
+        (await data_service.get_game_by_id("freeze_tag"))["rules"].clear()
+        (await data_service.search_games())[0]["rules"].clear()
+        (await data_service.get_all_principles())[0]["coaching_tips"].clear()
+        (await data_service.get_principle_by_id("yes_and"))["coaching_tips"].clear()
+        (await data_service.search_principles_by_keyword(""))[0][
+            "coaching_tips"
+        ].clear()
+        (await data_service.get_all_archetypes())[0]["traits"].clear()
+
+        assert (await data_service.get_game_by_id("freeze_tag"))["rules"] == [
+            "Freeze",
+            "Tag in",
+        ]
+        assert (await data_service.get_all_principles())[0]["coaching_tips"] == [
+            "Accept offers"
+        ]
+        assert (await data_service.get_all_archetypes())[0]["traits"] == ["curious"]
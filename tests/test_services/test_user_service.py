@@ -13,6 +13,8 @@ Test Cases:
 - TC-SVC-08: Delete user
 - TC-SVC-09: Migrate from ALLOWED_USERS env var
 - TC-SVC-10: Increment audio usage
+- TC-SVC-11: Bulk import with deduplication and batched writes
+- TC-SVC-12: Cursor-paginated user listing
 """
 
 import pytest
@@ -20,6 +22,8 @@ from datetime import datetime, timezone
 from typing import Dict, Any, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from tests.fakes.firestore import FakeFirestoreClient
+
 
 async def async_generator(items: List):
     """Create an async generator from a list."""
@@ -355,31 +359,17 @@ class TestMigrateFromEnv:
     """Tests for migrate_from_allowed_users function."""
 
     @pytest.mark.asyncio
-    async def test_tc_svc_09_migrate_from_env(self, mock_firestore_client):
+    async def test_tc_svc_09_migrate_from_env(self, fake_firestore_client):
         """TC-SVC-09: Migrate from ALLOWED_USERS env var."""
         from app.services.user_service import migrate_from_allowed_users
         from app.models.user import UserTier
 
-        # Mock that no users exist yet
-        mock_query = MagicMock()
-        mock_query.stream.return_value = async_generator([])
-
-        mock_doc_ref = MagicMock()
-        mock_doc_ref.id = "new-user"
-
-        async def mock_add(*args, **kwargs):
-            return (None, mock_doc_ref)
-
-        mock_collection = MagicMock()
-        mock_collection.where.return_value = mock_query
-        mock_collection.add = mock_add
-        mock_firestore_client.collection.return_value = mock_collection
-
         with patch("app.services.user_service.settings") as mock_settings:
             mock_settings.allowed_users_list = [
                 "user1@example.com",
                 "user2@example.com",
             ]
+            mock_settings.perf_firestore_batch_size = 500
 
             result = await migrate_from_allowed_users(default_tier=UserTier.REGULAR)
 
@@ -387,6 +377,218 @@ class TestMigrateFromEnv:
             assert result["skipped"] == 0
 
 
+@pytest.fixture
+def fake_firestore_client():
+    """In-process Firestore stand-in for bulk operations."""
+    client = FakeFirestoreClient()
+    with patch("app.services.user_service.get_firestore_client", return_value=client):
+        yield client
+
+
+class TestBulkImport:
+    """Tests for bulk_import_users function."""
+
+    @pytest.mark.asyncio
+    async def test_tc_svc_11_bulk_import_dedupes_and_skips_existing(
+        self, fake_firestore_client, sample_user_doc
+    ):
+        """TC-SVC-11: Bulk import deduplicates input and skips existing users."""
+        from app.services.user_service import bulk_import_users
+        from app.models.user import UserTier
+
+        fake_firestore_client.seed("users", {"existing": sample_user_doc})
+
+        progress = []
+        result = await bulk_import_users(
+            [
+                "test@example.com",
+                "new1@example.com",
+                " new1@example.com ",
+                "new2@example.com",
+            ],
+            tier=UserTier.PREMIUM,
+            created_by="admin@example.com",
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert result == {
+            "total": 4,
+            "duplicates": 1,
+            "created": 2,
+            "skipped": 1,
+            "errors": 0,
+        }
+        assert progress[-1] == (3, 3)
+
+        docs = fake_firestore_client.documents("users").values()
+        created = {d["email"]: d for d in docs if d["email"] != "test@example.com"}
+        assert set(created) == {"new1@example.com", "new2@example.com"}
+        assert created["new1@example.com"]["tier"] == "premium"
+        assert created["new1@example.com"]["user_id"] == "provisioned-new1-example-com"
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_large_list_uses_batched_writes(
+        self, fake_firestore_client
+    ):
+        """10k emails are imported with one commit per batch, in seconds."""
+        import time
+        from app.services.user_service import bulk_import_users
+
+        emails = [f"user{i}@example.com" for i in range(10_000)]
+
+        start = time.perf_counter()
+        result = await bulk_import_users(emails, batch_size=500)
+        elapsed = time.perf_counter() - start
+
+        assert result["created"] == 10_000
+        assert len(fake_firestore_client.documents("users")) == 10_000
+        # 334 chunked "in" prefetch queries + 20 batch commits
+        assert fake_firestore_client.stats["round_trips"] == 334 + 20
+        assert elapsed < 10
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_counts_failed_batches(self, fake_firestore_client):
+        """A failing batch commit is reported as errors without aborting others."""
+        from app.services.user_service import bulk_import_users
+
+        original_batch = fake_firestore_client.batch
+        calls = []
+
+        def flaky_batch():
+            batch = original_batch()
+            calls.append(batch)
+            if len(calls) == 1:
+                batch.commit = AsyncMock(side_effect=RuntimeError("unavailable"))
+            return batch
+
+        fake_firestore_client.batch = flaky_batch
+
+        emails = [f"user{i}@example.com" for i in range(10)]
+        result = await bulk_import_users(emails, batch_size=5)
+
+        assert result["errors"] == 5
+        assert result["created"] == 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_counts_failed_lookups(self, fake_firestore_client):
+        """A failing prefetch query only fails the emails of its chunk."""
+        from tests.fakes.firestore import FakeQuery
+        from app.services.user_service import bulk_import_users
+
+        original_stream = FakeQuery.stream
+
+        def flaky_stream(query):
+            if any(
+                op == "in" and "user0@example.com" in value
+                for _, op, value in query._filters
+            ):
+                raise RuntimeError("deadline exceeded")
+            return original_stream(query)
+
+        emails = [f"user{i}@example.com" for i in range(40)]
+        with patch.object(FakeQuery, "stream", flaky_stream):
+            result = await bulk_import_users(emails)
+
+        # First chunk of 30 could not be checked; the other 10 are created
+        assert result["errors"] == 30
+        assert result["created"] == 10
+        created = {d["email"] for d in fake_firestore_client.documents("users").values()}
+        assert created == {f"user{i}@example.com" for i in range(30, 40)}
+
+
+class TestListUsersPaginated:
+    """Tests for list_users_page and iter_users."""
+
+    @pytest.fixture
+    def seeded_users(self, fake_firestore_client):
+        from datetime import timedelta
+
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        docs = {}
+        for i in range(25):
+            docs[f"doc{i:02d}"] = {
+                "user_id": f"user-{i}",
+                "email": f"user{i}@example.com",
+                "tier": "premium" if i % 5 == 0 else "regular",
+                # Pairs of users share a timestamp to exercise the id tiebreak
+                "created_at": base + timedelta(minutes=i // 2),
+                "audio_usage_seconds": i,
+            }
+        fake_firestore_client.seed("users", docs)
+        return docs
+
+    @pytest.mark.asyncio
+    async def test_tc_svc_12_pages_follow_cursor(self, seeded_users):
+        """TC-SVC-12: Pages are disjoint, ordered, and end with no cursor."""
+        from app.services.user_service import list_users_page
+
+        emails = []
+        cursor = None
+        pages = 0
+        while True:
+            page = await list_users_page(page_size=10, cursor=cursor)
+            pages += 1
+            emails.extend(u.email for u in page.users)
+            if not page.next_cursor:
+                break
+            cursor = page.next_cursor
+
+        assert pages == 3
+        assert emails == [f"user{i}@example.com" for i in range(25)]
+
+    @pytest.mark.asyncio
+    async def test_users_without_created_at_are_listed(
+        self, fake_firestore_client, seeded_users
+    ):
+        """Users missing created_at are listed, also as the last of a page."""
+        from app.services.user_service import iter_users
+
+        legacy = {"user_id": "legacy", "email": "legacy@example.com"}
+        fake_firestore_client.seed("users", {"doc08a": legacy, "doc17a": legacy})
+
+        users = [u async for u in iter_users(page_size=10)]
+
+        assert len(users) == 27
+        assert [u.email for u in users].count("legacy@example.com") == 2
+
+    @pytest.mark.asyncio
+    async def test_list_users_page_projects_listed_fields(
+        self, fake_firestore_client, seeded_users
+    ):
+        """Only USER_LIST_FIELDS are read for listings."""
+        from app.services.user_service import list_users_page
+
+        fake_firestore_client.seed(
+            "users",
+            {"doc00": {**seeded_users["doc00"], "created_by": "admin@example.com"}},
+        )
+
+        page = await list_users_page(page_size=1)
+
+        assert page.users[0].email == "user0@example.com"
+        assert page.users[0].created_by is None
+
+    @pytest.mark.asyncio
+    async def test_iter_users_filters_by_tier(self, seeded_users):
+        """iter_users streams every matching user across pages."""
+        from app.services.user_service import iter_users
+        from app.models.user import UserTier
+
+        users = [u async for u in iter_users(tier=UserTier.PREMIUM, page_size=2)]
+
+        assert [u.email for u in users] == [
+            f"user{i}@example.com" for i in (0, 5, 10, 15, 20)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises(self, fake_firestore_client):
+        """Malformed cursors raise InvalidCursorError."""
+        from app.services.user_service import list_users_page, InvalidCursorError
+
+        with pytest.raises(InvalidCursorError):
+            await list_users_page(cursor="not-a-cursor")
+
+
 class TestAudioUsage:
     """Tests for audio usage tracking."""
 
@@ -0,0 +1,206 @@
+"""Tests for startup warmup and /ready gating"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock, patch
+
+from app.routers import health
+from app.services import warmup as warmup_module
+from app.services.warmup import WarmupManager, get_warmup_manager
+
+
+def succeeds(delay=0.0):
+    async def func():
+        await asyncio.sleep(delay)
+
+    return func
+
+
+async def fails():
+    raise RuntimeError("boom")
+
+
+def fails_then_succeeds(failures):
+    calls = []
+
+    async def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise RuntimeError("not yet")
+
+    return func
+
+
+class TestWarmupManager:
+    @pytest.mark.asyncio
+    async def test_not_ready_before_run(self):
+        manager = WarmupManager()
+        manager.register("runner", succeeds())
+
+        assert not manager.is_ready
+        assert manager.report()["status"] == "warming"
+
+    @pytest.mark.asyncio
+    async def test_components_run_concurrently_and_record_durations(self):
+        manager = WarmupManager()
+        for name in ("a", "b", "c"):
+            manager.register(name, succeeds(0.05))
+
+        start = asyncio.get_running_loop().time()
+        assert await manager.run(budget_seconds=5)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.14
+        report = manager.report()
+        assert report["status"] == "ready"
+        for component in report["components"].values():
+            assert component["status"] == "ok"
+            assert component["duration_ms"] >= 40
+
+    @pytest.mark.asyncio
+    async def test_non_critical_failure_does_not_block_readiness(self):
+        manager = WarmupManager()
+        manager.register("tool_data", succeeds())
+        manager.register("genai_client", fails, critical=False)
+
+        assert await manager.run(budget_seconds=1)
+        assert manager.report()["components"]["genai_client"] == {
+            "status": "failed",
+            "critical": False,
+            "duration_ms": manager.components["genai_client"].duration_ms,
+            "error": "boom",
+            "attempts": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_keeps_instance_not_ready(self):
+        manager = WarmupManager(retry_initial_seconds=0.01)
+        manager.register("runner", fails)
+
+        assert not await manager.run(budget_seconds=1)
+        assert manager.report()["status"] == "failed"
+
+        await asyncio.sleep(0.05)
+        assert manager.components["runner"].attempts > 1
+        assert not manager.is_ready
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_critical_component_is_retried_until_ready(self):
+        manager = WarmupManager(retry_initial_seconds=0.01, retry_max_seconds=0.02)
+        manager.register("tool_data", fails_then_succeeds(failures=2))
+
+        # Startup only waits for the first attempt, not the retries
+        assert not await manager.run(budget_seconds=1)
+        assert manager.report()["status"] == "failed"
+
+        await asyncio.sleep(0.1)
+        report = manager.report()
+        assert report["status"] == "ready"
+        assert report["components"]["tool_data"]["attempts"] == 3
+        assert report["components"]["tool_data"]["error"] is None
+
+    @pytest.mark.asyncio
+    async def test_non_critical_failures_are_not_retried(self):
+        manager = WarmupManager(retry_initial_seconds=0.01)
+        manager.register("genai_client", fails, critical=False)
+
+        await manager.run(budget_seconds=1)
+        await asyncio.sleep(0.05)
+
+        assert manager.components["genai_client"].attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_over_budget_components_finish_in_background(self):
+        manager = WarmupManager()
+        manager.register("fast", succeeds())
+        manager.register("slow", succeeds(0.1))
+
+        assert not await manager.run(budget_seconds=0.02)
+        assert manager.components["slow"].status == "running"
+
+        await asyncio.sleep(0.15)
+        assert manager.is_ready
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_running_components(self):
+        manager = WarmupManager()
+        manager.register("slow", succeeds(10))
+
+        await manager.run(budget_seconds=0)
+        await manager.stop()
+
+        assert not manager.is_ready
+
+    @pytest.mark.asyncio
+    async def test_run_only_once(self):
+        manager = WarmupManager()
+        await manager.run(budget_seconds=0)
+
+        with pytest.raises(RuntimeError):
+            await manager.run(budget_seconds=0)
+
+    def test_skip_is_ready(self):
+        manager = WarmupManager()
+        manager.register("runner", succeeds())
+        manager.skip()
+
+        assert manager.is_ready
+        assert manager.report()["components"]["runner"]["status"] == "skipped"
+
+    def test_default_components(self):
+        warmup_module.reset_warmup_manager()
+        components = get_warmup_manager().components
+        warmup_module.reset_warmup_manager()
+
+        assert {n for n, c in components.items() if c.critical} == {
+            "tool_data",
+            "adk_session_db",
+            "runner",
+        }
+        assert {"firestore", "agent_templates", "genai_client"} <= set(components)
+
+
+class TestReadyEndpoint:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(health.router)
+        return TestClient(app)
+
+    def test_not_ready_while_warming(self, client):
+        manager = WarmupManager()
+        manager.register("runner", succeeds())
+
+        with patch.object(health, "get_warmup_manager", return_value=manager), patch(
+            "app.routers.health.firestore.Client"
+        ) as firestore_client:
+            response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"] == {"warmup": False}
+        assert response.json()["warmup"]["components"]["runner"]["status"] == (
+            "pending"
+        )
+        firestore_client.assert_not_called()
+
+    def test_ready_once_warm(self, client):
+        manager = WarmupManager()
+        manager.register("runner", succeeds())
+        asyncio.run(manager.run(budget_seconds=1))
+
+        with patch.object(health, "get_warmup_manager", return_value=manager), patch(
+            "app.routers.health.firestore.Client", return_value=MagicMock()
+        ), patch("vertexai.init"):
+            response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["checks"] == {
+            "warmup": True,
+            "firestore": True,
+            "vertexai": True,
+        }
+        assert response.json()["warmup"]["status"] == "ready"
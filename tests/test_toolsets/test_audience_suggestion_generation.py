@@ -188,3 +188,61 @@ class TestAudienceSuggestionGeneration:
         # Should return a valid suggestion
         assert isinstance(suggestion, str)
         assert len(suggestion) > 0
+
+
+class TestSuggestionIndex:
+    """Precomputed suggestion index and profile-backed sampling."""
+
+    def test_index_covers_every_type_and_category(self):
+        from app.services.audience_profiles import DEMOGRAPHIC_KEYWORDS, MIXED
+        from app.toolsets.audience_archetypes_toolset import SUGGESTION_INDEX
+
+        categories = [c for c, _ in DEMOGRAPHIC_KEYWORDS] + [MIXED]
+        for suggestion_type in ("location", "relationship", "occupation", "topic", "object"):
+            for category in categories:
+                pool = SUGGESTION_INDEX[(suggestion_type, category)]
+                assert isinstance(pool, tuple) and pool
+
+        with pytest.raises(TypeError):
+            SUGGESTION_INDEX[("location", "tech")] = ()
+
+    def test_lookup_falls_back_to_location(self):
+        from app.toolsets.audience_archetypes_toolset import (
+            SUGGESTION_INDEX,
+            lookup_suggestions,
+        )
+
+        assert lookup_suggestions("LOCATION", "tech") == SUGGESTION_INDEX[("location", "tech")]
+        assert lookup_suggestions("interpretive dance", "arts") == SUGGESTION_INDEX[("location", "arts")]
+
+    @pytest.mark.asyncio
+    async def test_tech_audience_gets_tech_pool(self):
+        from app.toolsets.audience_archetypes_toolset import SUGGESTION_INDEX
+
+        toolset = AudienceArchetypesToolset()
+        audience = [
+            {"demographics": {"occupation": "Barista"}},
+            {"demographics": {"occupation": "Software Engineer"}},
+        ]
+        for _ in range(10):
+            suggestion = await toolset._generate_audience_suggestion("object", audience)
+            assert suggestion in SUGGESTION_INDEX[("object", "tech")]
+
+    @pytest.mark.asyncio
+    async def test_no_sample_uses_profiles_not_archetype_documents(self):
+        from unittest.mock import AsyncMock, patch
+
+        from app.services.audience_profiles import build_archetype_profiles
+        from app.toolsets import audience_archetypes_toolset as module
+
+        profiles = build_archetype_profiles(
+            [{"id": "nurse", "demographics": {"occupation": "Nurse"}}]
+        )
+        toolset = AudienceArchetypesToolset()
+        with patch.object(
+            module.data_service, "get_archetype_profiles", AsyncMock(return_value=profiles)
+        ), patch.object(module.data_service, "get_all_archetypes", AsyncMock()) as get_all:
+            suggestion = await toolset._generate_audience_suggestion("location")
+
+        assert suggestion in module.SUGGESTION_INDEX[("location", "healthcare")]
+        get_all.assert_not_called()
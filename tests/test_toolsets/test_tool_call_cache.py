@@ -0,0 +1,198 @@
+"""Tests for per-invocation tool call memoization
+
+Covers hits within one invocation, isolation between invocations, sharing
+concurrent identical calls, not caching failures, invocation release and
+eviction, and which toolset tools are memoized.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.toolsets import (
+    AudienceArchetypesToolset,
+    ImprovGamesToolset,
+    ImprovPrinciplesToolset,
+)
+from app.toolsets import tool_call_cache as tool_call_cache_module
+from app.toolsets.tool_call_cache import (
+    MemoizedFunctionTool,
+    ToolCallCache,
+    get_tool_call_cache,
+    reset_tool_call_cache,
+)
+
+
+def context(invocation_id):
+    return SimpleNamespace(invocation_id=invocation_id)
+
+
+class CountingTool:
+    """Async tool function that records its calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def lookup(self, item_id: str, limit: int = 3) -> dict:
+        """Look up an item."""
+        self.calls.append((item_id, limit))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return {"id": item_id, "limit": limit, "call": len(self.calls)}
+
+
+@pytest.fixture
+def cache():
+    return ToolCallCache(max_invocations=4)
+
+
+@pytest.mark.asyncio
+class TestMemoizedFunctionTool:
+    async def test_repeated_call_in_invocation_is_a_hit(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        first = await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+        second = await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+
+        assert first == second == {"id": "a", "limit": 3, "call": 1}
+        assert len(source.calls) == 1
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate_pct"] == 50.0
+
+    async def test_argument_order_does_not_matter(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        await tool.run_async(
+            args={"item_id": "a", "limit": 5}, tool_context=context("i1")
+        )
+        await tool.run_async(
+            args={"limit": 5, "item_id": "a"}, tool_context=context("i1")
+        )
+        await tool.run_async(
+            args={"item_id": "b", "limit": 5}, tool_context=context("i1")
+        )
+
+        assert source.calls == [("a", 5), ("b", 5)]
+
+    async def test_invocations_do_not_share_results(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+        other = await tool.run_async(args={"item_id": "a"}, tool_context=context("i2"))
+
+        assert other["call"] == 2
+        assert cache.get_stats()["hits"] == 0
+
+    async def test_concurrent_identical_calls_share_one_execution(self, cache):
+        source = CountingTool(delay=0.01)
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        results = await asyncio.gather(
+            *(
+                tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+                for _ in range(5)
+            )
+        )
+
+        assert len(source.calls) == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_failures_are_not_cached(self, cache):
+        attempts = []
+
+        async def flaky(item_id: str) -> dict:
+            """Fails on the first attempt."""
+            attempts.append(item_id)
+            if len(attempts) == 1:
+                raise RuntimeError("firestore unavailable")
+            return {"id": item_id}
+
+        tool = MemoizedFunctionTool(flaky, cache=cache)
+
+        with pytest.raises(RuntimeError):
+            await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+        result = await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+
+        assert result == {"id": "a"}
+        assert len(attempts) == 2
+
+    async def test_without_invocation_id_calls_through(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        for _ in range(2):
+            await tool.run_async(args={"item_id": "a"}, tool_context=context(None))
+
+        assert len(source.calls) == 2
+        assert cache.get_stats()["total_requests"] == 0
+
+    async def test_disabled_by_setting(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        with patch.object(
+            tool_call_cache_module.settings, "tool_call_memoization_enabled", False
+        ):
+            for _ in range(2):
+                await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+
+        assert len(source.calls) == 2
+
+    async def test_end_invocation_releases_entries(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+        cache.end_invocation("i1")
+        await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+
+        assert len(source.calls) == 2
+        assert cache.get_stats()["active_invocations"] == 1
+
+    async def test_oldest_invocations_are_evicted(self, cache):
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup, cache=cache)
+
+        for i in range(6):
+            await tool.run_async(args={"item_id": "a"}, tool_context=context(f"i{i}"))
+
+        stats = cache.get_stats()
+        assert stats["active_invocations"] == 4
+        assert stats["evictions"] == 2
+
+    async def test_uses_singleton_by_default(self):
+        reset_tool_call_cache()
+        source = CountingTool()
+        tool = MemoizedFunctionTool(source.lookup)
+
+        for _ in range(3):
+            await tool.run_async(args={"item_id": "a"}, tool_context=context("i1"))
+
+        assert get_tool_call_cache().get_stats()["hits"] == 2
+        reset_tool_call_cache()
+
+
+@pytest.mark.asyncio
+class TestToolsetMemoization:
+    async def test_read_only_data_tools_are_memoized(self):
+        for toolset in (ImprovGamesToolset(), ImprovPrinciplesToolset()):
+            tools = await toolset.get_tools()
+            assert tools
+            assert all(isinstance(tool, MemoizedFunctionTool) for tool in tools)
+
+    async def test_random_audience_tools_are_not_memoized(self):
+        tools = {
+            tool.name: tool for tool in await AudienceArchetypesToolset().get_tools()
+        }
+
+        assert isinstance(tools["_get_all_archetypes"], MemoizedFunctionTool)
+        assert isinstance(tools["_get_vibe_check"], MemoizedFunctionTool)
+        assert not isinstance(tools["_generate_audience_sample"], MemoizedFunctionTool)
+        assert not isinstance(tools["_get_suggestion_for_game"], MemoizedFunctionTool)